@@ -0,0 +1,298 @@
+"""Index of the build artifacts in the builds directory."""
+
+import fnmatch
+import os
+import re
+import threading
+
+
+class Artifact:
+    """Build artifact.
+
+    Attributes:
+      architecture (str): architecture of the artifact, such as "amd64",
+          "noarch" or "source".
+      distribution (str): name of the distribution of the artifact or None if
+          not available.
+      filename (str): name of the artifact file.
+      name (str): name of the package.
+      target (str): build target of the artifact, such as "dpkg", "dpkg-source",
+          "rpm", "srpm" or "wheel".
+      version (str): upstream version of the package.
+    """
+
+    def __init__(self, filename, target, name, version, architecture):
+        """Initializes a build artifact.
+
+        Args:
+          filename (str): name of the artifact file.
+          target (str): build target of the artifact.
+          name (str): name of the package.
+          version (str): upstream version of the package.
+          architecture (str): architecture of the artifact.
+        """
+        super().__init__()
+        self.architecture = architecture
+        self.distribution = None
+        self.filename = filename
+        self.name = name
+        self.target = target
+        self.version = version
+
+
+class ArtifactIndex:
+    """Index of the build artifacts in the builds directory.
+
+    The entries of the builds directory are scanned once, the first time they
+    are needed, and the index is updated when build results are added to or
+    removed from the builds directory.
+    """
+
+    # Binary and source dpkg package files in the format:
+    # <name>_<version>-<revision>_<architecture>.<extension>
+    _DPKG_REGEX = re.compile(
+        r"^(?P<name>[^_]+)_(?P<version>[^_]+)-(?P<revision>[^-_]+)_"
+        r"(?P<architecture>[^_.]+)\.(?:buildinfo|changes|deb)$"
+    )
+
+    # Source dpkg package files in the format:
+    # <name>_<version>-<revision>.<extension>
+    _DPKG_SOURCE_REGEX = re.compile(
+        r"^(?P<name>[^_]+)_(?P<version>[^_]+)-(?P<revision>[^-_]+)"
+        r"\.(?:debian\.tar\.[a-z0-9]+|dsc)$"
+    )
+
+    # Original source package files in the format:
+    # <name>_<version>.orig.tar.<compression>
+    _DPKG_ORIGINAL_SOURCE_REGEX = re.compile(
+        r"^(?P<name>[^_]+)_(?P<version>[^_]+)\.orig\.tar\.[a-z0-9]+$"
+    )
+
+    # The distribution is stored as suffix of the dpkg revision, such as
+    # 1ppa1~noble.
+    _DPKG_DISTRIBUTION_REGEX = re.compile(r"~(?P<distribution>[a-z]+)$")
+
+    # RPM package files in the format:
+    # <name>-<version>-<release>.<architecture>.rpm
+    _RPM_REGEX = re.compile(
+        r"^(?P<name>.+)-(?P<version>[^-]+)-(?P<release>[^-]+)"
+        r"\.(?P<architecture>[^.]+)\.rpm$"
+    )
+
+    # Wheel package files in the format:
+    # <name>-<version>[-<build>]-<python>-<abi>-<platform>.whl
+    _WHEEL_REGEX = re.compile(
+        r"^(?P<name>[^-]+)-(?P<version>[^-]+)(?:-[0-9][^-]*)?-[^-]+-[^-]+-"
+        r"(?P<architecture>[^-]+)\.whl$"
+    )
+
+    def __init__(self, path):
+        """Initializes an artifact index.
+
+        Args:
+          path (str): path of the builds directory.
+        """
+        super().__init__()
+        self._artifacts_per_name = {}
+        self._directory_entries = None
+        self._lock = threading.Lock()
+        self._path = os.path.abspath(path)
+
+    def _AddDirectoryEntry(self, name, is_directory):
+        """Adds a directory entry to the index.
+
+        Args:
+          name (str): name of the directory entry.
+          is_directory (bool): True if the directory entry is a directory.
+        """
+        self._directory_entries[name] = is_directory
+
+        if not is_directory:
+            artifact = self._ParseFilename(name)
+            if artifact:
+                artifacts = self._artifacts_per_name.setdefault(artifact.name, {})
+                artifacts[name] = artifact
+
+    def _GetDirectoryEntries(self):
+        """Retrieves the entries of the builds directory.
+
+        Note that the lock must be held by the caller.
+
+        Returns:
+          dict[str, bool]: True if the entry is a directory, per name.
+        """
+        if self._directory_entries is None:
+            self._directory_entries = {}
+            if os.path.isdir(self._path):
+                with os.scandir(self._path) as directory_entries:
+                    for directory_entry in directory_entries:
+                        self._AddDirectoryEntry(
+                            directory_entry.name,
+                            directory_entry.is_dir(follow_symlinks=False),
+                        )
+
+        return self._directory_entries
+
+    def _ParseFilename(self, filename):
+        """Parses the filename of a build artifact.
+
+        Args:
+          filename (str): name of the file.
+
+        Returns:
+          Artifact: build artifact or None if the filename is not that of
+              a build artifact.
+        """
+        revision = None
+        target = None
+
+        regex_match = self._WHEEL_REGEX.match(filename)
+        if regex_match:
+            target = "wheel"
+
+        if not target:
+            regex_match = self._RPM_REGEX.match(filename)
+            if regex_match:
+                if regex_match.group("architecture") == "src":
+                    target = "srpm"
+                else:
+                    target = "rpm"
+
+        if not target:
+            regex_match = self._DPKG_REGEX.match(filename)
+            if regex_match:
+                if regex_match.group("architecture") == "source":
+                    target = "dpkg-source"
+                else:
+                    target = "dpkg"
+
+                revision = regex_match.group("revision")
+
+        if not target:
+            regex_match = self._DPKG_SOURCE_REGEX.match(filename)
+            if regex_match:
+                target = "dpkg-source"
+                revision = regex_match.group("revision")
+
+        if not target:
+            regex_match = self._DPKG_ORIGINAL_SOURCE_REGEX.match(filename)
+            if regex_match:
+                target = "dpkg-source"
+
+        if not target:
+            return None
+
+        architecture = regex_match.groupdict().get("architecture", None)
+        if target == "dpkg-source":
+            architecture = "source"
+
+        artifact = Artifact(
+            filename,
+            target,
+            regex_match.group("name"),
+            regex_match.group("version"),
+            architecture,
+        )
+
+        if revision:
+            regex_match = self._DPKG_DISTRIBUTION_REGEX.search(revision)
+            if regex_match:
+                artifact.distribution = regex_match.group("distribution")
+
+        return artifact
+
+    def Add(self, filename, is_directory=False):
+        """Adds a file or directory, that was added to the builds directory.
+
+        Args:
+          filename (str): name of the file or directory.
+          is_directory (Optional[bool]): True if the entry is a directory.
+        """
+        with self._lock:
+            self._GetDirectoryEntries()
+            self._AddDirectoryEntry(filename, is_directory)
+
+    def Contains(self, filename):
+        """Determines if the builds directory contains a file or directory.
+
+        Build tools, such as dpkg-buildpackage, can write their results directly
+        into the builds directory, hence if the entry is not in the index the
+        file system is checked, which requires a single stat instead of
+        a directory scan.
+
+        Args:
+          filename (str): name of the file or directory.
+
+        Returns:
+          bool: True if the builds directory contains the file or directory.
+        """
+        with self._lock:
+            directory_entries = self._GetDirectoryEntries()
+            if filename in directory_entries:
+                return True
+
+            path = os.path.join(self._path, filename)
+            if not os.path.lexists(path):
+                return False
+
+            self._AddDirectoryEntry(filename, os.path.isdir(path))
+
+        return True
+
+    def GetArtifacts(self, name, target=None, version=None):
+        """Retrieves the build artifacts of a package.
+
+        Args:
+          name (str): name of the package.
+          target (Optional[str]): build target of the artifacts, where None
+              represents all build targets.
+          version (Optional[str]): upstream version of the artifacts, where None
+              represents all versions.
+
+        Returns:
+          list[Artifact]: build artifacts sorted by filename.
+        """
+        with self._lock:
+            self._GetDirectoryEntries()
+            artifacts = self._artifacts_per_name.get(name, {})
+
+            return [
+                artifact
+                for _, artifact in sorted(artifacts.items())
+                if (not target or artifact.target == target)
+                and (not version or artifact.version == version)
+            ]
+
+    def Glob(self, pattern, directories_only=False):
+        """Retrieves the names of the entries that match a pattern.
+
+        Args:
+          pattern (str): glob pattern of the names of the entries.
+          directories_only (Optional[bool]): True if only the names of
+              directories should be retrieved.
+
+        Returns:
+          list[str]: names of the matching entries.
+        """
+        with self._lock:
+            directory_entries = self._GetDirectoryEntries()
+            names = fnmatch.filter(directory_entries.keys(), pattern)
+            if directories_only:
+                names = [name for name in names if directory_entries[name]]
+
+        return names
+
+    def Remove(self, filename):
+        """Removes a file or directory, that was removed from the builds directory.
+
+        Args:
+          filename (str): name of the file or directory.
+        """
+        with self._lock:
+            self._GetDirectoryEntries()
+            self._directory_entries.pop(filename, None)
+
+            artifact = self._ParseFilename(filename)
+            if artifact:
+                artifacts = self._artifacts_per_name.get(artifact.name, {})
+                artifacts.pop(filename, None)
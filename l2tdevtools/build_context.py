@@ -0,0 +1,317 @@
+"""Build context."""
+
+import glob
+import gzip
+import logging
+import os
+import shlex
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+
+from l2tdevtools import artifact_index
+from l2tdevtools import cleanup_service
+
+
+class BuildContext:
+    """Context in which projects are built.
+
+    The build context is used instead of the process-wide current working
+    directory, so that multiple builds can run concurrently.
+
+    Attributes:
+      artifact_index (ArtifactIndex): index of the build artifacts in
+          the working directory.
+      environment (dict[str, str]): environment variables of the build commands,
+          where None represents the environment of the process.
+      log_directory (str): path of the directory in which the build log files
+          are stored.
+      private_rpmbuild (bool): True if every rpm build uses its own rpmbuild
+          top directory, which is created in rpmbuild_path, so that rpm builds
+          can run concurrently.
+      rpmbuild_path (str): path of the rpmbuild top directory, or the directory
+          that contains the private rpmbuild top directories.
+      scratch_path (str): path of the directory in which the source packages
+          are extracted and built, where None represents the working directory.
+      tail_logs (bool): True if the output of the build commands should also
+          be written to the console, prefixed with the name of the project.
+      working_directory (str): path of the directory in which the source packages
+          are extracted and the build results are stored.
+    """
+
+    # Lock to prevent the output of concurrent builds to be interleaved within
+    # a line on the console.
+    _CONSOLE_LOCK = threading.Lock()
+
+    def __init__(
+        self,
+        working_directory,
+        environment=None,
+        log_directory=None,
+        private_rpmbuild=False,
+        rpmbuild_path=None,
+        scratch_path=None,
+        tail_logs=False,
+    ):
+        """Initializes a build context.
+
+        Args:
+          working_directory (str): path of the directory in which the source
+              packages are extracted and the build results are stored.
+          environment (Optional[dict[str, str]]): environment variables of
+              the build commands, where None represents the environment of
+              the process.
+          log_directory (Optional[str]): path of the directory in which
+              the build log files are stored, where None represents the working
+              directory.
+          private_rpmbuild (Optional[bool]): True if every rpm build should use
+              its own rpmbuild top directory.
+          rpmbuild_path (Optional[str]): path of the rpmbuild top directory, or
+              the directory that contains the private rpmbuild top directories,
+              where None represents ~/rpmbuild.
+          scratch_path (Optional[str]): path of the directory in which
+              the source packages are extracted and built, such as a directory
+              on tmpfs, where None represents the working directory.
+          tail_logs (Optional[bool]): True if the output of the build commands
+              should also be written to the console.
+        """
+        super().__init__()
+        self.working_directory = os.path.abspath(working_directory)
+        self.environment = environment
+        self.log_directory = os.path.abspath(log_directory or self.working_directory)
+        self.private_rpmbuild = private_rpmbuild
+        self.rpmbuild_path = os.path.abspath(
+            rpmbuild_path or os.path.expanduser(os.path.join("~", "rpmbuild"))
+        )
+        self.scratch_path = None
+        if scratch_path:
+            self.scratch_path = os.path.abspath(scratch_path)
+
+        self.tail_logs = tail_logs
+        self.artifact_index = artifact_index.ArtifactIndex(self.working_directory)
+
+        self._cleanup_services = {}
+        self._cleanup_services_lock = threading.Lock()
+
+    def GetBuildPath(self, project_name):
+        """Retrieves the path of the directory to build a project in.
+
+        The source package of the project is extracted into this directory and
+        the build tools write their intermediate results into it. When a scratch
+        directory is used every project has its own build directory.
+
+        Args:
+          project_name (str): name of the project.
+
+        Returns:
+          str: path of the build directory.
+        """
+        if not self.scratch_path:
+            return self.working_directory
+
+        build_path = os.path.join(self.scratch_path, project_name)
+        os.makedirs(build_path, exist_ok=True)
+        return build_path
+
+    def GetCleanupService(self, path=None):
+        """Retrieves the cleanup service of a directory.
+
+        Args:
+          path (Optional[str]): path of the directory, where None represents
+              the working directory.
+
+        Returns:
+          CleanupService: cleanup service of the directory.
+        """
+        if path:
+            path = os.path.abspath(self.GetPath(path))
+        else:
+            path = self.working_directory
+
+        # The cleanup services can be retrieved from multiple build threads.
+        with self._cleanup_services_lock:
+            service = self._cleanup_services.get(path, None)
+            if not service:
+                index = None
+                if path == self.working_directory:
+                    index = self.artifact_index
+
+                service = cleanup_service.CleanupService(path, artifact_index=index)
+                self._cleanup_services[path] = service
+
+        return service
+
+    def GetLogPath(self, project_name, distribution=None):
+        """Retrieves the path of the build log file of a project.
+
+        Args:
+          project_name (str): name of the project.
+          distribution (Optional[str]): name of the distribution, where None
+              represents the build host distribution.
+
+        Returns:
+          str: path of the build log file.
+        """
+        if distribution:
+            log_filename = f"{project_name:s}_{distribution:s}_build.log.gz"
+        else:
+            log_filename = f"{project_name:s}_build.log.gz"
+
+        return os.path.join(self.log_directory, log_filename)
+
+    def GetPath(self, *path_segments):
+        """Retrieves the path of a file or directory in the working directory.
+
+        Args:
+          path_segments (list[str]): path segments relative to the working
+              directory. An absolute path is returned unchanged.
+
+        Returns:
+          str: path of the file or directory.
+        """
+        return os.path.join(self.working_directory, *path_segments)
+
+    def Glob(self, pattern):
+        """Retrieves the names of the files in the working directory.
+
+        Args:
+          pattern (str): glob pattern, relative to the working directory.
+
+        Returns:
+          list[str]: names of the matching files, relative to the working
+              directory.
+        """
+        return [
+            os.path.relpath(path, self.working_directory)
+            for path in glob.glob(
+                os.path.join(glob.escape(self.working_directory), pattern)
+            )
+        ]
+
+    def MoveBuildResults(self, build_path):
+        """Moves the build results into the working directory.
+
+        Args:
+          build_path (str): path of the build directory of the project.
+        """
+        if build_path == self.working_directory:
+            return
+
+        with os.scandir(build_path) as directory_entries:
+            paths = [
+                directory_entry.path
+                for directory_entry in directory_entries
+                if directory_entry.is_file()
+            ]
+
+        for path in paths:
+            logging.info(f"Moving: {path:s}")
+
+            # Note that shutil.move() is used since the scratch directory can be
+            # on a different file system, such as tmpfs.
+            filename = os.path.basename(path)
+            shutil.move(path, self.GetPath(filename))
+            self.artifact_index.Add(filename)
+
+    def RemoveBuildPath(self, project_name):
+        """Removes the build directory of a project in the background.
+
+        The build directory is only removed when a scratch directory is used.
+        It is renamed first, so that the project can be extracted again while
+        the removal is still in progress.
+
+        Args:
+          project_name (str): name of the project.
+        """
+        if not self.scratch_path:
+            return
+
+        build_path = os.path.join(self.scratch_path, project_name)
+        if not os.path.isdir(build_path):
+            return
+
+        removal_path = tempfile.mkdtemp(prefix=".remove-", dir=self.scratch_path)
+        os.rename(build_path, os.path.join(removal_path, project_name))
+
+        logging.info(f"Removing: {build_path:s}")
+        self.GetCleanupService(self.scratch_path).Remove(removal_path)
+
+    def RunCommand(
+        self, command, working_directory=None, project_name=None, distribution=None
+    ):
+        """Runs a command in the build context.
+
+        The command is run directly, without a shell. If a project name is
+        provided the output of the command is streamed into the compressed build
+        log file of the project and, if enabled, to the console.
+
+        Args:
+          command (list[str]): command and its arguments.
+          working_directory (Optional[str]): path of the directory to run
+              the command in, relative to the working directory of the build
+              context, where None represents the working directory of the build
+              context.
+          project_name (Optional[str]): name of the project, where None
+              represents that the output of the command is not logged.
+          distribution (Optional[str]): name of the distribution, where None
+              represents the build host distribution.
+
+        Returns:
+          int: exit code of the command.
+        """
+        if working_directory:
+            working_directory = self.GetPath(working_directory)
+        else:
+            working_directory = self.working_directory
+
+        if not project_name:
+            return subprocess.call(command, cwd=working_directory, env=self.environment)
+
+        prefix = project_name
+        if distribution:
+            prefix = f"{project_name:s}/{distribution:s}"
+
+        log_path = self.GetLogPath(project_name, distribution=distribution)
+
+        # Note that the build log file is opened in append mode, so that
+        # the output of all the commands of a build is stored, since every
+        # command is written as a separate gzip member.
+        with gzip.open(log_path, "ab") as log_file_object:
+            log_file_object.write(f"$ {shlex.join(command):s}\n".encode("utf-8"))
+
+            try:
+                process = subprocess.Popen(
+                    command,
+                    cwd=working_directory,
+                    env=self.environment,
+                    stderr=subprocess.STDOUT,
+                    stdout=subprocess.PIPE,
+                )
+            except OSError as exception:
+                log_file_object.write(f"{exception!s}\n".encode("utf-8"))
+                logging.error(
+                    f"Unable to run: {command[0]:s} with error: {exception!s}"
+                )
+                return 1
+
+            with process:
+                for line in process.stdout:
+                    log_file_object.write(line)
+
+                    if self.tail_logs:
+                        line = line.decode("utf-8", errors="replace").rstrip()
+                        with self._CONSOLE_LOCK:
+                            sys.stdout.write(f"[{prefix:s}] {line:s}\n")
+                            sys.stdout.flush()
+
+        return process.returncode
+
+    def WaitForCleanup(self):
+        """Waits for the background removals to complete."""
+        with self._cleanup_services_lock:
+            services = list(self._cleanup_services.values())
+
+        for service in services:
+            service.Wait()
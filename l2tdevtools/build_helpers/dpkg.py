@@ -1,17 +1,29 @@
 """Helper for building projects from source."""
 
+import concurrent.futures
+import csv
 import datetime
+import errno
 import glob
+import io
 import logging
 import os
 import platform
 import re
+import shlex
 import shutil
 import subprocess
 import sys
 import tarfile
+import tempfile
+import tomllib
 import zipfile
 
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
 from l2tdevtools import dpkg_files
 from l2tdevtools.build_helpers import interface
 from l2tdevtools.lib import definitions
@@ -61,7 +73,32 @@ class DPKGBuildHelper(interface.BuildHelper):
         "zlib": "zlib1g-dev",
     }
 
-    def __init__(self, project_definition, l2tdevtools_path, dependency_definitions):
+    # The first line of a changelog entry in the format:
+    # <source> (<version>) <distributions>; <options>
+    _CHANGELOG_ENTRY_REGEX = re.compile(
+        r"^(?P<source>\S+) \((?P<version>[^)]+)\) (?P<distributions>[^;]+);"
+    )
+
+    # The ioctl request to clone a file with a reflink, as defined in
+    # linux/fs.h.
+    _FICLONE = 0x40049409
+
+    # The errors that indicate that a file cannot be cloned with a reflink.
+    _REFLINK_UNSUPPORTED_ERRORS = frozenset(
+        [errno.EBADF, errno.EINVAL, errno.ENOTTY, errno.EOPNOTSUPP, errno.EXDEV]
+    )
+
+    # The names of the installed packages are shared by all dpkg build helpers
+    # in the process, so that dpkg-query is only run once.
+    _installed_packages = None
+
+    def __init__(
+        self,
+        project_definition,
+        l2tdevtools_path,
+        dependency_definitions,
+        build_context=None,
+    ):
         """Initializes a build helper.
 
         Args:
@@ -70,9 +107,17 @@ class DPKGBuildHelper(interface.BuildHelper):
           l2tdevtools_path (str): path to the l2tdevtools directory.
           dependency_definitions (dict[str, ProjectDefinition]): definitions of all
               projects, which is used to determine the properties of dependencies.
+          build_context (Optional[BuildContext]): build context, where None
+              represents a build context of the current working directory.
         """
-        super().__init__(project_definition, l2tdevtools_path, dependency_definitions)
+        super().__init__(
+            project_definition,
+            l2tdevtools_path,
+            dependency_definitions,
+            build_context=build_context,
+        )
         self._build_host_distribution = self._GetBuildHostDistribution()
+        self._clone_with_reflink = fcntl is not None
         self._prep_script = "prep-dpkg.sh"
         self._post_script = "post-dpkg.sh"
 
@@ -103,16 +148,22 @@ class DPKGBuildHelper(interface.BuildHelper):
           bool: True if the preparations were successful, False otherwise.
         """
         # Script to run before building, e.g. to change the dpkg packaging files.
-        if os.path.exists(self._prep_script):
-            command = (
-                f"sh ../{self._prep_script:s} {project_name:s} {project_version!s} "
-                f"{version_suffix:s} {distribution:s} {architecture:s}"
-            )
-            exit_code = subprocess.call(
-                f"(cd {source_directory:s} && {command:s})", shell=True
+        script_path = self._build_context.GetPath(self._prep_script)
+        if os.path.exists(script_path):
+            command = [
+                "sh",
+                script_path,
+                project_name,
+                f"{project_version!s}",
+                version_suffix,
+                distribution,
+                architecture,
+            ]
+            exit_code = self._RunCommand(
+                command, working_directory=source_directory, distribution=distribution
             )
             if exit_code != 0:
-                logging.error(f'Running: "{command:s}" failed.')
+                logging.error(f'Running: "{shlex.join(command):s}" failed.')
                 return False
 
         return True
@@ -141,20 +192,207 @@ class DPKGBuildHelper(interface.BuildHelper):
         """
         # Script to run after building, e.g. to automatically upload the dpkg
         # package files to an apt repository.
-        if os.path.exists(self._post_script):
-            command = (
-                f"sh ../{self._post_script:s} {project_name:s} {project_version!s} "
-                f"{version_suffix:s} {distribution:s} {architecture:s}"
+        script_path = self._build_context.GetPath(self._post_script)
+        if os.path.exists(script_path):
+            command = [
+                "sh",
+                script_path,
+                project_name,
+                f"{project_version!s}",
+                version_suffix,
+                distribution,
+                architecture,
+            ]
+            exit_code = self._RunCommand(
+                command, working_directory=source_directory, distribution=distribution
             )
-            exit_code = subprocess.call(
-                f"(cd {source_directory:s} && {command:s})", shell=True
+            if exit_code != 0:
+                logging.error(f'Running: "{shlex.join(command):s}" failed.')
+                return False
+
+        return True
+
+    def _BuildSourceDistribution(
+        self,
+        source_directory,
+        orig_source_package_path,
+        project_name,
+        project_version,
+        distribution,
+    ):
+        """Builds the source dpkg packages of a distribution in a clone.
+
+        The source directory is cloned, together with the .orig.tar.gz source
+        package, into a directory of its own, since debuild writes its results
+        into the parent directory of the source directory.
+
+        Args:
+          source_directory (str): path of the source directory, that contains
+              the base debian sub directory.
+          orig_source_package_path (str): path of the .orig.tar.gz source
+              package.
+          project_name (str): name of the project.
+          project_version (str): version of the project.
+          distribution (str): distribution.
+
+        Returns:
+          bool: True if successful, False otherwise.
+        """
+        clone_path = tempfile.mkdtemp(
+            prefix=f".{distribution:s}-", dir=os.path.dirname(source_directory)
+        )
+        try:
+            clone_directory = os.path.join(
+                clone_path, os.path.basename(source_directory)
+            )
+            self._CloneSourceDirectory(source_directory, clone_directory)
+
+            clone_orig_source_package_path = os.path.join(
+                clone_path, os.path.basename(orig_source_package_path)
+            )
+            self._CloneFile(orig_source_package_path, clone_orig_source_package_path)
+
+            if not self._CreateDistributionChangelog(
+                clone_directory, self.version_suffix, distribution
+            ):
+                return False
+
+            if not self._BuildPrepare(
+                clone_directory,
+                project_name,
+                project_version,
+                self.version_suffix,
+                distribution,
+                self.architecture,
+            ):
+                return False
+
+            command = ["debuild", "-S", "-sa"]
+            exit_code = self._RunCommand(
+                command, working_directory=clone_directory, distribution=distribution
             )
             if exit_code != 0:
-                logging.error(f'Running: "{command:s}" failed.')
+                logging.error(
+                    f'Failed to run: "{shlex.join(command):s}" in: '
+                    f"{clone_directory:s} with exit code {exit_code:d}"
+                )
+                return False
+
+            if not self._BuildFinalize(
+                clone_directory,
+                project_name,
+                project_version,
+                self.version_suffix,
+                distribution,
+                self.architecture,
+            ):
                 return False
 
+            # The .orig.tar.gz source package is moved from the source directory
+            # instead, since it is shared by all the distributions.
+            os.remove(clone_orig_source_package_path)
+
+            self._build_context.MoveBuildResults(clone_path)
+
+        finally:
+            cleanup_service = self._build_context.GetCleanupService(
+                os.path.dirname(source_directory)
+            )
+            cleanup_service.Remove(clone_path)
+
         return True
 
+    def _BuildSourceDistributions(
+        self, source_helper_object, project_name, project_version, distributions
+    ):
+        """Builds the source dpkg packages of multiple distributions.
+
+        The source package is extracted and the base debian sub directory is
+        created only once. The source dpkg packages of the distributions are
+        built in parallel, each in its own clone of the source directory.
+
+        Args:
+          source_helper_object (SourceHelper): source helper.
+          project_name (str): name of the project as used by the source dpkg
+              packages.
+          project_version (str): version of the project as used by the source
+              dpkg packages.
+          distributions (list[str]): distributions.
+
+        Returns:
+          list[str]: distributions for which the build failed.
+        """
+        source_package_path = source_helper_object.GetSourcePackagePath()
+        if not source_package_path:
+            logging.info(
+                f"Missing source package of: {source_helper_object.project_name:s}"
+            )
+            return list(distributions)
+
+        source_directory = source_helper_object.GetSourceDirectoryPath()
+        if not source_directory:
+            logging.info(
+                f"Missing source directory of: {source_helper_object.project_name:s}"
+            )
+            return list(distributions)
+
+        # Note that we need to pass the original project name to
+        # _CreateOriginalSourcePackage.
+        orig_source_package_path = self._CreateOriginalSourcePackage(
+            source_package_path,
+            source_directory,
+            source_helper_object.project_name,
+            project_version,
+        )
+
+        source_package_filename = source_helper_object.GetSourcePackageFilename()
+        logging.info(
+            f"Building source deb of: {source_package_filename:s} for: "
+            f"{', '.join(distributions):s}"
+        )
+
+        if not self._CreatePackagingFiles(source_directory, project_version):
+            return list(distributions)
+
+        # If there is a temporary packaging directory remove it.
+        temporary_directory = os.path.join(source_directory, "tmp")
+        if os.path.exists(temporary_directory):
+            logging.info(f"Removing: {temporary_directory:s}")
+            shutil.rmtree(temporary_directory, ignore_errors=True)
+
+        failed_distributions = []
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=len(distributions)
+        ) as executor:
+            futures = {
+                distribution: executor.submit(
+                    self._BuildSourceDistribution,
+                    source_directory,
+                    orig_source_package_path,
+                    project_name,
+                    project_version,
+                    distribution,
+                )
+                for distribution in distributions
+            }
+            for distribution, future in futures.items():
+                try:
+                    result = future.result()
+                except OSError as exception:
+                    logging.error(
+                        f"Unable to build source deb for: {distribution:s} with "
+                        f"error: {exception!s}"
+                    )
+                    result = False
+
+                if not result:
+                    failed_distributions.append(distribution)
+
+        # Move the .orig.tar.gz source package, when built in a scratch directory.
+        self._build_context.MoveBuildResults(os.path.dirname(source_directory))
+
+        return failed_distributions
+
     def _CheckIsInstalled(self, package_name):
         """Checks if a package is installed.
 
@@ -164,20 +402,136 @@ class DPKGBuildHelper(interface.BuildHelper):
         Returns:
           bool: True if the package is installed, False otherwise.
         """
-        exit_code = subprocess.call(
-            f"dpkg-query -s {package_name:s} >/dev/null 2>&1", shell=True
+        return package_name in self._GetInstalledPackages()
+
+    def _CloneFile(self, source_path, destination_path):
+        """Clones a file.
+
+        The file is cloned with a reflink, which shares the data of the file
+        until it is changed, when supported by the file system. Otherwise it is
+        copied, since with a hard link a build step of one distribution, such as
+        "debian/rules clean", could change the files of the other distributions.
+
+        Args:
+          source_path (str): path of the file to clone.
+          destination_path (str): path of the clone.
+        """
+        if self._clone_with_reflink:
+            try:
+                with open(source_path, "rb") as source_file_object:
+                    with open(destination_path, "wb") as destination_file_object:
+                        fcntl.ioctl(
+                            destination_file_object.fileno(),
+                            self._FICLONE,
+                            source_file_object.fileno(),
+                        )
+
+                shutil.copystat(source_path, destination_path)
+                return
+
+            except OSError as exception:
+                # Do not leave a partial clone behind.
+                if os.path.lexists(destination_path):
+                    os.remove(destination_path)
+
+                if exception.errno not in self._REFLINK_UNSUPPORTED_ERRORS:
+                    raise
+
+                self._clone_with_reflink = False
+
+        shutil.copy2(source_path, destination_path)
+
+    def _CloneSourceDirectory(self, source_directory, clone_directory):
+        """Clones a source directory.
+
+        The files are cloned, except for the files in the debian sub directory,
+        which are copied since these are changed per distribution.
+
+        Args:
+          source_directory (str): path of the source directory.
+          clone_directory (str): path of the clone.
+        """
+
+        def _IgnoreDebianDirectory(path, names):
+            if path == source_directory and "debian" in names:
+                return ["debian"]
+            return []
+
+        shutil.copytree(
+            source_directory,
+            clone_directory,
+            symlinks=True,
+            ignore=_IgnoreDebianDirectory,
+            copy_function=self._CloneFile,
         )
-        return exit_code == 0
+        shutil.copytree(
+            os.path.join(source_directory, "debian"),
+            os.path.join(clone_directory, "debian"),
+            symlinks=True,
+        )
+
+    def _CreateDistributionChangelog(
+        self, source_directory, version_suffix, distribution
+    ):
+        """Changes the debian/changelog file for a specific distribution.
+
+        The version suffix and distribution are added to the version of the first
+        changelog entry, such as "1.0-1ppa1~noble", and its distribution is
+        changed to the distribution.
+
+        Args:
+          source_directory (str): path of the source directory.
+          version_suffix (str): version suffix.
+          distribution (str): distribution.
+
+        Returns:
+          bool: True if successful, False otherwise.
+        """
+        changelog_path = os.path.join(source_directory, "debian", "changelog")
+
+        with open(changelog_path, "r", encoding="utf-8") as file_object:
+            lines = file_object.readlines()
+
+        regex_match = None
+        if lines:
+            regex_match = self._CHANGELOG_ENTRY_REGEX.match(lines[0])
+
+        if not regex_match:
+            logging.error(f"Unsupported changelog file: {changelog_path:s}")
+            return False
+
+        version = regex_match.group("version")
+        if not version.endswith(f"~{distribution:s}"):
+            version = f"{version:s}{version_suffix:s}~{distribution:s}"
+
+        lines[0] = "".join(
+            [
+                f"{regex_match.group('source'):s} ({version:s}) {distribution:s};",
+                lines[0][regex_match.end() :],
+            ]
+        )
+
+        with open(changelog_path, "w", encoding="utf-8") as file_object:
+            file_object.writelines(lines)
+
+        return True
 
     def _CreateOriginalSourcePackage(
-        self, source_package_path, project_name, project_version
+        self, source_package_path, source_directory, project_name, project_version
     ):
         """Creates the .orig.tar.gz source package.
 
+        The .orig.tar.gz source package is created next to the source directory,
+        where dpkg-buildpackage expects it.
+
         Args:
           source_package_path (str): path of the source package file.
+          source_directory (str): path of the source directory.
           project_name (str): project name.
           project_version (str): version of the project.
+
+        Returns:
+          str: path of the .orig.tar.gz source package.
         """
         if self._project_definition.dpkg_source_name:
             project_name = self._project_definition.dpkg_source_name
@@ -185,32 +539,47 @@ class DPKGBuildHelper(interface.BuildHelper):
         deb_orig_source_package_filename = (
             f"{project_name:s}_{project_version!s}.orig.tar.gz"
         )
-        if os.path.exists(deb_orig_source_package_filename):
-            return
+        deb_orig_source_package_path = os.path.join(
+            os.path.dirname(source_directory), deb_orig_source_package_filename
+        )
+        if os.path.exists(deb_orig_source_package_path):
+            return deb_orig_source_package_path
+
+        # Reuse a previously created .orig.tar.gz source package, such as one
+        # moved from the scratch directory, so that the source packages of all
+        # the distributions refer to the same .orig.tar.gz.
+        if self._build_context.artifact_index.Contains(
+            deb_orig_source_package_filename
+        ):
+            existing_path = self._build_context.GetPath(
+                deb_orig_source_package_filename
+            )
+            shutil.copy(existing_path, deb_orig_source_package_path)
+            return deb_orig_source_package_path
 
         if source_package_path.endswith(".zip"):
             self._CreateOriginalSourcePackageFromZip(
-                source_package_path, deb_orig_source_package_filename
+                source_package_path, deb_orig_source_package_path
             )
         else:
-            shutil.copy(source_package_path, deb_orig_source_package_filename)
+            shutil.copy(source_package_path, deb_orig_source_package_path)
+
+        return deb_orig_source_package_path
 
     def _CreateOriginalSourcePackageFromZip(
-        self, source_package_path, orig_source_package_filename
+        self, source_package_path, orig_source_package_path
     ):
         """Creates the .orig.tar.gz source package from a .zip file.
 
         Args:
           source_package_path (str): path of the source package file.
-          orig_source_package_filename (str): name of the .orig.tar.gz source
+          orig_source_package_path (str): path of the .orig.tar.gz source
               package file.
         """
         posix_epoch = datetime.datetime(1970, 1, 1)
 
         with zipfile.ZipFile(source_package_path, "r") as zip_file:
-            with tarfile.open(
-                name=orig_source_package_filename, mode="w:gz"
-            ) as tar_file:
+            with tarfile.open(name=orig_source_package_path, mode="w:gz") as tar_file:
                 for filename in zip_file.namelist():
                     with zip_file.open(filename) as file_object:
                         zip_info = zip_file.getinfo(filename)
@@ -267,24 +636,18 @@ class DPKGBuildHelper(interface.BuildHelper):
 
         else:
             build_configuration = self._DetermineBuildConfiguration(
-                source_directory
+                source_directory, project_version
             )  # pylint: disable=assignment-from-none
 
-            os.chdir(source_directory)
-
-            try:
-                build_files_generator = dpkg_files.DPKGBuildFilesGenerator(
-                    self._project_definition,
-                    project_version,
-                    self._data_path,
-                    self._dependency_definitions,
-                    build_configuration=build_configuration,
-                )
-
-                build_files_generator.GenerateFiles("debian")
+            build_files_generator = dpkg_files.DPKGBuildFilesGenerator(
+                self._project_definition,
+                project_version,
+                self._data_path,
+                self._dependency_definitions,
+                build_configuration=build_configuration,
+            )
 
-            finally:
-                os.chdir("..")
+            build_files_generator.GenerateFiles(debian_directory)
 
         if not os.path.exists(debian_directory):
             logging.error(f"Missing debian sub directory in: {source_directory:s}")
@@ -293,11 +656,12 @@ class DPKGBuildHelper(interface.BuildHelper):
         return True
 
     # pylint: disable=redundant-returns-doc,unused-argument
-    def _DetermineBuildConfiguration(self, source_directory):
+    def _DetermineBuildConfiguration(self, source_directory, project_version):
         """Determines the build configuration of a project.
 
         Args:
           source_directory (str): path of the source directory.
+          project_version (str): version of the project.
 
         Returns:
           DPKGBuildConfiguration: dpkg build configuration or None if the build
@@ -330,6 +694,49 @@ class DPKGBuildHelper(interface.BuildHelper):
 
         return distribution_name
 
+    def _GetInstalledPackages(self):
+        """Retrieves the names of the installed packages.
+
+        Returns:
+          set[str]: names of the installed packages.
+        """
+        installed_packages = DPKGBuildHelper._installed_packages
+        if installed_packages is None:
+            command = ["dpkg-query", "-W", "-f=${Package}\t${db:Status-Status}\n"]
+            try:
+                output = subprocess.check_output(command, stderr=subprocess.DEVNULL)
+            except (OSError, subprocess.CalledProcessError) as exception:
+                command_string = " ".join(command)
+                logging.error(
+                    f'Running: "{command_string:s}" failed with error: {exception!s}'
+                )
+                output = b""
+
+            installed_packages = self._ParseInstalledPackages(
+                output.decode("utf-8", errors="replace")
+            )
+            DPKGBuildHelper._installed_packages = installed_packages
+
+        return installed_packages
+
+    def _ParseInstalledPackages(self, output):
+        """Parses the names of the installed packages from dpkg-query output.
+
+        Args:
+          output (str): output of dpkg-query, with a package name and status
+              separated by a tab per line.
+
+        Returns:
+          set[str]: names of the installed packages.
+        """
+        installed_packages = set()
+        for line in output.split("\n"):
+            package_name, _, status = line.partition("\t")
+            if package_name and status == "installed":
+                installed_packages.add(package_name)
+
+        return installed_packages
+
     def _ReadLSBReleaseConfigurationFile(self, path):
         """Reads a lsb-release configuration (/etc/lsb-release) file.
 
@@ -368,33 +775,25 @@ class DPKGBuildHelper(interface.BuildHelper):
         if self._project_definition.dpkg_source_name:
             project_name = self._project_definition.dpkg_source_name
 
+        cleanup_service = self._build_context.GetCleanupService()
+
         filenames_to_ignore = re.compile(f"^{project_name:s}[-_].*{project_version!s}")
 
         # Remove files of previous versions in the format:
         # <project>*[-_][0-9]*-[1-9]_<architecture>.*
-        for filename in glob.glob(
+        for filename in cleanup_service.Glob(
             f"{project_name:s}*[-_][0-9]*-[1-9]_{self.architecture:s}.*"
         ):
             if not filenames_to_ignore.match(filename):
                 logging.info(f"Removing: {filename:s}")
-                try:
-                    os.remove(filename)
-                except PermissionError as exception:
-                    logging.info(
-                        f"Unable to remove: {filename:s} with error: {exception!s}"
-                    )
+                cleanup_service.Remove(filename)
 
         # Remove files of previous versions in the format:
         # <project>[-_][0-9]*-[1-9].*
-        for filename in glob.glob(f"{project_name:s}[-_][0-9]*-[1-9].*"):
+        for filename in cleanup_service.Glob(f"{project_name:s}[-_][0-9]*-[1-9].*"):
             if not filenames_to_ignore.match(filename):
                 logging.info(f"Removing: {filename:s}")
-                try:
-                    os.remove(filename)
-                except PermissionError as exception:
-                    logging.info(
-                        f"Unable to remove: {filename:s} with error: {exception!s}"
-                    )
+                cleanup_service.Remove(filename)
 
     def _RemoveOlderOriginalSourcePackage(
         self, project_name, project_version, version_suffix=None, distribution=None
@@ -410,37 +809,29 @@ class DPKGBuildHelper(interface.BuildHelper):
         if self._project_definition.dpkg_source_name:
             project_name = self._project_definition.dpkg_source_name
 
+        cleanup_service = self._build_context.GetCleanupService()
+
         filenames_to_ignore = re.compile(
             f"^{project_name:s}_{project_version!s}.orig.tar.gz"
         )
 
         # Remove files of previous versions in the format:
         # <project>_[0-9]*<suffix>.orig.tar.gz
-        for filename in glob.glob(f"{project_name:s}_[0-9]*.orig.tar.gz"):
+        for filename in cleanup_service.Glob(f"{project_name:s}_[0-9]*.orig.tar.gz"):
             if not filenames_to_ignore.match(filename):
                 logging.info(f"Removing: {filename:s}")
-                try:
-                    os.remove(filename)
-                except PermissionError as exception:
-                    logging.info(
-                        f"Unable to remove: {filename:s} with error: {exception!s}"
-                    )
+                cleanup_service.Remove(filename)
 
         # Remove files of previous versions in the format:
         # <project>_[0-9]*<suffix>~<distribution>.orig.tar.gz
         if version_suffix and distribution:
-            for filename in glob.glob(
+            for filename in cleanup_service.Glob(
                 f"{project_name:s}_[0-9]*{version_suffix:s}~{distribution:s}"
                 f".orig.tar.gz"
             ):
                 if not filenames_to_ignore.match(filename):
                     logging.info(f"Removing: {filename:s}")
-                    try:
-                        os.remove(filename)
-                    except PermissionError as exception:
-                        logging.info(
-                            f"Unable to remove: {filename:s} with error: {exception!s}"
-                        )
+                    cleanup_service.Remove(filename)
 
     def _RemoveOlderSourceDPKGPackages(self, project_name, project_version):
         """Removes previous versions of source dpkg packages.
@@ -452,22 +843,19 @@ class DPKGBuildHelper(interface.BuildHelper):
         if self._project_definition.dpkg_source_name:
             project_name = self._project_definition.dpkg_source_name
 
+        cleanup_service = self._build_context.GetCleanupService()
+
         filenames_to_ignore = re.compile(f"^{project_name:s}[-_].*{project_version!s}")
 
         # Remove files of previous versions in the format:
         # <project>[-_][0-9]*-[1-9]<suffix>~<distribution>_<architecture>.*
-        for filename in glob.glob(
+        for filename in cleanup_service.Glob(
             f"{project_name:s}[-_][0-9]*-[1-9]{self.version_suffix:s}~"
             f"{self.distribution:s}_{self.architecture:s}.*"
         ):
             if not filenames_to_ignore.match(filename):
                 logging.info(f"Removing: {filename:s}")
-                try:
-                    os.remove(filename)
-                except PermissionError as exception:
-                    logging.info(
-                        f"Unable to remove: {filename:s} with error: {exception!s}"
-                    )
+                cleanup_service.Remove(filename)
 
         # Remove files of previous versions in the format:
         # <project>[-_][0-9]*-[1-9]i<suffix>~<distribution>.*
@@ -475,17 +863,12 @@ class DPKGBuildHelper(interface.BuildHelper):
             f"{project_name:s}[-_][0-9]*-[1-9]{self.version_suffix:s}"
             f"~{self.distribution:s}.*"
         )
-        filenames = glob.glob(filenames_glob)
+        filenames = cleanup_service.Glob(filenames_glob)
 
         for filename in filenames:
             if not filenames_to_ignore.match(filename):
                 logging.info(f"Removing: {filename:s}")
-                try:
-                    os.remove(filename)
-                except PermissionError as exception:
-                    logging.info(
-                        f"Unable to remove: {filename:s} with error: {exception!s}"
-                    )
+                cleanup_service.Remove(filename)
 
     def _RunLSBReleaseCommand(self, option="-a"):
         """Runs the lsb-release command (/usr/bin/lsb_release).
@@ -565,7 +948,13 @@ class DPKGBuildHelper(interface.BuildHelper):
 class ConfigureMakeDPKGBuildHelper(DPKGBuildHelper):
     """Helper to build dpkg packages (.deb)."""
 
-    def __init__(self, project_definition, l2tdevtools_path, dependency_definitions):
+    def __init__(
+        self,
+        project_definition,
+        l2tdevtools_path,
+        dependency_definitions,
+        build_context=None,
+    ):
         """Initializes a build helper.
 
         Args:
@@ -574,8 +963,15 @@ class ConfigureMakeDPKGBuildHelper(DPKGBuildHelper):
           l2tdevtools_path (str): path to the l2tdevtools directory.
           dependency_definitions (dict[str, ProjectDefinition]): definitions of all
               projects, which is used to determine the properties of dependencies.
+          build_context (Optional[BuildContext]): build context, where None
+              represents a build context of the current working directory.
         """
-        super().__init__(project_definition, l2tdevtools_path, dependency_definitions)
+        super().__init__(
+            project_definition,
+            l2tdevtools_path,
+            dependency_definitions,
+            build_context=build_context,
+        )
         self.architecture = platform.machine()
         self.distribution = ""
         self.version_suffix = ""
@@ -611,7 +1007,7 @@ class ConfigureMakeDPKGBuildHelper(DPKGBuildHelper):
         # dpkg-buildpackage wants an source package filename without
         # the status indication and orig indication.
         self._CreateOriginalSourcePackage(
-            source_package_path, project_name, project_version
+            source_package_path, source_directory, project_name, project_version
         )
 
         source_package_filename = source_helper_object.GetSourcePackageFilename()
@@ -636,13 +1032,10 @@ class ConfigureMakeDPKGBuildHelper(DPKGBuildHelper):
         ):
             return False
 
-        log_file_path = os.path.join("..", self.LOG_FILENAME)
-        command = f"dpkg-buildpackage -uc -us -rfakeroot > {log_file_path:s} 2>&1"
-        exit_code = subprocess.call(
-            f"(cd {source_directory:s} && {command:s})", shell=True
-        )
+        command = ["dpkg-buildpackage", "-uc", "-us", "-rfakeroot"]
+        exit_code = self._RunCommand(command, working_directory=source_directory)
         if exit_code != 0:
-            logging.error(f'Running: "{command:s}" failed.')
+            logging.error(f'Running: "{shlex.join(command):s}" failed.')
             return False
 
         if not self._BuildFinalize(
@@ -655,6 +1048,8 @@ class ConfigureMakeDPKGBuildHelper(DPKGBuildHelper):
         ):
             return False
 
+        self._build_context.MoveBuildResults(os.path.dirname(source_directory))
+
         return True
 
     def CheckBuildRequired(self, source_helper_object):
@@ -669,7 +1064,7 @@ class ConfigureMakeDPKGBuildHelper(DPKGBuildHelper):
         project_name = source_helper_object.project_name
         project_version = source_helper_object.GetProjectVersion()
 
-        return not os.path.exists(
+        return not self._build_context.artifact_index.Contains(
             f"{project_name:s}_{project_version!s}-1_{self.architecture:s}.deb"
         )
 
@@ -691,7 +1086,13 @@ class ConfigureMakeDPKGBuildHelper(DPKGBuildHelper):
 class ConfigureMakeSourceDPKGBuildHelper(DPKGBuildHelper):
     """Helper to build source dpkg packages (.deb)."""
 
-    def __init__(self, project_definition, l2tdevtools_path, dependency_definitions):
+    def __init__(
+        self,
+        project_definition,
+        l2tdevtools_path,
+        dependency_definitions,
+        build_context=None,
+    ):
         """Initializes a build helper.
 
         Args:
@@ -700,8 +1101,15 @@ class ConfigureMakeSourceDPKGBuildHelper(DPKGBuildHelper):
           l2tdevtools_path (str): path to the l2tdevtools directory.
           dependency_definitions (dict[str, ProjectDefinition]): definitions of all
               projects, which is used to determine the properties of dependencies.
+          build_context (Optional[BuildContext]): build context, where None
+              represents a build context of the current working directory.
         """
-        super().__init__(project_definition, l2tdevtools_path, dependency_definitions)
+        super().__init__(
+            project_definition,
+            l2tdevtools_path,
+            dependency_definitions,
+            build_context=build_context,
+        )
         self._prep_script = "prep-dpkg-source.sh"
         self._post_script = "post-dpkg-source.sh"
         self.architecture = "source"
@@ -732,7 +1140,7 @@ class ConfigureMakeSourceDPKGBuildHelper(DPKGBuildHelper):
         project_version = source_helper_object.GetProjectVersion()
 
         self._CreateOriginalSourcePackage(
-            source_package_path, project_name, project_version
+            source_package_path, source_directory, project_name, project_version
         )
 
         source_package_filename = source_helper_object.GetSourcePackageFilename()
@@ -760,15 +1168,12 @@ class ConfigureMakeSourceDPKGBuildHelper(DPKGBuildHelper):
         ):
             return False
 
-        log_file_path = os.path.join("..", self.LOG_FILENAME)
-        command = f"debuild -S -sa > {log_file_path:s} 2>&1"
-        exit_code = subprocess.call(
-            f"(cd {source_directory:s} && {command:s})", shell=True
-        )
+        command = ["debuild", "-S", "-sa"]
+        exit_code = self._RunCommand(command, working_directory=source_directory)
         if exit_code != 0:
             logging.error(
-                f'Failed to run: "(cd {source_directory:s} && {command:s})" with '
-                f"exit code {exit_code:d}"
+                f'Failed to run: "{shlex.join(command):s}" in: {source_directory:s} '
+                f"with exit code {exit_code:d}"
             )
             return False
 
@@ -782,8 +1187,27 @@ class ConfigureMakeSourceDPKGBuildHelper(DPKGBuildHelper):
         ):
             return False
 
+        self._build_context.MoveBuildResults(os.path.dirname(source_directory))
+
         return True
 
+    def BuildDistributions(self, source_helper_object, distributions):
+        """Builds the source dpkg packages of multiple distributions in parallel.
+
+        Args:
+          source_helper_object (SourceHelper): source helper.
+          distributions (list[str]): distributions.
+
+        Returns:
+          list[str]: distributions for which the build failed.
+        """
+        return self._BuildSourceDistributions(
+            source_helper_object,
+            source_helper_object.project_name,
+            source_helper_object.GetProjectVersion(),
+            distributions,
+        )
+
     def CheckBuildRequired(self, source_helper_object):
         """Checks if a build is required.
 
@@ -796,7 +1220,7 @@ class ConfigureMakeSourceDPKGBuildHelper(DPKGBuildHelper):
         project_name = source_helper_object.project_name
         project_version = source_helper_object.GetProjectVersion()
 
-        return not os.path.exists(
+        return not self._build_context.artifact_index.Contains(
             f"{project_name:s}_{project_version!s}-1{self.version_suffix:s}"
             f"~{self.distribution:s}_{self.architecture:s}.changes"
         )
@@ -819,38 +1243,60 @@ class ConfigureMakeSourceDPKGBuildHelper(DPKGBuildHelper):
 class PybuildDPKGBuildHelperBase(DPKGBuildHelper):
     """Shared functionality for dh-pybuild build system dpkg build helpers."""
 
-    def _DetermineBuildConfiguration(self, source_directory):
-        """Determines the build configuration of a project that has setup.py.
+    _DISTRIBUTION_NAME_NORMALIZE_REGEX = re.compile(r"[-_.]+")
+
+    # The build configurations are shared by all dh-pybuild dpkg build helpers
+    # in the process, per project name and version.
+    _build_configurations = {}
+
+    def _DetermineBuildConfiguration(self, source_directory, project_version):
+        """Determines the build configuration of a project.
 
         Args:
           source_directory (str): path of the source directory.
+          project_version (str): version of the project.
 
         Returns:
           DPKGBuildConfiguration: dpkg build configuration or None if the build
               configuration could not be determined.
         """
+        lookup_key = (self._project_definition.name, project_version)
+        build_configuration = self._build_configurations.get(lookup_key, None)
+        if build_configuration:
+            return build_configuration
+
         if os.path.isfile(os.path.join(source_directory, "pyproject.toml")):
-            command = (
-                f"{sys.executable:s} -m pip install --no-deps -t installroot . "
-                f"> /dev/null 2>&1"
+            build_configuration = self._DetermineBuildConfigurationFromWheel(
+                source_directory, project_version
             )
 
         elif os.path.isfile(os.path.join(source_directory, "setup.py")):
-            command = (
-                f"{sys.executable:s} setup.py install --root=installroot "
-                f"> /dev/null 2>&1"
+            build_configuration = self._DetermineBuildConfigurationFromInstall(
+                source_directory
             )
 
-        else:
-            return None
+        if build_configuration:
+            self._build_configurations[lookup_key] = build_configuration
+
+        return build_configuration
+
+    def _DetermineBuildConfigurationFromInstall(self, source_directory):
+        """Determines the build configuration of a project that has setup.py.
+
+        Args:
+          source_directory (str): path of the source directory.
+
+        Returns:
+          DPKGBuildConfiguration: dpkg build configuration or None if the build
+              configuration could not be determined.
+        """
+        command = [sys.executable, "setup.py", "install", "--root=installroot"]
 
         installroot_path = os.path.join(source_directory, "installroot")
 
-        exit_code = subprocess.call(
-            f"(cd {source_directory:s} && {command:s})", shell=True
-        )
+        exit_code = self._RunCommand(command, working_directory=source_directory)
         if exit_code != 0:
-            logging.error(f'Running: "{command:s}" failed.')
+            logging.error(f'Running: "{shlex.join(command):s}" failed.')
             build_configuration = None
 
         else:
@@ -907,11 +1353,207 @@ class PybuildDPKGBuildHelperBase(DPKGBuildHelper):
 
         return build_configuration
 
+    def _DetermineBuildConfigurationFromWheel(self, source_directory, project_version):
+        """Determines the build configuration of a project that has pyproject.toml.
+
+        The build configuration is determined from the RECORD of the wheel of
+        the project. A wheel of the same version in the build directory is used
+        if available, otherwise a wheel is built in a temporary directory. The
+        wheel is not installed.
+
+        Args:
+          source_directory (str): path of the source directory.
+          project_version (str): version of the project.
+
+        Returns:
+          DPKGBuildConfiguration: dpkg build configuration or None if the build
+              configuration could not be determined.
+        """
+        distribution_name = self._GetDistributionName(source_directory)
+
+        wheel_path = None
+        if distribution_name:
+            wheel_path = self._GetWheelPath(
+                self._build_context.working_directory,
+                distribution_name,
+                project_version,
+            )
+
+        if wheel_path:
+            return self._ReadWheelBuildConfiguration(wheel_path)
+
+        temporary_directory = tempfile.mkdtemp(dir=self._build_context.scratch_path)
+        try:
+            command = [
+                sys.executable,
+                "-m",
+                "pip",
+                "wheel",
+                "--no-deps",
+                "--wheel-dir",
+                temporary_directory,
+                source_directory,
+            ]
+            exit_code = self._RunCommand(command, working_directory=source_directory)
+            if exit_code != 0:
+                logging.error(f'Running: "{shlex.join(command):s}" failed.')
+                return None
+
+            wheel_paths = glob.glob(os.path.join(temporary_directory, "*.whl"))
+            if len(wheel_paths) != 1:
+                logging.error(f"Unable to find wheel of: {source_directory:s}")
+                return None
+
+            return self._ReadWheelBuildConfiguration(wheel_paths[0])
+
+        finally:
+            shutil.rmtree(temporary_directory, ignore_errors=True)
+
+    def _GetDistributionName(self, source_directory):
+        """Retrieves the normalized distribution name from the project metadata.
+
+        The name is read from pyproject.toml or PKG-INFO.
+
+        Args:
+          source_directory (str): path of the source directory.
+
+        Returns:
+          str: normalized distribution name, as used in wheel filenames, or None
+              if not available.
+        """
+        name = None
+
+        pyproject_toml_path = os.path.join(source_directory, "pyproject.toml")
+        if os.path.isfile(pyproject_toml_path):
+            try:
+                with open(pyproject_toml_path, "rb") as file_object:
+                    pyproject_toml = tomllib.load(file_object)
+
+                name = pyproject_toml.get("project", {}).get("name", None)
+
+            except (OSError, tomllib.TOMLDecodeError) as exception:
+                logging.warning(
+                    f"Unable to read: {pyproject_toml_path:s} with error: "
+                    f"{exception!s}"
+                )
+
+        pkg_info_path = os.path.join(source_directory, "PKG-INFO")
+        if not name and os.path.isfile(pkg_info_path):
+            with open(pkg_info_path, "r", encoding="utf-8") as file_object:
+                for line in file_object:
+                    key, _, value = line.partition(":")
+                    if key == "Name":
+                        name = value.strip()
+                        break
+
+                    # The metadata headers are followed by an empty line.
+                    if not line.strip():
+                        break
+
+        if not name:
+            return None
+
+        return self._DISTRIBUTION_NAME_NORMALIZE_REGEX.sub("_", name).lower()
+
+    def _GetWheelPath(self, path, distribution_name, project_version):
+        """Retrieves the path of a wheel of a specific project version.
+
+        Args:
+          path (str): path of the directory that contains the wheels.
+          distribution_name (str): normalized distribution name.
+          project_version (str): version of the project.
+
+        Returns:
+          str: path of the wheel or None if not available.
+        """
+        filename_prefix = f"{distribution_name:s}-{project_version!s}-"
+        for filename in sorted(os.listdir(path)):
+            if filename.endswith(".whl") and filename.lower().startswith(
+                filename_prefix
+            ):
+                return os.path.join(path, filename)
+
+        return None
+
+    def _ReadWheelBuildConfiguration(self, path):
+        """Reads the build configuration from the RECORD of a wheel.
+
+        Args:
+          path (str): path of the wheel.
+
+        Returns:
+          DPKGBuildConfiguration: dpkg build configuration or None if the build
+              configuration could not be determined.
+        """
+        try:
+            with zipfile.ZipFile(path, "r") as zip_file:
+                record_names = [
+                    name
+                    for name in zip_file.namelist()
+                    if name.endswith(".dist-info/RECORD") and name.count("/") == 1
+                ]
+                if len(record_names) != 1:
+                    logging.error(f"Missing RECORD in wheel: {path:s}")
+                    return None
+
+                record_data = zip_file.read(record_names[0]).decode("utf-8")
+
+        except (OSError, UnicodeDecodeError, zipfile.BadZipFile) as exception:
+            logging.error(f"Unable to read wheel: {path:s} with error: {exception!s}")
+            return None
+
+        build_configuration = dpkg_files.DPKGBuildConfiguration()
+        module_directories = set()
+
+        for row in csv.reader(io.StringIO(record_data)):
+            if not row:
+                continue
+
+            path_segment, _, remainder = row[0].partition("/")
+
+            # The purelib and platlib data of a wheel is installed in the same
+            # directory as the modules.
+            if path_segment.endswith(".data"):
+                data_type, _, remainder = remainder.partition("/")
+                if data_type == "scripts":
+                    # Mimics the installed scripts detection of setup.py install.
+                    if remainder.endswith(".py"):
+                        build_configuration.has_bin_directory = True
+                    continue
+
+                if data_type not in ("platlib", "purelib"):
+                    continue
+
+                path_segment, _, remainder = remainder.partition("/")
+
+            if path_segment.endswith(".dist-info"):
+                build_configuration.has_dist_info_directory = True
+
+            elif remainder:
+                if path_segment != "__pycache__":
+                    module_directories.add(path_segment)
+
+            elif path_segment.endswith(".py"):
+                build_configuration.has_module_source_files = True
+
+            elif path_segment.endswith(".so"):
+                build_configuration.has_module_shared_object = True
+
+        build_configuration.module_directories = sorted(module_directories)
+
+        return build_configuration
+
 
 class PybuildDPKGBuildHelper(PybuildDPKGBuildHelperBase):
     """Helper to build dpkg packages (.deb) using dh-pybuild build system."""
 
-    def __init__(self, project_definition, l2tdevtools_path, dependency_definitions):
+    def __init__(
+        self,
+        project_definition,
+        l2tdevtools_path,
+        dependency_definitions,
+        build_context=None,
+    ):
         """Initializes a build helper.
 
         Args:
@@ -920,8 +1562,15 @@ class PybuildDPKGBuildHelper(PybuildDPKGBuildHelperBase):
           l2tdevtools_path (str): path to the l2tdevtools directory.
           dependency_definitions (dict[str, ProjectDefinition]): definitions of all
               projects, which is used to determine the properties of dependencies.
+          build_context (Optional[BuildContext]): build context, where None
+              represents a build context of the current working directory.
         """
-        super().__init__(project_definition, l2tdevtools_path, dependency_definitions)
+        super().__init__(
+            project_definition,
+            l2tdevtools_path,
+            dependency_definitions,
+            build_context=build_context,
+        )
         self.architecture = platform.machine()
         self.distribution = ""
         self.version_suffix = ""
@@ -990,7 +1639,10 @@ class PybuildDPKGBuildHelper(PybuildDPKGBuildHelperBase):
         # Note that we need to pass the original project name to
         # _CreateOriginalSourcePackage.
         self._CreateOriginalSourcePackage(
-            source_package_path, source_helper_object.project_name, project_version
+            source_package_path,
+            source_directory,
+            source_helper_object.project_name,
+            project_version,
         )
 
         source_package_filename = source_helper_object.GetSourcePackageFilename()
@@ -1015,15 +1667,12 @@ class PybuildDPKGBuildHelper(PybuildDPKGBuildHelperBase):
         ):
             return False
 
-        log_file_path = os.path.join("..", self.LOG_FILENAME)
-        command = f"dpkg-buildpackage -uc -us -rfakeroot > {log_file_path:s} 2>&1"
-        exit_code = subprocess.call(
-            f"(cd {source_directory:s} && {command:s})", shell=True
-        )
+        command = ["dpkg-buildpackage", "-uc", "-us", "-rfakeroot"]
+        exit_code = self._RunCommand(command, working_directory=source_directory)
         if exit_code != 0:
             logging.error(
-                f'Failed to run: "(cd {source_directory:s} && {command:s})" with '
-                f"exit code {exit_code:d}"
+                f'Failed to run: "{shlex.join(command):s}" in: {source_directory:s} '
+                f"with exit code {exit_code:d}"
             )
             return False
 
@@ -1037,6 +1686,8 @@ class PybuildDPKGBuildHelper(PybuildDPKGBuildHelperBase):
         ):
             return False
 
+        self._build_context.MoveBuildResults(os.path.dirname(source_directory))
+
         return True
 
     def CheckBuildRequired(self, source_helper_object):
@@ -1052,7 +1703,7 @@ class PybuildDPKGBuildHelper(PybuildDPKGBuildHelperBase):
             source_helper_object
         )
 
-        return not os.path.exists(
+        return not self._build_context.artifact_index.Contains(
             f"{project_name:s}_{project_version!s}-1_{self.architecture:s}.deb"
         )
 
@@ -1091,7 +1742,13 @@ class PybuildDPKGBuildHelper(PybuildDPKGBuildHelperBase):
 class PybuildSourceDPKGBuildHelper(PybuildDPKGBuildHelperBase):
     """Helper to build source dpkg packages using setup.py build system."""
 
-    def __init__(self, project_definition, l2tdevtools_path, dependency_definitions):
+    def __init__(
+        self,
+        project_definition,
+        l2tdevtools_path,
+        dependency_definitions,
+        build_context=None,
+    ):
         """Initializes a build helper.
 
         Args:
@@ -1100,8 +1757,15 @@ class PybuildSourceDPKGBuildHelper(PybuildDPKGBuildHelperBase):
           l2tdevtools_path (str): path to the l2tdevtools directory.
           dependency_definitions (dict[str, ProjectDefinition]): definitions of all
               projects, which is used to determine the properties of dependencies.
+          build_context (Optional[BuildContext]): build context, where None
+              represents a build context of the current working directory.
         """
-        super().__init__(project_definition, l2tdevtools_path, dependency_definitions)
+        super().__init__(
+            project_definition,
+            l2tdevtools_path,
+            dependency_definitions,
+            build_context=build_context,
+        )
         self._prep_script = "prep-dpkg-source.sh"
         self._post_script = "post-dpkg-source.sh"
         self.architecture = "source"
@@ -1162,7 +1826,10 @@ class PybuildSourceDPKGBuildHelper(PybuildDPKGBuildHelperBase):
         # Note that we need to pass the original project name to
         # _CreateOriginalSourcePackage.
         self._CreateOriginalSourcePackage(
-            source_package_path, source_helper_object.project_name, project_version
+            source_package_path,
+            source_directory,
+            source_helper_object.project_name,
+            project_version,
         )
 
         source_package_filename = source_helper_object.GetSourcePackageFilename()
@@ -1190,15 +1857,12 @@ class PybuildSourceDPKGBuildHelper(PybuildDPKGBuildHelperBase):
         ):
             return False
 
-        log_file_path = os.path.join("..", self.LOG_FILENAME)
-        command = f"debuild -S -sa > {log_file_path:s} 2>&1"
-        exit_code = subprocess.call(
-            f"(cd {source_directory:s} && {command:s})", shell=True
-        )
+        command = ["debuild", "-S", "-sa"]
+        exit_code = self._RunCommand(command, working_directory=source_directory)
         if exit_code != 0:
             logging.error(
-                f'Failed to run: "(cd {source_directory:s} && {command:s})" with '
-                f"exit code {exit_code:d}"
+                f'Failed to run: "{shlex.join(command):s}" in: {source_directory:s} '
+                f"with exit code {exit_code:d}"
             )
 
         if not self._BuildFinalize(
@@ -1211,8 +1875,28 @@ class PybuildSourceDPKGBuildHelper(PybuildDPKGBuildHelperBase):
         ):
             return False
 
+        self._build_context.MoveBuildResults(os.path.dirname(source_directory))
+
         return True
 
+    def BuildDistributions(self, source_helper_object, distributions):
+        """Builds the source dpkg packages of multiple distributions in parallel.
+
+        Args:
+          source_helper_object (SourceHelper): source helper.
+          distributions (list[str]): distributions.
+
+        Returns:
+          list[str]: distributions for which the build failed.
+        """
+        project_name, project_version = self._GetFilenameSafeProjectInformation(
+            source_helper_object
+        )
+
+        return self._BuildSourceDistributions(
+            source_helper_object, project_name, project_version, distributions
+        )
+
     def CheckBuildRequired(self, source_helper_object):
         """Checks if a build is required.
 
@@ -1226,7 +1910,7 @@ class PybuildSourceDPKGBuildHelper(PybuildDPKGBuildHelperBase):
             source_helper_object
         )
 
-        return not os.path.exists(
+        return not self._build_context.artifact_index.Contains(
             f"{project_name:s}_{project_version!s}-1{self.version_suffix:s}"
             f"~{self.distribution:s}_{self.architecture:s}.changes"
         )
@@ -37,7 +37,12 @@ class BuildHelperFactory:
 
     @classmethod
     def NewBuildHelper(
-        cls, project_definition, build_target, l2tdevtools_path, dependency_definitions
+        cls,
+        project_definition,
+        build_target,
+        l2tdevtools_path,
+        dependency_definitions,
+        build_context=None,
     ):
         """Creates a new build helper.
 
@@ -48,6 +53,8 @@ class BuildHelperFactory:
           l2tdevtools_path (str): path to the l2tdevtools directory.
           dependency_definitions (dict[str, ProjectDefinition]): definitions of all
               projects, which is used to determine the properties of dependencies.
+          build_context (Optional[BuildContext]): build context, where None
+              represents a build context of the current working directory.
 
         Returns:
           BuildHelper: build helper or None if build system is not supported.
@@ -78,5 +85,8 @@ class BuildHelperFactory:
             return None
 
         return build_helper_class(
-            project_definition, l2tdevtools_path, dependency_definitions
+            project_definition,
+            l2tdevtools_path,
+            dependency_definitions,
+            build_context=build_context,
         )
@@ -1,18 +1,27 @@
 """Helper for building projects from source."""
 
-import glob
 import logging
 import os
 import re
-import shutil
 
+from l2tdevtools import build_context as context_lib
 
-class BuildHelper:
-    """Helper to build projects from source."""
-
-    LOG_FILENAME = "build.log"
 
-    def __init__(self, project_definition, l2tdevtools_path, dependency_definitions):
+class BuildHelper:
+    """Helper to build projects from source.
+
+    Attributes:
+      distribution (str): name of the distribution to build for, where None
+          or an empty string represents the build host distribution.
+    """
+
+    def __init__(
+        self,
+        project_definition,
+        l2tdevtools_path,
+        dependency_definitions,
+        build_context=None,
+    ):
         """Initializes a build helper.
 
         Args:
@@ -21,12 +30,17 @@ class BuildHelper:
           l2tdevtools_path (str): path to the l2tdevtools directory.
           dependency_definitions (dict[str, ProjectDefinition]): definitions of all
               projects, which is used to determine the properties of dependencies.
+          build_context (Optional[BuildContext]): build context, where None
+              represents a build context of the current working directory.
         """
         super().__init__()
+        self._build_context = build_context or context_lib.BuildContext(os.getcwd())
         self._data_path = os.path.join(l2tdevtools_path, "data")
         self._dependency_definitions = dependency_definitions
         self._project_definition = project_definition
 
+        self.distribution = None
+
     def _RemoveOlderSourceDirectories(self, project_name, project_version):
         """Removes previous versions of source directories.
 
@@ -36,13 +50,17 @@ class BuildHelper:
         """
         filenames_to_ignore = re.compile(f"^{project_name:s}-.*{project_version!s}")
 
+        cleanup_service = self._build_context.GetCleanupService()
+
         # Remove previous versions of source directories in the format:
         # <project>-[0-9]*
-        filenames = glob.glob(f"{project_name:s}-[0-9]*")
+        filenames = cleanup_service.Glob(
+            f"{project_name:s}-[0-9]*", directories_only=True
+        )
         for filename in filenames:
-            if os.path.isdir(filename) and not filenames_to_ignore.match(filename):
+            if not filenames_to_ignore.match(filename):
                 logging.info(f"Removing: {filename:s}")
-                shutil.rmtree(filename, ignore_errors=True)
+                cleanup_service.Remove(filename)
 
     def _RemoveOlderSourcePackages(self, project_name, project_version):
         """Removes previous versions of source packages.
@@ -53,29 +71,58 @@ class BuildHelper:
         """
         filenames_to_ignore = re.compile(f"^{project_name:s}-.*{project_version!s}")
 
+        cleanup_service = self._build_context.GetCleanupService()
+
         # Remove previous versions of source packages in the format:
         # <project>-[0-9]*.tar.gz
-        filenames = glob.glob(f"{project_name:s}-[0-9]*.tar.gz")
+        filenames = cleanup_service.Glob(f"{project_name:s}-[0-9]*.tar.gz")
         for filename in filenames:
             if not filenames_to_ignore.match(filename):
                 logging.info(f"Removing: {filename:s}")
-                os.remove(filename)
+                cleanup_service.Remove(filename)
 
         # Remove previous versions of source packages in the format:
         # <project>-[0-9]*.tgz
-        filenames = glob.glob(f"{project_name:s}-[0-9]*.tgz")
+        filenames = cleanup_service.Glob(f"{project_name:s}-[0-9]*.tgz")
         for filename in filenames:
             if not filenames_to_ignore.match(filename):
                 logging.info(f"Removing: {filename:s}")
-                os.remove(filename)
+                cleanup_service.Remove(filename)
 
         # Remove previous versions of source packages in the format:
         # <project>-[0-9]*.zip
-        filenames = glob.glob(f"{project_name:s}-[0-9]*.zip")
+        filenames = cleanup_service.Glob(f"{project_name:s}-[0-9]*.zip")
         for filename in filenames:
             if not filenames_to_ignore.match(filename):
                 logging.info(f"Removing: {filename:s}")
-                os.remove(filename)
+                cleanup_service.Remove(filename)
+
+    def _RunCommand(self, command, working_directory=None, distribution=None):
+        """Runs a build command.
+
+        The output of the command is stored in the build log file of the project
+        and distribution.
+
+        Args:
+          command (list[str]): command and its arguments.
+          working_directory (Optional[str]): path of the directory to run
+              the command in, where None represents the working directory of
+              the build context.
+          distribution (Optional[str]): name of the distribution the command is
+              run for, where None represents the distribution of the helper.
+
+        Returns:
+          int: exit code of the command.
+        """
+        if distribution is None:
+            distribution = self.distribution
+
+        return self._build_context.RunCommand(
+            command,
+            working_directory=working_directory,
+            project_name=self._project_definition.name,
+            distribution=distribution,
+        )
 
     def CheckBuildDependencies(self):
         """Checks if the build dependencies are met.
@@ -1,12 +1,15 @@
 """Helper for building projects from source."""
 
+import abc
 import glob
 import logging
 import os
 import platform
 import re
+import shlex
 import shutil
 import subprocess
+import tempfile
 
 from l2tdevtools.build_helpers import interface
 from l2tdevtools import spec_file
@@ -48,7 +51,17 @@ class BaseRPMBuildHelper(interface.BuildHelper):
         "zlib": ["zlib-ng-devel"],
     }
 
-    def __init__(self, project_definition, l2tdevtools_path, dependency_definitions):
+    # The names of the installed packages are shared by all rpm build helpers
+    # in the process, so that rpm is only run once.
+    _installed_packages = None
+
+    def __init__(
+        self,
+        project_definition,
+        l2tdevtools_path,
+        dependency_definitions,
+        build_context=None,
+    ):
         """Initializes a build helper.
 
         Args:
@@ -57,17 +70,24 @@ class BaseRPMBuildHelper(interface.BuildHelper):
           l2tdevtools_path (str): path to the l2tdevtools directory.
           dependency_definitions (dict[str, ProjectDefinition]): definitions of all
               projects, which is used to determine the properties of dependencies.
+          build_context (Optional[BuildContext]): build context, where None
+              represents a build context of the current working directory.
         """
-        super().__init__(project_definition, l2tdevtools_path, dependency_definitions)
+        super().__init__(
+            project_definition,
+            l2tdevtools_path,
+            dependency_definitions,
+            build_context=build_context,
+        )
         self.architecture = platform.machine()
+        self.rpmbuild_path = None
 
-        self.rpmbuild_path = os.path.join("~", "rpmbuild")
-        self.rpmbuild_path = os.path.expanduser(self.rpmbuild_path)
+        self._rpmbuild_rpms_path = None
+        self._rpmbuild_sources_path = None
+        self._rpmbuild_specs_path = None
+        self._rpmbuild_srpms_path = None
 
-        self._rpmbuild_rpms_path = os.path.join(self.rpmbuild_path, "RPMS")
-        self._rpmbuild_sources_path = os.path.join(self.rpmbuild_path, "SOURCES")
-        self._rpmbuild_specs_path = os.path.join(self.rpmbuild_path, "SPECS")
-        self._rpmbuild_srpms_path = os.path.join(self.rpmbuild_path, "SRPMS")
+        self._SetRPMBuildPath(self._build_context.rpmbuild_path)
 
     def _BuildFromSpecFile(self, spec_filename, rpmbuild_flags="-ba"):
         """Builds the rpms directly from a spec file.
@@ -82,18 +102,16 @@ class BaseRPMBuildHelper(interface.BuildHelper):
         """
         spec_filename = os.path.join("SPECS", spec_filename)
 
-        current_path = os.getcwd()
-        os.chdir(self.rpmbuild_path)
-
-        command = (
-            f"rpmbuild {rpmbuild_flags:s} {spec_filename:s} > "
-            f"{self.LOG_FILENAME:s} 2>&1"
-        )
-        exit_code = subprocess.call(command, shell=True)
+        command = [
+            "rpmbuild",
+            "--define",
+            f"_topdir {self.rpmbuild_path:s}",
+            *shlex.split(rpmbuild_flags),
+            spec_filename,
+        ]
+        exit_code = self._RunCommand(command, working_directory=self.rpmbuild_path)
         if exit_code != 0:
-            logging.error(f'Running: "{command:s}" failed.')
-
-        os.chdir(current_path)
+            logging.error(f'Running: "{shlex.join(command):s}" failed.')
 
         return exit_code == 0
 
@@ -109,13 +127,16 @@ class BaseRPMBuildHelper(interface.BuildHelper):
         Returns:
           bool: True if successful, False otherwise.
         """
-        command = (
-            f"rpmbuild {rpmbuild_flags:s} {source_package_filename:s} > "
-            f"{self.LOG_FILENAME:s} 2>&1"
-        )
-        exit_code = subprocess.call(command, shell=True)
+        command = [
+            "rpmbuild",
+            "--define",
+            f"_topdir {self.rpmbuild_path:s}",
+            *shlex.split(rpmbuild_flags),
+            source_package_filename,
+        ]
+        exit_code = self._RunCommand(command)
         if exit_code != 0:
-            logging.error(f'Running: "{command:s}" failed.')
+            logging.error(f'Running: "{shlex.join(command):s}" failed.')
             return False
 
         return True
@@ -129,10 +150,7 @@ class BaseRPMBuildHelper(interface.BuildHelper):
         Returns:
           bool: True if the package is installed, False otherwise.
         """
-        exit_code = subprocess.call(
-            f"rpm -qi {package_name:s} >/dev/null 2>&1", shell=True
-        )
-        return exit_code == 0
+        return package_name in self._GetInstalledPackages()
 
     def _CopySourcePackageToRPMBuildSources(self, source_package_path):
         """Copies the source package to the rpmbuild SOURCES directory.
@@ -160,6 +178,22 @@ class BaseRPMBuildHelper(interface.BuildHelper):
         if not os.path.exists(self._rpmbuild_specs_path):
             os.mkdir(self._rpmbuild_specs_path)
 
+    def _CreatePrivateRPMBuildPath(self, project_name, project_version):
+        """Creates a private rpmbuild top directory for a build.
+
+        Args:
+          project_name (str): name of the project.
+          project_version (str): version of the project.
+        """
+        os.makedirs(self._build_context.rpmbuild_path, exist_ok=True)
+
+        rpmbuild_path = tempfile.mkdtemp(
+            prefix=f"{project_name:s}-{project_version!s}-",
+            dir=self._build_context.rpmbuild_path,
+        )
+        self._SetRPMBuildPath(rpmbuild_path)
+        self._CreateRPMbuildDirectories()
+
     def _CreateSpecFile(self, project_name, spec_file_data):
         """Creates a spec file in the rpmbuild directory.
 
@@ -202,8 +236,33 @@ class BaseRPMBuildHelper(interface.BuildHelper):
 
         return project_name, project_version
 
+    def _GetInstalledPackages(self):
+        """Retrieves the names of the installed packages.
+
+        Returns:
+          set[str]: names of the installed packages.
+        """
+        installed_packages = BaseRPMBuildHelper._installed_packages
+        if installed_packages is None:
+            command = ["rpm", "-qa", "--qf", "%{NAME}\n"]
+            try:
+                output = subprocess.check_output(command, stderr=subprocess.DEVNULL)
+            except (OSError, subprocess.CalledProcessError) as exception:
+                command_string = " ".join(command)
+                logging.error(
+                    f'Running: "{command_string:s}" failed with error: {exception!s}'
+                )
+                output = b""
+
+            installed_packages = self._ParseInstalledPackages(
+                output.decode("utf-8", errors="replace")
+            )
+            BaseRPMBuildHelper._installed_packages = installed_packages
+
+        return installed_packages
+
     def _MoveFilesToCurrentDirectory(self, filenames_glob):
-        """Moves files into the current directory.
+        """Moves files into the working directory of the build context.
 
         Args:
           filenames_glob (str): glob of the filenames to move.
@@ -213,10 +272,94 @@ class BaseRPMBuildHelper(interface.BuildHelper):
             logging.info(f"Moving: {filename:s}")
 
             local_filename = os.path.basename(filename)
-            if os.path.exists(local_filename):
-                os.remove(local_filename)
+            local_path = self._build_context.GetPath(local_filename)
+            if os.path.exists(local_path):
+                os.remove(local_path)
+
+            shutil.move(filename, self._build_context.working_directory)
+            self._build_context.artifact_index.Add(local_filename)
+
+    def _MoveRPMBuildResults(self):
+        """Moves the rpms from the private rpmbuild top directory.
+
+        The RPMS/<architecture> and SRPMS sub directories of the private rpmbuild
+        top directory only contain the results of the current build, hence all
+        the rpms in them are moved into the working directory of the build
+        context.
+        """
+        paths = []
+        if os.path.isdir(self._rpmbuild_rpms_path):
+            with os.scandir(self._rpmbuild_rpms_path) as directory_entries:
+                paths.extend(
+                    directory_entry.path
+                    for directory_entry in directory_entries
+                    if directory_entry.is_dir()
+                )
+
+        if os.path.isdir(self._rpmbuild_srpms_path):
+            paths.append(self._rpmbuild_srpms_path)
+
+        for path in paths:
+            with os.scandir(path) as directory_entries:
+                rpm_paths = [
+                    directory_entry.path
+                    for directory_entry in directory_entries
+                    if directory_entry.is_file()
+                    and directory_entry.name.endswith(".rpm")
+                ]
+
+            for rpm_path in rpm_paths:
+                logging.info(f"Moving: {rpm_path:s}")
+
+                # Note that shutil.move() is used since the private rpmbuild top
+                # directory can be on a different file system, such as tmpfs.
+                rpm_filename = os.path.basename(rpm_path)
+                shutil.move(rpm_path, self._build_context.GetPath(rpm_filename))
+                self._build_context.artifact_index.Add(rpm_filename)
+
+    @abc.abstractmethod
+    def _MoveRPMs(self, project_name, project_version):
+        """Moves the rpms from the rpmbuild directory into the current directory.
 
-            shutil.move(filename, ".")
+        Args:
+          project_name (str): name of the project.
+          project_version (str): version of the project.
+        """
+
+    def _ParseInstalledPackages(self, output):
+        """Parses the names of the installed packages from rpm output.
+
+        Args:
+          output (str): output of rpm, with a package name per line.
+
+        Returns:
+          set[str]: names of the installed packages.
+        """
+        return {package_name for package_name in output.split("\n") if package_name}
+
+    def _RemovePrivateRPMBuildPath(self):
+        """Removes the private rpmbuild top directory of a build in the background."""
+        if self.rpmbuild_path != self._build_context.rpmbuild_path:
+            logging.info(f"Removing: {self.rpmbuild_path:s}")
+            cleanup_service = self._build_context.GetCleanupService(
+                self._build_context.rpmbuild_path
+            )
+            cleanup_service.Remove(self.rpmbuild_path)
+
+            self._SetRPMBuildPath(self._build_context.rpmbuild_path)
+
+    def _SetRPMBuildPath(self, rpmbuild_path):
+        """Sets the rpmbuild top directory.
+
+        Args:
+          rpmbuild_path (str): path of the rpmbuild top directory.
+        """
+        self.rpmbuild_path = rpmbuild_path
+
+        self._rpmbuild_rpms_path = os.path.join(rpmbuild_path, "RPMS")
+        self._rpmbuild_sources_path = os.path.join(rpmbuild_path, "SOURCES")
+        self._rpmbuild_specs_path = os.path.join(rpmbuild_path, "SPECS")
+        self._rpmbuild_srpms_path = os.path.join(rpmbuild_path, "SRPMS")
 
     def CheckBuildDependencies(self):
         """Checks if the build dependencies are met.
@@ -243,6 +386,25 @@ class BaseRPMBuildHelper(interface.BuildHelper):
 class RPMBuildHelper(BaseRPMBuildHelper):
     """Helper to build RPM packages (.rpm)."""
 
+    # pylint: disable=abstract-method
+
+    def _MoveBuildResults(self, project_name, project_version):
+        """Moves the rpms into the working directory and removes the build directory.
+
+        Args:
+          project_name (str): name of the project.
+          project_version (str): version of the project.
+        """
+        if self._build_context.private_rpmbuild:
+            # The private rpmbuild top directory, including the build directory,
+            # is removed after the build.
+            self._MoveRPMBuildResults()
+        else:
+            self._MoveRPMs(project_name, project_version)
+
+            setup_name = self._project_definition.setup_name or project_name
+            self._RemoveBuildDirectory(setup_name, project_version)
+
     def _RemoveBuildDirectory(self, project_name, project_version):
         """Removes build directory.
 
@@ -267,17 +429,22 @@ class RPMBuildHelper(BaseRPMBuildHelper):
           project_name (str): name of the project.
           project_version (str): version of the project.
         """
+        if self._build_context.private_rpmbuild:
+            # Private rpmbuild top directories are removed after every build.
+            return
+
         filenames_to_ignore = re.compile(f"{project_name:s}-{project_version!s}")
 
-        filenames_glob = os.path.join(
-            self.rpmbuild_path, "BUILD", f"{project_name:s}-*"
+        cleanup_service = self._build_context.GetCleanupService(
+            os.path.join(self.rpmbuild_path, "BUILD")
         )
-        filenames = glob.glob(filenames_glob)
 
-        for filename in filenames:
+        for filename in cleanup_service.Glob(
+            f"{project_name:s}-*", directories_only=True
+        ):
             if not filenames_to_ignore.match(filename):
                 logging.info(f"Removing: {filename:s}")
-                shutil.rmtree(filename, ignore_errors=True)
+                cleanup_service.Remove(filename)
 
     def _RemoveOlderRPMs(self, project_name, project_version):
         """Removes previous versions of .rpm files.
@@ -292,22 +459,25 @@ class RPMBuildHelper(BaseRPMBuildHelper):
         filenames_to_ignore = re.compile(filenames_to_ignore)
 
         rpm_filenames_glob = f"*{project_name:s}-*-1.{self.architecture:s}.rpm"
-        filenames = glob.glob(rpm_filenames_glob)
 
-        for filename in filenames:
+        cleanup_service = self._build_context.GetCleanupService()
+
+        for filename in cleanup_service.Glob(rpm_filenames_glob):
             if not filenames_to_ignore.match(filename):
                 logging.info(f"Removing: {filename:s}")
-                os.remove(filename)
+                cleanup_service.Remove(filename)
 
-        filenames_glob = os.path.join(
-            self.rpmbuild_path, "RPMS", self.architecture, rpm_filenames_glob
+        if self._build_context.private_rpmbuild:
+            return
+
+        cleanup_service = self._build_context.GetCleanupService(
+            os.path.join(self.rpmbuild_path, "RPMS", self.architecture)
         )
-        filenames = glob.glob(filenames_glob)
 
-        for filename in filenames:
+        for filename in cleanup_service.Glob(rpm_filenames_glob):
             if not filenames_to_ignore.match(filename):
                 logging.info(f"Removing: {filename:s}")
-                os.remove(filename)
+                cleanup_service.Remove(filename)
 
     def CheckBuildRequired(self, source_helper_object):
         """Checks if a build is required.
@@ -324,7 +494,7 @@ class RPMBuildHelper(BaseRPMBuildHelper):
         rpm_filename = (
             f"{project_name:s}-{project_version!s}-1.{self.architecture:s}.rpm"
         )
-        return not os.path.exists(rpm_filename)
+        return not self._build_context.artifact_index.Contains(rpm_filename)
 
 
 class ConfigureMakeRPMBuildHelper(RPMBuildHelper):
@@ -370,17 +540,24 @@ class ConfigureMakeRPMBuildHelper(RPMBuildHelper):
         )
         # rpmbuild wants the source package filename without the status indication.
         rpm_source_package_filename = f"{project_name:s}-{project_version!s}.tar.gz"
-        if not os.path.exists(rpm_source_package_filename):
-            shutil.copyfile(source_package_path, rpm_source_package_filename)
-
-        build_successful = self._BuildFromSourcePackage(
-            rpm_source_package_filename, rpmbuild_flags="-tb"
+        rpm_source_package_path = self._build_context.GetPath(
+            rpm_source_package_filename
         )
-        if build_successful:
-            self._MoveRPMs(project_name, project_version)
+        if not os.path.exists(rpm_source_package_path):
+            shutil.copyfile(source_package_path, rpm_source_package_path)
 
-            setup_name = self._project_definition.setup_name or project_name
-            self._RemoveBuildDirectory(setup_name, project_version)
+        if self._build_context.private_rpmbuild:
+            self._CreatePrivateRPMBuildPath(project_name, project_version)
+
+        try:
+            build_successful = self._BuildFromSourcePackage(
+                rpm_source_package_filename, rpmbuild_flags="-tb"
+            )
+            if build_successful:
+                self._MoveBuildResults(project_name, project_version)
+
+        finally:
+            self._RemovePrivateRPMBuildPath()
 
         return build_successful
 
@@ -405,7 +582,13 @@ class ConfigureMakeRPMBuildHelper(RPMBuildHelper):
 class PyprojectRPMBuildHelper(RPMBuildHelper):
     """Helper to build RPM packages (.rpm)."""
 
-    def __init__(self, project_definition, l2tdevtools_path, dependency_definitions):
+    def __init__(
+        self,
+        project_definition,
+        l2tdevtools_path,
+        dependency_definitions,
+        build_context=None,
+    ):
         """Initializes a build helper.
 
         Args:
@@ -414,8 +597,15 @@ class PyprojectRPMBuildHelper(RPMBuildHelper):
           l2tdevtools_path (str): path to the l2tdevtools directory.
           dependency_definitions (dict[str, ProjectDefinition]): definitions of all
               projects, which is used to determine the properties of dependencies.
+          build_context (Optional[BuildContext]): build context, where None
+              represents a build context of the current working directory.
         """
-        super().__init__(project_definition, l2tdevtools_path, dependency_definitions)
+        super().__init__(
+            project_definition,
+            l2tdevtools_path,
+            dependency_definitions,
+            build_context=build_context,
+        )
         if not project_definition.architecture_dependent:
             self.architecture = "noarch"
 
@@ -526,23 +716,30 @@ class PyprojectRPMBuildHelper(RPMBuildHelper):
         project_name, project_version = self._GetFilenameSafeProjectInformation(
             source_helper_object
         )
-        self._CopySourcePackageToRPMBuildSources(source_package_path)
+        if self._build_context.private_rpmbuild:
+            self._CreatePrivateRPMBuildPath(project_name, project_version)
 
-        rpm_spec_file_path = self._GenerateSpecFile(
-            project_name, project_version, source_package_filename, source_helper_object
-        )
-        if not rpm_spec_file_path:
-            logging.error("Unable to generate rpm spec file.")
-            return False
+        try:
+            self._CopySourcePackageToRPMBuildSources(source_package_path)
 
-        build_successful = self._BuildFromSpecFile(
-            rpm_spec_file_path, rpmbuild_flags="-bb"
-        )
-        if build_successful:
-            self._MoveRPMs(project_name, project_version)
+            rpm_spec_file_path = self._GenerateSpecFile(
+                project_name,
+                project_version,
+                source_package_filename,
+                source_helper_object,
+            )
+            if not rpm_spec_file_path:
+                logging.error("Unable to generate rpm spec file.")
+                return False
 
-            setup_name = self._project_definition.setup_name or project_name
-            self._RemoveBuildDirectory(setup_name, project_version)
+            build_successful = self._BuildFromSpecFile(
+                rpm_spec_file_path, rpmbuild_flags="-bb"
+            )
+            if build_successful:
+                self._MoveBuildResults(project_name, project_version)
+
+        finally:
+            self._RemovePrivateRPMBuildPath()
 
         return build_successful
 
@@ -554,9 +751,10 @@ class PyprojectRPMBuildHelper(RPMBuildHelper):
         """
         # Remove previous versions build directories.
         for filename in ("build", "dist"):
-            if os.path.exists(filename):
+            path = self._build_context.GetPath(filename)
+            if os.path.exists(path):
                 logging.info(f"Removing: {filename:s}")
-                shutil.rmtree(filename, ignore_errors=True)
+                shutil.rmtree(path, ignore_errors=True)
 
         # Remove previous versions of rpms.
         project_name, project_version = self._GetFilenameSafeProjectInformation(
@@ -576,6 +774,18 @@ class PyprojectRPMBuildHelper(RPMBuildHelper):
 class SRPMBuildHelper(BaseRPMBuildHelper):
     """Helper to build source RPM packages (.src.rpm)."""
 
+    def _MoveBuildResults(self, project_name, project_version):
+        """Moves the source rpms into the working directory.
+
+        Args:
+          project_name (str): name of the project.
+          project_version (str): version of the project.
+        """
+        if self._build_context.private_rpmbuild:
+            self._MoveRPMBuildResults()
+        else:
+            self._MoveRPMs(project_name, project_version)
+
     def _MoveRPMs(self, project_name, project_version):
         """Moves the rpms from the rpmbuild directory into the current directory.
 
@@ -608,18 +818,24 @@ class SRPMBuildHelper(BaseRPMBuildHelper):
         )
         src_rpm_filenames_glob = f"{project_name:s}-*-1.src.rpm"
 
-        for filename in glob.glob(src_rpm_filenames_glob):
+        cleanup_service = self._build_context.GetCleanupService()
+
+        for filename in cleanup_service.Glob(src_rpm_filenames_glob):
             if not filenames_to_ignore.match(filename):
                 logging.info(f"Removing: {filename:s}")
-                os.remove(filename)
+                cleanup_service.Remove(filename)
 
-        filenames_glob = os.path.join(
-            self.rpmbuild_path, "SRPMS", src_rpm_filenames_glob
+        if self._build_context.private_rpmbuild:
+            return
+
+        cleanup_service = self._build_context.GetCleanupService(
+            self._rpmbuild_srpms_path
         )
-        for filename in glob.glob(filenames_glob):
+
+        for filename in cleanup_service.Glob(src_rpm_filenames_glob):
             if not filenames_to_ignore.match(filename):
                 logging.info(f"Removing: {filename:s}")
-                os.remove(filename)
+                cleanup_service.Remove(filename)
 
     def CheckBuildRequired(self, source_helper_object):
         """Checks if a build is required.
@@ -633,7 +849,9 @@ class SRPMBuildHelper(BaseRPMBuildHelper):
         project_name, project_version = self._GetFilenameSafeProjectInformation(
             source_helper_object
         )
-        return not os.path.exists(f"{project_name:s}-{project_version!s}-1.src.rpm")
+        return not self._build_context.artifact_index.Contains(
+            f"{project_name:s}-{project_version!s}-1.src.rpm"
+        )
 
     def Clean(self, source_helper_object):
         """Cleans the rpmbuild directory.
@@ -677,15 +895,25 @@ class ConfigureMakeSRPMBuildHelper(SRPMBuildHelper):
         )
         # rpmbuild wants the source package filename without the status indication.
         rpm_source_package_filename = f"{project_name:s}-{project_version!s}.tar.gz"
-        shutil.copyfile(source_package_path, rpm_source_package_filename)
-
-        build_successful = self._BuildFromSourcePackage(
-            rpm_source_package_filename, rpmbuild_flags="-ts"
+        shutil.copyfile(
+            source_package_path,
+            self._build_context.GetPath(rpm_source_package_filename),
         )
-        # TODO: test binary build of source package?
 
-        if build_successful:
-            self._MoveRPMs(project_name, project_version)
+        if self._build_context.private_rpmbuild:
+            self._CreatePrivateRPMBuildPath(project_name, project_version)
+
+        try:
+            build_successful = self._BuildFromSourcePackage(
+                rpm_source_package_filename, rpmbuild_flags="-ts"
+            )
+            # TODO: test binary build of source package?
+
+            if build_successful:
+                self._MoveBuildResults(project_name, project_version)
+
+        finally:
+            self._RemovePrivateRPMBuildPath()
 
         return build_successful
 
@@ -693,7 +921,13 @@ class ConfigureMakeSRPMBuildHelper(SRPMBuildHelper):
 class PyprojectSRPMBuildHelper(SRPMBuildHelper):
     """Helper to build source RPM packages (.src.rpm)."""
 
-    def __init__(self, project_definition, l2tdevtools_path, dependency_definitions):
+    def __init__(
+        self,
+        project_definition,
+        l2tdevtools_path,
+        dependency_definitions,
+        build_context=None,
+    ):
         """Initializes a build helper.
 
         Args:
@@ -702,8 +936,15 @@ class PyprojectSRPMBuildHelper(SRPMBuildHelper):
           l2tdevtools_path (str): path to the l2tdevtools directory.
           dependency_definitions (dict[str, ProjectDefinition]): definitions of all
               projects, which is used to determine the properties of dependencies.
+          build_context (Optional[BuildContext]): build context, where None
+              represents a build context of the current working directory.
         """
-        super().__init__(project_definition, l2tdevtools_path, dependency_definitions)
+        super().__init__(
+            project_definition,
+            l2tdevtools_path,
+            dependency_definitions,
+            build_context=build_context,
+        )
         if not project_definition.architecture_dependent:
             self.architecture = "noarch"
 
@@ -779,21 +1020,31 @@ class PyprojectSRPMBuildHelper(SRPMBuildHelper):
         project_name, project_version = self._GetFilenameSafeProjectInformation(
             source_helper_object
         )
-        self._CopySourcePackageToRPMBuildSources(source_package_path)
+        if self._build_context.private_rpmbuild:
+            self._CreatePrivateRPMBuildPath(project_name, project_version)
 
-        rpm_spec_file_path = self._GenerateSpecFile(
-            project_name, project_version, source_package_filename, source_helper_object
-        )
-        if not rpm_spec_file_path:
-            logging.error("Unable to generate rpm spec file.")
-            return False
+        try:
+            self._CopySourcePackageToRPMBuildSources(source_package_path)
 
-        build_successful = self._BuildFromSpecFile(
-            rpm_spec_file_path, rpmbuild_flags="-bs"
-        )
-        # TODO: test binary build of source package?
+            rpm_spec_file_path = self._GenerateSpecFile(
+                project_name,
+                project_version,
+                source_package_filename,
+                source_helper_object,
+            )
+            if not rpm_spec_file_path:
+                logging.error("Unable to generate rpm spec file.")
+                return False
 
-        if build_successful:
-            self._MoveRPMs(project_name, project_version)
+            build_successful = self._BuildFromSpecFile(
+                rpm_spec_file_path, rpmbuild_flags="-bs"
+            )
+            # TODO: test binary build of source package?
+
+            if build_successful:
+                self._MoveBuildResults(project_name, project_version)
+
+        finally:
+            self._RemovePrivateRPMBuildPath()
 
         return build_successful
@@ -1,8 +1,7 @@
 """Helper for building projects from source."""
 
 import logging
-import os
-import subprocess
+import shlex
 import sys
 
 from l2tdevtools.build_helpers import interface
@@ -39,21 +38,16 @@ class ConfigureMakeSourceBuildHelper(SourceBuildHelper):
         source_package_filename = source_helper_object.GetSourcePackageFilename()
         logging.info(f"Building source of: {source_package_filename:s}")
 
-        log_file_path = os.path.join("..", self.LOG_FILENAME)
-        command = f"./configure > {log_file_path:s} 2>&1"
-        exit_code = subprocess.call(
-            f"(cd {source_directory:s} && {command:s})", shell=True
-        )
+        command = ["./configure"]
+        exit_code = self._RunCommand(command, working_directory=source_directory)
         if exit_code != 0:
-            logging.error(f'Running: "{command:s}" failed.')
+            logging.error(f'Running: "{shlex.join(command):s}" failed.')
             return False
 
-        command = f"make >> {log_file_path:s} 2>&1"
-        exit_code = subprocess.call(
-            f"(cd {source_directory:s} && {command:s})", shell=True
-        )
+        command = ["make"]
+        exit_code = self._RunCommand(command, working_directory=source_directory)
         if exit_code != 0:
-            logging.error(f'Running: "{command:s}" failed.')
+            logging.error(f'Running: "{shlex.join(command):s}" failed.')
             return False
 
         return True
@@ -96,13 +90,10 @@ class SetupPySourceBuildHelper(SourceBuildHelper):
         source_package_filename = source_helper_object.GetSourcePackageFilename()
         logging.info(f"Building source of: {source_package_filename:s}")
 
-        log_file_path = os.path.join("..", self.LOG_FILENAME)
-        command = f"{sys.executable:s} setup.py build > {log_file_path:s} 2>&1"
-        exit_code = subprocess.call(
-            f"(cd {source_directory:s} && {command:s})", shell=True
-        )
+        command = [sys.executable, "setup.py", "build"]
+        exit_code = self._RunCommand(command, working_directory=source_directory)
         if exit_code != 0:
-            logging.error(f'Running: "{command:s}" failed.')
+            logging.error(f'Running: "{shlex.join(command):s}" failed.')
             return False
 
         return True
@@ -5,8 +5,8 @@ import logging
 import os
 import platform
 import re
+import shlex
 import shutil
-import subprocess
 import sys
 
 from l2tdevtools.build_helpers import interface
@@ -17,7 +17,13 @@ class WheelBuildHelper(interface.BuildHelper):
 
     _NON_PYTHON_DEPENDENCIES = frozenset(["fuse", "libcrypto", "zlib"])
 
-    def __init__(self, project_definition, l2tdevtools_path, dependency_definitions):
+    def __init__(
+        self,
+        project_definition,
+        l2tdevtools_path,
+        dependency_definitions,
+        build_context=None,
+    ):
         """Initializes a build helper.
 
         Args:
@@ -26,8 +32,15 @@ class WheelBuildHelper(interface.BuildHelper):
           l2tdevtools_path (str): path to the l2tdevtools directory.
           dependency_definitions (dict[str, ProjectDefinition]): definitions of all
               projects, which is used to determine the properties of dependencies.
+          build_context (Optional[BuildContext]): build context, where None
+              represents a build context of the current working directory.
         """
-        super().__init__(project_definition, l2tdevtools_path, dependency_definitions)
+        super().__init__(
+            project_definition,
+            l2tdevtools_path,
+            dependency_definitions,
+            build_context=build_context,
+        )
         self.architecture = None
 
         # Note that platform.machine() does not indicate if a 32-bit version of
@@ -90,11 +103,12 @@ class WheelBuildHelper(interface.BuildHelper):
             return False
 
         _, _, wheel_filename = filenames[0].rpartition(os.path.sep)
-        if os.path.exists(wheel_filename):
+        if self._build_context.artifact_index.Contains(wheel_filename):
             logging.warning("Wheel file already exists.")
         else:
             logging.info(f"Moving: {filenames[0]:s}")
-            shutil.move(filenames[0], ".")
+            shutil.move(filenames[0], self._build_context.working_directory)
+            self._build_context.artifact_index.Add(wheel_filename)
 
         return True
 
@@ -124,7 +138,9 @@ class WheelBuildHelper(interface.BuildHelper):
             source_helper_object
         )
 
-        return not glob.glob(f"{project_name:s}-{project_version:s}-*-*-*.whl")
+        return not self._build_context.artifact_index.GetArtifacts(
+            project_name, target="wheel", version=project_version
+        )
 
     def Clean(self, source_helper_object):
         """Cleans the build and dist directory.
@@ -141,10 +157,12 @@ class WheelBuildHelper(interface.BuildHelper):
             f"{project_name:s}-{project_version:s}-.*-.*-.*.whl"
         )
 
-        for filename in glob.glob(f"{project_name:s}-*-*-*.whl"):
+        cleanup_service = self._build_context.GetCleanupService()
+
+        for filename in cleanup_service.Glob(f"{project_name:s}-*-*-*.whl"):
             if not filenames_to_ignore.match(filename):
                 logging.info(f"Removing: {filename:s}")
-                os.remove(filename)
+                cleanup_service.Remove(filename)
 
 
 class BuildWheelBuildHelper(WheelBuildHelper):
@@ -176,13 +194,10 @@ class BuildWheelBuildHelper(WheelBuildHelper):
         source_package_filename = source_helper_object.GetSourcePackageFilename()
         logging.info(f"Building wheel of: {source_package_filename:s}")
 
-        log_file_path = os.path.join("..", self.LOG_FILENAME)
-        command = f'"{sys.executable:s}" -m build --wheel > {log_file_path:s} 2>&1'
-        exit_code = subprocess.call(
-            f"(cd {source_directory:s} && {command:s})", shell=True
-        )
+        command = [sys.executable, "-m", "build", "--wheel"]
+        exit_code = self._RunCommand(command, working_directory=source_directory)
         if exit_code != 0:
-            logging.error(f'Running: "{command:s}" failed.')
+            logging.error(f'Running: "{shlex.join(command):s}" failed.')
             return False
 
         return self._MoveWheel(source_helper_object)
@@ -232,13 +247,10 @@ class ConfigureMakeWheelBuildHelper(WheelBuildHelper):
                     "Cannot build wheel missing pyproject.toml and setup.py"
                 )
 
-        log_file_path = os.path.join("..", self.LOG_FILENAME)
-        command = f'"{sys.executable:s}" -m build --wheel > {log_file_path:s} 2>&1'
-        exit_code = subprocess.call(
-            f"(cd {source_directory:s} && {command:s})", shell=True
-        )
+        command = [sys.executable, "-m", "build", "--wheel"]
+        exit_code = self._RunCommand(command, working_directory=source_directory)
         if exit_code != 0:
-            logging.error(f'Running: "{command:s}" failed.')
+            logging.error(f'Running: "{shlex.join(command):s}" failed.')
             return False
 
         return self._MoveWheel(source_helper_object)
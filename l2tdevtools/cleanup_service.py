@@ -0,0 +1,126 @@
+"""Service to remove superseded files and directories."""
+
+import concurrent.futures
+import fnmatch
+import logging
+import os
+import shutil
+import threading
+
+
+class CleanupService:
+    """Service to remove superseded files and directories in the background.
+
+    The entries of the directory are scanned once, the first time they are
+    needed, and the scan is used to find the superseded files and directories
+    of all the projects. Entries that are created after the scan are not
+    included, which is sufficient for finding superseded entries since these
+    were created before the current versions were built.
+
+    If an artifact index is provided the directory entries are looked up in
+    the index instead, which is kept up to date by the build helpers.
+    """
+
+    def __init__(self, path, artifact_index=None):
+        """Initializes a cleanup service.
+
+        Args:
+          path (str): path of the directory that contains the superseded files
+              and directories.
+          artifact_index (Optional[ArtifactIndex]): index of the entries of
+              the directory, where None represents that the directory should be
+              scanned by the service.
+        """
+        super().__init__()
+        self._artifact_index = artifact_index
+        self._directory_entries = None
+        self._executor = None
+        self._lock = threading.Lock()
+        self._path = os.path.abspath(path)
+
+    def _GetDirectoryEntries(self):
+        """Retrieves the entries of the directory.
+
+        Returns:
+          dict[str, bool]: True if the entry is a directory, per name.
+        """
+        with self._lock:
+            if self._directory_entries is None:
+                self._directory_entries = {}
+                if os.path.isdir(self._path):
+                    with os.scandir(self._path) as directory_entries:
+                        for directory_entry in directory_entries:
+                            self._directory_entries[directory_entry.name] = (
+                                directory_entry.is_dir(follow_symlinks=False)
+                            )
+
+            return self._directory_entries
+
+    def _RemovePath(self, path):
+        """Removes a file or directory.
+
+        Args:
+          path (str): path of the file or directory.
+        """
+        try:
+            if os.path.isdir(path) and not os.path.islink(path):
+                shutil.rmtree(path)
+            else:
+                os.remove(path)
+
+        except OSError as exception:
+            logging.info(f"Unable to remove: {path:s} with error: {exception!s}")
+
+    def Glob(self, pattern, directories_only=False):
+        """Retrieves the names of the entries that match a pattern.
+
+        Args:
+          pattern (str): glob pattern of the names of the entries.
+          directories_only (Optional[bool]): True if only the names of
+              directories should be retrieved.
+
+        Returns:
+          list[str]: names of the matching entries.
+        """
+        if self._artifact_index:
+            return self._artifact_index.Glob(pattern, directories_only=directories_only)
+
+        directory_entries = self._GetDirectoryEntries()
+        with self._lock:
+            names = fnmatch.filter(directory_entries.keys(), pattern)
+            if directories_only:
+                names = [name for name in names if directory_entries[name]]
+
+        return names
+
+    def Remove(self, path):
+        """Removes a file or directory in the background.
+
+        Args:
+          path (str): path of the file or directory, relative to the directory
+              of the service. An absolute path is used unchanged.
+        """
+        path = os.path.join(self._path, path)
+
+        if os.path.dirname(path) == self._path:
+            if self._artifact_index:
+                self._artifact_index.Remove(os.path.basename(path))
+
+            with self._lock:
+                if self._directory_entries is not None:
+                    self._directory_entries.pop(os.path.basename(path), None)
+
+        with self._lock:
+            if not self._executor:
+                self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+
+            self._executor.submit(self._RemovePath, path)
+
+    def Wait(self):
+        """Waits for the background removals to complete."""
+        with self._lock:
+            executor = self._executor
+            self._executor = None
+
+        if executor:
+            executor.shutdown(wait=True)
@@ -30,5 +30,4 @@ class CheckDependenciesWriter(interface.DependencyFileWriter):
         )
         file_content = self._GenerateFromTemplate(template_file, template_mappings)
 
-        with open(self.PATH, "w", encoding="utf-8") as file_object:
-            file_object.write(file_content)
+        self._WriteFile(self.PATH, file_content)
@@ -15,8 +15,7 @@ class DPKGCompatWriter(interface.DependencyFileWriter):
 
     def Write(self):
         """Writes a dpkg control file."""
-        with open(self.PATH, "w", encoding="utf-8") as file_object:
-            file_object.write(self._FILE_CONTENT)
+        self._WriteFile(self.PATH, self._FILE_CONTENT)
 
 
 class DPKGControlWriter(interface.DependencyFileWriter):
@@ -157,8 +156,7 @@ class DPKGControlWriter(interface.DependencyFileWriter):
         file_content = "\n".join(file_content)
         file_content = file_content.format(**template_mappings)
 
-        with open(self.PATH, "w", encoding="utf-8") as file_object:
-            file_object.write(file_content)
+        self._WriteFile(self.PATH, file_content)
 
 
 class DPKGRulesWriter(interface.DependencyFileWriter):
@@ -206,5 +204,4 @@ class DPKGRulesWriter(interface.DependencyFileWriter):
         file_content = "\n".join(file_content)
         file_content = file_content.format(**template_mappings)
 
-        with open(self.PATH, "w", encoding="utf-8") as file_object:
-            file_object.write(file_content)
+        self._WriteFile(self.PATH, file_content)
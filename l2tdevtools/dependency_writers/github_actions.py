@@ -22,8 +22,7 @@ class GitHubActionsBuildWheelYmlWriter(interface.DependencyFileWriter):
         template_file = os.path.join(self._l2tdevtools_path, self._TEMPLATE_FILE)
         file_content = self._GenerateFromTemplate(template_file, template_mappings)
 
-        with open(self.PATH, "w", encoding="utf-8") as file_object:
-            file_object.write(file_content)
+        self._WriteFile(self.PATH, file_content)
 
 
 class GitHubActionsLintYmlWriter(interface.DependencyFileWriter):
@@ -93,8 +92,7 @@ class GitHubActionsLintYmlWriter(interface.DependencyFileWriter):
 
         file_content = "".join(file_content)
 
-        with open(self.PATH, "w", encoding="utf-8") as file_object:
-            file_object.write(file_content)
+        self._WriteFile(self.PATH, file_content)
 
 
 class GitHubActionsTestDockerYmlWriter(interface.DependencyFileWriter):
@@ -141,8 +139,7 @@ class GitHubActionsTestDockerYmlWriter(interface.DependencyFileWriter):
         template_file = os.path.join(self._l2tdevtools_path, self._TEMPLATE_FILE)
         file_content = self._GenerateFromTemplate(template_file, template_mappings)
 
-        with open(self.PATH, "w", encoding="utf-8") as file_object:
-            file_object.write(file_content)
+        self._WriteFile(self.PATH, file_content)
 
 
 class GitHubActionsTestDocsYmlWriter(interface.DependencyFileWriter):
@@ -170,8 +167,7 @@ class GitHubActionsTestDocsYmlWriter(interface.DependencyFileWriter):
         template_file = os.path.join(self._l2tdevtools_path, self._TEMPLATE_FILE)
         file_content = self._GenerateFromTemplate(template_file, template_mappings)
 
-        with open(self.PATH, "w", encoding="utf-8") as file_object:
-            file_object.write(file_content)
+        self._WriteFile(self.PATH, file_content)
 
 
 class GitHubActionsTestMacOSYmlWriter(interface.DependencyFileWriter):
@@ -190,8 +186,7 @@ class GitHubActionsTestMacOSYmlWriter(interface.DependencyFileWriter):
         template_file = os.path.join(self._l2tdevtools_path, self._TEMPLATE_FILE)
         file_content = self._GenerateFromTemplate(template_file, template_mappings)
 
-        with open(self.PATH, "w", encoding="utf-8") as file_object:
-            file_object.write(file_content)
+        self._WriteFile(self.PATH, file_content)
 
 
 class GitHubActionsTestToxYmlWriter(interface.DependencyFileWriter):
@@ -217,8 +212,7 @@ class GitHubActionsTestToxYmlWriter(interface.DependencyFileWriter):
         template_file = os.path.join(self._l2tdevtools_path, self._TEMPLATE_FILE)
         file_content = self._GenerateFromTemplate(template_file, template_mappings)
 
-        with open(self.PATH, "w", encoding="utf-8") as file_object:
-            file_object.write(file_content)
+        self._WriteFile(self.PATH, file_content)
 
 
 class GitHubActionsTestWindowsYmlWriter(interface.DependencyFileWriter):
@@ -248,5 +242,4 @@ class GitHubActionsTestWindowsYmlWriter(interface.DependencyFileWriter):
         template_file = os.path.join(self._l2tdevtools_path, template_file)
         file_content = self._GenerateFromTemplate(template_file, template_mappings)
 
-        with open(self.PATH, "w", encoding="utf-8") as file_object:
-            file_object.write(file_content)
+        self._WriteFile(self.PATH, file_content)
@@ -1,11 +1,23 @@
 """Helper for writing files that contain dependency information."""
 
 import abc
+import difflib
+import os
 import string
 
 
 class DependencyFileWriter:
-    """Base class for dependency file writers."""
+    """Base class for dependency file writers.
+
+    Attributes:
+      file_diffs (dict[str, str]): unified diffs of the files that were changed
+          by the writer, per path.
+    """
+
+    # The compiled templates are shared by all dependency file writers in
+    # the process and consist of: (modification time, size, template) per
+    # absolute path of the template file.
+    _templates = {}
 
     def __init__(self, l2tdevtools_path, project_definition, dependency_helper):
         """Initializes a dependency file writer.
@@ -19,6 +31,7 @@ class DependencyFileWriter:
         self._dependency_helper = dependency_helper
         self._l2tdevtools_path = l2tdevtools_path
         self._project_definition = project_definition
+        self.file_diffs = {}
 
     def _GenerateFromTemplate(self, template_filename, template_mappings):
         """Generates file context based on a template file.
@@ -167,16 +180,72 @@ class DependencyFileWriter:
     def _ReadTemplateFile(self, filename):
         """Reads a template string from file.
 
+        The template is cached and only read again if the modification time or
+        size of the file changed.
+
         Args:
           filename (str): name of the file containing the template string.
 
         Returns:
           string.Template: template string.
         """
-        with open(filename, "r", encoding="utf-8") as file_object:
-            file_data = file_object.read()
+        path = os.path.abspath(filename)
+        stat_object = os.stat(path)
+
+        modification_time, size, template = self._templates.get(
+            path, (None, None, None)
+        )
+        if (
+            template is None
+            or modification_time != stat_object.st_mtime_ns
+            or size != stat_object.st_size
+        ):
+            with open(path, "r", encoding="utf-8") as file_object:
+                file_data = file_object.read()
+
+            template = string.Template(file_data)
+            self._templates[path] = (
+                stat_object.st_mtime_ns,
+                stat_object.st_size,
+                template,
+            )
+
+        return template
 
-        return string.Template(file_data)
+    def _WriteFile(self, path, file_content):
+        """Writes a file if its content changed.
+
+        Args:
+          path (str): path of the file.
+          file_content (str): content of the file.
+
+        Returns:
+          bool: True if the file was written.
+        """
+        previous_file_content = None
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as file_object:
+                previous_file_content = file_object.read()
+
+        if file_content == previous_file_content:
+            return False
+
+        with open(path, "w", encoding="utf-8") as file_object:
+            file_object.write(file_content)
+
+        previous_lines = []
+        if previous_file_content:
+            previous_lines = previous_file_content.splitlines(keepends=True)
+
+        self.file_diffs[path] = "".join(
+            difflib.unified_diff(
+                previous_lines,
+                file_content.splitlines(keepends=True),
+                fromfile=f"a/{path:s}",
+                tofile=f"b/{path:s}",
+            )
+        )
+        return True
 
     @abc.abstractmethod
     def Write(self):
@@ -31,8 +31,7 @@ class LinuxRunEndToEndTestsScriptWriter(interface.DependencyFileWriter):
         template_file = os.path.join(self._l2tdevtools_path, self._TEMPLATE_FILE)
         file_content = self._GenerateFromTemplate(template_file, template_mappings)
 
-        with open(self.PATH, "w", encoding="utf-8") as file_object:
-            file_object.write(file_content)
+        self._WriteFile(self.PATH, file_content)
 
 
 class RunPython3EndToEndTestsScriptWriter(interface.DependencyFileWriter):
@@ -51,5 +50,4 @@ class RunPython3EndToEndTestsScriptWriter(interface.DependencyFileWriter):
         template_file = os.path.join(self._l2tdevtools_path, self._TEMPLATE_FILE)
         file_content = self._GenerateFromTemplate(template_file, template_mappings)
 
-        with open(self.PATH, "w", encoding="utf-8") as file_object:
-            file_object.write(file_content)
+        self._WriteFile(self.PATH, file_content)
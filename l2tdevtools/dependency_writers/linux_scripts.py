@@ -179,5 +179,4 @@ class UbuntuInstallationScriptWriter(interface.DependencyFileWriter):
         script_name = f"ubuntu_install_{self._project_definition.name:s}.sh"
         script_path = os.path.join("config", "linux", script_name)
 
-        with open(script_path, "w", encoding="utf-8") as file_object:
-            file_object.write(file_content)
+        self._WriteFile(script_path, file_content)
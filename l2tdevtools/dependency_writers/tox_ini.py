@@ -122,5 +122,4 @@ class ToxIniWriter(interface.DependencyFileWriter):
 
         file_content = "".join(file_content)
 
-        with open(self.PATH, "w", encoding="utf-8") as file_object:
-            file_object.write(file_content)
+        self._WriteFile(self.PATH, file_content)
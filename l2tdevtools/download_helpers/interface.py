@@ -3,6 +3,7 @@
 import http.client
 import logging
 import os
+import shutil
 
 import urllib.error as urllib_error
 import urllib.request as urllib_request
@@ -18,27 +19,37 @@ class DownloadHelper:
           download_url (str): download URL.
         """
         super().__init__()
-        self._cached_url = ""
-        self._cached_page_content = b""
+        # The URL and page content are cached as one value, so that concurrent
+        # downloads cannot return the page content of another URL.
+        self._cached_page = ("", b"")
         self._download_url = download_url
 
-    def DownloadFile(self, download_url):
+    def DownloadFile(self, download_url, output_path=None):
         """Downloads a file from the URL and returns the filename.
 
         The filename is extracted from the last part of the URL.
 
         Args:
           download_url (str): URL where to download the file.
+          output_path (Optional[str]): path of the file to download to, where
+              None represents the filename in the current working directory.
 
         Returns:
-          str: filename if successful also if the file was already downloaded
-              or None if not available.
+          str: filename, or output path if specified, if successful also if
+              the file was already downloaded or None if not available.
         """
-        _, _, filename = download_url.rpartition("/")
+        if output_path:
+            filename = output_path
+        else:
+            _, _, filename = download_url.rpartition("/")
 
         if not os.path.exists(filename):
             logging.info(f"Downloading: {download_url:s}")
 
+            # The content is written to a temporary file first, so that an
+            # interrupted download does not leave a partial file behind.
+            temporary_filename = f"{filename:s}.download"
+
             try:
                 with urllib_request.urlopen(download_url) as url_object:
                     if url_object.code != 200:
@@ -48,17 +59,20 @@ class DownloadHelper:
                         )
                         return None
 
-                    page_content = url_object.read()
-                    with open(filename, "wb") as file_object:
-                        file_object.write(page_content)
+                    with open(temporary_filename, "wb") as file_object:
+                        shutil.copyfileobj(url_object, file_object)
 
             except (http.client.InvalidURL, urllib_error.URLError) as exception:
                 logging.warning(
                     f"Unable to download URL: {download_url:s} with error: "
                     f"{exception!s}"
                 )
+                if os.path.exists(temporary_filename):
+                    os.remove(temporary_filename)
                 return None
 
+            os.replace(temporary_filename, filename)
+
         return filename
 
     def DownloadPageContent(self, download_url, encoding="utf-8"):
@@ -75,25 +89,87 @@ class DownloadHelper:
         if not download_url:
             return None
 
-        if self._cached_url != download_url:
-            try:
-                with urllib_request.urlopen(download_url) as url_object:
-                    if url_object.code != 200:
-                        return None
+        cached_url, cached_page_content = self._cached_page
+        if cached_url == download_url:
+            return cached_page_content
 
-                    page_content = url_object.read()
+        try:
+            with urllib_request.urlopen(download_url) as url_object:
+                if url_object.code != 200:
+                    return None
 
-            except urllib_error.URLError as exception:
-                logging.warning(
-                    f"Unable to download URL: {download_url:s} with error: "
-                    f"{exception!s}"
-                )
-                return None
+                page_content = url_object.read()
+
+        except urllib_error.URLError as exception:
+            logging.warning(
+                f"Unable to download URL: {download_url:s} with error: "
+                f"{exception!s}"
+            )
+            return None
+
+        if encoding and isinstance(page_content, bytes):
+            page_content = page_content.decode(encoding)
+
+        self._cached_page = (download_url, page_content)
+
+        return page_content
+
+    def DownloadPageHeaders(self, download_url):
+        """Retrieves the response headers of the URL without its content.
+
+        Args:
+          download_url (str): URL of which to retrieve the response headers.
+
+        Returns:
+          http.client.HTTPMessage: response headers if successful or None if not
+              available.
+        """
+        if not download_url:
+            return None
+
+        request = urllib_request.Request(download_url, method="HEAD")
+
+        try:
+            with urllib_request.urlopen(request) as url_object:
+                if url_object.code != 200:
+                    return None
+
+                return url_object.info()
+
+        except (http.client.InvalidURL, urllib_error.URLError) as exception:
+            logging.warning(
+                f"Unable to retrieve headers of URL: {download_url:s} with error: "
+                f"{exception!s}"
+            )
+            return None
+
+    def OpenURL(self, download_url):
+        """Opens the URL to read its content as a stream.
 
-            if encoding and isinstance(page_content, bytes):
-                page_content = page_content.decode(encoding)
+        Args:
+          download_url (str): URL to open.
+
+        Returns:
+          http.client.HTTPResponse: file-like object of the response if successful
+              or None if not available. The caller is responsible for closing
+              the response.
+        """
+        if not download_url:
+            return None
+
+        try:
+            # pylint: disable=consider-using-with
+            url_object = urllib_request.urlopen(download_url)
 
-            self._cached_page_content = page_content
-            self._cached_url = download_url
+        except (http.client.InvalidURL, urllib_error.URLError) as exception:
+            logging.warning(
+                f"Unable to download URL: {download_url:s} with error: "
+                f"{exception!s}"
+            )
+            return None
+
+        if url_object.code != 200:
+            url_object.close()
+            return None
 
-        return self._cached_page_content
+        return url_object
@@ -86,12 +86,14 @@ class ProjectDownloadHelper(interface.DownloadHelper):
         # Convert the result of dict.keys() into a list for Python 3.
         return list(available_versions.keys())[latest_match]
 
-    def Download(self, project_name, project_version):
+    def Download(self, project_name, project_version, output_directory=None):
         """Downloads the project for a given project name and version.
 
         Args:
           project_name (str): name of the project.
           project_version (str): version of the project.
+          output_directory (Optional[str]): path of the directory to download
+              to, where None represents the current working directory.
 
         Returns:
           str: filename if successful also if the file was already downloaded
@@ -102,7 +104,11 @@ class ProjectDownloadHelper(interface.DownloadHelper):
             logging.warning(f"Unable to determine download URL for: {project_name:s}")
             return None
 
-        filename = self.DownloadFile(download_url)
+        _, _, filename = download_url.rpartition("/")
+        output_path = os.path.join(output_directory or "", filename)
+
+        if not self.DownloadFile(download_url, output_path=output_path):
+            return None
 
         # GitHub archive package filenames can be:
         # {project version}.tar.gz
@@ -118,11 +124,12 @@ class ProjectDownloadHelper(interface.DownloadHelper):
             # The desired source package filename is:
             # {project name}-{project version}.tar.gz
             package_filename = f"{project_name:s}-{project_version!s}.tar.gz"
+            package_path = os.path.join(output_directory or "", package_filename)
 
-            if os.path.exists(package_filename):
-                os.remove(package_filename)
+            if os.path.exists(package_path):
+                os.remove(package_path)
 
-            os.rename(filename, package_filename)
+            os.rename(output_path, package_path)
             filename = package_filename
 
         return filename
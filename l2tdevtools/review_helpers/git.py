@@ -1,12 +1,42 @@
 """Helper for interacting with git."""
 
+import logging
 import os
+import subprocess
 
 from l2tdevtools.review_helpers import cli
 
 
+class GitRepositoryStatus:
+    """Git repository status.
+
+    Attributes:
+      active_branch (str): name of the active branch or None if not available,
+          for example when HEAD is detached.
+      changed_files (list[str]): names of the changed and untracked files.
+      commit_identifier (str): identifier (SHA-1) of the HEAD commit or None
+          if not available.
+      upstream_branch (str): name of the upstream branch of the active branch
+          or None if not set.
+    """
+
+    def __init__(self):
+        """Initializes a git repository status."""
+        super().__init__()
+        self.active_branch = None
+        self.changed_files = []
+        self.commit_identifier = None
+        self.upstream_branch = None
+
+
 class GitHelper(cli.CLIHelper):
-    """Git command helper."""
+    """Git command helper.
+
+    Repository state, such as the active branch, the local branches and
+    uncommitted changes, is queried with as few git invocations as possible
+    and cached until a command is run that changes the state. Git objects are
+    read from a long-lived "git cat-file --batch" process.
+    """
 
     def __init__(self, git_repo_url):
         """Initializes a git helper.
@@ -15,8 +45,141 @@ class GitHelper(cli.CLIHelper):
           git_repo_url (str): git repo URL.
         """
         super().__init__()
+        self._cat_file_process = None
         self._git_repo_url = git_repo_url
+        self._references = None
         self._remotes = []
+        self._status = None
+
+    def _GetReferences(self):
+        """Retrieves the git repository references.
+
+        Returns:
+          set[str]: full names of the references, for example
+              "refs/heads/main", or an empty set if not available.
+        """
+        if self._references is None:
+            exit_code, output, _ = self.RunCommand(
+                "git for-each-ref --format=%(refname) refs/heads refs/remotes"
+            )
+            if exit_code != 0:
+                return set()
+
+            self._references = set(filter(None, output.split("\n")))
+
+        return self._references
+
+    def _GetStatus(self):
+        """Retrieves the git repository status.
+
+        Returns:
+          GitRepositoryStatus: git repository status or None if not available.
+        """
+        if self._status is None:
+            exit_code, output, _ = self.RunCommand("git status --porcelain=v2 --branch")
+            if exit_code != 0:
+                return None
+
+            self._status = self._ParseStatus(output)
+
+        return self._status
+
+    def _InvalidateCache(self):
+        """Invalidates the cached git repository state."""
+        self._references = None
+        self._status = None
+
+    def _ParseStatus(self, output):
+        """Parses "git status --porcelain=v2 --branch" output.
+
+        Args:
+          output (str): output of the git status command.
+
+        Returns:
+          GitRepositoryStatus: git repository status.
+        """
+        status = GitRepositoryStatus()
+
+        for line in output.split("\n"):
+            if not line:
+                continue
+
+            if line.startswith("# "):
+                key, _, value = line[2:].partition(" ")
+                if key == "branch.oid" and value != "(initial)":
+                    status.commit_identifier = value
+                elif key == "branch.head" and value != "(detached)":
+                    status.active_branch = value
+                elif key == "branch.upstream":
+                    status.upstream_branch = value
+
+            elif line[0] in ("1", "u"):
+                # Ordinary and unmerged entries have the path as last field.
+                number_of_fields = 9 if line[0] == "1" else 11
+                values = line.split(" ", number_of_fields - 1)
+                if len(values) == number_of_fields:
+                    status.changed_files.append(values[-1])
+
+            elif line[0] == "2":
+                # Renamed or copied entries have "path<tab>original path".
+                values = line.split(" ", 9)
+                if len(values) == 10:
+                    path, _, _ = values[-1].partition("\t")
+                    status.changed_files.append(path)
+
+            elif line[0] in ("?", "!"):
+                status.changed_files.append(line[2:])
+
+        return status
+
+    def _ReadObject(self, object_name):
+        """Reads a git object.
+
+        Args:
+          object_name (str): name of the object, for example "HEAD" or
+              a SHA-1.
+
+        Returns:
+          tuple[str, bytes]: object type and data or (None, None) if not
+              available.
+        """
+        if not self._cat_file_process:
+            # pylint: disable=consider-using-with
+            try:
+                self._cat_file_process = subprocess.Popen(
+                    ["git", "cat-file", "--batch"],
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                )
+            except OSError as exception:
+                logging.error(
+                    f'Running: "git cat-file --batch" failed with error: '
+                    f"{exception!s}"
+                )
+                return None, None
+
+        try:
+            self._cat_file_process.stdin.write(f"{object_name:s}\n".encode("utf-8"))
+            self._cat_file_process.stdin.flush()
+
+            header = self._cat_file_process.stdout.readline()
+            values = header.decode("utf-8").split()
+            if len(values) != 3:
+                return None, None
+
+            _, object_type, object_size = values
+            object_size = int(object_size, 10)
+
+            # The object data is followed by a newline.
+            data = self._cat_file_process.stdout.read(object_size + 1)
+
+        except (OSError, ValueError) as exception:
+            logging.error(f"Unable to read git object with error: {exception!s}")
+            self.Close()
+            return None, None
+
+        return object_type, data[:object_size]
 
     def _GetRemotes(self):
         """Retrieves the git repository remotes.
@@ -41,6 +204,7 @@ class GitHelper(cli.CLIHelper):
           bool: True if the path was added.
         """
         exit_code, _, _ = self.RunCommand(f"git add -A {path:s}")
+        self._InvalidateCache()
         return exit_code == 0
 
     def CheckHasBranch(self, branch):
@@ -52,16 +216,7 @@ class GitHelper(cli.CLIHelper):
         Returns:
           bool: True if git repo has the specific branch.
         """
-        exit_code, output, _ = self.RunCommand("git branch")
-        if exit_code != 0:
-            return False
-
-        # Check for remote entries starting with upstream.
-        for line in output.split("\n"):
-            # Ignore the first 2 characters of the line.
-            if line[2:] == branch:
-                return True
-        return False
+        return f"refs/heads/{branch:s}" in self._GetReferences()
 
     def CheckHasProjectOrigin(self):
         """Checks if the git repo has the project remote origin defined.
@@ -95,15 +250,11 @@ class GitHelper(cli.CLIHelper):
         Returns:
           bool: True if the git repo has uncommitted changes.
         """
-        exit_code, output, _ = self.RunCommand("git status -s")
-        if exit_code != 0:
+        status = self._GetStatus()
+        if not status:
             return False
 
-        # Check if 'git status -s' yielded any output.
-        for line in output.split("\n"):
-            if line:
-                return True
-        return False
+        return bool(status.changed_files)
 
     def CheckSynchronizedWithUpstream(self):
         """Checks if the git repo is synchronized with upstream.
@@ -115,6 +266,7 @@ class GitHelper(cli.CLIHelper):
         # the main branch. Otherwise the information about the current
         # upstream HEAD is not updated.
         exit_code, _, _ = self.RunCommand("git fetch upstream")
+        self._InvalidateCache()
         if exit_code != 0:
             return False
 
@@ -123,10 +275,23 @@ class GitHelper(cli.CLIHelper):
         exit_code, output, _ = self.RunCommand("git log HEAD..upstream/main --oneline")
         return exit_code == 0 and not output
 
+    def Close(self):
+        """Closes the long-lived git processes."""
+        if self._cat_file_process:
+            try:
+                self._cat_file_process.stdin.close()
+                self._cat_file_process.wait(timeout=5)
+            except (OSError, subprocess.TimeoutExpired):
+                self._cat_file_process.kill()
+                self._cat_file_process.wait()
+
+            self._cat_file_process = None
+
     def DropUncommittedChanges(self):
         """Drops the uncommitted changes."""
         self.RunCommand("git stash")
         self.RunCommand("git stash drop")
+        self._InvalidateCache()
 
     def GetActiveBranch(self):
         """Retrieves the active branch.
@@ -134,16 +299,11 @@ class GitHelper(cli.CLIHelper):
         Returns:
           str: name of the active branch or None if not available.
         """
-        exit_code, output, _ = self.RunCommand("git branch")
-        if exit_code != 0:
-            return False
+        status = self._GetStatus()
+        if not status:
+            return None
 
-        # Check for remote entries starting with upstream.
-        for line in output.split("\n"):
-            if line.startswith("* "):
-                # Ignore the first 2 characters of the line.
-                return line[2:]
-        return None
+        return status.active_branch
 
     def GetChangedFiles(self, diffbase=None):
         """Retrieves the changed files.
@@ -202,17 +362,17 @@ class GitHelper(cli.CLIHelper):
         Returns:
           str: last commit message or None if not available.
         """
-        exit_code, output, _ = self.RunCommand("git log -1")
-        if exit_code != 0:
+        object_type, data = self._ReadObject("HEAD")
+        if object_type != "commit":
             return None
 
-        # Expecting 6 lines of output where the 5th line contains
-        # the commit message.
-        output_lines = output.split("\n")
-        if len(output_lines) != 6:
+        # The commit message follows the commit headers after an empty line.
+        _, _, message = data.decode("utf-8", errors="replace").partition("\n\n")
+        message_lines = message.strip().split("\n")
+        if len(message_lines) != 1 or not message_lines[0]:
             return None
 
-        return output_lines[4].strip()
+        return message_lines[0].strip()
 
     def GetRemoteOrigin(self):
         """Retrieves the remote origin.
@@ -242,6 +402,7 @@ class GitHelper(cli.CLIHelper):
         exit_code, _, _ = self.RunCommand(
             f"git pull --squash {git_repo_url:s} {branch:s}"
         )
+        self._InvalidateCache()
         return exit_code == 0
 
     def PushToOrigin(self, branch, force=False):
@@ -260,6 +421,7 @@ class GitHelper(cli.CLIHelper):
             command = f"git push --set-upstream origin {branch:s}"
 
         exit_code, _, _ = self.RunCommand(command)
+        self._InvalidateCache()
         return exit_code == 0
 
     def RemoveFeatureBranch(self, branch):
@@ -273,6 +435,7 @@ class GitHelper(cli.CLIHelper):
 
         self.RunCommand(f"git push origin --delete {branch:s}")
         self.RunCommand(f"git branch -D {branch:s}")
+        self._InvalidateCache()
 
     def SynchronizeWithOrigin(self):
         """Synchronizes git with origin.
@@ -281,10 +444,12 @@ class GitHelper(cli.CLIHelper):
           bool: True if the git repository has synchronized with origin.
         """
         exit_code, _, _ = self.RunCommand("git fetch origin")
+        self._InvalidateCache()
         if exit_code != 0:
             return False
 
         exit_code, _, _ = self.RunCommand("git pull --no-edit origin main")
+        self._InvalidateCache()
 
         return exit_code == 0
 
@@ -295,10 +460,12 @@ class GitHelper(cli.CLIHelper):
           bool: True if the git repository has synchronized with upstream.
         """
         exit_code, _, _ = self.RunCommand("git fetch upstream")
+        self._InvalidateCache()
         if exit_code != 0:
             return False
 
         exit_code, _, _ = self.RunCommand("git pull --no-edit --rebase upstream main")
+        self._InvalidateCache()
         if exit_code != 0:
             return False
 
@@ -313,4 +480,5 @@ class GitHelper(cli.CLIHelper):
           bool: True if the git repository has switched to the main branch.
         """
         exit_code, _, _ = self.RunCommand("git checkout main")
+        self._InvalidateCache()
         return exit_code == 0
@@ -131,6 +131,11 @@ class ReviewHelper:
 
         return True
 
+    def CloseHelpers(self):
+        """Closes the helpers, such as the long-lived git processes."""
+        if self._git_helper:
+            self._git_helper.Close()
+
     def InitializeHelpers(self):
         """Initializes the helpers.
 
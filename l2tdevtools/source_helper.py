@@ -1,7 +1,7 @@
 """Helper for managing project source code."""
 
 import abc
-import glob
+import functools
 import logging
 import os
 import re
@@ -10,6 +10,9 @@ import subprocess
 import tarfile
 import zipfile
 
+from l2tdevtools import build_context as context_lib
+from l2tdevtools import versions
+
 
 class SourceHelper:
     """Helper to manage project source code."""
@@ -154,6 +157,7 @@ class SourcePackageHelper(SourceHelper):
         project_definition,
         downloads_directory,
         download_helper_object,
+        build_context=None,
     ):
         """Initializes a source package helper.
 
@@ -163,8 +167,13 @@ class SourcePackageHelper(SourceHelper):
           downloads_directory (str): path to the directory where source package
               is downloaded.
           download_helper_object (DownloadHelper): download helper.
+          build_context (Optional[BuildContext]): build context in which
+              the source directory is created, where None represents a build
+              context of the current working directory.
         """
         super().__init__(project_name, project_definition)
+        self._build_context = build_context or context_lib.BuildContext(os.getcwd())
+        self._cached_source_package_filename = None
         self._download_helper = download_helper_object
         self._downloads_directory = os.path.abspath(downloads_directory)
         self._project_version = None
@@ -181,35 +190,41 @@ class SourcePackageHelper(SourceHelper):
         """
         filenames_to_ignore = re.compile(f"^{project_name:s}-.*{project_version!s}")
 
+        cleanup_service = self._build_context.GetCleanupService(
+            self._downloads_directory
+        )
+
         # Remove previous versions of source packages in the format:
         # <project>-*[0-9]*.tar.gz
-        filenames = glob.glob(f"{project_name:s}-*[0-9]*.tar.gz")
+        filenames = cleanup_service.Glob(f"{project_name:s}-*[0-9]*.tar.gz")
         for filename in filenames:
             if not filenames_to_ignore.match(filename):
                 logging.info(f"Removing: {filename:s}")
-                os.remove(filename)
+                cleanup_service.Remove(filename)
 
         # Remove previous versions of source packages in the format:
         # <project>-*[0-9]*.tgz
-        filenames = glob.glob(f"{project_name:s}-*[0-9]*.tgz")
+        filenames = cleanup_service.Glob(f"{project_name:s}-*[0-9]*.tgz")
         for filename in filenames:
             if not filenames_to_ignore.match(filename):
                 logging.info(f"Removing: {filename:s}")
-                os.remove(filename)
+                cleanup_service.Remove(filename)
 
         # Remove previous versions of source packages in the format:
         # <project>-*[0-9]*.zip
-        filenames = glob.glob(f"{project_name:s}-*[0-9]*.zip")
+        filenames = cleanup_service.Glob(f"{project_name:s}-*[0-9]*.zip")
         for filename in filenames:
             if not filenames_to_ignore.match(filename):
                 logging.info(f"Removing: {filename:s}")
-                os.remove(filename)
+                cleanup_service.Remove(filename)
 
-    def _CreateFromTar(self, source_package_filename):
+    def _CreateFromTar(self, source_package_filename, build_path):
         """Creates the source directory from a .tar source package.
 
         Args:
           source_package_filename (str): filename of the source package.
+          build_path (str): path of the directory to extract the source package
+              in.
 
         Returns:
           str: name of the source directory or None if no files can be extracted
@@ -248,7 +263,7 @@ class SourcePackageHelper(SourceHelper):
                         )
                         return None
 
-                    if os.path.exists(directory_name):
+                    if os.path.exists(os.path.join(build_path, directory_name)):
                         break
 
                     logging.info(f"Extracting: {source_package_filename:s}")
@@ -260,15 +275,17 @@ class SourcePackageHelper(SourceHelper):
                     )
                     continue
 
-                archive.extract(tar_info)
+                archive.extract(tar_info, path=build_path)
 
         return directory_name
 
-    def _CreateFromZip(self, source_package_filename):
+    def _CreateFromZip(self, source_package_filename, build_path):
         """Creates the source directory from a .zip source package.
 
         Args:
           source_package_filename (str): filename of the source package.
+          build_path (str): path of the directory to extract the source package
+              in.
 
         Returns:
           str: name of the source directory or None if no files can be extracted
@@ -296,7 +313,7 @@ class SourcePackageHelper(SourceHelper):
                         )
                         return None
 
-                    if os.path.exists(directory_name):
+                    if os.path.exists(os.path.join(build_path, directory_name)):
                         break
 
                     logging.info(f"Extracting: {source_package_filename:s}")
@@ -308,7 +325,7 @@ class SourcePackageHelper(SourceHelper):
                     )
                     continue
 
-                archive.extract(zip_info)
+                archive.extract(zip_info, path=build_path)
 
         return directory_name
 
@@ -318,13 +335,7 @@ class SourcePackageHelper(SourceHelper):
         if not project_version:
             return
 
-        current_working_directory = os.getcwd()
-        os.chdir(self._downloads_directory)
-
-        try:
-            self._CleanDownloads(self.project_name, project_version)
-        finally:
-            os.chdir(current_working_directory)
+        self._CleanDownloads(self.project_name, project_version)
 
         filenames_to_ignore = re.compile(
             f"^{self.project_name:s}-.*{project_version!s}"
@@ -332,11 +343,15 @@ class SourcePackageHelper(SourceHelper):
 
         # Remove previous versions of source directories in the format:
         # <project>-[0-9]*
-        filenames = glob.glob(f"{self.project_name:s}-[0-9]*")
+        cleanup_service = self._build_context.GetCleanupService()
+
+        filenames = cleanup_service.Glob(
+            f"{self.project_name:s}-[0-9]*", directories_only=True
+        )
         for filename in filenames:
-            if os.path.isdir(filename) and not filenames_to_ignore.match(filename):
+            if not filenames_to_ignore.match(filename):
                 logging.info(f"Removing: {filename:s}")
-                shutil.rmtree(filename)
+                cleanup_service.Remove(filename)
 
     def Create(self):
         """Creates the source directory from the source package.
@@ -350,18 +365,21 @@ class SourcePackageHelper(SourceHelper):
             logging.info(f"Missing source package of: {self.project_name:s}")
             return False
 
+        build_path = self._build_context.GetBuildPath(self.project_name)
+
         directory_name = None
         if (
             self._source_package_path.endswith(".tar.bz2")
             or self._source_package_path.endswith(".tar.gz")
             or self._source_package_path.endswith(".tgz")
         ):
-            directory_name = self._CreateFromTar(self._source_package_path)
+            directory_name = self._CreateFromTar(self._source_package_path, build_path)
 
         elif self._source_package_path.endswith(".zip"):
-            directory_name = self._CreateFromZip(self._source_package_path)
+            directory_name = self._CreateFromZip(self._source_package_path, build_path)
 
-        self._source_directory_path = directory_name
+        if directory_name:
+            self._source_directory_path = os.path.join(build_path, directory_name)
 
         return bool(directory_name)
 
@@ -377,15 +395,11 @@ class SourcePackageHelper(SourceHelper):
             if not project_version:
                 return None
 
-            current_working_directory = os.getcwd()
-            os.chdir(self._downloads_directory)
-
-            try:
-                self._source_package_filename = self._download_helper.Download(
-                    self.project_name, project_version
-                )
-            finally:
-                os.chdir(current_working_directory)
+            self._source_package_filename = self._download_helper.Download(
+                self.project_name,
+                project_version,
+                output_directory=self._downloads_directory,
+            )
 
             if self._source_package_filename:
                 self._source_package_path = os.path.join(
@@ -394,6 +408,120 @@ class SourcePackageHelper(SourceHelper):
 
         return self._source_package_path
 
+    def GetCachedProjectVersion(self):
+        """Retrieves the version number from the downloaded source packages.
+
+        Unlike GetProjectVersion this function does not query the download
+        location of the project. If available the version number of the most
+        recent downloaded source package is used as the project version.
+
+        Returns:
+          str: version number or None if no source package was downloaded.
+        """
+        if not self._project_version:
+            source_names = set()
+            for source_name in (
+                self.project_name,
+                self._project_definition.github_release_prefix,
+                self._project_definition.pypi_name,
+                self._project_definition.pypi_source_name,
+                self._project_definition.setup_name,
+            ):
+                if source_name:
+                    source_name = source_name.rstrip("-_")
+                    source_names.add(
+                        "[-_.]".join(
+                            re.escape(segment)
+                            for segment in re.split(r"[-_.]+", source_name)
+                        )
+                    )
+
+            # Source packages filenames are in the format:
+            # <source name>-[alpha-|beta-|experimental-][v]<version><extension>
+            expression_string = "|".join(sorted(source_names))
+            source_package_regex = re.compile(
+                f"^(?:{expression_string:s})[-_](?:(?:alpha|beta|experimental)-)?v?"
+                f"([0-9][^/]*?)[.](?:tar[.]bz2|tar[.]gz|tgz|zip)$",
+                flags=re.IGNORECASE,
+            )
+
+            filenames_per_version = {}
+            if os.path.isdir(self._downloads_directory):
+                for filename in os.listdir(self._downloads_directory):
+                    regex_match = source_package_regex.match(filename)
+                    if regex_match:
+                        filenames_per_version[regex_match.group(1)] = filename
+
+            if filenames_per_version:
+                available_versions = sorted(
+                    filenames_per_version.keys(),
+                    key=functools.cmp_to_key(
+                        lambda first, second: versions.CompareVersions(
+                            re.split(r"[.-]", first), re.split(r"[.-]", second)
+                        )
+                    ),
+                )
+                self._project_version = available_versions[-1]
+                self._cached_source_package_filename = filenames_per_version[
+                    self._project_version
+                ]
+
+        return self._project_version
+
+    def GetCachedSourcePackageFilenames(self):
+        """Retrieves the names of the files in the downloaded source package.
+
+        Only the names of the files in the top-level directory of the source
+        package are retrieved, without extracting the source package. The source
+        package is determined by GetCachedProjectVersion.
+
+        Returns:
+          list[str]: names of the files in the top-level directory of the source
+              package or None if not available.
+        """
+        if not self.GetCachedProjectVersion():
+            return None
+
+        if not self._cached_source_package_filename:
+            return None
+
+        source_package_path = os.path.join(
+            self._downloads_directory, self._cached_source_package_filename
+        )
+
+        try:
+            if source_package_path.endswith(".zip"):
+                with zipfile.ZipFile(source_package_path, "r") as archive:
+                    names = [
+                        zip_info.filename
+                        for zip_info in archive.infolist()
+                        if not zip_info.is_dir()
+                    ]
+            else:
+                with tarfile.open(
+                    source_package_path, "r:*", encoding="utf-8"
+                ) as archive:
+                    names = [
+                        tar_info.name
+                        for tar_info in archive.getmembers()
+                        if not tar_info.isdir()
+                    ]
+
+        except (OSError, tarfile.TarError, zipfile.BadZipFile) as exception:
+            logging.warning(
+                f"Unable to list files in source package: {source_package_path:s} "
+                f"with error: {exception!s}"
+            )
+            return None
+
+        filenames = set()
+        for name in names:
+            path_segments = name.split("/")
+            if len(path_segments) == 2:
+                filenames.add(path_segments[1])
+
+        return sorted(filenames)
+
     def GetProjectIdentifier(self):
         """Retrieves the project identifier for a given project name.
 
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""Tests for the index of the build artifacts in the builds directory."""
+
+import os
+import unittest
+
+from l2tdevtools import artifact_index
+
+from tests import test_lib
+
+
+class ArtifactIndexTest(test_lib.BaseTestCase):
+    """Tests for the index of the build artifacts in the builds directory."""
+
+    # pylint: disable=protected-access
+
+    _FILENAMES = [
+        "test-1.0-1.noarch.rpm",
+        "test-1.0-1.src.rpm",
+        "test-1.0-py3-none-any.whl",
+        "test_1.0-1_amd64.deb",
+        "test_1.0-1ppa1~noble_source.changes",
+        "test_1.0-1ppa1~noble.dsc",
+        "test_1.0.orig.tar.gz",
+    ]
+
+    def _CreateTestFiles(self, path):
+        """Creates test files.
+
+        Args:
+          path (str): path of the directory to create the test files in.
+        """
+        os.mkdir(os.path.join(path, "test-1.0"))
+        for filename in self._FILENAMES:
+            with open(os.path.join(path, filename), "wb") as file_object:
+                file_object.write(b"")
+
+    def testParseFilename(self):
+        """Tests the _ParseFilename function."""
+        test_index = artifact_index.ArtifactIndex("/tmp")
+
+        artifact = test_index._ParseFilename("test-1.0-1.noarch.rpm")
+        self.assertIsNotNone(artifact)
+        self.assertEqual(artifact.architecture, "noarch")
+        self.assertEqual(artifact.name, "test")
+        self.assertEqual(artifact.target, "rpm")
+        self.assertEqual(artifact.version, "1.0")
+
+        artifact = test_index._ParseFilename("test-1.0-1.src.rpm")
+        self.assertIsNotNone(artifact)
+        self.assertEqual(artifact.target, "srpm")
+
+        artifact = test_index._ParseFilename("test-1.0-py3-none-any.whl")
+        self.assertIsNotNone(artifact)
+        self.assertEqual(artifact.architecture, "any")
+        self.assertEqual(artifact.name, "test")
+        self.assertEqual(artifact.target, "wheel")
+        self.assertEqual(artifact.version, "1.0")
+
+        artifact = test_index._ParseFilename("test_1.0-1_amd64.deb")
+        self.assertIsNotNone(artifact)
+        self.assertEqual(artifact.architecture, "amd64")
+        self.assertIsNone(artifact.distribution)
+        self.assertEqual(artifact.name, "test")
+        self.assertEqual(artifact.target, "dpkg")
+        self.assertEqual(artifact.version, "1.0")
+
+        artifact = test_index._ParseFilename("test_1.0-1ppa1~noble_source.changes")
+        self.assertIsNotNone(artifact)
+        self.assertEqual(artifact.architecture, "source")
+        self.assertEqual(artifact.distribution, "noble")
+        self.assertEqual(artifact.target, "dpkg-source")
+        self.assertEqual(artifact.version, "1.0")
+
+        artifact = test_index._ParseFilename("test_1.0.orig.tar.gz")
+        self.assertIsNotNone(artifact)
+        self.assertEqual(artifact.target, "dpkg-source")
+        self.assertEqual(artifact.version, "1.0")
+
+        artifact = test_index._ParseFilename("test-1.0.tar.gz")
+        self.assertIsNone(artifact)
+
+    def testAddAndContains(self):
+        """Tests the Add and Contains functions."""
+        with test_lib.TempDirectory() as temp_directory:
+            self._CreateTestFiles(temp_directory)
+
+            test_index = artifact_index.ArtifactIndex(temp_directory)
+
+            self.assertTrue(test_index.Contains("test_1.0-1_amd64.deb"))
+            self.assertFalse(test_index.Contains("test_2.0-1_amd64.deb"))
+
+            # Files written directly into the builds directory are found.
+            path = os.path.join(temp_directory, "test_2.0-1_amd64.deb")
+            with open(path, "wb") as file_object:
+                file_object.write(b"")
+
+            self.assertTrue(test_index.Contains("test_2.0-1_amd64.deb"))
+
+            test_index.Add("test-2.0-py3-none-any.whl")
+
+            artifacts = test_index.GetArtifacts("test", target="wheel")
+            self.assertEqual(
+                [artifact.filename for artifact in artifacts],
+                ["test-1.0-py3-none-any.whl", "test-2.0-py3-none-any.whl"],
+            )
+
+    def testGetArtifacts(self):
+        """Tests the GetArtifacts function."""
+        with test_lib.TempDirectory() as temp_directory:
+            self._CreateTestFiles(temp_directory)
+
+            test_index = artifact_index.ArtifactIndex(temp_directory)
+
+            artifacts = test_index.GetArtifacts("test")
+            self.assertEqual(len(artifacts), 7)
+
+            artifacts = test_index.GetArtifacts("test", target="dpkg-source")
+            self.assertEqual(
+                [artifact.filename for artifact in artifacts],
+                [
+                    "test_1.0-1ppa1~noble.dsc",
+                    "test_1.0-1ppa1~noble_source.changes",
+                    "test_1.0.orig.tar.gz",
+                ],
+            )
+
+            artifacts = test_index.GetArtifacts("test", target="wheel", version="2.0")
+            self.assertEqual(artifacts, [])
+
+            artifacts = test_index.GetArtifacts("bogus")
+            self.assertEqual(artifacts, [])
+
+    def testGlob(self):
+        """Tests the Glob function."""
+        with test_lib.TempDirectory() as temp_directory:
+            self._CreateTestFiles(temp_directory)
+
+            test_index = artifact_index.ArtifactIndex(temp_directory)
+
+            filenames = test_index.Glob("test-1.0*")
+            self.assertEqual(
+                sorted(filenames),
+                [
+                    "test-1.0",
+                    "test-1.0-1.noarch.rpm",
+                    "test-1.0-1.src.rpm",
+                    "test-1.0-py3-none-any.whl",
+                ],
+            )
+
+            filenames = test_index.Glob("test-*", directories_only=True)
+            self.assertEqual(filenames, ["test-1.0"])
+
+    def testRemove(self):
+        """Tests the Remove function."""
+        with test_lib.TempDirectory() as temp_directory:
+            self._CreateTestFiles(temp_directory)
+
+            test_index = artifact_index.ArtifactIndex(temp_directory)
+
+            test_index.Remove("test-1.0-py3-none-any.whl")
+
+            filenames = test_index.Glob("*.whl")
+            self.assertEqual(filenames, [])
+
+            artifacts = test_index.GetArtifacts("test", target="wheel")
+            self.assertEqual(artifacts, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""Tests for the build tool."""
+
+import io
+import os
+import tarfile
+import unittest
+
+from l2tdevtools import projects
+
+from tools import build
+
+from tests import test_lib
+
+
+class TestBuildHelper:
+    """Build helper for testing, that builds multiple distributions.
+
+    Attributes:
+      built_distributions (list[str]): distributions passed to
+          BuildDistributions.
+      cleaned_distributions (list[str]): distributions for which Clean was
+          called.
+      distribution (str): distribution.
+      failing_distributions (set[str]): distributions for which the build
+          fails.
+      required_distributions (set[str]): distributions for which a build is
+          required.
+    """
+
+    def __init__(self, build_context, required_distributions, failing_distributions):
+        """Initializes a build helper for testing.
+
+        Args:
+          build_context (BuildContext): build context.
+          required_distributions (set[str]): distributions for which a build is
+              required.
+          failing_distributions (set[str]): distributions for which the build
+              fails.
+        """
+        super().__init__()
+        self._build_context = build_context
+        self.built_distributions = []
+        self.cleaned_distributions = []
+        self.distribution = None
+        self.failing_distributions = failing_distributions
+        self.required_distributions = required_distributions
+
+    def BuildDistributions(self, source_helper_object, distributions):
+        """Builds multiple distributions.
+
+        The output of the build is written to the build log file of every
+        distribution.
+
+        Args:
+          source_helper_object (SourceHelper): source helper.
+          distributions (list[str]): distributions.
+
+        Returns:
+          list[str]: distributions for which the build failed.
+        """
+        self.built_distributions = list(distributions)
+
+        for distribution in distributions:
+            log_path = self._build_context.GetLogPath(
+                source_helper_object.project_name, distribution=distribution
+            )
+            with open(log_path, "wb") as file_object:
+                file_object.write(b"")
+
+        return [
+            distribution
+            for distribution in distributions
+            if distribution in self.failing_distributions
+        ]
+
+    def CheckBuildRequired(self, unused_source_helper_object):
+        """Checks if a build is required.
+
+        Returns:
+          bool: True if a build is required, False otherwise.
+        """
+        return self.distribution in self.required_distributions
+
+    def Clean(self, unused_source_helper_object):
+        """Cleans the build results of the distribution."""
+        self.cleaned_distributions.append(self.distribution)
+
+
+class TestSourceHelper:
+    """Source helper for testing.
+
+    Attributes:
+      project_name (str): name of the project.
+    """
+
+    def __init__(self, project_name):
+        """Initializes a source helper for testing.
+
+        Args:
+          project_name (str): name of the project.
+        """
+        super().__init__()
+        self.project_name = project_name
+
+
+class ProjectBuilderTest(test_lib.BaseTestCase):
+    """Tests for the project builder."""
+
+    # pylint: disable=protected-access
+
+    def _CreateProjectDefinition(self, name, build_dependencies=None):
+        """Creates a project definition for testing.
+
+        Args:
+          name (str): name of the project.
+          build_dependencies (Optional[list[str]]): build dependencies.
+
+        Returns:
+          ProjectDefinition: project definition.
+        """
+        project_definition = projects.ProjectDefinition(name)
+        project_definition.build_dependencies = build_dependencies or []
+        project_definition.build_system = "setuptools"
+        project_definition.download_url = f"https://pypi.org/project/{name:s}"
+        project_definition.dpkg_build_dependencies = []
+        project_definition.rpm_build_dependencies = []
+        return project_definition
+
+    def testBuildDistributions(self):
+        """Tests the _BuildDistributions function."""
+        with test_lib.TempDirectory() as temp_directory:
+            project_builder = build.ProjectBuilder(
+                "dpkg-source", ".", temp_directory, builds_directory=temp_directory
+            )
+            test_context = project_builder._build_context
+
+            # The build log file of a previous build is removed.
+            log_path = test_context.GetLogPath("test", distribution="jammy")
+            with open(log_path, "wb") as file_object:
+                file_object.write(b"previous")
+
+            test_build_helper = TestBuildHelper(
+                test_context, {"jammy", "noble"}, {"jammy"}
+            )
+            source_helper_object = TestSourceHelper("test")
+
+            result = project_builder._BuildDistributions(
+                test_build_helper,
+                source_helper_object,
+                ["jammy", "noble", "resolute"],
+            )
+            self.assertFalse(result)
+
+            self.assertEqual(
+                test_build_helper.cleaned_distributions, ["jammy", "noble", "resolute"]
+            )
+            self.assertEqual(test_build_helper.built_distributions, ["jammy", "noble"])
+
+            # Only the build log file of the failed distribution is kept.
+            self.assertEqual(os.listdir(temp_directory), ["test_jammy_build.log.gz"])
+            self.assertEqual(os.path.getsize(log_path), 0)
+
+            # Nothing is built if no build is required.
+            test_build_helper = TestBuildHelper(test_context, set(), set())
+
+            result = project_builder._BuildDistributions(
+                test_build_helper, source_helper_object, ["jammy", "noble"]
+            )
+            self.assertTrue(result)
+            self.assertEqual(test_build_helper.built_distributions, [])
+
+    def testGetDistributions(self):
+        """Tests the _GetDistributions function."""
+        project_builder = build.ProjectBuilder("dpkg-source", ".", ".")
+
+        distributions = project_builder._GetDistributions(None)
+        self.assertEqual(
+            distributions, sorted(build.ProjectBuilder._DPKG_SOURCE_DISTRIBUTIONS)
+        )
+
+        distributions = project_builder._GetDistributions(["noble"])
+        self.assertEqual(distributions, ["noble"])
+
+        project_builder = build.ProjectBuilder("wheel", ".", ".")
+
+        distributions = project_builder._GetDistributions(None)
+        self.assertEqual(distributions, [None])
+
+    def testSortProjectsByDependencies(self):
+        """Tests the _SortProjectsByDependencies function."""
+        project_definitions = [
+            self._CreateProjectDefinition("dfvfs", ["python3-dtfabric", "zlib"]),
+            self._CreateProjectDefinition("dtfabric", ["pbr"]),
+            self._CreateProjectDefinition("pbr"),
+        ]
+
+        project_builder = build.ProjectBuilder("wheel", ".", ".")
+
+        sorted_project_definitions = project_builder._SortProjectsByDependencies(
+            project_definitions
+        )
+        names = [
+            project_definition.name for project_definition in sorted_project_definitions
+        ]
+        self.assertEqual(names, ["pbr", "dtfabric", "dfvfs"])
+
+        # Circular dependencies are sorted by name.
+        project_definitions = [
+            self._CreateProjectDefinition("first", ["second"]),
+            self._CreateProjectDefinition("second", ["first"]),
+        ]
+
+        sorted_project_definitions = project_builder._SortProjectsByDependencies(
+            project_definitions
+        )
+        names = [
+            project_definition.name for project_definition in sorted_project_definitions
+        ]
+        self.assertEqual(names, ["first", "second"])
+
+    def testPlan(self):
+        """Tests the Plan function."""
+        project_definitions = [
+            self._CreateProjectDefinition("dtfabric", ["pbr"]),
+            self._CreateProjectDefinition("pbr"),
+        ]
+
+        with test_lib.TempDirectory() as temp_directory:
+            for filename in (
+                "dtfabric-20230520.tar.gz",
+                "dtfabric-20230520-py2.py3-none-any.whl",
+                "pbr-6.1.0.tar.gz",
+            ):
+                path = os.path.join(temp_directory, filename)
+                with open(path, "wb") as file_object:
+                    file_object.write(b"")
+
+            project_builder = build.ProjectBuilder(
+                "wheel", ".", temp_directory, builds_directory=temp_directory
+            )
+            build_plan = project_builder.Plan(project_definitions)
+
+        self.assertEqual(len(build_plan), 2)
+
+        self.assertEqual(build_plan[0].name, "pbr")
+        self.assertEqual(build_plan[0].version, "6.1.0")
+        self.assertTrue(build_plan[0].build_required)
+
+        self.assertEqual(build_plan[1].name, "dtfabric")
+        self.assertEqual(build_plan[1].version, "20230520")
+        self.assertFalse(build_plan[1].build_required)
+        self.assertEqual(build_plan[1].missing_dependencies, ["pbr"])
+
+    def testPlanWithoutBuildSystem(self):
+        """Tests the Plan function with projects without a build system."""
+        project_definitions = [
+            self._CreateProjectDefinition("dtfabric"),
+            self._CreateProjectDefinition("pbr"),
+        ]
+        for project_definition in project_definitions:
+            project_definition.build_system = None
+
+        with test_lib.TempDirectory() as temp_directory:
+            path = os.path.join(temp_directory, "dtfabric-20230520.tar.gz")
+            with tarfile.open(path, "w:gz") as archive:
+                for name in ("dtfabric-20230520/setup.py", "dtfabric-20230520/README"):
+                    tar_info = tarfile.TarInfo(name)
+                    archive.addfile(tar_info, io.BytesIO(b""))
+
+            project_builder = build.ProjectBuilder(
+                "wheel", ".", temp_directory, builds_directory=temp_directory
+            )
+            build_plan = project_builder.Plan(project_definitions)
+
+        self.assertEqual(len(build_plan), 2)
+
+        # The build system is determined from the cached source package.
+        self.assertEqual(build_plan[0].name, "dtfabric")
+        self.assertEqual(build_plan[0].build_system, "setup_py")
+        self.assertEqual(build_plan[0].version, "20230520")
+        self.assertTrue(build_plan[0].build_required)
+
+        # The build system is unknown until the source package is extracted.
+        self.assertEqual(build_plan[1].name, "pbr")
+        self.assertIsNone(build_plan[1].build_system)
+        self.assertIsNone(build_plan[1].build_required)
+
+
+if __name__ == "__main__":
+    unittest.main()
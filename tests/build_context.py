@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""Tests for the build context."""
+
+import concurrent.futures
+import gzip
+import os
+import unittest
+
+from l2tdevtools import build_context
+
+from tests import test_lib
+
+
+class BuildContextTest(test_lib.BaseTestCase):
+    """Tests for the build context."""
+
+    def testInitialize(self):
+        """Tests the __init__ function."""
+        with test_lib.TempDirectory() as temp_directory:
+            test_context = build_context.BuildContext(temp_directory)
+
+            self.assertEqual(test_context.working_directory, temp_directory)
+            self.assertEqual(test_context.log_directory, temp_directory)
+            self.assertIsNone(test_context.environment)
+
+    def testGetBuildPath(self):
+        """Tests the GetBuildPath function."""
+        with test_lib.TempDirectory() as temp_directory:
+            test_context = build_context.BuildContext(temp_directory)
+
+            build_path = test_context.GetBuildPath("test")
+            self.assertEqual(build_path, temp_directory)
+
+            scratch_path = os.path.join(temp_directory, "scratch")
+            test_context = build_context.BuildContext(
+                temp_directory, scratch_path=scratch_path
+            )
+
+            build_path = test_context.GetBuildPath("test")
+            self.assertEqual(build_path, os.path.join(scratch_path, "test"))
+            self.assertTrue(os.path.isdir(build_path))
+
+    def testGetCleanupService(self):
+        """Tests the GetCleanupService function."""
+        with test_lib.TempDirectory() as temp_directory:
+            test_context = build_context.BuildContext(temp_directory)
+
+            cleanup_service = test_context.GetCleanupService()
+            self.assertIsNotNone(cleanup_service)
+            self.assertIs(test_context.GetCleanupService(), cleanup_service)
+
+            # The same cleanup service is retrieved from multiple threads.
+            sub_directory = os.path.join(temp_directory, "test-1.0")
+            with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+                cleanup_services = list(
+                    executor.map(
+                        lambda _: test_context.GetCleanupService(sub_directory),
+                        range(32),
+                    )
+                )
+
+            self.assertEqual(len(set(map(id, cleanup_services))), 1)
+            self.assertIsNot(cleanup_services[0], cleanup_service)
+
+    def testGetLogPath(self):
+        """Tests the GetLogPath function."""
+        with test_lib.TempDirectory() as temp_directory:
+            test_context = build_context.BuildContext(temp_directory)
+
+            log_path = test_context.GetLogPath("test")
+            self.assertEqual(
+                log_path, os.path.join(temp_directory, "test_build.log.gz")
+            )
+
+            log_path = test_context.GetLogPath("test", distribution="noble")
+            self.assertEqual(
+                log_path, os.path.join(temp_directory, "test_noble_build.log.gz")
+            )
+
+    def testGetPath(self):
+        """Tests the GetPath function."""
+        with test_lib.TempDirectory() as temp_directory:
+            test_context = build_context.BuildContext(temp_directory)
+
+            path = test_context.GetPath("test-1.0", "setup.py")
+            self.assertEqual(path, os.path.join(temp_directory, "test-1.0", "setup.py"))
+
+            path = test_context.GetPath(self._TEST_DATA_PATH)
+            self.assertEqual(path, self._TEST_DATA_PATH)
+
+    def testGlob(self):
+        """Tests the Glob function."""
+        with test_lib.TempDirectory() as temp_directory:
+            for filename in ("test-1.0.tar.gz", "test-2.0.tar.gz", "other.tar.gz"):
+                path = os.path.join(temp_directory, filename)
+                with open(path, "wb") as file_object:
+                    file_object.write(b"")
+
+            test_context = build_context.BuildContext(temp_directory)
+
+            filenames = test_context.Glob("test-*.tar.gz")
+            self.assertEqual(sorted(filenames), ["test-1.0.tar.gz", "test-2.0.tar.gz"])
+
+    def testMoveBuildResults(self):
+        """Tests the MoveBuildResults function."""
+        with test_lib.TempDirectory() as temp_directory:
+            scratch_path = os.path.join(temp_directory, "scratch")
+            test_context = build_context.BuildContext(
+                temp_directory, scratch_path=scratch_path
+            )
+
+            build_path = test_context.GetBuildPath("test")
+            os.mkdir(os.path.join(build_path, "test-1.0"))
+
+            path = os.path.join(build_path, "test_1.0-1_all.deb")
+            with open(path, "wb") as file_object:
+                file_object.write(b"")
+
+            test_context.MoveBuildResults(build_path)
+
+            self.assertEqual(os.listdir(build_path), ["test-1.0"])
+            self.assertTrue(
+                os.path.exists(os.path.join(temp_directory, "test_1.0-1_all.deb"))
+            )
+
+    def testRemoveBuildPath(self):
+        """Tests the RemoveBuildPath function."""
+        with test_lib.TempDirectory() as temp_directory:
+            scratch_path = os.path.join(temp_directory, "scratch")
+            test_context = build_context.BuildContext(
+                temp_directory, scratch_path=scratch_path
+            )
+
+            build_path = test_context.GetBuildPath("test")
+            os.mkdir(os.path.join(build_path, "test-1.0"))
+
+            test_context.RemoveBuildPath("test")
+            self.assertFalse(os.path.exists(build_path))
+
+            test_context.WaitForCleanup()
+            self.assertEqual(os.listdir(scratch_path), [])
+
+    def testRunCommand(self):
+        """Tests the RunCommand function."""
+        with test_lib.TempDirectory() as temp_directory:
+            os.mkdir(os.path.join(temp_directory, "test-1.0"))
+
+            test_context = build_context.BuildContext(temp_directory)
+
+            exit_code = test_context.RunCommand(
+                ["touch", "test.txt"], working_directory="test-1.0"
+            )
+            self.assertEqual(exit_code, 0)
+
+            path = os.path.join(temp_directory, "test-1.0", "test.txt")
+            self.assertTrue(os.path.exists(path))
+
+            exit_code = test_context.RunCommand(
+                ["echo", "first"], project_name="test", distribution="noble"
+            )
+            self.assertEqual(exit_code, 0)
+
+            exit_code = test_context.RunCommand(
+                ["sh", "-c", "echo second >&2; exit 2"],
+                project_name="test",
+                distribution="noble",
+            )
+            self.assertEqual(exit_code, 2)
+
+            log_path = test_context.GetLogPath("test", distribution="noble")
+            with gzip.open(log_path, "rt", encoding="utf-8") as file_object:
+                log_data = file_object.read()
+
+            self.assertEqual(
+                log_data,
+                "$ echo first\nfirst\n$ sh -c 'echo second >&2; exit 2'\nsecond\n",
+            )
+
+            exit_code = test_context.RunCommand(["bogus-command"], project_name="test")
+            self.assertNotEqual(exit_code, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,27 +2,474 @@
 """Tests for the helper for building projects from source."""
 
 import os
+import threading
 import unittest
+import zipfile
 
+from l2tdevtools import build_context
 from l2tdevtools import projects
 from l2tdevtools.build_helpers import dpkg
 
 from tests import test_lib
 
 
+class TestSourceHelper:
+    """Source helper for testing.
+
+    Attributes:
+      project_name (str): name of the project.
+    """
+
+    def __init__(
+        self, project_name, project_version, source_directory, source_package_path
+    ):
+        """Initializes a source helper for testing.
+
+        Args:
+          project_name (str): name of the project.
+          project_version (str): version of the project.
+          source_directory (str): path of the source directory.
+          source_package_path (str): path of the source package.
+        """
+        super().__init__()
+        self._project_version = project_version
+        self._source_directory = source_directory
+        self._source_package_path = source_package_path
+        self.project_name = project_name
+
+    def GetProjectVersion(self):
+        """Retrieves the version of the project.
+
+        Returns:
+          str: version of the project.
+        """
+        return self._project_version
+
+    def GetSourceDirectoryPath(self):
+        """Retrieves the path of the source directory.
+
+        Returns:
+          str: path of the source directory.
+        """
+        return self._source_directory
+
+    def GetSourcePackageFilename(self):
+        """Retrieves the filename of the source package.
+
+        Returns:
+          str: filename of the source package.
+        """
+        return os.path.basename(self._source_package_path)
+
+    def GetSourcePackagePath(self):
+        """Retrieves the path of the source package.
+
+        Returns:
+          str: path of the source package.
+        """
+        return self._source_package_path
+
+
+class TestSourceDPKGBuildHelper(dpkg.ConfigureMakeSourceDPKGBuildHelper):
+    """Helper to build source dpkg packages for testing.
+
+    Instead of running debuild, the build results are created from the version
+    in debian/changelog.
+
+    Attributes:
+      built_distributions (list[str]): distributions for which debuild was run.
+      failing_distributions (set[str]): distributions for which debuild fails.
+    """
+
+    def __init__(self, project_definition, l2tdevtools_path, context):
+        """Initializes a build helper for testing.
+
+        Args:
+          project_definition (ProjectDefinition): definition of the project
+              to build.
+          l2tdevtools_path (str): path to the l2tdevtools directory.
+          context (BuildContext): build context.
+        """
+        super().__init__(
+            project_definition, l2tdevtools_path, {}, build_context=context
+        )
+        self._lock = threading.Lock()
+        self.built_distributions = []
+        self.failing_distributions = set()
+
+    def _RunCommand(self, command, working_directory=None, distribution=None):
+        """Runs a build command.
+
+        Args:
+          command (list[str]): build command and its arguments.
+          working_directory (Optional[str]): path of the working directory.
+          distribution (Optional[str]): name of the distribution.
+
+        Returns:
+          int: exit code of the build command.
+        """
+        with self._lock:
+            self.built_distributions.append(distribution)
+
+        if distribution in self.failing_distributions:
+            return 1
+
+        changelog_path = os.path.join(working_directory, "debian", "changelog")
+        with open(changelog_path, "r", encoding="utf-8") as file_object:
+            line = file_object.readline()
+
+        version = line.split("(", 1)[1].split(")", 1)[0]
+        name = self._project_definition.name
+
+        for filename in (
+            f"{name:s}_{version:s}.dsc",
+            f"{name:s}_{version:s}_source.changes",
+        ):
+            path = os.path.join(os.path.dirname(working_directory), filename)
+            with open(path, "w", encoding="utf-8") as file_object:
+                file_object.write("")
+
+        return 0
+
+
 class DPKGBuildHelperTest(test_lib.BaseTestCase):
     """Tests for the helper to build dpkg packages (.deb)."""
 
     # pylint: disable=protected-access
 
+    def _CreateTestSourceDirectory(self, build_path):
+        """Creates a source directory for testing.
+
+        Args:
+          build_path (str): path of the directory to create the source directory
+              in.
+
+        Returns:
+          str: path of the source directory.
+        """
+        source_directory = os.path.join(build_path, "test-1.0")
+        os.makedirs(os.path.join(source_directory, "dpkg"))
+        os.makedirs(os.path.join(source_directory, "src"))
+
+        path = os.path.join(source_directory, "dpkg", "changelog")
+        with open(path, "w", encoding="utf-8") as file_object:
+            file_object.write("test (1.0-1) unstable; urgency=low\n\n  * Test\n")
+
+        path = os.path.join(source_directory, "src", "test.c")
+        with open(path, "w", encoding="utf-8") as file_object:
+            file_object.write("test\n")
+
+        return source_directory
+
     # TODO: add tests for _BuildPrepare
     # TODO: add tests for _BuildFinalize
+
+    def testBuildSourceDistribution(self):
+        """Tests the _BuildSourceDistribution function."""
+        project_definition = projects.ProjectDefinition("test")
+
+        l2tdevtools_path = os.path.dirname(
+            os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        )
+
+        with test_lib.TempDirectory() as temp_directory:
+            builds_directory = os.path.join(temp_directory, "builds")
+            os.mkdir(builds_directory)
+
+            build_path = os.path.join(temp_directory, "scratch")
+            os.mkdir(build_path)
+
+            source_directory = self._CreateTestSourceDirectory(build_path)
+            os.rename(
+                os.path.join(source_directory, "dpkg"),
+                os.path.join(source_directory, "debian"),
+            )
+
+            orig_source_package_path = os.path.join(build_path, "test_1.0.orig.tar.gz")
+            with open(orig_source_package_path, "wb") as file_object:
+                file_object.write(b"")
+
+            test_context = build_context.BuildContext(builds_directory)
+            test_build_helper = TestSourceDPKGBuildHelper(
+                project_definition, l2tdevtools_path, test_context
+            )
+            test_build_helper.failing_distributions.add("jammy")
+
+            result = test_build_helper._BuildSourceDistribution(
+                source_directory, orig_source_package_path, "test", "1.0", "noble"
+            )
+            self.assertTrue(result)
+
+            result = test_build_helper._BuildSourceDistribution(
+                source_directory, orig_source_package_path, "test", "1.0", "jammy"
+            )
+            self.assertFalse(result)
+
+            test_context.WaitForCleanup()
+
+            # Only the build results of the successful build are moved.
+            self.assertEqual(
+                sorted(os.listdir(builds_directory)),
+                ["test_1.0-1ppa1~noble.dsc", "test_1.0-1ppa1~noble_source.changes"],
+            )
+
+            # The clones are removed and the source directory is not changed.
+            self.assertEqual(
+                sorted(os.listdir(build_path)), ["test-1.0", "test_1.0.orig.tar.gz"]
+            )
+
+            path = os.path.join(source_directory, "debian", "changelog")
+            with open(path, "r", encoding="utf-8") as file_object:
+                self.assertTrue(file_object.read().startswith("test (1.0-1) unstable;"))
+
+    def testBuildSourceDistributions(self):
+        """Tests the _BuildSourceDistributions function."""
+        project_definition = projects.ProjectDefinition("test")
+
+        l2tdevtools_path = os.path.dirname(
+            os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        )
+
+        with test_lib.TempDirectory() as temp_directory:
+            builds_directory = os.path.join(temp_directory, "builds")
+            os.mkdir(builds_directory)
+
+            scratch_directory = os.path.join(temp_directory, "scratch")
+
+            test_context = build_context.BuildContext(
+                builds_directory, scratch_path=scratch_directory
+            )
+            build_path = test_context.GetBuildPath("test")
+            source_directory = self._CreateTestSourceDirectory(build_path)
+
+            test_build_helper = TestSourceDPKGBuildHelper(
+                project_definition, l2tdevtools_path, test_context
+            )
+            test_build_helper.failing_distributions.add("jammy")
+
+            source_package_path = os.path.join(temp_directory, "test-1.0.tar.gz")
+            with open(source_package_path, "wb") as file_object:
+                file_object.write(b"")
+
+            source_helper_object = TestSourceHelper(
+                "test", "1.0", source_directory, source_package_path
+            )
+
+            failed_distributions = test_build_helper.BuildDistributions(
+                source_helper_object, ["jammy", "noble", "resolute"]
+            )
+            self.assertEqual(failed_distributions, ["jammy"])
+            self.assertEqual(
+                sorted(test_build_helper.built_distributions),
+                ["jammy", "noble", "resolute"],
+            )
+
+            test_context.WaitForCleanup()
+
+            # The build results are moved into the builds directory and indexed.
+            expected_filenames = [
+                "test_1.0-1ppa1~noble.dsc",
+                "test_1.0-1ppa1~noble_source.changes",
+                "test_1.0-1ppa1~resolute.dsc",
+                "test_1.0-1ppa1~resolute_source.changes",
+                "test_1.0.orig.tar.gz",
+            ]
+            self.assertEqual(sorted(os.listdir(builds_directory)), expected_filenames)
+
+            artifacts = test_context.artifact_index.GetArtifacts(
+                "test", target="dpkg-source"
+            )
+            self.assertEqual(
+                [artifact.filename for artifact in artifacts], expected_filenames
+            )
+            self.assertEqual(
+                [artifact.distribution for artifact in artifacts],
+                ["noble", "noble", "resolute", "resolute", None],
+            )
+
+            # The clones of the source directory are removed.
+            self.assertEqual(os.listdir(build_path), ["test-1.0"])
+
     # TODO: add tests for _CheckIsInstalled
+
+    def testCloneFile(self):
+        """Tests the _CloneFile function."""
+        project_definition = projects.ProjectDefinition("test")
+
+        l2tdevtools_path = os.path.dirname(
+            os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        )
+
+        with test_lib.TempDirectory() as temp_directory:
+            source_path = os.path.join(temp_directory, "source")
+            with open(source_path, "w", encoding="utf-8") as file_object:
+                file_object.write("test\n")
+
+            test_build_helper = dpkg.DPKGBuildHelper(
+                project_definition,
+                l2tdevtools_path,
+                {},
+                build_context=build_context.BuildContext(temp_directory),
+            )
+
+            # Without reflink support the file is copied.
+            test_build_helper._clone_with_reflink = False
+
+            destination_path = os.path.join(temp_directory, "copy")
+            test_build_helper._CloneFile(source_path, destination_path)
+
+            with open(destination_path, "r", encoding="utf-8") as file_object:
+                self.assertEqual(file_object.read(), "test\n")
+
+            self.assertNotEqual(
+                os.stat(source_path).st_ino, os.stat(destination_path).st_ino
+            )
+
+            if dpkg.fcntl:
+                # An unsupported reflink falls back to a copy, without leaving
+                # a partial clone behind.
+                test_build_helper._FICLONE = 0  # pylint: disable=invalid-name
+                test_build_helper._clone_with_reflink = True
+
+                destination_path = os.path.join(temp_directory, "clone")
+                test_build_helper._CloneFile(source_path, destination_path)
+
+                self.assertFalse(test_build_helper._clone_with_reflink)
+
+                with open(destination_path, "r", encoding="utf-8") as file_object:
+                    self.assertEqual(file_object.read(), "test\n")
+
+                self.assertNotEqual(
+                    os.stat(source_path).st_ino, os.stat(destination_path).st_ino
+                )
+
+            # A failed clone does not leave a destination behind.
+            destination_path = os.path.join(temp_directory, "bogus")
+            with self.assertRaises(OSError):
+                test_build_helper._CloneFile(
+                    os.path.join(temp_directory, "missing"), destination_path
+                )
+
+            self.assertFalse(os.path.exists(destination_path))
+
+    def testCloneSourceDirectory(self):
+        """Tests the _CloneSourceDirectory function."""
+        project_definition = projects.ProjectDefinition("test")
+
+        l2tdevtools_path = os.path.dirname(
+            os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        )
+
+        with test_lib.TempDirectory() as temp_directory:
+            source_directory = os.path.join(temp_directory, "test-1.0")
+            os.makedirs(os.path.join(source_directory, "debian"))
+            os.makedirs(os.path.join(source_directory, "src"))
+
+            for path_segments in (["debian", "changelog"], ["src", "test.c"]):
+                path = os.path.join(source_directory, *path_segments)
+                with open(path, "w", encoding="utf-8") as file_object:
+                    file_object.write("test\n")
+
+            test_build_helper = dpkg.DPKGBuildHelper(
+                project_definition,
+                l2tdevtools_path,
+                {},
+                build_context=build_context.BuildContext(temp_directory),
+            )
+
+            clone_directory = os.path.join(temp_directory, "clone", "test-1.0")
+            test_build_helper._CloneSourceDirectory(source_directory, clone_directory)
+
+            path = os.path.join(clone_directory, "src", "test.c")
+            with open(path, "r", encoding="utf-8") as file_object:
+                self.assertEqual(file_object.read(), "test\n")
+
+            # The files in the debian sub directory are copied.
+            path = os.path.join(clone_directory, "debian", "changelog")
+            with open(path, "w", encoding="utf-8") as file_object:
+                file_object.write("changed\n")
+
+            path = os.path.join(source_directory, "debian", "changelog")
+            with open(path, "r", encoding="utf-8") as file_object:
+                self.assertEqual(file_object.read(), "test\n")
+
+    def testCreateDistributionChangelog(self):
+        """Tests the _CreateDistributionChangelog function."""
+        project_definition = projects.ProjectDefinition("test")
+
+        l2tdevtools_path = os.path.dirname(
+            os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        )
+
+        with test_lib.TempDirectory() as temp_directory:
+            os.mkdir(os.path.join(temp_directory, "debian"))
+
+            changelog_path = os.path.join(temp_directory, "debian", "changelog")
+            with open(changelog_path, "w", encoding="utf-8") as file_object:
+                file_object.write(
+                    "test (1.0-1) unstable; urgency=low\n\n  * Auto-generated\n"
+                )
+
+            test_build_helper = dpkg.DPKGBuildHelper(
+                project_definition,
+                l2tdevtools_path,
+                {},
+                build_context=build_context.BuildContext(temp_directory),
+            )
+
+            result = test_build_helper._CreateDistributionChangelog(
+                temp_directory, "ppa1", "noble"
+            )
+            self.assertTrue(result)
+
+            with open(changelog_path, "r", encoding="utf-8") as file_object:
+                changelog_data = file_object.read()
+
+            self.assertEqual(
+                changelog_data,
+                "test (1.0-1ppa1~noble) noble; urgency=low\n\n  * Auto-generated\n",
+            )
+
+            # The version suffix and distribution are not added twice.
+            result = test_build_helper._CreateDistributionChangelog(
+                temp_directory, "ppa1", "noble"
+            )
+            self.assertTrue(result)
+
+            with open(changelog_path, "r", encoding="utf-8") as file_object:
+                changelog_data = file_object.read()
+
+            self.assertTrue(changelog_data.startswith("test (1.0-1ppa1~noble) noble;"))
+
+            with open(changelog_path, "w", encoding="utf-8") as file_object:
+                file_object.write("bogus\n")
+
+            result = test_build_helper._CreateDistributionChangelog(
+                temp_directory, "ppa1", "noble"
+            )
+            self.assertFalse(result)
+
     # TODO: add tests for _CreateOriginalSourcePackage
     # TODO: add tests for _CreateOriginalSourcePackageFromZip
     # TODO: add tests for _CreatePackagingFiles
     # TODO: add tests for _GetBuildHostDistribution
 
+    def testParseInstalledPackages(self):
+        """Tests the _ParseInstalledPackages function."""
+        project_definition = projects.ProjectDefinition("test")
+
+        l2tdevtools_path = os.path.dirname(
+            os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        )
+
+        test_build_helper = dpkg.DPKGBuildHelper(
+            project_definition, l2tdevtools_path, {}
+        )
+        installed_packages = test_build_helper._ParseInstalledPackages(
+            "git\tinstalled\nlibssl-dev\tconfig-files\npython3-all\tinstalled\n"
+        )
+        self.assertEqual(installed_packages, {"git", "python3-all"})
+
     def testReadLSBReleaseConfigurationFile(self):
         """Tests the _ReadLSBReleaseConfigurationFile function."""
         test_path = self._GetTestFilePath(["lsb-release"])
@@ -96,6 +543,105 @@ class ConfigureMakeSourceDPKGBuildHelperTest(test_lib.BaseTestCase):
 class PybuildDPKGBuildHelperTest(test_lib.BaseTestCase):
     """Tests for the helper to build dpkg packages (.deb)."""
 
+    # pylint: disable=protected-access
+
+    _WHEEL_RECORD = "\n".join(
+        [
+            "test/__init__.py,sha256=,0",
+            "test/__pycache__/__init__.cpython-312.pyc,,",
+            "test/lib/module.py,sha256=,0",
+            "test_module.py,sha256=,0",
+            "_test.cpython-312-x86_64-linux-gnu.so,sha256=,0",
+            "test-20260101.data/scripts/test_tool.py,sha256=,0",
+            "test-20260101.data/purelib/test_data/__init__.py,sha256=,0",
+            "test-20260101.dist-info/METADATA,sha256=,0",
+            "test-20260101.dist-info/RECORD,,",
+            "",
+        ]
+    )
+
+    def _CreateTestBuildHelper(self):
+        """Creates a build helper for testing.
+
+        Returns:
+          PybuildDPKGBuildHelper: build helper.
+        """
+        project_definition = projects.ProjectDefinition("test")
+
+        l2tdevtools_path = os.path.dirname(
+            os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        )
+
+        return dpkg.PybuildDPKGBuildHelper(project_definition, l2tdevtools_path, {})
+
+    def testGetDistributionName(self):
+        """Tests the _GetDistributionName function."""
+        test_build_helper = self._CreateTestBuildHelper()
+
+        with test_lib.TempDirectory() as temp_directory:
+            distribution_name = test_build_helper._GetDistributionName(temp_directory)
+            self.assertIsNone(distribution_name)
+
+            pkg_info_path = os.path.join(temp_directory, "PKG-INFO")
+            with open(pkg_info_path, "w", encoding="utf-8") as file_object:
+                file_object.write("Metadata-Version: 2.1\nName: Test.Project\n\n")
+
+            distribution_name = test_build_helper._GetDistributionName(temp_directory)
+            self.assertEqual(distribution_name, "test_project")
+
+            pyproject_toml_path = os.path.join(temp_directory, "pyproject.toml")
+            with open(pyproject_toml_path, "w", encoding="utf-8") as file_object:
+                file_object.write('[project]\nname = "test-project"\n')
+
+            distribution_name = test_build_helper._GetDistributionName(temp_directory)
+            self.assertEqual(distribution_name, "test_project")
+
+    def testGetWheelPath(self):
+        """Tests the _GetWheelPath function."""
+        test_build_helper = self._CreateTestBuildHelper()
+
+        with test_lib.TempDirectory() as temp_directory:
+            wheel_path = os.path.join(temp_directory, "Test-20260101-py3-none-any.whl")
+            with open(wheel_path, "wb") as file_object:
+                file_object.write(b"")
+
+            path = test_build_helper._GetWheelPath(temp_directory, "test", "20260101")
+            self.assertEqual(path, wheel_path)
+
+            path = test_build_helper._GetWheelPath(temp_directory, "test", "20260102")
+            self.assertIsNone(path)
+
+    def testReadWheelBuildConfiguration(self):
+        """Tests the _ReadWheelBuildConfiguration function."""
+        test_build_helper = self._CreateTestBuildHelper()
+
+        with test_lib.TempDirectory() as temp_directory:
+            wheel_path = os.path.join(temp_directory, "test-20260101-py3-none-any.whl")
+            with zipfile.ZipFile(wheel_path, "w") as zip_file:
+                zip_file.writestr("test-20260101.dist-info/RECORD", self._WHEEL_RECORD)
+
+            build_configuration = test_build_helper._ReadWheelBuildConfiguration(
+                wheel_path
+            )
+            self.assertIsNotNone(build_configuration)
+            self.assertTrue(build_configuration.has_bin_directory)
+            self.assertTrue(build_configuration.has_dist_info_directory)
+            self.assertFalse(build_configuration.has_egg_info_directory)
+            self.assertTrue(build_configuration.has_module_shared_object)
+            self.assertTrue(build_configuration.has_module_source_files)
+            self.assertEqual(
+                build_configuration.module_directories, ["test", "test_data"]
+            )
+
+            # A wheel without RECORD is not supported.
+            with zipfile.ZipFile(wheel_path, "w") as zip_file:
+                zip_file.writestr("test_module.py", "")
+
+            build_configuration = test_build_helper._ReadWheelBuildConfiguration(
+                wheel_path
+            )
+            self.assertIsNone(build_configuration)
+
     # TODO: add tests for _GetFilenameSafeProjectInformation
     # TODO: add tests for Build
     # TODO: add tests for CheckBuildRequired
@@ -1,9 +1,90 @@
 #!/usr/bin/env python3
 """Tests for the helper for building projects from source."""
 
+import os
 import unittest
 
-# TODO: add BaseRPMBuildHelper tests.
+from l2tdevtools import build_context
+from l2tdevtools import projects
+from l2tdevtools.build_helpers import rpm
+
+from tests import test_lib
+
+
+class BaseRPMBuildHelperTest(test_lib.BaseTestCase):
+    """Tests for the helper to build RPM packages (.rpm)."""
+
+    # pylint: disable=protected-access
+
+    def testParseInstalledPackages(self):
+        """Tests the _ParseInstalledPackages function."""
+        project_definition = projects.ProjectDefinition("test")
+
+        l2tdevtools_path = os.path.dirname(
+            os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        )
+
+        test_build_helper = rpm.BaseRPMBuildHelper(
+            project_definition, l2tdevtools_path, {}
+        )
+        installed_packages = test_build_helper._ParseInstalledPackages(
+            "git\npython3-devel\n\n"
+        )
+        self.assertEqual(installed_packages, {"git", "python3-devel"})
+
+    def testPrivateRPMBuildPath(self):
+        """Tests the private rpmbuild top directory functions."""
+        project_definition = projects.ProjectDefinition("test")
+
+        l2tdevtools_path = os.path.dirname(
+            os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        )
+
+        with test_lib.TempDirectory() as temp_directory:
+            rpmbuild_path = os.path.join(temp_directory, "rpmbuild")
+            test_context = build_context.BuildContext(
+                temp_directory, private_rpmbuild=True, rpmbuild_path=rpmbuild_path
+            )
+            test_build_helper = rpm.BaseRPMBuildHelper(
+                project_definition, l2tdevtools_path, {}, build_context=test_context
+            )
+
+            test_build_helper._CreatePrivateRPMBuildPath("test", "1.0")
+
+            private_rpmbuild_path = test_build_helper.rpmbuild_path
+            self.assertEqual(os.path.dirname(private_rpmbuild_path), rpmbuild_path)
+            self.assertTrue(os.path.isdir(test_build_helper._rpmbuild_specs_path))
+
+            path = os.path.join(private_rpmbuild_path, "RPMS", "noarch")
+            os.makedirs(path)
+            for filename in ("test-1.0-1.noarch.rpm", "test-1.0-1.noarch.txt"):
+                with open(os.path.join(path, filename), "wb") as file_object:
+                    file_object.write(b"")
+
+            os.makedirs(test_build_helper._rpmbuild_srpms_path)
+            path = os.path.join(
+                test_build_helper._rpmbuild_srpms_path, "test-1.0-1.src.rpm"
+            )
+            with open(path, "wb") as file_object:
+                file_object.write(b"")
+
+            test_build_helper._MoveRPMBuildResults()
+
+            filenames = sorted(
+                filename
+                for filename in os.listdir(temp_directory)
+                if filename.endswith(".rpm")
+            )
+            self.assertEqual(filenames, ["test-1.0-1.noarch.rpm", "test-1.0-1.src.rpm"])
+
+            test_build_helper._RemovePrivateRPMBuildPath()
+            test_context.WaitForCleanup()
+
+            self.assertFalse(os.path.exists(private_rpmbuild_path))
+            self.assertEqual(test_build_helper.rpmbuild_path, rpmbuild_path)
+
+
+# TODO: add more BaseRPMBuildHelper tests.
 # TODO: add RPMBuildHelper tests.
 # TODO: add ConfigureMakeRPMBuildHelper tests.
 # TODO: add PyprojectRPMBuildHelper tests.
@@ -1,10 +1,12 @@
 #!/usr/bin/env python3
 """Tests for the helper for building projects from source."""
 
+import gzip
 import os
 import shutil
 import unittest
 
+from l2tdevtools import build_context
 from l2tdevtools import projects
 from l2tdevtools.build_helpers import wheel
 
@@ -102,10 +104,6 @@ class WheelBuildHelperTest(shared_test_lib.BaseTestCase):
             os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         )
 
-        test_build_helper = wheel.WheelBuildHelper(
-            project_definition, l2tdevtools_path, {}
-        )
-
         source_helper_object = test_lib.TestSourceHelper(
             self._TEST_PROJECT_NAME, project_definition, self._TEST_PROJECT_VERSION
         )
@@ -129,13 +127,15 @@ class WheelBuildHelperTest(shared_test_lib.BaseTestCase):
             directory_entries = os.listdir(temp_directory)
             self.assertEqual(len(directory_entries), 2)
 
-            current_working_directory = os.getcwd()
-            os.chdir(temp_directory)
-
-            try:
-                test_build_helper.Clean(source_helper_object)
-            finally:
-                os.chdir(current_working_directory)
+            test_context = build_context.BuildContext(temp_directory)
+            test_build_helper = wheel.WheelBuildHelper(
+                project_definition,
+                l2tdevtools_path,
+                {},
+                build_context=test_context,
+            )
+            test_build_helper.Clean(source_helper_object)
+            test_context.WaitForCleanup()
 
             directory_entries = os.listdir(temp_directory)
             self.assertEqual(len(directory_entries), 1)
@@ -158,10 +158,6 @@ class ConfigureMakeWheelBuildHelperTest(shared_test_lib.BaseTestCase):
             os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         )
 
-        test_build_helper = wheel.ConfigureMakeWheelBuildHelper(
-            project_definition, l2tdevtools_path, {}
-        )
-
         source_helper_object = test_lib.TestSourceHelper(
             self._TEST_PROJECT_NAME, project_definition, self._TEST_PROJECT_VERSION
         )
@@ -177,6 +173,13 @@ class ConfigureMakeWheelBuildHelperTest(shared_test_lib.BaseTestCase):
             directory_entries = os.listdir(temp_directory)
             self.assertEqual(len(directory_entries), 1)
 
+            test_build_helper = wheel.ConfigureMakeWheelBuildHelper(
+                project_definition,
+                l2tdevtools_path,
+                {},
+                build_context=build_context.BuildContext(temp_directory),
+            )
+
             current_working_directory = os.getcwd()
             os.chdir(temp_directory)
 
@@ -186,12 +189,14 @@ class ConfigureMakeWheelBuildHelperTest(shared_test_lib.BaseTestCase):
             finally:
                 os.chdir(current_working_directory)
 
+            log_filename = f"{self._TEST_PROJECT_NAME:s}_build.log.gz"
+
             directory_entries = os.listdir(temp_directory)
-            self.assertIn("build.log", directory_entries)
+            self.assertIn(log_filename, directory_entries)
 
             if len(directory_entries) < 4:
-                build_log_path = os.path.join(temp_directory, "build.log")
-                with open(build_log_path, "r", encoding="utf-8") as file_object:
+                build_log_path = os.path.join(temp_directory, log_filename)
+                with gzip.open(build_log_path, "rt", encoding="utf-8") as file_object:
                     print("".join(file_object.readlines()))
 
             self.assertEqual(len(directory_entries), 4)
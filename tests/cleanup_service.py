@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""Tests for the service to remove superseded files and directories."""
+
+import os
+import unittest
+
+from l2tdevtools import cleanup_service
+
+from tests import test_lib
+
+
+class CleanupServiceTest(test_lib.BaseTestCase):
+    """Tests for the service to remove superseded files and directories."""
+
+    def testGlob(self):
+        """Tests the Glob function."""
+        with test_lib.TempDirectory() as temp_directory:
+            os.mkdir(os.path.join(temp_directory, "test-1.0"))
+            for filename in ("test-1.0.tar.gz", "test-2.0.tar.gz", "other.tar.gz"):
+                path = os.path.join(temp_directory, filename)
+                with open(path, "wb") as file_object:
+                    file_object.write(b"")
+
+            test_service = cleanup_service.CleanupService(temp_directory)
+
+            filenames = test_service.Glob("test-*")
+            self.assertEqual(
+                sorted(filenames), ["test-1.0", "test-1.0.tar.gz", "test-2.0.tar.gz"]
+            )
+
+            filenames = test_service.Glob("test-*", directories_only=True)
+            self.assertEqual(filenames, ["test-1.0"])
+
+    def testRemove(self):
+        """Tests the Remove function."""
+        with test_lib.TempDirectory() as temp_directory:
+            os.mkdir(os.path.join(temp_directory, "test-1.0"))
+            for filename in ("test-1.0.tar.gz", "test-2.0.tar.gz"):
+                path = os.path.join(temp_directory, filename)
+                with open(path, "wb") as file_object:
+                    file_object.write(b"")
+
+            test_service = cleanup_service.CleanupService(temp_directory)
+
+            for filename in test_service.Glob("test-1.0*"):
+                test_service.Remove(filename)
+
+            # The removed entries are no longer in the scan of the directory.
+            filenames = test_service.Glob("test-*")
+            self.assertEqual(filenames, ["test-2.0.tar.gz"])
+
+            test_service.Wait()
+
+            self.assertEqual(os.listdir(temp_directory), ["test-2.0.tar.gz"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Tests for the base class for dependency file writers."""
 
+import os
 import unittest
 
 from l2tdevtools import dependencies
@@ -97,7 +98,54 @@ class DependencyFileWriterTest(test_lib.BaseTestCase):
         test_dependencies = test_writer._GetRPMTestDependencies(python_dependencies)
         self.assertEqual(test_dependencies, expected_test_dependencies)
 
-    # TODO: add tests for _ReadTemplateFile.
+    def testReadTemplateFile(self):
+        """Tests the _ReadTemplateFile function."""
+        test_writer = self._CreateTestWriter()
+
+        with test_lib.TempDirectory() as temp_directory:
+            template_filename = os.path.join(temp_directory, "template")
+            with open(template_filename, "w", encoding="utf-8") as file_object:
+                file_object.write("${name}")
+
+            template = test_writer._ReadTemplateFile(template_filename)
+            self.assertEqual(template.template, "${name}")
+
+            # The template is cached for all writers.
+            other_test_writer = self._CreateTestWriter()
+            other_template = other_test_writer._ReadTemplateFile(template_filename)
+            self.assertIs(other_template, template)
+
+            # The template is read again if the file changed.
+            with open(template_filename, "w", encoding="utf-8") as file_object:
+                file_object.write("${name} ${version}")
+
+            template = test_writer._ReadTemplateFile(template_filename)
+            self.assertEqual(template.template, "${name} ${version}")
+
+    def testWriteFile(self):
+        """Tests the _WriteFile function."""
+        test_writer = self._CreateTestWriter()
+
+        with test_lib.TempDirectory() as temp_directory:
+            path = os.path.join(temp_directory, "file.txt")
+
+            result = test_writer._WriteFile(path, "first\n")
+            self.assertTrue(result)
+            self.assertIn("+first", test_writer.file_diffs[path])
+
+            # The file is not written if its content did not change.
+            test_writer.file_diffs = {}
+            result = test_writer._WriteFile(path, "first\n")
+            self.assertFalse(result)
+            self.assertEqual(test_writer.file_diffs, {})
+
+            result = test_writer._WriteFile(path, "second\n")
+            self.assertTrue(result)
+            self.assertIn("-first", test_writer.file_diffs[path])
+            self.assertIn("+second", test_writer.file_diffs[path])
+
+            with open(path, "r", encoding="utf-8") as file_object:
+                self.assertEqual(file_object.read(), "second\n")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,535 @@
+#!/usr/bin/env python3
+"""Tests for the manage tool."""
+
+import gzip
+import io
+import os
+import unittest
+
+from tools import manage
+
+from tests import test_lib
+
+
+class COPRProjectManagerTest(test_lib.BaseTestCase):
+    """Tests for the COPR project manager."""
+
+    # pylint: disable=protected-access
+
+    _PRIMARY_XML = b"""\
+<?xml version="1.0" encoding="UTF-8"?>
+<metadata xmlns="http://linux.duke.edu/metadata/common"
+  xmlns:rpm="http://linux.duke.edu/metadata/rpm" packages="4">
+<package type="rpm">
+  <name>libbde</name>
+  <arch>src</arch>
+  <version epoch="0" ver="20240502" rel="1"/>
+</package>
+<package type="rpm">
+  <name>libbde</name>
+  <arch>x86_64</arch>
+  <version epoch="0" ver="20240601" rel="1"/>
+</package>
+<package type="rpm">
+  <name>libbde</name>
+  <arch>src</arch>
+  <version epoch="0" ver="20230101" rel="1"/>
+</package>
+<package type="rpm">
+  <name>python-dfvfs</name>
+  <arch>src</arch>
+  <version epoch="0" ver="20240505" rel="1"/>
+</package>
+</metadata>
+"""
+
+    def testParsePrimaryXML(self):
+        """Tests the _ParsePrimaryXML function."""
+        copr_project_manager = manage.COPRProjectManager("gift")
+
+        file_object = io.BytesIO(gzip.compress(self._PRIMARY_XML))
+        with gzip.GzipFile(fileobj=file_object) as gzip_file_object:
+            packages = copr_project_manager._ParsePrimaryXML(gzip_file_object)
+
+        self.assertEqual(packages, {"libbde": "20240502", "python-dfvfs": "20240505"})
+
+
+class TestDownloadHelper:
+    """Download helper for testing."""
+
+    def __init__(self, data):
+        """Initializes a download helper for testing.
+
+        Args:
+          data (bytes): data returned by OpenURL or None if not available.
+        """
+        super().__init__()
+        self._data = data
+
+    def OpenURL(self, unused_download_url):
+        """Opens the URL.
+
+        Returns:
+          file: file-like object of the data or None if not available.
+        """
+        if self._data is None:
+            return None
+
+        return io.BytesIO(self._data)
+
+
+class LaunchpadPPAManagerTest(test_lib.BaseTestCase):
+    """Tests for the Launchpad PPA manager."""
+
+    # pylint: disable=protected-access
+
+    _SOURCES = """\
+Package: libbde
+Binary: libbde, libbde-dev
+Version: 20240502-1ppa1~resolute
+Files:
+ 0123456789abcdef0123456789abcdef 1024 libbde_20240502-1ppa1~resolute.dsc
+ fedcba9876543210fedcba9876543210 2048 libbde_20240502.orig.tar.gz
+Checksums-Sha256:
+ aaaa 1024 libbde_20240502-1ppa1~resolute.dsc
+ bbbb 2048 libbde_20240502.orig.tar.gz
+
+Package: libbde
+Version: 20230101-1ppa1~resolute
+
+Binary: no-package-name
+Version: 1.0-1
+"""
+
+    def testParseSources(self):
+        """Tests the _ParseSources function."""
+        launchpad_ppa_manager = manage.LaunchpadPPAManager("gift")
+
+        file_object = io.StringIO(self._SOURCES)
+        source_packages = list(launchpad_ppa_manager._ParseSources(file_object))
+        self.assertEqual(len(source_packages), 2)
+
+        source_package = source_packages[0]
+        self.assertEqual(source_package.name, "libbde")
+        self.assertEqual(source_package.version, "20240502-1ppa1~resolute")
+        self.assertEqual(
+            source_package.files,
+            ["libbde_20240502-1ppa1~resolute.dsc", "libbde_20240502.orig.tar.gz"],
+        )
+        self.assertEqual(
+            source_package.checksums,
+            {
+                "libbde_20240502-1ppa1~resolute.dsc": "aaaa",
+                "libbde_20240502.orig.tar.gz": "bbbb",
+            },
+        )
+
+        source_package = source_packages[1]
+        self.assertEqual(source_package.name, "libbde")
+        self.assertEqual(source_package.version, "20230101-1ppa1~resolute")
+        self.assertEqual(source_package.files, [])
+        self.assertEqual(source_package.checksums, {})
+
+    def testGetSourcePackages(self):
+        """Tests the GetPackages and GetSourcePackages functions."""
+        launchpad_ppa_manager = manage.LaunchpadPPAManager("gift")
+        launchpad_ppa_manager._download_helper = TestDownloadHelper(
+            gzip.compress(self._SOURCES.encode("utf-8"))
+        )
+
+        packages = launchpad_ppa_manager.GetPackages("testing")
+        self.assertEqual(packages, {"libbde": "20240502"})
+
+        source_packages = launchpad_ppa_manager.GetSourcePackages("testing")
+        self.assertEqual(list(source_packages.keys()), ["libbde"])
+        self.assertEqual(
+            [source_package.version for source_package in source_packages["libbde"]],
+            ["20240502-1ppa1~resolute", "20230101-1ppa1~resolute"],
+        )
+        self.assertEqual(
+            source_packages["libbde"][0].checksums["libbde_20240502.orig.tar.gz"],
+            "bbbb",
+        )
+
+        # A sources list that cannot be retrieved or parsed is not available.
+        launchpad_ppa_manager._download_helper = TestDownloadHelper(None)
+        self.assertIsNone(launchpad_ppa_manager.GetPackages("testing"))
+        self.assertIsNone(launchpad_ppa_manager.GetSourcePackages("testing"))
+
+        launchpad_ppa_manager._download_helper = TestDownloadHelper(b"bogus")
+        self.assertIsNone(launchpad_ppa_manager.GetPackages("testing"))
+        self.assertIsNone(launchpad_ppa_manager.GetSourcePackages("testing"))
+
+
+class DirectoryIndexTest(test_lib.BaseTestCase):
+    """Tests for the directory index."""
+
+    # pylint: disable=protected-access
+
+    _TEST_FILENAMES = [
+        "dfvfs-20240505.tar.gz",
+        "dfvfs-20240505.zip",
+        "dfvfs-20240505-1.src.rpm",
+        "dfvfs-20240505-py3-none-any.whl",
+        "libbde-20230101.tar.gz",
+        "libbde-alpha-20240502.tar.gz",
+        "libbde_20240502.orig.tar.gz",
+        "libbde_20240502-1ppa1~jammy.debian.tar.gz",
+        "libbde_20240502-1ppa1~jammy_source.changes",
+        "libbde_20240502-1ppa1~noble_source.changes",
+        "libbde_20230101-1ppa1~noble_source.changes",
+        "README",
+    ]
+
+    def _CreateTestFiles(self, path):
+        """Creates test files.
+
+        Args:
+          path (str): path of the directory to create the test files in.
+        """
+        for filename in self._TEST_FILENAMES:
+            with open(os.path.join(path, filename), "wb") as file_object:
+                file_object.write(filename.encode("utf-8"))
+
+    def testGetDigest(self):
+        """Tests the GetDigest function."""
+        with test_lib.TempDirectory() as temp_directory:
+            self._CreateTestFiles(temp_directory)
+
+            directory_index = manage.DirectoryIndex(temp_directory)
+            directory_index.Refresh()
+
+            digest = directory_index.GetDigest("dfvfs-20240505-1.src.rpm")
+            self.assertEqual(
+                digest,
+                "6876ddf646b4c77c180b625236bb59f6d4366f1acc195c4542691b0396335986",
+            )
+
+            digest = directory_index.GetDigest("bogus")
+            self.assertIsNone(digest)
+
+    def testGetPackages(self):
+        """Tests the GetPackages function."""
+        with test_lib.TempDirectory() as temp_directory:
+            self._CreateTestFiles(temp_directory)
+
+            directory_index = manage.DirectoryIndex(temp_directory)
+            directory_index.Refresh()
+
+            packages = directory_index.GetPackages("source")
+            self.assertEqual(packages, {"dfvfs": "20240505", "libbde": "20240502"})
+
+            packages = directory_index.GetPackages("srpm")
+            self.assertEqual(packages, {"dfvfs": "20240505"})
+
+            packages = directory_index.GetPackages("wheel")
+            self.assertEqual(packages, {"dfvfs": "20240505"})
+
+            packages = directory_index.GetPackages("dpkg_source", distribution="noble")
+            self.assertEqual(packages, {"libbde": "20240502"})
+
+            packages = directory_index.GetPackages("dpkg_source", distribution="focal")
+            self.assertEqual(packages, {})
+
+    def testRefresh(self):
+        """Tests the Refresh function."""
+        with test_lib.TempDirectory() as temp_directory:
+            cache_file = os.path.join(temp_directory, "index.json")
+
+            build_directory = os.path.join(temp_directory, "builds")
+            os.mkdir(build_directory)
+            self._CreateTestFiles(build_directory)
+
+            directory_index = manage.DirectoryIndex(
+                build_directory, cache_file=cache_file
+            )
+            directory_index.Refresh()
+
+            entries = list(directory_index.GetEntries())
+            self.assertEqual(len(entries), 9)
+
+            entry = directory_index._entries["dfvfs-20240505-1.src.rpm"]
+            directory_index.GetDigest("dfvfs-20240505-1.src.rpm")
+
+            # Unchanged files are not parsed again.
+            directory_index.Refresh()
+            self.assertIs(directory_index._entries["dfvfs-20240505-1.src.rpm"], entry)
+
+            os.remove(os.path.join(build_directory, "dfvfs-20240505.zip"))
+            directory_index.Refresh()
+
+            entries = list(directory_index.GetEntries())
+            self.assertEqual(len(entries), 8)
+
+            # The index is read from the cache file.
+            self.assertTrue(os.path.exists(cache_file))
+            directory_index = manage.DirectoryIndex(
+                build_directory, cache_file=cache_file
+            )
+            entry = directory_index._entries["dfvfs-20240505-1.src.rpm"]
+            self.assertEqual(entry.name, "dfvfs")
+            self.assertEqual(entry.package_type, "srpm")
+            self.assertEqual(entry.version, "20240505")
+            self.assertIsNotNone(entry.digest)
+
+
+class SQLiteSnapshotStoreTest(test_lib.BaseTestCase):
+    """Tests for the SQLite-backed snapshot store."""
+
+    # pylint: disable=protected-access
+
+    def testAddSnapshot(self):
+        """Tests the AddSnapshot function."""
+        snapshot_store = manage.SQLiteSnapshotStore(maximum_number_of_snapshots=2)
+        self.assertTrue(snapshot_store.Open(":memory:"))
+
+        try:
+            for revision in ("1", "2", "3"):
+                snapshot_store.AddSnapshot(
+                    "copr", "dev", "44", revision, {"libbde": revision}
+                )
+            snapshot_store.AddSnapshot("copr", "testing", "44", "1", {"libbde": "1"})
+
+            snapshots = snapshot_store._GetSnapshots("copr", "dev", "44", 10)
+            self.assertEqual([snapshot.revision for snapshot in snapshots], ["3", "2"])
+            self.assertEqual(snapshots[0].packages, {"libbde": "3"})
+
+            snapshots = snapshot_store._GetSnapshots("copr", "testing", "44", 10)
+            self.assertEqual(len(snapshots), 1)
+
+            number_of_packages = snapshot_store._connection.execute(
+                "SELECT COUNT(*) FROM snapshot_packages"
+            ).fetchone()[0]
+            self.assertEqual(number_of_packages, 3)
+
+        finally:
+            snapshot_store.Close()
+
+
+class TestRepositoryManager:
+    """Repository manager for testing.
+
+    Attributes:
+      number_of_listings (int): number of package listings retrieved.
+      packages (dict[str, dict[str, str]]): package names and versions per
+          track, where None represents a failed listing.
+      revisions (dict[str, str]): revision per track.
+    """
+
+    def __init__(self, packages, revisions):
+        """Initializes a repository manager for testing.
+
+        Args:
+          packages (dict[str, dict[str, str]]): package names and versions per
+              track.
+          revisions (dict[str, str]): revision per track.
+        """
+        super().__init__()
+        self.number_of_listings = 0
+        self.packages = packages
+        self.revisions = revisions
+
+    def GetPackages(self, track):
+        """Retrieves a list of packages of a specific track.
+
+        Args:
+          track (str): track name.
+
+        Returns:
+          dict[str, str]: package names and versions as values or None if
+              the packages cannot be determined.
+        """
+        self.number_of_listings += 1
+
+        packages = self.packages.get(track, {})
+        if packages is None:
+            return None
+
+        return dict(packages)
+
+    def GetRevision(self, track):
+        """Retrieves the revision of a specific track.
+
+        Args:
+          track (str): track name.
+
+        Returns:
+          str: revision.
+        """
+        return self.revisions.get(track, None)
+
+
+class TestPackagesManager(manage.PackagesManager):
+    """Packages manager for testing."""
+
+    def __init__(self, repository_manager, snapshot_store):
+        """Initializes a packages manager for testing.
+
+        Args:
+          repository_manager (TestRepositoryManager): repository manager.
+          snapshot_store (SQLiteSnapshotStore): snapshot store.
+        """
+        super().__init__(None, snapshot_store=snapshot_store)
+        self._test_repository_manager = repository_manager
+
+    def _GetRepositoryManager(self, repository, distribution):
+        """Retrieves the manager of a repository.
+
+        Args:
+          repository (str): name of the repository.
+          distribution (str): name of the distribution.
+
+        Returns:
+          TestRepositoryManager: repository manager.
+        """
+        return self._test_repository_manager
+
+
+class PackagesManagerTest(test_lib.BaseTestCase):
+    """Tests for the packages manager."""
+
+    # pylint: disable=protected-access
+
+    def testGetConcurrently(self):
+        """Tests the _GetConcurrently function."""
+        packages_manager = manage.PackagesManager(None, number_of_workers=2)
+
+        results = packages_manager._GetConcurrently(
+            [(max, (1, 3)), (min, (2, 4)), (sorted, ([3, 1, 2],))]
+        )
+        self.assertEqual(results, [3, 2, [1, 2, 3]])
+
+    def testGetPackagesMatrix(self):
+        """Tests the GetPackagesMatrix function."""
+        packages_manager = manage.PackagesManager(None)
+
+        with self.assertRaises(ValueError):
+            packages_manager.GetPackagesMatrix("bogus")
+
+    def testGetRepositoryPackagesWithSnapshots(self):
+        """Tests the _GetRepositoryPackages function with a snapshot store."""
+        repository_manager = TestRepositoryManager(
+            {"dev": {"libbde": "20240502"}}, {"dev": "1"}
+        )
+
+        snapshot_store = manage.SQLiteSnapshotStore()
+        self.assertTrue(snapshot_store.Open(":memory:"))
+
+        try:
+            packages_manager = TestPackagesManager(repository_manager, snapshot_store)
+
+            packages = packages_manager._GetRepositoryPackages("copr", "dev", "44")
+            self.assertEqual(packages, {"libbde": "20240502"})
+            self.assertEqual(repository_manager.number_of_listings, 1)
+
+            # The listing is not retrieved again if the revision did not change.
+            packages = packages_manager._GetRepositoryPackages("copr", "dev", "44")
+            self.assertEqual(packages, {"libbde": "20240502"})
+            self.assertEqual(repository_manager.number_of_listings, 1)
+
+            repository_manager.revisions["dev"] = "2"
+            packages = packages_manager._GetRepositoryPackages("copr", "dev", "44")
+            self.assertEqual(repository_manager.number_of_listings, 2)
+
+        finally:
+            snapshot_store.Close()
+
+    def testGetTrackChanges(self):
+        """Tests the GetTrackChanges function."""
+        repository_manager = TestRepositoryManager(
+            {
+                "testing": {"libbde": "20240502", "libfsntfs": "20240501"},
+                "dev": {"libbde": "20230101", "libewf": "20231119"},
+            },
+            {"testing": "1", "dev": "1"},
+        )
+
+        snapshot_store = manage.SQLiteSnapshotStore()
+        self.assertTrue(snapshot_store.Open(":memory:"))
+
+        try:
+            packages_manager = TestPackagesManager(repository_manager, snapshot_store)
+
+            track_changes = packages_manager.GetTrackChanges("copr")
+            changes = track_changes["dev"]
+            self.assertIsNone(changes.previous_snapshot)
+            self.assertEqual(
+                changes.added_packages,
+                {"libbde": "20230101", "libewf": "20231119"},
+            )
+
+            repository_manager.packages["dev"] = {
+                "libbde": "20240502",
+                "libfsntfs": "20240501",
+            }
+            repository_manager.revisions["dev"] = "2"
+
+            track_changes = packages_manager.GetTrackChanges("copr")
+            changes = track_changes["dev"]
+            self.assertIsNotNone(changes.previous_snapshot)
+            self.assertEqual(changes.added_packages, {"libfsntfs": "20240501"})
+            self.assertEqual(
+                changes.moved_packages,
+                {"libbde": "20240502", "libfsntfs": "20240501"},
+            )
+            self.assertEqual(changes.removed_packages, {"libewf": "20231119"})
+            self.assertEqual(
+                changes.updated_packages, {"libbde": ("20230101", "20240502")}
+            )
+
+            changes = track_changes["testing"]
+            self.assertEqual(changes.added_packages, {})
+            self.assertEqual(changes.updated_packages, {})
+
+        finally:
+            snapshot_store.Close()
+
+    def testGetTrackChangesWithFailedListing(self):
+        """Tests the GetTrackChanges function with a failed listing."""
+        repository_manager = TestRepositoryManager(
+            {
+                "testing": {"libbde": "20240502"},
+                "dev": {"libbde": "20230101", "libewf": "20231119"},
+            },
+            {"testing": "1", "dev": "1"},
+        )
+
+        snapshot_store = manage.SQLiteSnapshotStore()
+        self.assertTrue(snapshot_store.Open(":memory:"))
+
+        try:
+            packages_manager = TestPackagesManager(repository_manager, snapshot_store)
+
+            track_changes = packages_manager.GetTrackChanges("copr")
+            self.assertIn("dev", track_changes)
+
+            repository_manager.packages["dev"] = None
+            repository_manager.revisions["dev"] = "2"
+
+            # A failed listing is not reported as removal of all packages.
+            track_changes = packages_manager.GetTrackChanges("copr")
+            self.assertNotIn("dev", track_changes)
+
+            # The moved packages cannot be determined if the listing of
+            # the reference track failed.
+            changes = track_changes["staging"]
+            self.assertIsNone(changes.moved_packages)
+
+            # The previous snapshot is still used once the listing succeeds.
+            repository_manager.packages["dev"] = {"libbde": "20240502"}
+            repository_manager.revisions["dev"] = "3"
+
+            track_changes = packages_manager.GetTrackChanges("copr")
+            changes = track_changes["dev"]
+            self.assertEqual(changes.removed_packages, {"libewf": "20231119"})
+            self.assertEqual(
+                changes.updated_packages, {"libbde": ("20230101", "20240502")}
+            )
+            self.assertEqual(changes.moved_packages, {"libbde": "20240502"})
+
+        finally:
+            snapshot_store.Close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -11,11 +11,110 @@ from tests import test_lib
 class GitHelperTest(test_lib.BaseTestCase):
     """Tests the git helper."""
 
+    # pylint: disable=protected-access
+
+    _STATUS_OUTPUT = "\n".join(
+        [
+            "# branch.oid 3c02f98cfd1d6bbf6d0ea7a3d5e5e4bd3c0f1a2b",
+            "# branch.head feature",
+            "# branch.upstream origin/feature",
+            "# branch.ab +0 -0",
+            (
+                "1 .M N... 100644 100644 100644 "
+                "3c02f98cfd1d6bbf6d0ea7a3d5e5e4bd3c0f1a2b "
+                "3c02f98cfd1d6bbf6d0ea7a3d5e5e4bd3c0f1a2b setup.py"
+            ),
+            "? new file.py",
+            "",
+        ]
+    )
+
+    def _CreateTestHelper(self):
+        """Creates a git helper with mock responses.
+
+        Returns:
+          GitHelper: git helper.
+        """
+        helper = git.GitHelper("https://github.com/log2timeline/l2tdevtools.git")
+        helper.mock_responses = {
+            "git for-each-ref --format=%(refname) refs/heads refs/remotes": [
+                0,
+                "refs/heads/feature\nrefs/heads/main\nrefs/remotes/origin/main\n",
+                "",
+            ],
+            "git status --porcelain=v2 --branch": [0, self._STATUS_OUTPUT, ""],
+        }
+        return helper
+
     def testInitialize(self):
         """Tests that the helper can be initialized."""
         helper = git.GitHelper("https://github.com/log2timeline/l2tdevtools.git")
         self.assertIsNotNone(helper)
 
+    def testParseStatus(self):
+        """Tests the _ParseStatus function."""
+        helper = git.GitHelper("https://github.com/log2timeline/l2tdevtools.git")
+
+        status = helper._ParseStatus(self._STATUS_OUTPUT)
+        self.assertEqual(status.active_branch, "feature")
+        self.assertEqual(status.changed_files, ["setup.py", "new file.py"])
+        self.assertEqual(
+            status.commit_identifier, "3c02f98cfd1d6bbf6d0ea7a3d5e5e4bd3c0f1a2b"
+        )
+        self.assertEqual(status.upstream_branch, "origin/feature")
+
+        status = helper._ParseStatus(
+            "# branch.oid (initial)\n# branch.head (detached)\n"
+        )
+        self.assertIsNone(status.active_branch)
+        self.assertEqual(status.changed_files, [])
+        self.assertIsNone(status.commit_identifier)
+
+    def testCheckHasBranch(self):
+        """Tests the CheckHasBranch function."""
+        helper = self._CreateTestHelper()
+
+        self.assertTrue(helper.CheckHasBranch("feature"))
+        self.assertTrue(helper.CheckHasBranch("main"))
+        self.assertFalse(helper.CheckHasBranch("origin/main"))
+        self.assertFalse(helper.CheckHasBranch("bogus"))
+
+    def testCheckHasUncommittedChanges(self):
+        """Tests the CheckHasUncommittedChanges function."""
+        helper = self._CreateTestHelper()
+
+        self.assertTrue(helper.CheckHasUncommittedChanges())
+
+    def testGetActiveBranch(self):
+        """Tests the GetActiveBranch function."""
+        helper = self._CreateTestHelper()
+
+        self.assertEqual(helper.GetActiveBranch(), "feature")
+
+        # The cached status is used when the command is no longer available.
+        helper.mock_responses = {"git": [0, "", ""]}
+        self.assertEqual(helper.GetActiveBranch(), "feature")
+
+    def testReadObject(self):
+        """Tests the _ReadObject function."""
+        helper = git.GitHelper("https://github.com/log2timeline/l2tdevtools.git")
+
+        exit_code, _, _ = helper.RunCommand("git rev-parse --git-dir")
+        if exit_code != 0:
+            raise unittest.SkipTest("not a git repository")
+
+        try:
+            object_type, data = helper._ReadObject("HEAD")
+            self.assertEqual(object_type, "commit")
+            self.assertTrue(data.startswith(b"tree "))
+
+            object_type, data = helper._ReadObject("does-not-exist")
+            self.assertIsNone(object_type)
+            self.assertIsNone(data)
+
+        finally:
+            helper.Close()
+
 
 if __name__ == "__main__":
     unittest.main()
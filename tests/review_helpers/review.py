@@ -3,6 +3,7 @@
 
 import unittest
 
+from l2tdevtools.review_helpers import git
 from l2tdevtools.review_helpers import review
 
 from tests import test_lib
@@ -11,6 +12,8 @@ from tests import test_lib
 class ReviewHelperTest(test_lib.BaseTestCase):
     """Tests the review helper."""
 
+    # pylint: disable=protected-access
+
     def testInitialize(self):
         """Tests that the helper can be initialized."""
         helper = review.ReviewHelper(
@@ -25,6 +28,35 @@ class ReviewHelperTest(test_lib.BaseTestCase):
     # TODO: test CheckLocalGitState.
     # TODO: test CheckRemoteGitState.
     # TODO: test Close.
+
+    def testCloseHelpers(self):
+        """Tests the CloseHelpers function."""
+        helper = review.ReviewHelper(
+            "test",
+            ".",
+            "https://github.com/log2timeline/l2tdevtools.git",
+            "import",
+            "upstream/main",
+        )
+
+        # CloseHelpers can be called before the helpers are initialized.
+        helper.CloseHelpers()
+
+        git_helper = git.GitHelper("https://github.com/log2timeline/l2tdevtools.git")
+        exit_code, _, _ = git_helper.RunCommand("git rev-parse --git-dir")
+        if exit_code != 0:
+            raise unittest.SkipTest("not a git repository")
+
+        git_helper._ReadObject("HEAD")
+        cat_file_process = git_helper._cat_file_process
+        self.assertIsNotNone(cat_file_process)
+
+        helper._git_helper = git_helper
+        helper.CloseHelpers()
+
+        self.assertIsNone(git_helper._cat_file_process)
+        self.assertIsNotNone(cat_file_process.poll())
+
     # TODO: test CreatePullRequest.
     # TODO: test InitializeHelpers.
     # TODO: test Lint.
@@ -49,6 +49,40 @@ class SQLiteSchemaExtractorTest(test_lib.BaseTestCase):
 
         self.assertEqual(schema, self._TEST_SCHEMA)
 
+    def testExtractSchemas(self):
+        """Tests the ExtractSchemas function."""
+        test_path = self._GetTestFilePath(["downloads.sqlite"])
+        self._SkipIfPathNotExists(test_path)
+
+        non_database_path = self._GetTestFilePath(["lsb-release"])
+        self._SkipIfPathNotExists(non_database_path)
+
+        test_extractor = schema_extractor.SQLiteSchemaExtractor()
+        schemas_per_hash = test_extractor.ExtractSchemas(
+            [test_path, non_database_path, test_path], number_of_workers=2
+        )
+
+        schema_hash = test_extractor.GetSchemaHash(self._TEST_SCHEMA)
+        self.assertEqual(
+            schemas_per_hash, {schema_hash: (self._TEST_SCHEMA, [test_path, test_path])}
+        )
+
+    def testGetSchemaHash(self):
+        """Tests the GetSchemaHash function."""
+        test_extractor = schema_extractor.SQLiteSchemaExtractor()
+
+        schema_hash = test_extractor.GetSchemaHash(self._TEST_SCHEMA)
+        self.assertEqual(len(schema_hash), 64)
+
+        # Differences in whitespace result in the same hash.
+        schema = {
+            "moz_downloads": self._TEST_SCHEMA["moz_downloads"].replace(" ", "\n  ")
+        }
+        self.assertEqual(test_extractor.GetSchemaHash(schema), schema_hash)
+
+        schema = {"moz_downloads": "CREATE TABLE moz_downloads (id INTEGER)"}
+        self.assertNotEqual(test_extractor.GetSchemaHash(schema), schema_hash)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,8 +1,12 @@
 #!/usr/bin/env python3
 """Tests for the helper for managing project source code."""
 
+import os
 import unittest
+import zipfile
 
+from l2tdevtools import build_context
+from l2tdevtools import projects
 from l2tdevtools import source_helper
 
 from tests import test_lib
@@ -19,5 +23,101 @@ class SourceHelperTest(test_lib.BaseTestCase):
     # TODO: more add tests.
 
 
+class SourcePackageHelperTest(test_lib.BaseTestCase):
+    """Tests the helper to manager project source code from a source package."""
+
+    # pylint: disable=protected-access
+
+    def testCreate(self):
+        """Tests the Create function."""
+        test_path = self._GetTestFilePath(["dfdatetime-20190517.tar.gz"])
+        self._SkipIfPathNotExists(test_path)
+
+        project_definition = projects.ProjectDefinition("dfdatetime")
+
+        with test_lib.TempDirectory() as temp_directory:
+            source_helper_object = source_helper.SourcePackageHelper(
+                "dfdatetime",
+                project_definition,
+                temp_directory,
+                None,
+                build_context=build_context.BuildContext(temp_directory),
+            )
+            source_helper_object._source_package_path = test_path
+
+            result = source_helper_object.Create()
+            self.assertTrue(result)
+
+            source_directory = source_helper_object.GetSourceDirectoryPath()
+            self.assertEqual(
+                source_directory, os.path.join(temp_directory, "dfdatetime-20190517")
+            )
+            self.assertTrue(os.path.isdir(source_directory))
+
+    def testGetCachedProjectVersion(self):
+        """Tests the GetCachedProjectVersion function."""
+        project_definition = projects.ProjectDefinition("PyYAML")
+
+        with test_lib.TempDirectory() as temp_directory:
+            source_helper_object = source_helper.SourcePackageHelper(
+                "PyYAML",
+                project_definition,
+                temp_directory,
+                None,
+                build_context=build_context.BuildContext(temp_directory),
+            )
+            self.assertIsNone(source_helper_object.GetCachedProjectVersion())
+
+            for filename in (
+                "pyyaml-6.0.1.tar.gz",
+                "pyyaml-6.0.10.tar.gz",
+                "pyyaml-6.0.2.tar.gz",
+                "pyyaml-extra-7.0.tar.gz",
+            ):
+                path = os.path.join(temp_directory, filename)
+                with open(path, "wb") as file_object:
+                    file_object.write(b"")
+
+            self.assertEqual(source_helper_object.GetCachedProjectVersion(), "6.0.10")
+
+            project_definition = projects.ProjectDefinition("libbde")
+
+            path = os.path.join(temp_directory, "libbde-alpha-20240502.tar.gz")
+            with open(path, "wb") as file_object:
+                file_object.write(b"")
+
+            source_helper_object = source_helper.SourcePackageHelper(
+                "libbde",
+                project_definition,
+                temp_directory,
+                None,
+                build_context=build_context.BuildContext(temp_directory),
+            )
+            self.assertEqual(source_helper_object.GetCachedProjectVersion(), "20240502")
+
+    def testGetCachedSourcePackageFilenames(self):
+        """Tests the GetCachedSourcePackageFilenames function."""
+        project_definition = projects.ProjectDefinition("dtfabric")
+
+        with test_lib.TempDirectory() as temp_directory:
+            source_helper_object = source_helper.SourcePackageHelper(
+                "dtfabric",
+                project_definition,
+                temp_directory,
+                None,
+                build_context=build_context.BuildContext(temp_directory),
+            )
+            self.assertIsNone(source_helper_object.GetCachedSourcePackageFilenames())
+
+            path = os.path.join(temp_directory, "dtfabric-20230520.zip")
+            with zipfile.ZipFile(path, "w") as archive:
+                archive.writestr("dtfabric-20230520/pyproject.toml", "")
+                archive.writestr("dtfabric-20230520/dtfabric/__init__.py", "")
+                archive.writestr("dtfabric-20230520/setup.cfg", "")
+
+            filenames = source_helper_object.GetCachedSourcePackageFilenames()
+            self.assertEqual(filenames, ["pyproject.toml", "setup.cfg"])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,395 @@
+#!/usr/bin/env python3
+"""Tests for the GitHub project statistics tool."""
+
+import contextlib
+import http.client
+import io
+import json
+import os
+import sqlite3
+import time
+import unittest
+
+from tools import stats
+
+from tests import test_lib
+
+
+class TestGithubContributionsHelper(stats.GithubContributionsHelper):
+    """GitHub contributions helper for testing."""
+
+    def __init__(self, pages):
+        """Initializes a GitHub contributions helper for testing.
+
+        Args:
+          pages (dict[str, tuple[object, dict[str, str]]]): JSON formatted page
+              content and response headers per URL.
+        """
+        super().__init__(number_of_workers=2)
+        self._pages = pages
+
+    def _DownloadPageContent(self, download_url):
+        """Downloads the page content from the URL.
+
+        Args:
+          download_url (str): URL where to download the page content.
+
+        Returns:
+          tuple[bytes, http.client.HTTPMessage]: page content and response
+              headers if successful or None otherwise.
+        """
+        page_json, headers = self._pages.get(download_url, (None, None))
+        if page_json is None:
+            return None, None
+
+        response_headers = http.client.HTTPMessage()
+        for key, value in (headers or {}).items():
+            response_headers[key] = value
+
+        return json.dumps(page_json).encode("utf-8"), response_headers
+
+
+class DownloadHelperTest(test_lib.BaseTestCase):
+    """Tests for the download helper."""
+
+    # pylint: disable=protected-access
+
+    def testDownloadPaginatedJSON(self):
+        """Tests the _DownloadPaginatedJSON function."""
+        pages = {
+            "https://example.com/pulls?page=1": (
+                [{"number": 2}],
+                {
+                    "Link": (
+                        '<https://example.com/pulls?page=2>; rel="next", '
+                        '<https://example.com/pulls?page=2>; rel="last"'
+                    )
+                },
+            ),
+            "https://example.com/pulls?page=2": ([{"number": 1}], {}),
+        }
+        download_helper = TestGithubContributionsHelper(pages)
+
+        json_objects = download_helper._DownloadPaginatedJSON(
+            "https://example.com/pulls?page=1"
+        )
+        self.assertEqual(json_objects, [{"number": 2}, {"number": 1}])
+
+        json_objects = download_helper._DownloadPaginatedJSON(
+            "https://example.com/bogus"
+        )
+        self.assertIsNone(json_objects)
+
+        # A page after the first that cannot be downloaded results in no data.
+        del pages["https://example.com/pulls?page=2"]
+
+        json_objects = download_helper._DownloadPaginatedJSON(
+            "https://example.com/pulls?page=1"
+        )
+        self.assertIsNone(json_objects)
+
+    def testGetNextPageURL(self):
+        """Tests the _GetNextPageURL function."""
+        download_helper = stats.DownloadHelper()
+
+        response_headers = http.client.HTTPMessage()
+        response_headers["Link"] = (
+            '<https://example.com/pulls?page=1>; rel="prev", '
+            '<https://example.com/pulls?page=3>; rel="next"'
+        )
+        next_page_url = download_helper._GetNextPageURL(response_headers)
+        self.assertEqual(next_page_url, "https://example.com/pulls?page=3")
+
+        response_headers = http.client.HTTPMessage()
+        response_headers["Link"] = '<https://example.com/pulls?page=1>; rel="prev"'
+        next_page_url = download_helper._GetNextPageURL(response_headers)
+        self.assertIsNone(next_page_url)
+
+        next_page_url = download_helper._GetNextPageURL(None)
+        self.assertIsNone(next_page_url)
+
+    def testGetRateLimitWaitTime(self):
+        """Tests the _GetRateLimitWaitTime function."""
+        download_helper = stats.DownloadHelper()
+
+        response_headers = http.client.HTTPMessage()
+        response_headers["Retry-After"] = "30"
+        wait_time = download_helper._GetRateLimitWaitTime(response_headers)
+        self.assertEqual(wait_time, 30)
+
+        response_headers = http.client.HTTPMessage()
+        response_headers["X-RateLimit-Remaining"] = "0"
+        response_headers["X-RateLimit-Reset"] = str(int(time.time()) + 10)
+        wait_time = download_helper._GetRateLimitWaitTime(response_headers)
+        self.assertGreater(wait_time, 0)
+        self.assertLessEqual(wait_time, 11)
+
+        response_headers = http.client.HTTPMessage()
+        response_headers["X-RateLimit-Remaining"] = "59"
+        wait_time = download_helper._GetRateLimitWaitTime(response_headers)
+        self.assertIsNone(wait_time)
+
+
+class TestOutputWriter(stats.OutputWriter):
+    """Output writer for testing.
+
+    Attributes:
+      contributions (list[tuple[str, str, str, str, int, int, int]]):
+          contributions written.
+      reviews (list[tuple[str, str, str, int, str, str, str]]): reviews written.
+    """
+
+    def __init__(self):
+        """Initializes an output writer for testing."""
+        super().__init__({})
+        self.contributions = []
+        self.reviews = []
+
+    def WriteContributions(self, contributions):
+        """Writes a batch of contributions.
+
+        Args:
+          contributions (list[tuple[str, str, str, str, int, int, int]]):
+              contribution rows.
+        """
+        self.contributions.extend(contributions)
+
+    def WriteReviews(self, reviews):
+        """Writes a batch of reviews.
+
+        Args:
+          reviews (list[tuple[str, str, str, int, str, str, str]]): review rows.
+        """
+        self.reviews.extend(reviews)
+
+
+class GithubContributionsHelperTest(test_lib.BaseTestCase):
+    """Tests for the GitHub contributions helper."""
+
+    _CONTRIBUTORS_URL = (
+        "https://api.github.com/repos/log2timeline/plaso/stats/contributors"
+    )
+
+    _PULLS_URL = (
+        "https://api.github.com/repos/log2timeline/plaso/pulls?state=all&"
+        "sort=updated&direction=desc&per_page=100"
+    )
+
+    _PULLS_PAGE2_URL = f"{_PULLS_URL:s}&page=2"
+
+    _PROJECTS_PER_ORGANIZATION = {"log2timeline": ["plaso"]}
+
+    def testUpdateContributions(self):
+        """Tests the UpdateContributions function."""
+        contributors_json = [
+            {
+                "author": {"login": "user1"},
+                "weeks": [
+                    {"w": 1704585600, "a": 10, "c": 1, "d": 2},
+                    {"w": 1705190400, "a": 0, "c": 0, "d": 0},
+                ],
+            }
+        ]
+        contributions_helper = TestGithubContributionsHelper(
+            {self._CONTRIBUTORS_URL: (contributors_json, {})}
+        )
+
+        stats_store = stats.SQLiteStatsStore()
+        self.assertTrue(stats_store.Open(":memory:"))
+
+        try:
+            contributions_helper.UpdateContributions(
+                self._PROJECTS_PER_ORGANIZATION, stats_store
+            )
+            self.assertEqual(
+                list(stats_store.GetContributions()),
+                [("plaso", 1704585600, "user1", 1, 10, 2)],
+            )
+
+            output_writer = TestOutputWriter()
+            contributions_helper.ListContributionsFromStore(stats_store, output_writer)
+            self.assertEqual(
+                output_writer.contributions,
+                [("2024", "01", "user1", "plaso", 1, 10, 2)],
+            )
+
+        finally:
+            stats_store.Close()
+
+    def testUpdatePullRequests(self):
+        """Tests the UpdatePullRequests function."""
+        pulls_json = [
+            {
+                "created_at": "2024-01-03T00:00:00Z",
+                "number": 3,
+                "requested_reviewers": [{"login": "user2"}],
+                "state": "open",
+                "title": "Third",
+                "updated_at": "2024-01-05T00:00:00Z",
+                "user": {"login": "user1"},
+            },
+            {
+                "created_at": "2024-01-02T00:00:00Z",
+                "number": 2,
+                "state": "closed",
+                "title": "Second",
+                "updated_at": "2024-01-02T00:00:00Z",
+                "user": {"login": "user1"},
+            },
+        ]
+        next_page_headers = {"Link": f'<{self._PULLS_PAGE2_URL:s}>; rel="next"'}
+        contributions_helper = TestGithubContributionsHelper(
+            {
+                self._PULLS_URL: (pulls_json, next_page_headers),
+                self._PULLS_PAGE2_URL: (
+                    [
+                        {
+                            "created_at": "2024-01-01T00:00:00Z",
+                            "number": 1,
+                            "state": "closed",
+                            "title": "First",
+                            "updated_at": "2024-01-01T00:00:00Z",
+                            "user": {"login": "user2"},
+                        }
+                    ],
+                    {},
+                ),
+            }
+        )
+
+        stats_store = stats.SQLiteStatsStore()
+        self.assertTrue(stats_store.Open(":memory:"))
+
+        try:
+            stats_store.AddPullRequests(
+                "plaso",
+                [
+                    (
+                        2,
+                        "2024-01-02T00:00:00Z",
+                        "2024-01-02T00:00:00Z",
+                        "user1",
+                        "Second",
+                        "",
+                        "open",
+                    )
+                ],
+            )
+
+            contributions_helper.UpdatePullRequests(
+                self._PROJECTS_PER_ORGANIZATION, stats_store
+            )
+
+            # Only the pull request updated after the last stored update was added
+            # and the second page was not retrieved.
+            output_writer = TestOutputWriter()
+            contributions_helper.ListPullRequestsFromStore(stats_store, output_writer)
+            self.assertEqual(
+                output_writer.reviews,
+                [
+                    (
+                        "2024-01-02T00:00:00Z",
+                        "user1",
+                        "plaso",
+                        2,
+                        "Second",
+                        "",
+                        "open",
+                    ),
+                    (
+                        "2024-01-03T00:00:00Z",
+                        "user1",
+                        "plaso",
+                        3,
+                        "Third",
+                        "user2",
+                        "open",
+                    ),
+                ],
+            )
+
+        finally:
+            stats_store.Close()
+
+
+class OutputWritersTest(test_lib.BaseTestCase):
+    """Tests for the output writers."""
+
+    _CONTRIBUTIONS = [
+        ("2024", "01", "User1", "plaso", 1, 10, 2),
+        ("2024", "02", "user2", "dfvfs", 3, 20, 4),
+    ]
+
+    _REVIEWS = [
+        ("2024-01-03T00:00:00Z", "user1", "plaso", 3, "Third", "user2", "open"),
+    ]
+
+    def testArrowWriter(self):
+        """Tests the ArrowWriter."""
+        if not stats.pyarrow:
+            raise unittest.SkipTest("missing pyarrow")
+
+        with test_lib.TempDirectory() as temp_directory:
+            path = os.path.join(temp_directory, "contributions.parquet")
+            output_writer = stats.ArrowWriter({}, path)
+
+            self.assertTrue(output_writer.Open())
+            output_writer.WriteContributions(self._CONTRIBUTIONS)
+            output_writer.WriteContributions(self._CONTRIBUTIONS)
+            output_writer.Close()
+
+            table = stats.pyarrow_parquet.read_table(path)
+            self.assertEqual(table.num_rows, 4)
+            self.assertEqual(table.column("year").to_pylist()[0], 2024)
+
+    def testSQLiteWriter(self):
+        """Tests the SQLiteWriter."""
+        with test_lib.TempDirectory() as temp_directory:
+            path = os.path.join(temp_directory, "stats.db")
+            output_writer = stats.SQLiteWriter({"user1": "mapped1"}, path)
+
+            self.assertTrue(output_writer.Open())
+            output_writer.WriteContributions(self._CONTRIBUTIONS)
+            output_writer.WriteReviews(self._REVIEWS)
+            output_writer.Close()
+
+            connection = sqlite3.connect(path)
+            try:
+                rows = connection.execute(
+                    "SELECT * FROM output_contributions"
+                ).fetchall()
+                self.assertEqual(rows, [(2024, 1, "mapped1", "plaso", 1, 10, 2)])
+
+                rows = connection.execute("SELECT * FROM output_reviews").fetchall()
+                self.assertEqual(rows, self._REVIEWS)
+
+            finally:
+                connection.close()
+
+    def testStdoutWriter(self):
+        """Tests the StdoutWriter."""
+        output_writer = stats.StdoutWriter({})
+
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            self.assertTrue(output_writer.Open())
+            output_writer.WriteContributions(self._CONTRIBUTIONS)
+
+            # Output is buffered until the writer is closed.
+            self.assertEqual(output.getvalue(), "")
+
+            output_writer.Close()
+
+        self.assertEqual(
+            output.getvalue(),
+            (
+                "year\tweek number\tlogin name\tproject\tnumber of contributions\t"
+                "number lines added\tnumber lines deleted\n"
+                "2024\t01\tUser1\tplaso\t1\t10\t2\n"
+                "2024\t02\tuser2\tdfvfs\t3\t20\t4\n"
+            ),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
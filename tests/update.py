@@ -2,6 +2,8 @@
 """Tests for the update tool."""
 
 import glob
+import hashlib
+import json
 import os
 import sys
 import unittest
@@ -11,6 +13,70 @@ from tools import update
 from tests import test_lib
 
 
+class TestDownloadHelper(update.GithubRepoDownloadHelper):
+    """Download helper for testing.
+
+    Attributes:
+      downloaded_urls (list[str]): URLs of which the page content was
+          downloaded.
+      file_contents (dict[str, bytes]): file contents per download URL.
+      page_contents (dict[str, str]): page contents per download URL.
+    """
+
+    def __init__(self, file_contents=None, page_contents=None, tree_index_file=None):
+        """Initializes a download helper for testing.
+
+        Args:
+          file_contents (Optional[dict[str, bytes]]): file contents per download
+              URL.
+          page_contents (Optional[dict[str, str]]): page contents per download
+              URL.
+          tree_index_file (Optional[str]): path of the file to cache the git
+              tree listings in.
+        """
+        super().__init__(
+            "https://github.com/log2timeline/l2tbinaries/releases",
+            branch="dev",
+            tree_index_file=tree_index_file,
+        )
+        self.downloaded_urls = []
+        self.file_contents = file_contents or {}
+        self.page_contents = page_contents or {}
+
+    def DownloadFile(self, download_url, output_path=None):
+        """Downloads a file from the URL and returns the filename.
+
+        Args:
+          download_url (str): URL where to download the file.
+          output_path (Optional[str]): path of the file to download to.
+
+        Returns:
+          str: output path or None if not available.
+        """
+        file_content = self.file_contents.get(download_url, None)
+        if file_content is None:
+            return None
+
+        if not os.path.exists(output_path):
+            with open(output_path, "wb") as file_object:
+                file_object.write(file_content)
+
+        return output_path
+
+    def DownloadPageContent(self, download_url, encoding="utf-8"):
+        """Downloads the page content from the URL.
+
+        Args:
+          download_url (str): URL where to download the page content.
+          encoding (Optional[str]): encoding of the page content.
+
+        Returns:
+          str: page content if successful or None if not available.
+        """
+        self.downloaded_urls.append(download_url)
+        return self.page_contents.get(download_url, None)
+
+
 class GithubRepoDownloadHelperTest(test_lib.BaseTestCase):
     """Tests for the GitHub repo download helper class."""
 
@@ -45,6 +111,76 @@ class GithubRepoDownloadHelperTest(test_lib.BaseTestCase):
             )
             self.assertIn(expected_url, package_download_urls)
 
+    def testGetTreePaths(self):
+        """Tests the _GetTreePaths function."""
+        api_url = "https://api.github.com/repos/log2timeline/l2tbinaries"
+        refs_url = f"{api_url:s}/git/refs/heads/dev"
+        tree_url = f"{api_url:s}/git/trees/{'1' * 40:s}?recursive=1"
+
+        page_contents = {
+            refs_url: json.dumps({"object": {"sha": "1" * 40}}),
+            tree_url: json.dumps(
+                {
+                    "sha": "2" * 40,
+                    "tree": [
+                        {"path": "win32", "type": "tree"},
+                        {"path": "win32/SHA256SUMS", "type": "blob"},
+                        {
+                            "path": "win32/dfvfs-20260411-py3-none-any.whl",
+                            "type": "blob",
+                        },
+                    ],
+                    "truncated": False,
+                }
+            ),
+        }
+
+        with test_lib.TempDirectory() as temp_directory:
+            tree_index_file = os.path.join(temp_directory, "tree-index.json")
+
+            download_helper = TestDownloadHelper(
+                page_contents=page_contents, tree_index_file=tree_index_file
+            )
+            expected_paths = [
+                "win32/SHA256SUMS",
+                "win32/dfvfs-20260411-py3-none-any.whl",
+            ]
+
+            paths = download_helper._GetTreePaths()
+            self.assertEqual(paths, expected_paths)
+            self.assertEqual(download_helper.downloaded_urls, [refs_url, tree_url])
+
+            # The tree is not retrieved again if the branch did not change.
+            download_helper = TestDownloadHelper(
+                page_contents=page_contents, tree_index_file=tree_index_file
+            )
+            paths = download_helper._GetTreePaths()
+            self.assertEqual(paths, expected_paths)
+            self.assertEqual(download_helper.downloaded_urls, [refs_url])
+
+            # Without the API no paths are available.
+            download_helper = TestDownloadHelper(tree_index_file=tree_index_file)
+            paths = download_helper._GetTreePaths()
+            self.assertIsNone(paths)
+
+    def testParseSHA256Sums(self):
+        """Tests the ParseSHA256Sums function."""
+        download_helper = update.GithubRepoDownloadHelper(self._DOWNLOAD_URL)
+
+        digest = "a" * 64
+        sha256_sums = download_helper.ParseSHA256Sums(
+            f"{digest:s}  artifacts-20260421-py3-none-any.whl\n"
+            f"{digest:s} *PyYAML-6.0.2-cp312-cp312-win32.whl\n"
+            f"bogus\n"
+        )
+        self.assertEqual(
+            sha256_sums,
+            {
+                "artifacts-20260421-py3-none-any.whl": digest,
+                "pyyaml-6.0.2-cp312-cp312-win32.whl": digest,
+            },
+        )
+
 
 class DependencyUpdaterTest(test_lib.BaseTestCase):
     """Tests for the dependency updater class."""
@@ -85,6 +221,123 @@ class DependencyUpdaterTest(test_lib.BaseTestCase):
                     expected_package_version = [self._PROJECT_VERSION]
                     self.assertEqual(package_download.version, expected_package_version)
 
+    def testDownloadWheelPackage(self):
+        """Tests the _DownloadWheelPackage function."""
+        filename = "dfvfs-20260411-py3-none-any.whl"
+        download_url = (
+            f"https://github.com/log2timeline/l2tbinaries/raw/dev/win32/{filename:s}"
+        )
+
+        file_content = b"test"
+        digest = hashlib.sha256(file_content).hexdigest()
+
+        package_download = update.PackageDownload(
+            "dfvfs", ["20260411"], filename, download_url
+        )
+
+        with test_lib.TempDirectory() as temp_directory:
+            dependency_updater = update.DependencyUpdater(
+                download_directory=temp_directory
+            )
+            dependency_updater._download_helper = TestDownloadHelper(
+                file_contents={download_url: file_content}
+            )
+
+            expected_path = os.path.join(temp_directory, filename)
+
+            path = dependency_updater._DownloadWheelPackage(
+                package_download, {filename: digest}
+            )
+            self.assertEqual(path, expected_path)
+
+            # A file that does not match the digest is downloaded again.
+            with open(expected_path, "wb") as file_object:
+                file_object.write(b"corrupted")
+
+            path = dependency_updater._DownloadWheelPackage(
+                package_download, {filename: digest}
+            )
+            self.assertEqual(path, expected_path)
+            with open(expected_path, "rb") as file_object:
+                self.assertEqual(file_object.read(), file_content)
+
+            # A download that does not match the digest is rejected.
+            os.remove(expected_path)
+            path = dependency_updater._DownloadWheelPackage(
+                package_download, {filename: "b" * 64}
+            )
+            self.assertIsNone(path)
+            self.assertFalse(os.path.exists(expected_path))
+
+            # Without digests the download is not verified.
+            path = dependency_updater._DownloadWheelPackage(package_download, None)
+            self.assertEqual(path, expected_path)
+
+    def testGetInstalledPackages(self):
+        """Tests the _GetInstalledPackages function."""
+        dependency_updater = update.DependencyUpdater()
+
+        installed_packages = dependency_updater._GetInstalledPackages()
+        self.assertIn("pip", installed_packages)
+
+    def testGetPackageUpdates(self):
+        """Tests the _GetPackageUpdates function."""
+        package_downloads = [
+            update.PackageDownload(
+                "dfvfs",
+                ["20260411"],
+                "dfvfs-20260411-py3-none-any.whl",
+                "https://github.com/log2timeline/l2tbinaries/raw/dev/win32/"
+                "dfvfs-20260411-py3-none-any.whl",
+            ),
+            update.PackageDownload(
+                "dfwinreg",
+                ["20260411"],
+                "dfwinreg-20260411-py3-none-any.whl",
+                "https://github.com/log2timeline/l2tbinaries/raw/dev/win32/"
+                "dfwinreg-20260411-py3-none-any.whl",
+            ),
+            update.PackageDownload(
+                "pyyaml",
+                ["6", "0", "2"],
+                "pyyaml-6.0.2-cp312-cp312-win32.whl",
+                "https://github.com/log2timeline/l2tbinaries/raw/dev/win32/"
+                "pyyaml-6.0.2-cp312-cp312-win32.whl",
+            ),
+        ]
+        installed_packages = {"dfvfs": ["20260101"], "pyyaml": ["6", "0", "2"]}
+
+        dependency_updater = update.DependencyUpdater(delta_update=True)
+
+        package_updates = dependency_updater._GetPackageUpdates(
+            package_downloads, installed_packages
+        )
+        self.assertEqual(
+            package_updates,
+            [(package_downloads[0], ["20260101"]), (package_downloads[1], None)],
+        )
+
+        dependency_updater = update.DependencyUpdater(
+            delta_update=True, force_install=True
+        )
+
+        package_updates = dependency_updater._GetPackageUpdates(
+            package_downloads, installed_packages
+        )
+        self.assertEqual(len(package_updates), 3)
+
+    def testNormalizePackageName(self):
+        """Tests the _NormalizePackageName function."""
+        dependency_updater = update.DependencyUpdater()
+
+        self.assertEqual(dependency_updater._NormalizePackageName("PyYAML"), "pyyaml")
+        self.assertEqual(
+            dependency_updater._NormalizePackageName("bencode.py"), "bencode_py"
+        )
+        self.assertEqual(
+            dependency_updater._NormalizePackageName("python-lz4"), "python_lz4"
+        )
+
     def testUpdatePackages(self):
         """Tests the UpdatePackages function."""
         projects_file = os.path.join("data", "projects.ini")
@@ -114,6 +367,70 @@ class DependencyUpdaterTest(test_lib.BaseTestCase):
                 expected_path = os.path.join(temp_directory, expected_filename)
                 self.assertEqual(glob_results[0], expected_path)
 
+    def testUpdatePackagesWithDryRun(self):
+        """Tests the UpdatePackages function with dry run."""
+        l2tdevtools_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        projects_file = os.path.join(l2tdevtools_path, "data", "projects.ini")
+
+        api_url = "https://api.github.com/repos/log2timeline/l2tbinaries"
+        tree_url = f"{api_url:s}/git/trees/{'1' * 40:s}?recursive=1"
+        filename = f"{self._PROJECT_NAME:s}-{self._PROJECT_VERSION:s}-py3-none-any.whl"
+
+        page_contents = {
+            f"{api_url:s}/git/refs/heads/dev": json.dumps(
+                {"object": {"sha": "1" * 40}}
+            ),
+            tree_url: json.dumps(
+                {
+                    "sha": "2" * 40,
+                    "tree": [{"path": f"win32/{filename:s}", "type": "blob"}],
+                    "truncated": False,
+                }
+            ),
+        }
+
+        with test_lib.TempDirectory() as temp_directory:
+            previous_filename = f"{self._PROJECT_NAME:s}-20200101-py3-none-any.whl"
+            previous_path = os.path.join(temp_directory, previous_filename)
+            with open(previous_path, "wb") as file_object:
+                file_object.write(b"")
+
+            for download_directory in (
+                temp_directory,
+                os.path.join(temp_directory, "build"),
+            ):
+                dependency_updater = update.DependencyUpdater(
+                    download_directory=download_directory,
+                    download_track="dev",
+                    preferred_machine_type="x86",
+                    preferred_operating_system="Windows",
+                )
+
+                download_helper = TestDownloadHelper(
+                    page_contents=page_contents,
+                    tree_index_file=os.path.join(
+                        download_directory,
+                        update.DependencyUpdater._TREE_INDEX_FILENAME,
+                    ),
+                )
+                # Make sure the test also runs on unsupported versions of Python.
+                supported_python_versions = frozenset(
+                    [(sys.version_info[0], sys.version_info[1])]
+                )
+                download_helper._SUPPORTED_PYTHON_VERSIONS = (  # pylint: disable=invalid-name
+                    supported_python_versions
+                )
+                dependency_updater._download_helper = download_helper
+
+                result = dependency_updater.UpdatePackages(
+                    projects_file, [self._PROJECT_NAME], dry_run=True
+                )
+                self.assertTrue(result)
+                self.assertIn(tree_url, download_helper.downloaded_urls)
+
+                # The download directory is not created or changed.
+                self.assertEqual(os.listdir(temp_directory), [previous_filename])
+
 
 if __name__ == "__main__":
     unittest.main()
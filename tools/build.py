@@ -5,9 +5,11 @@ import argparse
 import logging
 import os
 import platform
+import shlex
 import subprocess
 import sys
 
+from l2tdevtools import build_context as context_lib
 from l2tdevtools import download_helper
 from l2tdevtools import presets
 from l2tdevtools import projects
@@ -23,6 +25,34 @@ __file__ = os.path.abspath(__file__)
 # TODO: look into merging functionality with update script.
 
 
+class BuildPlanEntry:
+    """Build plan entry.
+
+    Attributes:
+      build_required (bool): True if a build is required, False if the build
+          results are already available or None if this could not be determined.
+      build_system (str): build system of the project or None if this could
+          not be determined without extracting the source package.
+      missing_dependencies (list[str]): names of the build dependencies that are
+          not installed.
+      name (str): name of the project.
+      version (str): version of the project or None if not available.
+    """
+
+    def __init__(self, name):
+        """Initializes a build plan entry.
+
+        Args:
+          name (str): name of the project.
+        """
+        super().__init__()
+        self.build_required = None
+        self.build_system = None
+        self.missing_dependencies = []
+        self.name = name
+        self.version = None
+
+
 class ProjectBuilder:
     """Class that helps in building projects.
 
@@ -30,10 +60,29 @@ class ProjectBuilder:
       project_definitions (dict[str, ProjectDefinition]): project definitions.
     """
 
+    # The build systems per name of a file in the top-level source directory,
+    # in order of precedence.
+    _BUILD_SYSTEM_PER_FILENAME = [
+        ("configure", "configure_make"),
+        ("setup.py", "setup_py"),
+        ("pyproject.toml", "pyproject"),
+    ]
+
     # The distributions to build dpkg-source packages for.
     _DPKG_SOURCE_DISTRIBUTIONS = frozenset(["resolute"])
 
-    def __init__(self, build_target, l2tdevtools_path, downloads_directory):
+    def __init__(
+        self,
+        build_target,
+        l2tdevtools_path,
+        downloads_directory,
+        builds_directory=None,
+        distribution_fan_out=False,
+        private_rpmbuild=False,
+        rpmbuild_directory=None,
+        scratch_directory=None,
+        tail_build_logs=False,
+    ):
         """Initializes the project builder.
 
         Args:
@@ -41,16 +90,101 @@ class ProjectBuilder:
           l2tdevtools_path (str): path to l2tdevtools.
           downloads_directory (str): path to the directory where projects are
               downloaded.
+          builds_directory (Optional[str]): path to the directory where projects
+              are built, where None represents the current working directory.
+          distribution_fan_out (Optional[bool]): True if the dpkg-source packages
+              of multiple distributions should be built in parallel from a single
+              extraction of the source package.
+          private_rpmbuild (Optional[bool]): True if every rpm build should use
+              its own rpmbuild top directory.
+          rpmbuild_directory (Optional[str]): path of the rpmbuild top directory,
+              or the directory that contains the private rpmbuild top directories,
+              where None represents ~/rpmbuild.
+          scratch_directory (Optional[str]): path of the directory where source
+              packages are extracted and built, where None represents the builds
+              directory.
+          tail_build_logs (Optional[bool]): True if the output of the build
+              commands should also be written to the console.
         """
         super().__init__()
+        self._build_context = context_lib.BuildContext(
+            builds_directory or os.getcwd(),
+            private_rpmbuild=private_rpmbuild,
+            rpmbuild_path=rpmbuild_directory,
+            scratch_path=scratch_directory,
+            tail_logs=tail_build_logs,
+        )
         self._build_helpers = {}
         self._build_target = build_target
+        self._distribution_fan_out = distribution_fan_out
         self._downloads_directory = downloads_directory
         self._l2tdevtools_path = l2tdevtools_path
         self._source_helpers = {}
 
         self.project_definitions = {}
 
+    def _BuildDistributions(
+        self, build_helper_object, source_helper_object, distributions
+    ):
+        """Builds a project for multiple distributions in parallel.
+
+        Args:
+          build_helper_object (BuildHelper): build helper, that supports building
+              multiple distributions.
+          source_helper_object (SourceHelper): source helper.
+          distributions (list[str]): names of the distributions.
+
+        Returns:
+          bool: True if the builds are successful or False on error.
+        """
+        log_paths = {}
+        for distribution in distributions:
+            build_helper_object.distribution = distribution
+
+            build_required = build_helper_object.CheckBuildRequired(
+                source_helper_object
+            )
+
+            build_helper_object.Clean(source_helper_object)
+
+            if build_required:
+                log_path = self._build_context.GetLogPath(
+                    source_helper_object.project_name, distribution=distribution
+                )
+                # Remove the build log file of a previous build, since the output
+                # of the build commands is appended to it.
+                if os.path.exists(log_path):
+                    os.remove(log_path)
+
+                log_paths[distribution] = log_path
+
+        if not log_paths:
+            return True
+
+        failed_distributions = build_helper_object.BuildDistributions(
+            source_helper_object, list(log_paths.keys())
+        )
+
+        for distribution, log_path in log_paths.items():
+            if distribution not in failed_distributions:
+                if os.path.exists(log_path):
+                    logging.info(f"Removing: {log_path:s}")
+                    os.remove(log_path)
+
+            elif not os.path.exists(log_path):
+                logging.warning(
+                    f"Build of: {source_helper_object.project_name:s} for: "
+                    f"{distribution:s} failed."
+                )
+            else:
+                logging.warning(
+                    f"Build of: {source_helper_object.project_name:s} for: "
+                    f"{distribution:s} failed, for more information check "
+                    f"{log_path:s}"
+                )
+
+        return not failed_distributions
+
     def _BuildProject(self, build_helper_object, source_helper_object, distribution):
         """Builds a project.
 
@@ -69,28 +203,51 @@ class ProjectBuilder:
 
         build_helper_object.Clean(source_helper_object)
 
-        if not build_required or build_helper_object.Build(source_helper_object):
+        if not build_required:
             return True
 
-        if not os.path.exists(build_helper_object.LOG_FILENAME):
+        log_path = self._build_context.GetLogPath(
+            source_helper_object.project_name,
+            distribution=build_helper_object.distribution,
+        )
+        # Remove the build log file of a previous build, since the output of
+        # the build commands is appended to it.
+        if os.path.exists(log_path):
+            os.remove(log_path)
+
+        if build_helper_object.Build(source_helper_object):
+            if os.path.exists(log_path):
+                logging.info(f"Removing: {log_path:s}")
+                os.remove(log_path)
+
+            return True
+
+        if not os.path.exists(log_path):
             logging.warning(f"Build of: {source_helper_object.project_name:s} failed.")
         else:
-            log_filename = "_".join(
-                [source_helper_object.project_name, build_helper_object.LOG_FILENAME]
-            )
-            # Remove older logfiles if they exists otherwise the rename
-            # fails on Windows.
-            if os.path.exists(log_filename):
-                os.remove(log_filename)
-
-            os.rename(build_helper_object.LOG_FILENAME, log_filename)
             logging.warning(
                 f"Build of: {source_helper_object.project_name:s} failed, for more "
-                f"information check {log_filename:s}"
+                f"information check {log_path:s}"
             )
 
         return False
 
+    def _DetermineBuildSystem(self, filenames):
+        """Determines the build system from the files in the source directory.
+
+        Args:
+          filenames (list[str]): names of the files in the top-level source
+              directory.
+
+        Returns:
+          str: build system or None if the build system cannot be determined.
+        """
+        for filename, build_system in self._BUILD_SYSTEM_PER_FILENAME:
+            if filename in filenames:
+                return build_system
+
+        return None
+
     def _ExpandPresets(self, preset_definitions, preset_names):
         """Expands preset names to project names.
 
@@ -117,6 +274,89 @@ class ProjectBuilder:
 
         return project_names
 
+    def _GetDistributions(self, distributions):
+        """Determines the distributions to build.
+
+        Args:
+          distributions (list[str]): distributions to build or None to use the
+              defaults of the build target.
+
+        Returns:
+          list[str]: distributions to build, where None represents the build host
+              distribution.
+        """
+        if distributions:
+            return distributions
+
+        if self._build_target == "dpkg-source":
+            return sorted(self._DPKG_SOURCE_DISTRIBUTIONS)
+
+        return [None]
+
+    def _SortProjectsByDependencies(self, project_definitions):
+        """Sorts projects so that dependencies are built before their dependents.
+
+        Args:
+          project_definitions (list[ProjectDefinition]): project definitions.
+
+        Returns:
+          list[ProjectDefinition]: project definitions in build order.
+        """
+        project_definitions_per_name = {
+            project_definition.name: project_definition
+            for project_definition in project_definitions
+        }
+
+        # Map the package names of the projects, such as "python3-dfvfs", to
+        # the project names.
+        project_names_per_package_name = {}
+        for name, project_definition in project_definitions_per_name.items():
+            for package_name in (
+                name,
+                f"python3-{name:s}",
+                project_definition.dpkg_name,
+                project_definition.rpm_name,
+            ):
+                if package_name:
+                    project_names_per_package_name[package_name] = name
+
+        dependencies_per_name = {}
+        for name, project_definition in project_definitions_per_name.items():
+            dependencies = set()
+            for package_names in (
+                project_definition.build_dependencies,
+                project_definition.dpkg_build_dependencies,
+                project_definition.rpm_build_dependencies,
+            ):
+                for package_name in package_names or []:
+                    dependency = project_names_per_package_name.get(package_name, None)
+                    if dependency and dependency != name:
+                        dependencies.add(dependency)
+
+            dependencies_per_name[name] = dependencies
+
+        sorted_project_definitions = []
+        while dependencies_per_name:
+            names = sorted(
+                name
+                for name, dependencies in dependencies_per_name.items()
+                if not dependencies
+            )
+            if not names:
+                names = sorted(dependencies_per_name.keys())
+                logging.warning(
+                    f"Circular build dependencies between: {', '.join(names):s}"
+                )
+
+            for name in names:
+                sorted_project_definitions.append(project_definitions_per_name[name])
+                del dependencies_per_name[name]
+
+            for dependencies in dependencies_per_name.values():
+                dependencies.difference_update(names)
+
+        return sorted_project_definitions
+
     def Build(self, project_definition, distributions=None):
         """Builds a project.
 
@@ -137,21 +377,26 @@ class ProjectBuilder:
             logging.warning("Missing source helper.")
             return False
 
-        if not distributions:
-            if self._build_target == "dpkg-source":
-                distributions = self._DPKG_SOURCE_DISTRIBUTIONS
-            else:
-                distributions = [None]
+        distributions = self._GetDistributions(distributions)
 
-        for distribution in distributions:
-            if not self._BuildProject(
-                build_helper_object, source_helper_object, distribution
+        try:
+            if (
+                self._distribution_fan_out
+                and self._build_target == "dpkg-source"
+                and len(distributions) > 1
             ):
-                return False
+                return self._BuildDistributions(
+                    build_helper_object, source_helper_object, distributions
+                )
 
-        if os.path.exists(build_helper_object.LOG_FILENAME):
-            logging.info(f"Removing: {build_helper_object.LOG_FILENAME:s}")
-            os.remove(build_helper_object.LOG_FILENAME)
+            for distribution in distributions:
+                if not self._BuildProject(
+                    build_helper_object, source_helper_object, distribution
+                ):
+                    return False
+
+        finally:
+            self._build_context.RemoveBuildPath(project_definition.name)
 
         return True
 
@@ -189,13 +434,10 @@ class ProjectBuilder:
             return []
 
         if not project_definition.build_system:
-            if os.path.exists(os.path.join(source_directory, "configure")):
-                project_definition.build_system = "configure_make"
-            elif os.path.exists(os.path.join(source_directory, "setup.py")):
-                project_definition.build_system = "setup_py"
-            elif os.path.exists(os.path.join(source_directory, "pyproject.toml")):
-                project_definition.build_system = "pyproject"
-            else:
+            project_definition.build_system = self._DetermineBuildSystem(
+                os.listdir(source_directory)
+            )
+            if not project_definition.build_system:
                 logging.warning(
                     f"Unable to determine build system of: {project_definition.name:s}"
                 )
@@ -206,6 +448,7 @@ class ProjectBuilder:
             self._build_target,
             self._l2tdevtools_path,
             self.project_definitions,
+            build_context=self._build_context,
         )
         if not build_helper_object:
             logging.warning(
@@ -215,7 +458,13 @@ class ProjectBuilder:
 
         self._build_helpers[project_definition.name] = build_helper_object
 
-        return build_helper_object.CheckBuildDependencies()
+        missing_dependencies = build_helper_object.CheckBuildDependencies()
+        if missing_dependencies:
+            # The project is not built, hence its build directory is no longer
+            # needed.
+            self._build_context.RemoveBuildPath(project_definition.name)
+
+        return missing_dependencies
 
     def CheckProjectConfiguration(self, project_definition):
         """Checks if the project configuration is correct.
@@ -253,6 +502,7 @@ class ProjectBuilder:
             project_definition,
             self._downloads_directory,
             download_helper_object,
+            build_context=self._build_context,
         )
         source_helper_object.Clean()
 
@@ -264,16 +514,92 @@ class ProjectBuilder:
         if self._build_target == "download":
             # If available run the script post-download.sh after download.
             if os.path.exists("post-download.sh"):
-                command = f"sh ./post-download.sh {source_package_path:s}"
-                exit_code = subprocess.call(command, shell=True)
+                command = ["sh", "./post-download.sh", source_package_path]
+                exit_code = subprocess.call(command)
                 if exit_code != 0:
-                    logging.error(f'Running: "{command:s}" failed.')
+                    logging.error(f'Running: "{shlex.join(command):s}" failed.')
                     return False
 
         self._source_helpers[project_definition.name] = source_helper_object
 
         return True
 
+    def Plan(self, project_definitions, distributions=None):
+        """Determines the build plan of projects.
+
+        The build plan is determined without downloading or extracting source
+        packages. The project versions are determined from the source packages
+        in the downloads directory and the build dependencies from the project
+        definitions. If not defined, the build system is determined from the
+        names of the files in the source package.
+
+        Args:
+          project_definitions (list[ProjectDefinition]): project definitions.
+          distributions (Optional[list[str]]): distributions to build.
+
+        Returns:
+          list[BuildPlanEntry]: build plan entries in build order.
+        """
+        build_plan = []
+        for project_definition in self._SortProjectsByDependencies(project_definitions):
+            plan_entry = BuildPlanEntry(project_definition.name)
+            build_plan.append(plan_entry)
+
+            try:
+                download_helper_object = (
+                    download_helper.DownloadHelperFactory.NewDownloadHelper(
+                        project_definition
+                    )
+                )
+            except ValueError as exception:
+                logging.warning(f"{exception!s}")
+                continue
+
+            source_helper_object = source_helper.SourcePackageHelper(
+                project_definition.name,
+                project_definition,
+                self._downloads_directory,
+                download_helper_object,
+                build_context=self._build_context,
+            )
+            plan_entry.version = source_helper_object.GetCachedProjectVersion()
+
+            if not project_definition.build_system:
+                filenames = source_helper_object.GetCachedSourcePackageFilenames()
+                project_definition.build_system = self._DetermineBuildSystem(
+                    filenames or []
+                )
+                if not project_definition.build_system:
+                    continue
+
+            plan_entry.build_system = project_definition.build_system
+
+            build_helper_object = build_helper.BuildHelperFactory.NewBuildHelper(
+                project_definition,
+                self._build_target,
+                self._l2tdevtools_path,
+                self.project_definitions,
+                build_context=self._build_context,
+            )
+            if not build_helper_object:
+                continue
+
+            plan_entry.missing_dependencies = (
+                build_helper_object.CheckBuildDependencies()
+            )
+
+            if plan_entry.version:
+                plan_entry.build_required = False
+                for distribution in self._GetDistributions(distributions):
+                    if distribution:
+                        build_helper_object.distribution = distribution
+
+                    if build_helper_object.CheckBuildRequired(source_helper_object):
+                        plan_entry.build_required = True
+                        break
+
+        return build_plan
+
     def ReadProjectDefinitions(self, path):
         """Reads project definitions.
 
@@ -309,6 +635,10 @@ class ProjectBuilder:
 
         return list(self._ExpandPresets(preset_definitions, [preset_name]))
 
+    def WaitForCleanup(self):
+        """Waits for the files and directories to be removed in the background."""
+        self._build_context.WaitForCleanup()
+
 
 def Main():
     """Entry point of console script.
@@ -363,6 +693,21 @@ def Main():
         default="",
         help=("comma separated list of specific distribution names to build."),
     )
+    argument_parser.add_argument(
+        "--distribution-fan-out",
+        "--distribution_fan_out",
+        dest="distribution_fan_out",
+        action="store_true",
+        default=False,
+        help=(
+            "build the dpkg-source packages of all the distributions from one "
+            "extraction of the source package, in parallel in clones of "
+            "the source directory. The version suffix and distribution are set "
+            "in debian/changelog of every clone. The clones share the data of "
+            "the source directory if the file system supports reflinks, such as "
+            "btrfs or XFS, and are full copies otherwise."
+        ),
+    )
     argument_parser.add_argument(
         "--download-directory",
         "--downloads-directory",
@@ -375,6 +720,17 @@ def Main():
         default=None,
         help="The location of the downloads directory.",
     )
+    argument_parser.add_argument(
+        "--plan",
+        dest="plan",
+        action="store_true",
+        default=False,
+        help=(
+            "print the build plan, with the projects in build order, which "
+            "builds are required and the missing build dependencies, without "
+            "downloading or building."
+        ),
+    )
     argument_parser.add_argument(
         "--preset",
         dest="preset",
@@ -387,6 +743,17 @@ def Main():
             "The presets are defined in the preset.ini configuration file."
         ),
     )
+    argument_parser.add_argument(
+        "--private-rpmbuild",
+        "--private_rpmbuild",
+        dest="private_rpmbuild",
+        action="store_true",
+        default=False,
+        help=(
+            "build every rpm and srpm in its own rpmbuild top directory, which "
+            "is created in the rpmbuild directory and removed after the build."
+        ),
+    )
     argument_parser.add_argument(
         "--projects",
         dest="projects",
@@ -399,6 +766,47 @@ def Main():
             "configuration file."
         ),
     )
+    argument_parser.add_argument(
+        "--rpmbuild-directory",
+        "--rpmbuild_directory",
+        action="store",
+        metavar="DIRECTORY",
+        dest="rpmbuild_directory",
+        type=str,
+        default=None,
+        help=(
+            "The location of the rpmbuild top directory, or with "
+            "--private-rpmbuild of the private rpmbuild top directories, for "
+            "example on tmpfs. The default is ~/rpmbuild."
+        ),
+    )
+    argument_parser.add_argument(
+        "--scratch-directory",
+        "--scratch_directory",
+        action="store",
+        metavar="DIRECTORY",
+        dest="scratch_directory",
+        type=str,
+        default=None,
+        help=(
+            "The location of the scratch directory, for example on tmpfs, where "
+            "source packages are extracted and built. Only the build results "
+            "and logs are stored in the builds directory. The default is to "
+            "build in the builds directory."
+        ),
+    )
+    argument_parser.add_argument(
+        "--tail-build-logs",
+        "--tail_build_logs",
+        dest="tail_build_logs",
+        action="store_true",
+        default=False,
+        help=(
+            "write the output of the build commands to the console, prefixed "
+            "with the project and distribution name, in addition to the "
+            "compressed build log files in the builds directory."
+        ),
+    )
     options = argument_parser.parse_args()
 
     if not options.build_target:
@@ -454,7 +862,15 @@ def Main():
         options.downloads_directory = options.builds_directory
 
     project_builder = ProjectBuilder(
-        options.build_target, l2tdevtools_path, options.downloads_directory
+        options.build_target,
+        l2tdevtools_path,
+        options.downloads_directory,
+        builds_directory=options.builds_directory,
+        distribution_fan_out=options.distribution_fan_out,
+        private_rpmbuild=options.private_rpmbuild,
+        rpmbuild_directory=options.rpmbuild_directory,
+        scratch_directory=options.scratch_directory,
+        tail_build_logs=options.tail_build_logs,
     )
     project_names = []
     if options.preset:
@@ -504,6 +920,37 @@ def Main():
     for disabled_package in disabled_projects:
         undefined_projects.remove(disabled_package)
 
+    if options.plan:
+        build_plan = project_builder.Plan(builds, distributions=distributions)
+
+        missing_build_dependencies = set()
+
+        print("Build plan:")
+        for index, plan_entry in enumerate(build_plan):
+            if not plan_entry.version:
+                status = "download and build"
+            elif not plan_entry.build_system:
+                status = "build system unknown until extraction"
+            elif plan_entry.build_required is None:
+                status = "unsupported build system"
+            elif plan_entry.build_required:
+                status = "build"
+            else:
+                status = "up to date"
+
+            version = plan_entry.version or "latest version"
+            print(f"\t{index + 1:d}. {plan_entry.name:s} {version:s}: {status:s}")
+
+            missing_build_dependencies.update(plan_entry.missing_dependencies)
+
+        if missing_build_dependencies:
+            print("")
+            print("Missing build dependencies:")
+            for dependency in sorted(missing_build_dependencies):
+                print(f"\t{dependency:s}")
+
+        return 1 if missing_build_dependencies else 0
+
     configuration_errors = set()
     failed_builds = set()
     failed_downloads = set()
@@ -523,44 +970,46 @@ def Main():
             failed_downloads.add(project_definition.name)
 
     if options.build_target != "download":
-        current_working_directory = os.getcwd()
-        os.chdir(options.builds_directory)
+        for project_definition in list(builds):
+            project_name = project_definition.name
+            dependencies = project_builder.CheckBuildDependencies(project_definition)
 
-        try:
-            for project_definition in list(builds):
-                project_name = project_definition.name
-                dependencies = project_builder.CheckBuildDependencies(
-                    project_definition
-                )
+            if dependencies:
+                builds.remove(project_definition)
+                build_dependencies = ", ".join(dependencies)
 
-                if dependencies:
-                    builds.remove(project_definition)
-                    build_dependencies = ", ".join(dependencies)
+                print(
+                    f"Unable to build: {project_name:s} missing build "
+                    f"dependencies: {build_dependencies:s}"
+                )
+                missing_build_dependencies.update(dependencies)
 
-                    print(
-                        f"Unable to build: {project_name:s} missing build "
-                        f"dependencies: {build_dependencies:s}"
-                    )
-                    missing_build_dependencies.update(dependencies)
+            if not project_builder.CheckProjectConfiguration(project_definition):
+                print(f"Detected error in configuration of: {project_name:s}")
+                configuration_errors.add(project_name)
 
-                if not project_builder.CheckProjectConfiguration(project_definition):
-                    print(f"Detected error in configuration of: {project_name:s}")
-                    configuration_errors.add(project_name)
+        # The missing build dependencies of all the projects are reported
+        # before building, so that they can be installed in one go.
+        if missing_build_dependencies:
+            print("")
+            print("Missing build dependencies:")
+            for dependency in sorted(missing_build_dependencies):
+                print(f"\t{dependency:s}")
+            print("")
 
-            for project_definition in list(builds):
-                project_name = project_definition.name
-                logging.info(f"Building: {project_name:s}")
+        for project_definition in list(builds):
+            project_name = project_definition.name
+            logging.info(f"Building: {project_name:s}")
 
-                # TODO: add support for dokan, bzip2
-                # TODO: setup sqlite in build directory.
-                if not project_builder.Build(
-                    project_definition, distributions=distributions
-                ):
-                    print(f"Failed building: {project_name:s}")
-                    failed_builds.add(project_name)
+            # TODO: add support for dokan, bzip2
+            # TODO: setup sqlite in build directory.
+            if not project_builder.Build(
+                project_definition, distributions=distributions
+            ):
+                print(f"Failed building: {project_name:s}")
+                failed_builds.add(project_name)
 
-        finally:
-            os.chdir(current_working_directory)
+    project_builder.WaitForCleanup()
 
     if undefined_projects:
         print("")
@@ -580,12 +1029,6 @@ def Main():
         for name in sorted(failed_downloads):
             print(f"\t{name:s}")
 
-    if missing_build_dependencies:
-        print("")
-        print("Missing build dependencies:")
-        for dependency in sorted(missing_build_dependencies):
-            print(f"\t{dependency:s}")
-
     if failed_builds:
         print("")
         print("Failed building:")
@@ -2,16 +2,21 @@
 """Script to manage the GIFT launchpad PPA and l2tbinaries."""
 
 import argparse
+import concurrent.futures
 import csv
+import datetime
 import gzip
+import hashlib
 import io
 import json
 import logging
 import os
 import platform
 import re
+import sqlite3
 import sys
-import zlib
+import threading
+import time
 
 from xml.etree import ElementTree
 
@@ -36,6 +41,8 @@ class COPRProjectManager:
         "{project:s}/fedora-{fedora_version:s}-x86_64"
     )
 
+    _REVISION_XML_XPATH = "./{http://linux.duke.edu/metadata/repo}revision"
+
     _PRIMARY_XML_XPATH = (
         './{http://linux.duke.edu/metadata/repo}data[@type="primary"]/'
         "{http://linux.duke.edu/metadata/repo}location"
@@ -53,6 +60,88 @@ class COPRProjectManager:
         self._download_helper = interface.DownloadHelper("")
         self._name = name
 
+    def _ParsePrimaryXML(self, file_object):
+        """Parses the source packages from a primary.xml file.
+
+        The XML is parsed incrementally and package elements are cleared once
+        parsed, to bound memory usage for large repositories.
+
+        Args:
+          file_object (file): file-like object that contains the primary.xml.
+
+        Returns:
+          dict[str, str]: package names and versions as values.
+        """
+        packages = {}
+        root_xml = None
+        for event, element_xml in ElementTree.iterparse(
+            file_object, events=("start", "end")
+        ):
+            if event == "start":
+                if root_xml is None:
+                    root_xml = element_xml
+                continue
+
+            if element_xml.tag != "{http://linux.duke.edu/metadata/common}package":
+                continue
+
+            arch_xml = element_xml.find("{http://linux.duke.edu/metadata/common}arch")
+            package_name_xml = element_xml.find(
+                "{http://linux.duke.edu/metadata/common}name"
+            )
+            package_version_xml = element_xml.find(
+                "{http://linux.duke.edu/metadata/common}version"
+            )
+
+            package_name = None
+            package_version = None
+            # Note explicitly checking xml.Element against None because of
+            # deprecation warning.
+            if (
+                arch_xml is not None
+                and arch_xml.text == "src"
+                and package_name_xml is not None
+                and package_version_xml is not None
+            ):
+                package_name = package_name_xml.text
+                package_version = package_version_xml.attrib.get("ver", None)
+
+            # Release the memory of the parsed package elements.
+            element_xml.clear()
+            root_xml.clear()
+
+            if not package_name or not package_version:
+                continue
+
+            if package_name in packages:
+                package_version_tuple = package_version.split(".")
+                version_tuple = packages[package_name].split(".")
+                compare_result = versions.CompareVersions(
+                    package_version_tuple, version_tuple
+                )
+                if compare_result < 0:
+                    continue
+
+            packages[package_name] = package_version
+
+        return packages
+
+    def _GetRepositoryURL(self, project):
+        """Retrieves the repository URL of a specific project.
+
+        Args:
+          project (str): project name.
+
+        Returns:
+          str: repository URL.
+        """
+        kwargs = {
+            "fedora_version": self._distribution,
+            "name": self._name,
+            "project": project,
+        }
+        return self._COPR_REPO_URL.format(**kwargs)
+
     def GetPackages(self, project):
         """Retrieves a list of packages of a specific project.
 
@@ -68,12 +157,7 @@ class COPRProjectManager:
         # testing/fedora-26-x86_64/repodata/repomd.xml
         # to find primary.xml.gz or primary.sqlite.bz2
 
-        kwargs = {
-            "fedora_version": self._distribution,
-            "name": self._name,
-            "project": project,
-        }
-        copr_repo_url = self._COPR_REPO_URL.format(**kwargs)
+        copr_repo_url = self._GetRepositoryURL(project)
 
         download_url = "/".join([copr_repo_url, "repodata", "repomd.xml"])
         page_content = self._download_helper.DownloadPageContent(download_url)
@@ -93,57 +177,50 @@ class COPRProjectManager:
             return None
 
         download_url = "/".join([copr_repo_url, href_value_tuple[1]])
-        page_content = self._download_helper.DownloadPageContent(
-            download_url, encoding=None
-        )
-        if not page_content:
-            _, _, download_url = download_url.rpartition("/")
+        url_object = self._download_helper.OpenURL(download_url)
+        if not url_object:
             logging.error("Unable to retrieve primary.xml.gz.")
             return None
 
-        with gzip.GzipFile(fileobj=io.BytesIO(page_content)) as file_object:
-            page_content = file_object.read()
+        try:
+            with gzip.GzipFile(fileobj=url_object) as file_object:
+                packages = self._ParsePrimaryXML(file_object)
 
-        primary_xml = ElementTree.fromstring(page_content)
-        # Note explicitly checking xml.Element against None because of deprecation
-        # warning.
-        if primary_xml is None:
-            logging.error("Packages missing from primary.xml.")
+        except (EOFError, OSError, ElementTree.ParseError) as exception:
+            logging.error(f"Unable to parse primary.xml.gz with error: {exception!s}")
             return None
 
-        packages = {}
-        for project_xml in primary_xml:
-            arch_xml = project_xml.find("{http://linux.duke.edu/metadata/common}arch")
-            if arch_xml is None or arch_xml.text != "src":
-                continue
+        finally:
+            url_object.close()
 
-            package_name_xml = project_xml.find(
-                "{http://linux.duke.edu/metadata/common}name"
-            )
-            package_version_xml = project_xml.find(
-                "{http://linux.duke.edu/metadata/common}version"
-            )
-            if package_name_xml is None or package_version_xml is None:
-                continue
+        return packages
 
-            package_name = package_name_xml.text
-            package_version = package_version_xml.attrib["ver"]
+    def GetRevision(self, project):
+        """Retrieves the revision of the repository of a specific project.
 
-            if not package_name or not package_version:
-                continue
+        Args:
+          project (str): project name.
 
-            if package_name in packages:
-                package_version_tuple = package_version.split(".")
-                version_tuple = packages[package_name].split(".")
-                compare_result = versions.CompareVersions(
-                    package_version_tuple, version_tuple
-                )
-                if compare_result < 0:
-                    continue
+        Returns:
+          str: revision from repomd.xml or None if not available.
+        """
+        copr_repo_url = self._GetRepositoryURL(project)
 
-            packages[package_name] = package_version
+        download_url = "/".join([copr_repo_url, "repodata", "repomd.xml"])
+        page_content = self._download_helper.DownloadPageContent(download_url)
+        if not page_content:
+            return None
 
-        return packages
+        try:
+            repomd_xml = ElementTree.fromstring(page_content)
+        except ElementTree.ParseError:
+            return None
+
+        revision_xml = repomd_xml.find(self._REVISION_XML_XPATH)
+        if revision_xml is None:
+            return None
+
+        return revision_xml.text
 
 
 class GithubRepoManager:
@@ -158,6 +235,20 @@ class GithubRepoManager:
         super().__init__()
         self._download_helper = interface.DownloadHelper("")
 
+    def _GetBranch(self, track):
+        """Retrieves the branch of a track.
+
+        Args:
+          track (str): track name.
+
+        Returns:
+          str: branch name.
+        """
+        if track == "stable":
+            return "main"
+
+        return track
+
     def _GetDownloadURL(self, sub_directory, track, use_api=False):
         """Retrieves the download URL.
 
@@ -172,10 +263,7 @@ class GithubRepoManager:
         if not sub_directory:
             return None
 
-        if track == "stable":
-            branch = "main"
-        else:
-            branch = track
+        branch = self._GetBranch(track)
 
         if use_api:
             return (
@@ -261,6 +349,59 @@ class GithubRepoManager:
 
         return packages
 
+    def GetRevision(self, track):
+        """Retrieves the revision of a specific track.
+
+        Args:
+          track (str): track name.
+
+        Returns:
+          str: SHA-1 of the last commit of the track branch or None if not
+              available.
+        """
+        branch = self._GetBranch(track)
+        download_url = f"{self._GITHUB_REPO_API_URL:s}/git/refs/heads/{branch:s}"
+
+        page_content = self._download_helper.DownloadPageContent(download_url)
+        if not page_content:
+            return None
+
+        try:
+            reference_json = json.loads(page_content)
+        except json.JSONDecodeError:
+            return None
+
+        if not isinstance(reference_json, dict):
+            return None
+
+        return reference_json.get("object", {}).get("sha", None)
+
+
+class DebianSourcePackage:
+    """Debian source package.
+
+    Attributes:
+      checksums (dict[str, str]): SHA-256 checksums per filename.
+      files (list[str]): names of the files of the source package.
+      name (str): name of the source package.
+      version (str): version of the source package, including the Debian
+          revision.
+    """
+
+    def __init__(self, name, version):
+        """Initializes a Debian source package.
+
+        Args:
+          name (str): name of the source package.
+          version (str): version of the source package, including the Debian
+              revision.
+        """
+        super().__init__()
+        self.checksums = {}
+        self.files = []
+        self.name = name
+        self.version = version
+
 
 class LaunchpadPPAManager:
     """Defines a Launchpad PPA manager."""
@@ -289,9 +430,124 @@ class LaunchpadPPAManager:
         #              /+copy-packages
         return
 
+    def _GetSourcePackage(self, fields):
+        """Retrieves a source package from the fields of a Sources stanza.
+
+        Args:
+          fields (dict[str, list[str]]): values per field name, where a value
+              is stored per line.
+
+        Returns:
+          DebianSourcePackage: source package or None if the stanza does not
+              contain a package name and version.
+        """
+        name = fields.get("Package", [None])[0]
+        version = fields.get("Version", [None])[0]
+        if not name or not version:
+            return None
+
+        source_package = DebianSourcePackage(name, version)
+
+        # Both the Files and Checksums-Sha256 fields contain lines with:
+        # "{digest} {size} {filename}"
+        for line in fields.get("Files", []):
+            values = line.split()
+            if len(values) == 3:
+                source_package.files.append(values[2])
+
+        for line in fields.get("Checksums-Sha256", []):
+            values = line.split()
+            if len(values) == 3:
+                source_package.checksums[values[2]] = values[0]
+
+        return source_package
+
+    def _ParseSources(self, file_object):
+        """Parses a Debian Sources file.
+
+        The file is read stanza by stanza, to bound memory usage to the size
+        of a single stanza.
+
+        Args:
+          file_object (file): text file-like object that contains the Debian
+              Sources file.
+
+        Yields:
+          DebianSourcePackage: source package.
+        """
+        fields = {}
+        field_name = None
+
+        for line in file_object:
+            line = line.rstrip("\n")
+
+            if not line.strip():
+                if fields:
+                    source_package = self._GetSourcePackage(fields)
+                    if source_package:
+                        yield source_package
+
+                fields = {}
+                field_name = None
+
+            elif line[0] in (" ", "\t"):
+                # Continuation line of a multi-line field.
+                if field_name:
+                    fields[field_name].append(line.strip())
+
+            else:
+                field_name, _, value = line.partition(":")
+                fields[field_name] = [value.strip()]
+
+        if fields:
+            source_package = self._GetSourcePackage(fields)
+            if source_package:
+                yield source_package
+
+    def _ReadSourcePackages(self, track):
+        """Reads the source packages of a specific PPA track.
+
+        The PPA sources list is parsed while it is downloaded.
+
+        Args:
+          track (str): PPA track name.
+
+        Yields:
+          DebianSourcePackage: source package.
+
+        Raises:
+          IOError: if the PPA sources list cannot be retrieved or parsed.
+        """
+        kwargs = {
+            "distribution": self._distribution,
+            "name": self._name,
+            "track": track,
+        }
+        download_url = self._LAUNCHPAD_URL.format(**kwargs)
+
+        url_object = self._download_helper.OpenURL(download_url)
+        if not url_object:
+            raise IOError("Unable to retrieve PPA sources list.")
+
+        try:
+            with gzip.GzipFile(fileobj=url_object) as gzip_file_object:
+                file_object = io.TextIOWrapper(gzip_file_object, encoding="utf-8")
+                yield from self._ParseSources(file_object)
+
+        except (EOFError, OSError, UnicodeDecodeError) as exception:
+            raise IOError(
+                f"Unable to parse PPA sources list with error: {exception!s}"
+            ) from exception
+
+        finally:
+            url_object.close()
+
     def GetPackages(self, track):
         """Retrieves a list of packages of a specific PPA track.
 
+        The PPA sources list is parsed while it is downloaded, hence only the
+        latest version per package is kept in memory.
+
         Args:
           track (str): PPA track name.
 
@@ -299,6 +555,39 @@ class LaunchpadPPAManager:
           dict[str, str]: package names and versions as values or None if
               the packages cannot be determined.
         """
+        packages = {}
+        try:
+            for source_package in self._ReadSourcePackages(track):
+                # Strip the Debian revision from the version.
+                package_version, _, _ = source_package.version.rpartition("-")
+
+                if source_package.name in packages:
+                    package_version_tuple = package_version.split(".")
+                    version_tuple = packages[source_package.name].split(".")
+                    compare_result = versions.CompareVersions(
+                        package_version_tuple, version_tuple
+                    )
+                    if compare_result < 0:
+                        continue
+
+                packages[source_package.name] = package_version
+
+        except IOError as exception:
+            logging.error(f"{exception!s}")
+            return None
+
+        return packages
+
+    def GetRevision(self, track):
+        """Retrieves the revision of a specific PPA track.
+
+        Args:
+          track (str): PPA track name.
+
+        Returns:
+          str: ETag or last modification date and time of the PPA sources list
+              or None if not available.
+        """
         kwargs = {
             "distribution": self._distribution,
             "name": self._name,
@@ -306,35 +595,40 @@ class LaunchpadPPAManager:
         }
         download_url = self._LAUNCHPAD_URL.format(**kwargs)
 
-        ppa_sources = self._download_helper.DownloadPageContent(
-            download_url, encoding=None
-        )
-        if not ppa_sources:
-            logging.error("Unable to retrieve PPA sources list.")
+        response_headers = self._download_helper.DownloadPageHeaders(download_url)
+        if not response_headers:
             return None
 
-        ppa_sources = zlib.decompress(ppa_sources, 16 + zlib.MAX_WBITS)
+        return response_headers.get("ETag", None) or response_headers.get(
+            "Last-Modified", None
+        )
 
-        try:
-            ppa_sources = ppa_sources.decode("utf-8")
-        except UnicodeDecodeError as exception:
-            logging.error(
-                f"Unable to decode PPA sources list with error: {exception!s}"
-            )
-            return None
+    def GetSourcePackages(self, track):
+        """Retrieves the source packages of a specific PPA track.
 
-        packages = {}
-        for line in ppa_sources.split("\n"):
-            if line.startswith("Package: "):
-                _, _, package = line.rpartition("Package: ")
+        Unlike GetPackages, every version of a package is retrieved, including
+        the names and checksums of its files.
 
-            elif line.startswith("Version: "):
-                _, _, version = line.rpartition("Version: ")
-                version, _, _ = version.rpartition("-")
+        Args:
+          track (str): PPA track name.
+
+        Returns:
+          dict[str, list[DebianSourcePackage]]: source packages, in the order of
+              the PPA sources list, per package name or None if the source
+              packages cannot be determined.
+        """
+        source_packages = {}
+        try:
+            for source_package in self._ReadSourcePackages(track):
+                source_packages.setdefault(source_package.name, []).append(
+                    source_package
+                )
 
-                packages[package] = version
+        except IOError as exception:
+            logging.error(f"{exception!s}")
+            return None
 
-        return packages
+        return source_packages
 
 
 class OpenSuseBuildServiceManager:
@@ -349,104 +643,679 @@ class PyPIManager:
 
     _PYPI_URL = "https://pypi.python.org/pypi/{package_name:s}"
 
-    def __init__(self, projects_file):
+    def __init__(self, projects_file, number_of_workers=8):
         """Initializes a PyPI manager.
 
         Args:
           projects_file (str): path to the projects.ini file.
+          number_of_workers (Optional[int]): maximum number of PyPI pages
+              that are retrieved concurrently.
         """
         super().__init__()
         self._download_helper = interface.DownloadHelper("")
+        self._number_of_workers = number_of_workers
         self._package_names = []
         self._pypi_package_names = {}
 
-        if projects_file:
-            with open(projects_file, encoding="utf-8") as file_object:
-                project_definition_reader = projects.ProjectDefinitionReader()
-                for project_definition in project_definition_reader.Read(file_object):
-                    self._package_names.append(project_definition.name)
+        if projects_file:
+            with open(projects_file, encoding="utf-8") as file_object:
+                project_definition_reader = projects.ProjectDefinitionReader()
+                for project_definition in project_definition_reader.Read(file_object):
+                    self._package_names.append(project_definition.name)
+
+                    if project_definition.pypi_name:
+                        self._pypi_package_names[project_definition.pypi_name] = (
+                            project_definition.name
+                        )
+
+    def CopyPackages(self):
+        """Copies packages."""
+        # TODO: implement:
+        # send post to https://launchpad.net/~gift/+archive/ubuntu/testing
+        #              /+copy-packages
+        return
+
+    def _GetPackageVersion(self, package_name):
+        """Retrieves the version of a package on PyPI.
+
+        Args:
+          package_name (str): package name.
+
+        Returns:
+          str: version of the package or None if not available.
+        """
+        pypi_package_name = self._pypi_package_names.get(package_name, package_name)
+
+        kwargs = {"package_name": pypi_package_name}
+        download_url = self._PYPI_URL.format(**kwargs)
+
+        page_content = self._download_helper.DownloadPageContent(
+            download_url, encoding=None
+        )
+        if not page_content:
+            logging.error(
+                f"Unable to retrieve PyPI package: {pypi_package_name:s} page."
+            )
+            return None
+
+        try:
+            page_content = page_content.decode("utf-8")
+        except UnicodeDecodeError as exception:
+            logging.error(
+                f"Unable to decode PyPI package: {pypi_package_name:s} page with "
+                f"error: {exception!s}"
+            )
+            return None
+
+        expression_string = (
+            f"<title>{pypi_package_name:s} ([^ ]*) : Python Package Index</title>"
+        )
+        matches = re.findall(expression_string, page_content)
+        if not matches or len(matches) != 1:
+            logging.warning(
+                f"Unable to determine PyPI package: {pypi_package_name:s} "
+                f"information."
+            )
+            return None
+
+        return matches[0]
+
+    def GetPackages(self):
+        """Retrieves a list of packages.
+
+        The PyPI pages of the packages are retrieved concurrently.
+
+        Returns:
+          dict[str, str]: package names and versions as values or None if
+              the packages cannot be determined.
+        """
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=self._number_of_workers
+        ) as executor:
+            package_versions = executor.map(
+                self._GetPackageVersion, self._package_names
+            )
+
+            packages = {}
+            for package_name, package_version in zip(
+                self._package_names, package_versions
+            ):
+                if package_version:
+                    packages[package_name] = package_version
+
+        return packages
+
+
+class DirectoryIndexEntry:
+    """Directory index entry.
+
+    Attributes:
+      digest (str): hexadecimal SHA-256 of the file content or None if not
+          determined yet.
+      distribution (str): name of the distribution or None if not applicable.
+      filename (str): name of the file.
+      modification_time (int): modification time of the file in nanoseconds.
+      name (str): name of the package.
+      package_type (str): package type, for example "srpm" or "wheel".
+      size (int): size of the file in bytes.
+      version (str): version of the package.
+    """
+
+    def __init__(self, filename):
+        """Initializes a directory index entry.
+
+        Args:
+          filename (str): name of the file.
+        """
+        super().__init__()
+        self.digest = None
+        self.distribution = None
+        self.filename = filename
+        self.modification_time = None
+        self.name = None
+        self.package_type = None
+        self.size = None
+        self.version = None
+
+    def CopyFromDict(self, json_dict):
+        """Copies the attributes from a JSON dictionary.
+
+        Args:
+          json_dict (dict[str, object]): JSON dictionary.
+        """
+        self.digest = json_dict.get("digest", None)
+        self.distribution = json_dict.get("distribution", None)
+        self.modification_time = json_dict.get("modification_time", None)
+        self.name = json_dict.get("name", None)
+        self.package_type = json_dict.get("package_type", None)
+        self.size = json_dict.get("size", None)
+        self.version = json_dict.get("version", None)
+
+    def CopyToDict(self):
+        """Copies the attributes to a JSON dictionary.
+
+        Returns:
+          dict[str, object]: JSON dictionary.
+        """
+        return {
+            "digest": self.digest,
+            "distribution": self.distribution,
+            "modification_time": self.modification_time,
+            "name": self.name,
+            "package_type": self.package_type,
+            "size": self.size,
+            "version": self.version,
+        }
+
+
+class DirectoryIndex:
+    """Index of the packages in a directory.
+
+    The index is refreshed incrementally, where only files that were added or
+    changed size or modification time are parsed again. The index can be
+    cached in a file between runs.
+    """
+
+    # Package types and the corresponding file naming conventions:
+    # dpkg_source: package_version-#ppa1~distribution_source.changes
+    # source: package-version.tar.gz or package-version.zip
+    # srpm: package-version-#.src.rpm
+    # wheel: package-version-python-abi-platform.whl
+    PACKAGE_TYPES = frozenset(["dpkg_source", "source", "srpm", "wheel"])
+
+    def __init__(self, path, cache_file=None):
+        """Initializes a directory index.
+
+        Args:
+          path (str): path of the directory.
+          cache_file (Optional[str]): path of the file to cache the index in,
+              where None represents the index is not cached.
+        """
+        super().__init__()
+        self._cache_file = cache_file
+        self._entries = {}
+        self._path = path
+
+        if cache_file and os.path.exists(cache_file):
+            self._ReadCacheFile()
+
+    def _ParseFilename(self, entry):
+        """Parses the package type, name, version and distribution of a file.
+
+        Args:
+          entry (DirectoryIndexEntry): directory index entry.
+        """
+        filename = entry.filename
+
+        if filename.endswith(".src.rpm"):
+            name, _, _ = filename.rpartition("-")
+            name, _, version = name.rpartition("-")
+            entry.package_type = "srpm"
+
+        elif filename.endswith("_source.changes"):
+            name, _, _ = filename.rpartition("-")
+            name, _, version = name.rpartition("_")
+            _, _, distribution = filename[: -len("_source.changes")].rpartition("~")
+            entry.distribution = distribution or None
+            entry.package_type = "dpkg_source"
+
+        elif filename.endswith(".whl"):
+            name, _, version = filename.partition("-")
+            version, _, _ = version.partition("-")
+            entry.package_type = "wheel"
+
+        elif filename.endswith(".tar.gz") or filename.endswith(".zip"):
+            if (
+                filename.endswith(".debian.tar.gz")
+                or filename.endswith(".orig.tar.gz")
+                or filename.endswith("-1.tar.gz")
+            ):
+                return
+
+            name, _, _ = filename.rpartition(".")
+            if name.endswith(".tar"):
+                name, _, _ = name.rpartition(".")
+            name, _, version = name.rpartition("-")
+
+            if (
+                name.endswith("-alpha")
+                or name.endswith("-beta")
+                or name.endswith("-experimental")
+            ):
+                name, _, _ = name.rpartition("-")
+
+            entry.package_type = "source"
+
+        else:
+            return
+
+        entry.name = name
+        entry.version = version
+
+    def _ReadCacheFile(self):
+        """Reads the cached index from the cache file."""
+        try:
+            with open(self._cache_file, encoding="utf-8") as file_object:
+                json_dict = json.load(file_object)
+
+        except (OSError, ValueError) as exception:
+            logging.warning(
+                f"Unable to read directory index cache: {self._cache_file:s} with "
+                f"error: {exception!s}"
+            )
+            return
+
+        if json_dict.get("path", None) != os.path.abspath(self._path):
+            return
+
+        for filename, entry_dict in json_dict.get("entries", {}).items():
+            entry = DirectoryIndexEntry(filename)
+            entry.CopyFromDict(entry_dict)
+            self._entries[filename] = entry
+
+    def _WriteCacheFile(self):
+        """Writes the index to the cache file."""
+        json_dict = {
+            "entries": {
+                filename: entry.CopyToDict()
+                for filename, entry in self._entries.items()
+            },
+            "path": os.path.abspath(self._path),
+        }
+
+        try:
+            with open(self._cache_file, "w", encoding="utf-8") as file_object:
+                json.dump(json_dict, file_object)
+
+        except OSError as exception:
+            logging.warning(
+                f"Unable to write directory index cache: {self._cache_file:s} "
+                f"with error: {exception!s}"
+            )
+
+    def GetDigest(self, filename):
+        """Retrieves the SHA-256 digest of a file.
+
+        The digest is calculated on first use and stored in the index.
+
+        Args:
+          filename (str): name of the file.
+
+        Returns:
+          str: hexadecimal SHA-256 of the file content or None if not available.
+        """
+        entry = self._entries.get(filename, None)
+        if not entry:
+            return None
+
+        if not entry.digest:
+            sha256_context = hashlib.sha256()
+            try:
+                with open(os.path.join(self._path, filename), "rb") as file_object:
+                    for data in iter(lambda: file_object.read(1024 * 1024), b""):
+                        sha256_context.update(data)
+
+            except OSError as exception:
+                logging.warning(
+                    f"Unable to read file: {filename:s} with error: {exception!s}"
+                )
+                return None
+
+            entry.digest = sha256_context.hexdigest()
+
+        return entry.digest
+
+    def GetEntries(self, package_type=None):
+        """Retrieves the entries of packages.
+
+        Args:
+          package_type (Optional[str]): package type, where None represents
+              all package types.
+
+        Yields:
+          DirectoryIndexEntry: directory index entry.
+        """
+        for filename in sorted(self._entries.keys()):
+            entry = self._entries[filename]
+            if entry.package_type and (
+                not package_type or entry.package_type == package_type
+            ):
+                yield entry
+
+    def GetPackages(self, package_type, distribution=None):
+        """Retrieves the packages of a specific type.
+
+        Args:
+          package_type (str): package type.
+          distribution (Optional[str]): name of the distribution, where None
+              represents all distributions.
+
+        Returns:
+          dict[str, str]: package names and their most recent versions.
+        """
+        packages = {}
+        for entry in self.GetEntries(package_type=package_type):
+            if distribution and entry.distribution != distribution:
+                continue
+
+            if entry.name in packages:
+                package_version_tuple = entry.version.split(".")
+                version_tuple = packages[entry.name].split(".")
+                compare_result = versions.CompareVersions(
+                    package_version_tuple, version_tuple
+                )
+                if compare_result < 0:
+                    continue
+
+            packages[entry.name] = entry.version
+
+        return packages
+
+    def Refresh(self):
+        """Refreshes the index from the directory."""
+        entries = {}
+        with os.scandir(self._path) as directory_entries:
+            for directory_entry in directory_entries:
+                if not directory_entry.is_file():
+                    continue
+
+                stat_object = directory_entry.stat()
+
+                entry = self._entries.get(directory_entry.name, None)
+                if (
+                    not entry
+                    or entry.size != stat_object.st_size
+                    or entry.modification_time != stat_object.st_mtime_ns
+                ):
+                    entry = DirectoryIndexEntry(directory_entry.name)
+                    entry.modification_time = stat_object.st_mtime_ns
+                    entry.size = stat_object.st_size
+                    self._ParseFilename(entry)
+
+                entries[directory_entry.name] = entry
+
+        self._entries = entries
+
+        if self._cache_file:
+            self._WriteCacheFile()
+
+
+class Snapshot:
+    """Snapshot of the packages of a repository.
+
+    Attributes:
+      creation_time (int): POSIX timestamp of when the snapshot was created.
+      packages (dict[str, str]): package names and versions.
+      revision (str): revision of the repository or None if not available.
+    """
+
+    def __init__(self, creation_time, revision, packages):
+        """Initializes a snapshot.
+
+        Args:
+          creation_time (int): POSIX timestamp of when the snapshot was created.
+          revision (str): revision of the repository or None if not available.
+          packages (dict[str, str]): package names and versions.
+        """
+        super().__init__()
+        self.creation_time = creation_time
+        self.packages = packages
+        self.revision = revision
+
+
+class SQLiteSnapshotStore:
+    """SQLite-backed store of snapshots of the packages of repositories.
+
+    The store can be used from multiple threads. Only the most recent snapshots
+    per repository, track and distribution are kept, older snapshots are
+    removed when a snapshot is added.
+    """
+
+    _CREATE_TABLE_QUERIES = [
+        (
+            "CREATE TABLE IF NOT EXISTS snapshots ("
+            "identifier INTEGER PRIMARY KEY AUTOINCREMENT, "
+            "repository TEXT NOT NULL, "
+            "track TEXT NOT NULL, "
+            "distribution TEXT NOT NULL, "
+            "revision TEXT, "
+            "creation_time INTEGER NOT NULL)"
+        ),
+        (
+            "CREATE TABLE IF NOT EXISTS snapshot_packages ("
+            "snapshot_identifier INTEGER NOT NULL, "
+            "name TEXT NOT NULL, "
+            "version TEXT NOT NULL, "
+            "PRIMARY KEY (snapshot_identifier, name))"
+        ),
+    ]
+
+    def __init__(self, maximum_number_of_snapshots=2):
+        """Initializes a SQLite-backed snapshot store.
+
+        Args:
+          maximum_number_of_snapshots (Optional[int]): maximum number of
+              snapshots to keep per repository, track and distribution.
+        """
+        super().__init__()
+        self._connection = None
+        self._lock = threading.Lock()
+        self._maximum_number_of_snapshots = maximum_number_of_snapshots
+
+    def _GetSnapshots(self, repository, track, distribution, maximum_number):
+        """Retrieves the most recent snapshots.
+
+        Args:
+          repository (str): name of the repository.
+          track (str): name of the track.
+          distribution (str): name of the distribution.
+          maximum_number (int): maximum number of snapshots to retrieve.
+
+        Returns:
+          list[Snapshot]: snapshots, most recent first.
+        """
+        snapshots = []
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT identifier, creation_time, revision FROM snapshots "
+                "WHERE repository = ? AND track = ? AND distribution = ? "
+                "ORDER BY identifier DESC LIMIT ?",
+                (repository, track, distribution or "", maximum_number),
+            ).fetchall()
+
+            for identifier, creation_time, revision in rows:
+                packages = dict(
+                    self._connection.execute(
+                        "SELECT name, version FROM snapshot_packages "
+                        "WHERE snapshot_identifier = ?",
+                        (identifier,),
+                    )
+                )
+                snapshots.append(Snapshot(creation_time, revision, packages))
+
+        return snapshots
+
+    def AddSnapshot(self, repository, track, distribution, revision, packages):
+        """Adds a snapshot.
+
+        Args:
+          repository (str): name of the repository.
+          track (str): name of the track.
+          distribution (str): name of the distribution.
+          revision (str): revision of the repository or None if not available.
+          packages (dict[str, str]): package names and versions.
+        """
+        with self._lock, self._connection:
+            cursor = self._connection.execute(
+                "INSERT INTO snapshots (repository, track, distribution, revision, "
+                "creation_time) VALUES (?, ?, ?, ?, ?)",
+                (repository, track, distribution or "", revision, int(time.time())),
+            )
+            self._connection.executemany(
+                "INSERT INTO snapshot_packages VALUES (?, ?, ?)",
+                [
+                    (cursor.lastrowid, name, version)
+                    for name, version in packages.items()
+                ],
+            )
+
+            # Remove the snapshots that were superseded by the added snapshot.
+            rows = self._connection.execute(
+                "SELECT identifier FROM snapshots "
+                "WHERE repository = ? AND track = ? AND distribution = ? "
+                "ORDER BY identifier DESC LIMIT -1 OFFSET ?",
+                (
+                    repository,
+                    track,
+                    distribution or "",
+                    self._maximum_number_of_snapshots,
+                ),
+            ).fetchall()
+
+            self._connection.executemany(
+                "DELETE FROM snapshot_packages WHERE snapshot_identifier = ?", rows
+            )
+            self._connection.executemany(
+                "DELETE FROM snapshots WHERE identifier = ?", rows
+            )
 
-                    if project_definition.pypi_name:
-                        self._pypi_package_names[project_definition.pypi_name] = (
-                            project_definition.name
-                        )
+    def Close(self):
+        """Closes the snapshot store."""
+        if self._connection:
+            self._connection.close()
+            self._connection = None
 
-    def CopyPackages(self):
-        """Copies packages."""
-        # TODO: implement:
-        # send post to https://launchpad.net/~gift/+archive/ubuntu/testing
-        #              /+copy-packages
-        return
+    def GetLatestSnapshot(self, repository, track, distribution):
+        """Retrieves the most recent snapshot.
 
-    def GetPackages(self):
-        """Retrieves a list of packages.
+        Args:
+          repository (str): name of the repository.
+          track (str): name of the track.
+          distribution (str): name of the distribution.
 
         Returns:
-          dict[str, str]: package names and versions as values or None if
-              the packages cannot be determined.
+          Snapshot: most recent snapshot or None if not available.
         """
-        packages = {}
-        for package_name in self._package_names:
-            pypi_package_name = self._pypi_package_names.get(package_name, package_name)
+        snapshots = self._GetSnapshots(repository, track, distribution, 1)
+        if not snapshots:
+            return None
 
-            kwargs = {"package_name": pypi_package_name}
-            download_url = self._PYPI_URL.format(**kwargs)
+        return snapshots[0]
 
-            page_content = self._download_helper.DownloadPageContent(download_url)
-            if not page_content:
-                logging.error(
-                    f"Unable to retrieve PyPI package: {pypi_package_name:s} page."
-                )
-                continue
+    def Open(self, path):
+        """Opens the snapshot store.
 
-            try:
-                page_content = page_content.decode("utf-8")
-            except UnicodeDecodeError as exception:
-                logging.error(
-                    f"Unable to decode PyPI package: {pypi_package_name:s} page with "
-                    f"error: {exception!s}"
-                )
-                continue
+        Args:
+          path (str): path of the SQLite database file.
 
-            expression_string = (
-                f"<title>{pypi_package_name:s} ([^ ]*) : Python Package "
-                f"Index</title>"
+        Returns:
+          bool: True if successful or False if not.
+        """
+        try:
+            self._connection = sqlite3.connect(path, check_same_thread=False)
+            with self._connection:
+                for query in self._CREATE_TABLE_QUERIES:
+                    self._connection.execute(query)
+
+        except sqlite3.Error as exception:
+            logging.error(
+                f"Unable to open snapshot store: {path:s} with error: {exception!s}"
             )
-            matches = re.findall(expression_string, page_content)
-            if not matches or len(matches) != 1:
-                logging.warning(
-                    f"Unable to determine PyPI package: {pypi_package_name:s} "
-                    f"information."
-                )
-                continue
+            self.Close()
+            return False
+
+        return True
+
+
+class TrackChanges:
+    """Changes of the packages of a track since the previous snapshot.
+
+    Attributes:
+      added_packages (dict[str, str]): names and versions of packages that were
+          added.
+      moved_packages (dict[str, str]): names and versions of added or updated
+          packages that have the same version as in the reference track, which
+          indicates they moved from the reference track, or None if
+          the packages of the reference track are not available.
+      previous_snapshot (Snapshot): previous snapshot or None if not available.
+      removed_packages (dict[str, str]): names and versions of packages that
+          were removed.
+      updated_packages (dict[str, tuple[str, str]]): names and previous and
+          current versions of packages that were updated.
+    """
 
-            packages[package_name] = matches
+    def __init__(self, previous_snapshot):
+        """Initializes track changes.
 
-        return packages
+        Args:
+          previous_snapshot (Snapshot): previous snapshot or None if not
+              available.
+        """
+        super().__init__()
+        self.added_packages = {}
+        self.moved_packages = {}
+        self.previous_snapshot = previous_snapshot
+        self.removed_packages = {}
+        self.updated_packages = {}
 
 
 class PackagesManager:
-    """Manages packages across various repositories."""
+    """Manages packages across various repositories.
+
+    Package listings of repositories that are compared are retrieved
+    concurrently.
+    """
+
+    TRACKS = ("dev", "testing", "staging", "stable")
 
-    def __init__(self, projects_file, distribution=None):
+    # The reference track of each track, where packages move from the reference
+    # track to the track.
+    REFERENCE_TRACKS = {"dev": "testing", "staging": "dev", "stable": "staging"}
+
+    def __init__(
+        self,
+        projects_file,
+        directory_index_file=None,
+        distribution=None,
+        number_of_workers=8,
+        snapshot_store=None,
+    ):
         """Initializes a packages manager.
 
         Args:
           projects_file (str): path to the projects.ini file.
+          directory_index_file (Optional[str]): path of the file to cache
+              the reference directory index in, where None represents the index
+              is not cached between runs.
           distribution (Optional[str]): name of the distribution.
+          number_of_workers (Optional[int]): maximum number of package listings
+              that are retrieved concurrently.
+          snapshot_store (Optional[SQLiteSnapshotStore]): snapshot store, where
+              None represents package listings are always retrieved.
         """
         fedora_distribution = distribution or definitions.DEFAULT_FEDORA_DISTRIBUTION
         ubuntu_distribution = distribution or definitions.DEFAULT_UBUNTU_DISTRIBUTION
 
         super().__init__()
-        self._copr_project_manager = COPRProjectManager(
-            "gift", distribution=fedora_distribution
-        )
+        self._copr_project_managers = {
+            fedora_distribution: COPRProjectManager(
+                "gift", distribution=fedora_distribution
+            )
+        }
+        self._directory_index_file = directory_index_file
+        self._directory_indexes = {}
+        self._fedora_distribution = fedora_distribution
         self._github_repo_manager = GithubRepoManager()
-        self._launchpad_ppa_manager = LaunchpadPPAManager(
-            "gift", distribution=ubuntu_distribution
+        self._launchpad_ppa_managers = {
+            ubuntu_distribution: LaunchpadPPAManager(
+                "gift", distribution=ubuntu_distribution
+            )
+        }
+        self._number_of_workers = number_of_workers
+        self._pypi_manager = PyPIManager(
+            projects_file, number_of_workers=number_of_workers
         )
-        self._pypi_manager = PyPIManager(projects_file)
+        self._snapshot_store = snapshot_store
         self._ubuntu_distribution = ubuntu_distribution
 
     def _ComparePackages(self, reference_packages, packages):
@@ -481,6 +1350,127 @@ class PackagesManager:
 
         return new_packages, new_versions
 
+    def _GetConcurrently(self, function_calls):
+        """Calls functions concurrently.
+
+        Args:
+          function_calls (list[tuple[function, tuple[object, ...]]]): functions
+              and their arguments.
+
+        Returns:
+          list[object]: return values of the functions in order of the function
+              calls.
+        """
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=self._number_of_workers
+        ) as executor:
+            futures = [
+                executor.submit(function, *arguments)
+                for function, arguments in function_calls
+            ]
+            return [future.result() for future in futures]
+
+    def _GetDirectoryIndex(self, path):
+        """Retrieves an up to date index of a directory.
+
+        Args:
+          path (str): path of the directory.
+
+        Returns:
+          DirectoryIndex: directory index.
+        """
+        directory_index = self._directory_indexes.get(path, None)
+        if not directory_index:
+            directory_index = DirectoryIndex(
+                path, cache_file=self._directory_index_file
+            )
+            self._directory_indexes[path] = directory_index
+
+        directory_index.Refresh()
+
+        return directory_index
+
+    def _GetRepositoryManager(self, repository, distribution):
+        """Retrieves the manager of a repository.
+
+        Args:
+          repository (str): name of the repository, either "copr", "l2tbinaries"
+              or "launchpad".
+          distribution (str): name of the distribution, not used by the
+              "l2tbinaries" repository.
+
+        Returns:
+          object: COPR project, GitHub repository or Launchpad PPA manager.
+
+        Raises:
+          ValueError: if the repository is not supported.
+        """
+        if repository == "copr":
+            if distribution not in self._copr_project_managers:
+                self._copr_project_managers[distribution] = COPRProjectManager(
+                    "gift", distribution=distribution
+                )
+            return self._copr_project_managers[distribution]
+
+        if repository == "l2tbinaries":
+            return self._github_repo_manager
+
+        if repository == "launchpad":
+            if distribution not in self._launchpad_ppa_managers:
+                self._launchpad_ppa_managers[distribution] = LaunchpadPPAManager(
+                    "gift", distribution=distribution
+                )
+            return self._launchpad_ppa_managers[distribution]
+
+        raise ValueError(f"Unsupported repository: {repository:s}")
+
+    def _GetRepositoryPackages(self, repository, track, distribution):
+        """Retrieves the packages of a track of a repository.
+
+        If a snapshot store is used and the revision of the repository did not
+        change since the last snapshot, the packages of the last snapshot are
+        returned instead of retrieving the package listing.
+
+        Args:
+          repository (str): name of the repository, either "copr", "l2tbinaries"
+              or "launchpad".
+          track (str): name of the track.
+          distribution (str): name of the distribution or for the "l2tbinaries"
+              repository the machine type sub directory.
+
+        Returns:
+          dict[str, str]: package names and versions as values or None if
+              the packages cannot be determined.
+
+        Raises:
+          ValueError: if the repository is not supported.
+        """
+        repository_manager = self._GetRepositoryManager(repository, distribution)
+
+        if repository == "l2tbinaries":
+            arguments = (distribution, track)
+        else:
+            arguments = (track,)
+
+        revision = None
+        if self._snapshot_store:
+            revision = repository_manager.GetRevision(track)
+            if revision:
+                snapshot = self._snapshot_store.GetLatestSnapshot(
+                    repository, track, distribution
+                )
+                if snapshot and snapshot.revision == revision:
+                    return snapshot.packages
+
+        packages = repository_manager.GetPackages(*arguments)
+
+        if self._snapshot_store and packages is not None:
+            self._snapshot_store.AddSnapshot(
+                repository, track, distribution, revision, packages
+            )
+
+        return packages
+
     def CompareDirectoryWithCOPRProject(self, reference_directory, project):
         """Compares a directory containing source rpm packages with a COPR project.
 
@@ -498,29 +1488,12 @@ class PackagesManager:
                 existing packages are those that have a newer version in the
                 reference directory.
         """
-        reference_packages = {}
-        for directory_entry in os.listdir(reference_directory):
-            # The directory contains various files and we are only interested
-            # in the source RPM packages that use the naming convention:
-            # package-version-#.src.rpm
-            if not directory_entry.endswith(".src.rpm"):
-                continue
-
-            package_name, _, _ = directory_entry.rpartition("-")
-            package_name, _, package_version = package_name.rpartition("-")
-
-            if package_name in reference_packages:
-                package_version_tuple = package_version.split(".")
-                version_tuple = reference_packages[package_name].split(".")
-                compare_result = versions.CompareVersions(
-                    package_version_tuple, version_tuple
-                )
-                if compare_result < 0:
-                    continue
-
-            reference_packages[package_name] = package_version
+        directory_index = self._GetDirectoryIndex(reference_directory)
+        reference_packages = directory_index.GetPackages("srpm")
 
-        packages = self._copr_project_manager.GetPackages(project)
+        packages = self._GetRepositoryPackages(
+            "copr", project, self._fedora_distribution
+        )
         return self._ComparePackages(reference_packages, packages)
 
     def CompareDirectoryWithCSV(self, reference_directory, csv_file):
@@ -540,46 +1513,8 @@ class PackagesManager:
                 existing packages are those that have a newer version in the
                 reference directory.
         """
-        reference_packages = {}
-        for directory_entry in os.listdir(reference_directory):
-            # The directory contains various files and we are only interested
-            # in the source packages that use the naming convention:
-            # package-version-#.tar.gz
-            # package-version-#.zip
-            if not directory_entry.endswith(".tar.gz") and not directory_entry.endswith(
-                ".zip"
-            ):
-                continue
-
-            if (
-                directory_entry.endswith(".debian.tar.gz")
-                or directory_entry.endswith(".orig.tar.gz")
-                or directory_entry.endswith("-1.tar.gz")
-            ):
-                continue
-
-            package_name, _, _ = directory_entry.rpartition(".")
-            if package_name.endswith(".tar"):
-                package_name, _, _ = package_name.rpartition(".")
-            package_name, _, package_version = package_name.rpartition("-")
-
-            if (
-                package_name.endswith("-alpha")
-                or package_name.endswith("-beta")
-                or package_name.endswith("-experimental")
-            ):
-                package_name, _, _ = package_name.rpartition("-")
-
-            if package_name in reference_packages:
-                package_version_tuple = package_version.split(".")
-                version_tuple = reference_packages[package_name].split(".")
-                compare_result = versions.CompareVersions(
-                    package_version_tuple, version_tuple
-                )
-                if compare_result < 0:
-                    continue
-
-            reference_packages[package_name] = package_version
+        directory_index = self._GetDirectoryIndex(reference_directory)
+        reference_packages = directory_index.GetPackages("source")
 
         packages = {}
         with open(csv_file, encoding="utf-8") as file_object:
@@ -607,26 +1542,10 @@ class PackagesManager:
                 existing packages are those that have a newer version in the
                 reference directory.
         """
-        reference_packages = {}
-        for directory_entry in os.listdir(reference_directory):
-            if not directory_entry or not directory_entry.endswith(".whl"):
-                continue
-
-            directory_entry, _, _ = directory_entry.rpartition("-")
-            package_name, _, package_version = directory_entry.rpartition("-")
-
-            if package_name in reference_packages:
-                package_version_tuple = package_version.split(".")
-                version_tuple = reference_packages[package_name].split(".")
-                compare_result = versions.CompareVersions(
-                    package_version_tuple, version_tuple
-                )
-                if compare_result < 0:
-                    continue
+        directory_index = self._GetDirectoryIndex(reference_directory)
+        reference_packages = directory_index.GetPackages("wheel")
 
-            reference_packages[package_name] = package_version
-
-        packages = self._github_repo_manager.GetPackages(sub_directory, track)
+        packages = self._GetRepositoryPackages("l2tbinaries", track, sub_directory)
         return self._ComparePackages(reference_packages, packages)
 
     def CompareDirectoryWithLaunchpadPPATrack(self, reference_directory, track):
@@ -646,31 +1565,14 @@ class PackagesManager:
                 existing packages are those that have a newer version in the
                 reference directory.
         """
-        reference_packages = {}
-        for directory_entry in os.listdir(reference_directory):
-            # The directory contains various files and we are only interested
-            # in the source dpkg packages that use the naming convention:
-            # package_version-#ppa1~distribution_source.changes
-            if not directory_entry.endswith(
-                f"ppa1~{self._ubuntu_distribution:s}_source.changes"
-            ):
-                continue
-
-            package_name, _, _ = directory_entry.rpartition("-")
-            package_name, _, package_version = package_name.rpartition("_")
-
-            if package_name in reference_packages:
-                package_version_tuple = package_version.split(".")
-                version_tuple = reference_packages[package_name].split(".")
-                compare_result = versions.CompareVersions(
-                    package_version_tuple, version_tuple
-                )
-                if compare_result < 0:
-                    continue
-
-            reference_packages[package_name] = package_version
+        directory_index = self._GetDirectoryIndex(reference_directory)
+        reference_packages = directory_index.GetPackages(
+            "dpkg_source", distribution=self._ubuntu_distribution
+        )
 
-        packages = self._launchpad_ppa_manager.GetPackages(track)
+        packages = self._GetRepositoryPackages(
+            "launchpad", track, self._ubuntu_distribution
+        )
         return self._ComparePackages(reference_packages, packages)
 
     def CompareCOPRProjects(self, reference_project, project):
@@ -689,8 +1591,18 @@ class PackagesManager:
                 existing packages are those that have a newer version in the
                 reference project.
         """
-        reference_packages = self._copr_project_manager.GetPackages(reference_project)
-        packages = self._copr_project_manager.GetPackages(project)
+        reference_packages, packages = self._GetConcurrently(
+            [
+                (
+                    self._GetRepositoryPackages,
+                    ("copr", reference_project, self._fedora_distribution),
+                ),
+                (
+                    self._GetRepositoryPackages,
+                    ("copr", project, self._fedora_distribution),
+                ),
+            ]
+        )
 
         return self._ComparePackages(reference_packages, packages)
 
@@ -711,10 +1623,18 @@ class PackagesManager:
                 existing packages are those that have a newer version in the
                 reference track.
         """
-        reference_packages = self._github_repo_manager.GetPackages(
-            sub_directory, reference_track
+        reference_packages, packages = self._GetConcurrently(
+            [
+                (
+                    self._GetRepositoryPackages,
+                    ("l2tbinaries", reference_track, sub_directory),
+                ),
+                (
+                    self._GetRepositoryPackages,
+                    ("l2tbinaries", track, sub_directory),
+                ),
+            ]
         )
-        packages = self._github_repo_manager.GetPackages(sub_directory, track)
 
         return self._ComparePackages(reference_packages, packages)
 
@@ -734,8 +1654,18 @@ class PackagesManager:
                 existing packages are those that have a newer version in the
                 reference track.
         """
-        reference_packages = self._launchpad_ppa_manager.GetPackages(reference_track)
-        packages = self._launchpad_ppa_manager.GetPackages(track)
+        reference_packages, packages = self._GetConcurrently(
+            [
+                (
+                    self._GetRepositoryPackages,
+                    ("launchpad", reference_track, self._ubuntu_distribution),
+                ),
+                (
+                    self._GetRepositoryPackages,
+                    ("launchpad", track, self._ubuntu_distribution),
+                ),
+            ]
+        )
 
         return self._ComparePackages(reference_packages, packages)
 
@@ -755,25 +1685,146 @@ class PackagesManager:
                 existing packages are those that have a newer version in the
                 reference directory.
         """
-        reference_packages = {}
-        for directory_entry in os.listdir(reference_directory):
-            if not directory_entry.endswith(".tar.gz"):
+        directory_index = self._GetDirectoryIndex(reference_directory)
+        reference_packages = directory_index.GetPackages("source")
+
+        packages = self._pypi_manager.GetPackages()
+        return self._ComparePackages(reference_packages, packages)
+
+    def GetPackagesMatrix(self, repository, distributions=None, sub_directory=None):
+        """Retrieves the packages of all tracks and distributions of a repository.
+
+        Args:
+          repository (str): name of the repository, either "copr", "l2tbinaries"
+              or "launchpad".
+          distributions (Optional[list[str]]): names of the distributions, where
+              None represents the distribution of the packages manager. Not
+              used by the "l2tbinaries" repository.
+          sub_directory (Optional[str]): name of the machine type sub directory,
+              used by the "l2tbinaries" repository.
+
+        Returns:
+          dict[tuple[str, str], dict[str, str]]: package names and versions per
+              track and distribution or machine type sub directory. The packages
+              are None if they cannot be determined.
+
+        Raises:
+          ValueError: if the repository is not supported.
+        """
+        if repository == "copr":
+            distributions = distributions or [self._fedora_distribution]
+        elif repository == "l2tbinaries":
+            distributions = [sub_directory]
+        else:
+            distributions = distributions or [self._ubuntu_distribution]
+
+        columns = []
+        function_calls = []
+        for distribution in distributions:
+            # Create the repository managers before they are used concurrently.
+            self._GetRepositoryManager(repository, distribution)
+
+            for track in self.TRACKS:
+                columns.append((track, distribution))
+                function_calls.append(
+                    (self._GetRepositoryPackages, (repository, track, distribution))
+                )
+
+        return dict(zip(columns, self._GetConcurrently(function_calls)))
+
+    def GetTrackChanges(self, repository, distribution=None, sub_directory=None):
+        """Retrieves the changes of the tracks of a repository since the last run.
+
+        The changes of a track are determined by comparing its packages with
+        those of its last snapshot. Tracks that did not change revision are not
+        retrieved again.
+
+        Args:
+          repository (str): name of the repository, either "copr", "l2tbinaries"
+              or "launchpad".
+          distribution (Optional[str]): name of the distribution, where None
+              represents the distribution of the packages manager. Not used by
+              the "l2tbinaries" repository.
+          sub_directory (Optional[str]): name of the machine type sub directory,
+              used by the "l2tbinaries" repository.
+
+        Returns:
+          dict[str, TrackChanges]: changes per track, where tracks of which
+              the packages are not available are omitted.
+
+        Raises:
+          RuntimeError: if no snapshot store is used.
+          ValueError: if the repository is not supported.
+        """
+        if not self._snapshot_store:
+            raise RuntimeError("Missing snapshot store.")
+
+        if repository == "l2tbinaries":
+            distribution = sub_directory
+        elif not distribution:
+            if repository == "copr":
+                distribution = self._fedora_distribution
+            else:
+                distribution = self._ubuntu_distribution
+
+        previous_snapshots = {
+            track: self._snapshot_store.GetLatestSnapshot(
+                repository, track, distribution
+            )
+            for track in self.TRACKS
+        }
+
+        packages_matrix = self.GetPackagesMatrix(
+            repository, distributions=[distribution], sub_directory=sub_directory
+        )
+
+        track_changes = {}
+        for track in self.TRACKS:
+            # A failed listing is not compared with the previous snapshot, since
+            # all its packages would be reported as removed.
+            packages = packages_matrix.get((track, distribution), None)
+            if packages is None:
+                logging.warning(f"Packages of track: {track:s} not available.")
                 continue
 
-            directory_entry, _, _ = directory_entry.rpartition(".tar.gz")
-            name, _, version = directory_entry.rpartition("-")
+            changes = TrackChanges(previous_snapshots[track])
 
-            if (
-                name.endswith("-alpha")
-                or name.endswith("-beta")
-                or name.endswith("-experimental")
-            ):
-                name, _, _ = name.rpartition("-")
+            previous_packages = {}
+            if changes.previous_snapshot:
+                previous_packages = changes.previous_snapshot.packages
 
-            reference_packages[name] = version
+            reference_packages = {}
+            reference_track = self.REFERENCE_TRACKS.get(track, None)
+            if reference_track:
+                reference_packages = packages_matrix.get(
+                    (reference_track, distribution), None
+                )
+                if reference_packages is None:
+                    changes.moved_packages = None
 
-        packages = self._pypi_manager.GetPackages()
-        return self._ComparePackages(reference_packages, packages)
+            for name, version in packages.items():
+                previous_version = previous_packages.get(name, None)
+                if previous_version == version:
+                    continue
+
+                if previous_version is None:
+                    changes.added_packages[name] = version
+                else:
+                    changes.updated_packages[name] = (previous_version, version)
+
+                if (
+                    reference_packages is not None
+                    and reference_packages.get(name, None) == version
+                ):
+                    changes.moved_packages[name] = version
+
+            for name, version in previous_packages.items():
+                if name not in packages:
+                    changes.removed_packages[name] = version
+
+            track_changes[track] = changes
+
+        return track_changes
 
     def GetMachineTypeSubDirectory(
         self, preferred_machine_type=None, preferred_operating_system=None
@@ -828,19 +1879,25 @@ def Main():
     """
     actions = frozenset(
         [
+            "copr-changes-since",
             "copr-diff-dev",
             "copr-diff-stable",
             "copr-diff-staging",
             "copr-diff-testing",
+            "copr-matrix",
             "csv-diff",
+            "l2tbinaries-changes-since",
             "l2tbinaries-diff-dev",
             "l2tbinaries-diff-stable",
             "l2tbinaries-diff-staging",
             "l2tbinaries-diff-testing",
+            "l2tbinaries-matrix",
+            "launchpad-changes-since",
             "launchpad-diff-dev",
             "launchpad-diff-stable",
             "launchpad-diff-staging",
             "launchpad-diff-testing",
+            "launchpad-matrix",
             "pypi-diff",
         ]
     )
@@ -896,6 +1953,32 @@ def Main():
         default=None,
         help="The name or version of the distribution.",
     )
+    argument_parser.add_argument(
+        "--distributions",
+        action="store",
+        metavar="NAMES",
+        dest="distributions",
+        type=str,
+        default="",
+        help=(
+            "Comma separated list of the names or versions of the distributions "
+            "to include in a matrix report."
+        ),
+    )
+    argument_parser.add_argument(
+        "--index-file",
+        "--index_file",
+        action="store",
+        metavar="FILE",
+        dest="index_file",
+        type=str,
+        default=None,
+        help=(
+            "The location of a file to cache the index of the build directory "
+            "in. Only files that were added or changed since the index was "
+            "cached are parsed again."
+        ),
+    )
     argument_parser.add_argument(
         "--machine-type",
         "--machine_type",
@@ -911,6 +1994,29 @@ def Main():
             "'x86' onto another 'amd64'."
         ),
     )
+    argument_parser.add_argument(
+        "--snapshots",
+        action="store",
+        metavar="FILE",
+        dest="snapshots_file",
+        type=str,
+        default=None,
+        help=(
+            "The location of a SQLite database file that contains snapshots of "
+            "the package listings. Package listings of repositories that did "
+            "not change since the last snapshot are not retrieved again. "
+            "Required by the changes-since actions."
+        ),
+    )
+    argument_parser.add_argument(
+        "--workers",
+        action="store",
+        metavar="NUMBER",
+        dest="number_of_workers",
+        type=int,
+        default=8,
+        help="The maximum number of package listings to retrieve concurrently.",
+    )
     options = argument_parser.parse_args()
 
     if not options.action:
@@ -938,9 +2044,30 @@ def Main():
     # TODO: add action to copy files between PPA tracks.
     # TODO: add pypi support.
 
-    packages_manager = PackagesManager(projects_file, distribution=options.distribution)
-
     action_tuple = options.action.split("-")
+    if action_tuple[1] == "changes" and not options.snapshots_file:
+        print(f"Action: {options.action:s} requires a snapshots file.")
+        print("")
+        argument_parser.print_help()
+        print("")
+        return 1
+
+    snapshot_store = None
+    if options.snapshots_file:
+        snapshot_store = SQLiteSnapshotStore()
+        if not snapshot_store.Open(options.snapshots_file):
+            print(f"Unable to open snapshots file: {options.snapshots_file:s}")
+            print("")
+            return 1
+
+    packages_manager = PackagesManager(
+        projects_file,
+        directory_index_file=options.index_file,
+        distribution=options.distribution,
+        number_of_workers=options.number_of_workers,
+        snapshot_store=snapshot_store,
+    )
+
     diff_header = None
     new_packages = {}
     new_versions = {}
@@ -1070,7 +2197,100 @@ def Main():
 
         diff_header = f"Difference between: {reference_directory:s} and release"
 
-    if action_tuple[1] == "diff":
+    if action_tuple[1] == "changes":
+        sub_directory = None
+        if action_tuple[0] == "l2tbinaries":
+            sub_directory = packages_manager.GetMachineTypeSubDirectory(
+                preferred_machine_type=options.machine_type
+            )
+
+        track_changes = packages_manager.GetTrackChanges(
+            action_tuple[0],
+            distribution=options.distribution,
+            sub_directory=sub_directory,
+        )
+
+        for track in packages_manager.TRACKS:
+            changes = track_changes.get(track, None)
+            if not changes:
+                print(f"Packages of track: {track:s} not available")
+                print("")
+                continue
+
+            if not changes.previous_snapshot:
+                print(f"Changes of track: {track:s} since: first snapshot")
+            else:
+                date_time = datetime.datetime.fromtimestamp(
+                    changes.previous_snapshot.creation_time
+                )
+                date_time_string = date_time.isoformat(sep=" ")
+                print(f"Changes of track: {track:s} since: {date_time_string:s}")
+            print("")
+
+            reference_track = packages_manager.REFERENCE_TRACKS.get(track, None)
+            if reference_track:
+                print(f"Moved from track: {reference_track:s}:")
+                if changes.moved_packages is None:
+                    print("  not available")
+                else:
+                    for package, version in sorted(changes.moved_packages.items()):
+                        print(f"  {package:s} {version:s}")
+                print("")
+
+            print("Added packages:")
+            for package, version in sorted(changes.added_packages.items()):
+                print(f"  {package:s} {version:s}")
+            print("")
+
+            print("Updated packages:")
+            for package, (previous_version, version) in sorted(
+                changes.updated_packages.items()
+            ):
+                print(f"  {package:s} {previous_version:s} -> {version:s}")
+            print("")
+
+            print("Removed packages:")
+            for package, version in sorted(changes.removed_packages.items()):
+                print(f"  {package:s} {version:s}")
+            print("")
+
+    elif action_tuple[1] == "matrix":
+        sub_directory = None
+        if action_tuple[0] == "l2tbinaries":
+            sub_directory = packages_manager.GetMachineTypeSubDirectory(
+                preferred_machine_type=options.machine_type
+            )
+
+        distributions = [
+            distribution
+            for distribution in options.distributions.split(",")
+            if distribution
+        ]
+        packages_matrix = packages_manager.GetPackagesMatrix(
+            action_tuple[0],
+            distributions=distributions or None,
+            sub_directory=sub_directory,
+        )
+
+        columns = list(packages_matrix.keys())
+        package_names = set()
+        for packages in packages_matrix.values():
+            package_names.update(packages or {})
+
+        header = "\t".join(
+            [f"{track:s}/{distribution or '':s}" for track, distribution in columns]
+        )
+        print(f"package\t{header:s}")
+
+        for package_name in sorted(package_names):
+            package_versions = [
+                (packages_matrix[column] or {}).get(package_name, None) or "-"
+                for column in columns
+            ]
+            package_versions = "\t".join(package_versions)
+            print(f"{package_name:s}\t{package_versions:s}")
+
+    elif action_tuple[1] == "diff":
         print(diff_header)
         print("")
 
@@ -1084,6 +2304,9 @@ def Main():
             print(f"  {package:s}")
         print("")
 
+    if snapshot_store:
+        snapshot_store.Close()
+
     return 0
 
 
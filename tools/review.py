@@ -92,20 +92,24 @@ def Main():
         feature_branch,
         all_files=options.all_files,
     )
-    if not review_helper.InitializeHelpers():
-        return 1
+    try:
+        if not review_helper.InitializeHelpers():
+            return 1
 
-    if not review_helper.CheckLocalGitState():
-        return 1
+        if not review_helper.CheckLocalGitState():
+            return 1
 
-    if not review_helper.Lint():
-        return 1
+        if not review_helper.Lint():
+            return 1
 
-    if not review_helper.Test():
-        return 1
+        if not review_helper.Test():
+            return 1
 
-    if options.command == "close" and not review_helper.Close():
-        return 1
+        if options.command == "close" and not review_helper.Close():
+            return 1
+
+    finally:
+        review_helper.CloseHelpers()
 
     return 0
 
@@ -2,8 +2,12 @@
 """Script to extract the database schema from SQLite database files."""
 
 import argparse
+import concurrent.futures
+import glob
+import hashlib
 import logging
 import os
+import pathlib
 import sqlite3
 import sys
 import textwrap
@@ -17,6 +21,8 @@ except ImportError:
 class SQLiteSchemaExtractor:
     """SQLite database file schema extractor."""
 
+    _SQLITE_SIGNATURE = b"SQLite format 3\x00"
+
     _SCHEMA_QUERY = (
         "SELECT tbl_name, sql "
         "FROM sqlite_master "
@@ -60,9 +66,70 @@ class SQLiteSchemaExtractor:
 
         return "\n".join(lines)
 
+    def _GetDatabaseSchemaWithPath(self, database_path):
+        """Retrieves schema from given database if it is a SQLite database file.
+
+        Args:
+          database_path (str): file path to database.
+
+        Returns:
+          tuple[str, dict[str, str]]: file path to database and schema as an SQL
+              query per table name or None if the file is not a SQLite database
+              file or the schema could not be retrieved.
+        """
+        try:
+            with open(database_path, "rb") as file_object:
+                signature = file_object.read(len(self._SQLITE_SIGNATURE))
+        except OSError as exception:
+            logging.error(
+                f"Unable to read file: {database_path:s} with error: {exception!s}"
+            )
+            return database_path, None
+
+        if signature != self._SQLITE_SIGNATURE:
+            return database_path, None
+
+        return database_path, self.GetDatabaseSchema(database_path)
+
+    def ExtractSchemas(self, database_paths, number_of_workers=None):
+        """Extracts the schemas of multiple databases and groups them by variant.
+
+        Files that are not SQLite database files are ignored.
+
+        Args:
+          database_paths (list[str]): file paths to databases.
+          number_of_workers (Optional[int]): number of worker processes, where
+              None represents the number of processors.
+
+        Returns:
+          dict[str, tuple[dict[str, str], list[str]]]: schema and file paths of
+              the databases with that schema per schema hash.
+        """
+        schemas_per_hash = {}
+
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=number_of_workers
+        ) as executor:
+            for database_path, schema in executor.map(
+                self._GetDatabaseSchemaWithPath, database_paths, chunksize=16
+            ):
+                if not schema:
+                    continue
+
+                schema_hash = self.GetSchemaHash(schema)
+                if schema_hash not in schemas_per_hash:
+                    schemas_per_hash[schema_hash] = (schema, [])
+
+                schemas_per_hash[schema_hash][1].append(database_path)
+
+        return schemas_per_hash
+
     def GetDatabaseSchema(self, database_path):
         """Retrieves schema from given database.
 
+        The database is opened read-only and immutable, so no journal or lock
+        files are created or accessed.
+
         Args:
           database_path (str): file path to database.
 
@@ -72,7 +139,18 @@ class SQLiteSchemaExtractor:
         """
         schema = None
 
-        database = sqlite3.connect(database_path)
+        database_uri = pathlib.Path(os.path.abspath(database_path)).as_uri()
+        try:
+            database = sqlite3.connect(
+                f"{database_uri:s}?mode=ro&immutable=1", uri=True
+            )
+        except sqlite3.Error as exception:
+            logging.error(
+                f"Unable to open database: {database_path:s} with error: "
+                f"{exception!s}"
+            )
+            return None
+
         database.row_factory = sqlite3.Row
 
         try:
@@ -90,6 +168,21 @@ class SQLiteSchemaExtractor:
 
         return schema
 
+    def GetSchemaHash(self, schema):
+        """Retrieves a hash of a schema.
+
+        Args:
+          schema (dict[str, str]): schema as an SQL query per table name.
+
+        Returns:
+          str: hexadecimal SHA-256 of the normalized schema.
+        """
+        normalized_schema = "\n".join(
+            f"{table_name:s}\t{' '.join(query.split()):s}"
+            for table_name, query in sorted(schema.items())
+        )
+        return hashlib.sha256(normalized_schema.encode("utf-8")).hexdigest()
+
 
 def Main():
     """Entry point of console script.
@@ -113,19 +206,80 @@ def Main():
             ),
         )
 
+    argument_parser.add_argument(
+        "--workers",
+        dest="number_of_workers",
+        action="store",
+        metavar="NUMBER",
+        type=int,
+        default=None,
+        help=(
+            "number of worker processes used to extract schemas from a directory "
+            "or glob pattern, where the default is the number of processors."
+        ),
+    )
+
     argument_parser.add_argument(
         "database_path",
         type=str,
-        help="path to the database file to extract schema from.",
+        help=(
+            "path to the database file to extract schema from or a directory or "
+            "glob pattern of database files to extract schemas from grouped by "
+            "schema variant."
+        ),
     )
     options = argument_parser.parse_args()
 
+    extractor = SQLiteSchemaExtractor()
+
+    if os.path.isdir(options.database_path):
+        database_paths = []
+        for directory_path, _, filenames in os.walk(options.database_path):
+            for filename in sorted(filenames):
+                database_paths.append(os.path.join(directory_path, filename))
+
+    elif glob.has_magic(options.database_path):
+        database_paths = sorted(
+            path
+            for path in glob.glob(options.database_path, recursive=True)
+            if os.path.isfile(path)
+        )
+
+    else:
+        database_paths = None
+
+    if database_paths is not None:
+        schemas_per_hash = extractor.ExtractSchemas(
+            database_paths, number_of_workers=options.number_of_workers
+        )
+        if not schemas_per_hash:
+            print(
+                f"Unable to determine schema from database files: "
+                f"{options.database_path:s}"
+            )
+            return 1
+
+        lines = []
+        for schema_hash, (database_schema, paths) in sorted(
+            schemas_per_hash.items(), key=lambda item: (-len(item[1][1]), item[0])
+        ):
+            lines.append(f"Schema: {schema_hash:s} ({len(paths):d} databases)")
+            lines.extend(f"  {path:s}" for path in paths)
+            lines.append(extractor.FormatSchema(database_schema))
+            lines.append("")
+
+        output = "\n".join(lines)
+        if pyperclip and options.to_clipboard:
+            pyperclip.copy(output)
+        else:
+            print(output)
+
+        return 0
+
     if not os.path.exists(options.database_path):
         print(f"No such database file: {options.database_path:s}")
         return 1
 
-    extractor = SQLiteSchemaExtractor()
-
     database_schema = extractor.GetDatabaseSchema(options.database_path)
     if not database_schema:
         print(
@@ -1,18 +1,31 @@
 #!/usr/bin/env python3
 """Script to retrieve GitHub project statistics."""
 
+import abc
 import argparse
+import concurrent.futures
 import configparser
 import datetime
 import json
 import logging
 import os
+import re
+import sqlite3
 import sys
 import time
 
 import urllib.error as urllib_error
+from urllib.request import Request
 from urllib.request import urlopen
 
+try:
+    import pyarrow
+    import pyarrow.ipc  # pylint: disable=unused-import
+    import pyarrow.parquet as pyarrow_parquet
+except ImportError:
+    pyarrow = None
+    pyarrow_parquet = None
+
 
 class StatsDefinitionReader:
     """Class that implements a stats definition reader."""
@@ -104,7 +117,29 @@ class StatsDefinitionReader:
 
 
 class DownloadHelper:
-    """Class that defines a download helper."""
+    """Class that defines a download helper.
+
+    The download helper supports authenticated requests, retries responses
+    that indicate the data is still being computed (HTTP 202), waits when
+    the rate limit has been exceeded and follows pagination "Link" headers.
+    """
+
+    _LINK_NEXT_REGEX = re.compile(r'<([^>]+)>;\s*rel="next"')
+
+    # Maximum number of retries of a single request.
+    _MAXIMUM_NUMBER_OF_RETRIES = 5
+
+    # Maximum number of seconds to wait before retrying a request.
+    _MAXIMUM_RETRY_WAIT = 300
+
+    def __init__(self, token=None):
+        """Initializes a download helper.
+
+        Args:
+          token (Optional[str]): GitHub API authentication token.
+        """
+        super().__init__()
+        self._token = token
 
     def _DownloadPageContent(self, download_url):
         """Downloads the page content from the URL.
@@ -113,85 +148,281 @@ class DownloadHelper:
           download_url (str): URL where to download the page content.
 
         Returns:
-          tuple[bytes, TODO]: page content and response headers if successful or
-              None otherwise.
+          tuple[bytes, http.client.HTTPMessage]: page content and response
+              headers if successful or None otherwise.
         """
         if not download_url:
             return None, None
 
-        page_content = None
-        response_headers = None
+        headers = {"Accept": "application/vnd.github+json"}
+        if self._token:
+            headers["Authorization"] = f"Bearer {self._token:s}"
+
+        retry_wait = 1
+        for _ in range(self._MAXIMUM_NUMBER_OF_RETRIES + 1):
+            request = Request(download_url, headers=headers)
+
+            try:
+                with urlopen(request) as url_object:
+                    # GitHub returns 202 when statistics are still being computed.
+                    if url_object.code == 202:
+                        logging.info(
+                            f"Data of URL: {download_url:s} is being computed, "
+                            f"retrying in {retry_wait:d} seconds."
+                        )
+                        time.sleep(retry_wait)
+                        retry_wait = min(retry_wait * 2, self._MAXIMUM_RETRY_WAIT)
+                        continue
+
+                    if url_object.code != 200:
+                        return None, None
 
-        try:
-            with urlopen(download_url) as url_object:
-                if url_object.code == 200:
                     page_content = url_object.read()
                     response_headers = url_object.info()
 
-        except urllib_error.URLError as exception:
-            logging.warning(
-                f"Unable to download URL: {download_url:s} with error: {exception!s}"
-            )
+                    self._WaitForRateLimitReset(response_headers)
+                    return page_content, response_headers
+
+            except urllib_error.HTTPError as exception:
+                wait_time = None
+                if exception.code in (403, 429):
+                    wait_time = self._GetRateLimitWaitTime(exception.headers)
+
+                if wait_time is None:
+                    logging.warning(
+                        f"Unable to download URL: {download_url:s} with error: "
+                        f"{exception!s}"
+                    )
+                    return None, None
+
+                logging.info(
+                    f"Rate limit exceeded, retrying URL: {download_url:s} in "
+                    f"{wait_time:d} seconds."
+                )
+                time.sleep(wait_time)
+
+            except urllib_error.URLError as exception:
+                logging.warning(
+                    f"Unable to download URL: {download_url:s} with error: "
+                    f"{exception!s}"
+                )
+                return None, None
+
+        logging.warning(
+            f"Unable to download URL: {download_url:s} maximum number of retries "
+            f"exceeded."
+        )
+        return None, None
+
+    def _DownloadPaginatedJSON(self, download_url, stop_function=None):
+        """Downloads JSON formatted data from the URL and follows pagination.
+
+        Args:
+          download_url (str): URL of the first page.
+          stop_function (Optional[function]): function that takes the JSON
+              formatted objects of a page and returns True if no further pages
+              should be downloaded.
+
+        Returns:
+          list[object]: JSON formatted objects of all pages or None if any of
+              the pages could not be downloaded, since the statistics would
+              otherwise be determined from incomplete data.
+        """
+        json_objects = []
+
+        while download_url:
+            page_content, response_headers = self._DownloadPageContent(download_url)
+            if not page_content:
+                logging.error(
+                    f"Unable to download page: {download_url:s}, ignoring "
+                    f"incomplete data."
+                )
+                return None
+
+            page_json = json.loads(page_content)
+            if not isinstance(page_json, list):
+                page_json = [page_json]
+
+            json_objects.extend(page_json)
+
+            if stop_function and stop_function(page_json):
+                break
+
+            download_url = self._GetNextPageURL(response_headers)
 
-        return page_content, response_headers
+        return json_objects
+
+    def _GetNextPageURL(self, response_headers):
+        """Retrieves the URL of the next page from the "Link" response header.
+
+        Args:
+          response_headers (http.client.HTTPMessage): response headers.
+
+        Returns:
+          str: URL of the next page or None if not available.
+        """
+        if not response_headers:
+            return None
+
+        link_header = response_headers.get("Link", None)
+        if not link_header:
+            return None
+
+        match = self._LINK_NEXT_REGEX.search(link_header)
+        if not match:
+            return None
+
+        return match.group(1)
+
+    def _GetRateLimitWaitTime(self, response_headers):
+        """Determines the number of seconds to wait for the rate limit.
+
+        Args:
+          response_headers (http.client.HTTPMessage): response headers.
+
+        Returns:
+          int: number of seconds to wait or None if the response does not
+              indicate that the rate limit was exceeded.
+        """
+        if not response_headers:
+            return None
+
+        retry_after = response_headers.get("Retry-After", None)
+        if retry_after and retry_after.isdigit():
+            return min(int(retry_after, 10), self._MAXIMUM_RETRY_WAIT)
+
+        remaining = response_headers.get("X-RateLimit-Remaining", None)
+        reset_time = response_headers.get("X-RateLimit-Reset", None)
+        if remaining == "0" and reset_time and reset_time.isdigit():
+            wait_time = int(reset_time, 10) - int(time.time()) + 1
+            return max(0, min(wait_time, self._MAXIMUM_RETRY_WAIT))
+
+        return None
+
+    def _WaitForRateLimitReset(self, response_headers):
+        """Waits for the rate limit to reset if no requests are remaining.
+
+        Args:
+          response_headers (http.client.HTTPMessage): response headers.
+        """
+        wait_time = self._GetRateLimitWaitTime(response_headers)
+        if wait_time:
+            logging.info(f"Rate limit reached, waiting {wait_time:d} seconds.")
+            time.sleep(wait_time)
 
 
 class GithubContributionsHelper(DownloadHelper):
     """Class that defines a GitHub contributions helper."""
 
-    def _ListContributionsForProject(self, organization, project_name, output_writer):
-        """Lists the contributions of a specific project.
+    # Number of rows that are passed to the output writer at once.
+    _BATCH_SIZE = 1000
+
+    def __init__(self, number_of_workers=8, token=None):
+        """Initializes a GitHub contributions helper.
+
+        Args:
+          number_of_workers (Optional[int]): maximum number of projects for which
+              data is retrieved concurrently.
+          token (Optional[str]): GitHub API authentication token.
+        """
+        super().__init__(token=token)
+        self._number_of_workers = number_of_workers
+
+    def _GetContributionsForProject(self, organization, project_name):
+        """Retrieves the contributions of a specific project.
 
         Args:
           organization (str): name of the organization.
           project_name (str): name of the project.
-          output_writer (OutputWriter): output writer.
+
+        Returns:
+          list[object]: JSON formatted contributors objects or None if not
+              available.
         """
         download_url = (
             f"https://api.github.com/repos/{organization:s}/{project_name:s}/"
             f"stats/contributors"
         )
 
-        contributors_data, response = self._DownloadPageContent(download_url)
-        if not contributors_data:
-            return
+        return self._DownloadPaginatedJSON(download_url)
 
-        # TODO: check if response is not None
-        _ = response
+    def _GetPerProject(self, projects_per_organization, function):
+        """Retrieves data for all projects concurrently.
 
-        contributors_json = json.loads(contributors_data)
-        self._WriteContributions(project_name, contributors_json, output_writer)
+        Args:
+          projects_per_organization (dict[str, list[str]]): organization names
+              with corresponding projects names.
+          function (function): function that retrieves the data of a project
+              and takes the organization and project names as arguments.
 
-    def _ListPullRequestsForProject(self, organization, project_name, output_writer):
-        """Lists the pull requests of a specific project.
+        Yields:
+          tuple[str, object]: project name and data of the project, in the
+              order of the projects.
+        """
+        organizations_and_projects = [
+            (organization, project_name)
+            for organization, projects in projects_per_organization.items()
+            for project_name in projects
+        ]
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=self._number_of_workers
+        ) as executor:
+            futures = [
+                executor.submit(function, organization, project_name)
+                for organization, project_name in organizations_and_projects
+            ]
+            for (_, project_name), future in zip(organizations_and_projects, futures):
+                yield project_name, future.result()
+
+    def _GetPullRequestsForProject(self, organization, project_name, since=None):
+        """Retrieves the pull requests of a specific project.
 
         Args:
           organization (str): name of the organization.
           project_name (str): name of the project.
-          output_writer (OutputWriter): output writer.
+          since (Optional[str]): ISO 8601 date and time, where only pull requests
+              updated after this date and time are retrieved.
+
+        Returns:
+          list[object]: JSON formatted pull objects or None if not available.
         """
         download_url = (
             f"https://api.github.com/repos/{organization:s}/{project_name:s}/"
-            f"pulls?state=all"
+            f"pulls?state=all&sort=updated&direction=desc&per_page=100"
         )
 
-        pulls_data, response = self._DownloadPageContent(download_url)
-        if not pulls_data:
-            return
-
-        # TODO: check if response is not None
-        _ = response
+        if not since:
+            return self._DownloadPaginatedJSON(download_url)
+
+        # Pull requests are sorted by last update, most recent first, hence
+        # no further pages are needed once a page contains an older update.
+        pulls_json = self._DownloadPaginatedJSON(
+            download_url,
+            stop_function=lambda page_json: any(
+                (pull_json.get("updated_at", None) or "") <= since
+                for pull_json in page_json
+            ),
+        )
+        if pulls_json is None:
+            return None
 
-        pulls_json = json.loads(pulls_data)
-        self._WritePullRequests(project_name, pulls_json, output_writer)
+        return [
+            pull_json
+            for pull_json in pulls_json
+            if (pull_json.get("updated_at", None) or "") > since
+        ]
 
-    def _WriteContributions(self, project_name, contributors_json, output_writer):
-        """Writes the contributions to the output writer.
+    def _ParseContributions(self, contributors_json):
+        """Parses the contributions.
 
         Args:
-          project_name (str): name of the project.
           contributors_json (list[object]): JSON formatted contributors objects.
-          output_writer (OutputWriter): output writer.
+
+        Yields:
+          tuple[int, str, int, int, int]: POSIX timestamp of the start of the week,
+              login name, number of contributions, number of lines added and
+              number of lines deleted.
         """
         # https://developer.github.com/v3/repos/statistics/
         # [{
@@ -207,7 +438,6 @@ class GithubContributionsHelper(DownloadHelper):
         #   }, ...],
         # }, ...]
 
-        contributions_per_week = {}
         for contributions_per_author_json in contributors_json:
             author_json = contributions_per_author_json.get("author", None)
             if not author_json:
@@ -243,49 +473,144 @@ class GithubContributionsHelper(DownloadHelper):
                     logging.error("Missing week timestamp JSON value.")
                     continue
 
-                time_elements = time.gmtime(week_timestamp)
-                year = time.strftime("%Y", time_elements)
-                week_number = time.strftime("%U", time_elements)
-
-                if week_number not in contributions_per_week:
-                    contributions_per_week[week_number] = {}
-
-                contributions_per_week[week_number][login_name] = (
-                    number_of_contributions,
-                    number_of_lines_added,
-                    number_of_lines_deleted,
-                )
-
-                output_writer.WriteContribution(
-                    year,
-                    week_number,
+                yield (
+                    week_timestamp,
                     login_name,
-                    project_name,
                     number_of_contributions,
                     number_of_lines_added,
                     number_of_lines_deleted,
                 )
 
-    def _WritePullRequests(self, project_name, pulls_json, output_writer):
-        """Writes the pull requests to the output writer.
+    def _ParsePullRequests(self, pulls_json):
+        """Parses the pull requests.
 
         Args:
-          project_name (str): name of the project.
           pulls_json (list[object]): JSON formatted pull objects.
-          output_writer (OutputWriter): output writer.
-        """
 
+        Yields:
+          tuple[int, str, str, str, str, str, str]: pull request number, creation
+              date and time, last update date and time, login name of the
+              creator, title, comma separated login names of the requested
+              reviewers and state.
+        """
         # https://developer.github.com/v3/pulls/#list-pull-requests
         # [{
         #  "created_at": creation date and time of the CL.
+        #  "number": number of the CL.
+        #  "requested_reviewers": [{
+        #    "login": github username.
+        #   }, ...]
         #  "state": state of the CL.
         #  "title": string containing the CL description.
+        #  "updated_at": last update date and time of the CL.
         #  "user": {
         #    "login": github username.
         #   }, ...]
         #  ...
         # }, ...]
 
+        for pull_json in pulls_json:
+            number = pull_json.get("number", None)
+            if number is None:
+                logging.error("Missing number JSON value.")
+                continue
+
+            user_json = pull_json.get("user", None) or {}
+            reviewers = [
+                reviewer_json.get("login", "")
+                for reviewer_json in pull_json.get("requested_reviewers", None) or []
+            ]
+
+            yield (
+                number,
+                pull_json.get("created_at", None) or "",
+                pull_json.get("updated_at", None) or "",
+                user_json.get("login", None) or "",
+                pull_json.get("title", None) or "",
+                ",".join(reviewers),
+                pull_json.get("state", None) or "",
+            )
+
+    def _WriteContributions(self, contributions, output_writer):
+        """Writes contributions to the output writer in batches.
+
+        Args:
+          contributions (iterable[tuple[str, int, str, int, int, int]]): project
+              name, POSIX timestamp of the start of the week, login name, number
+              of contributions, number of lines added and number of lines
+              deleted.
+          output_writer (OutputWriter): output writer.
+        """
+        batch = []
+        for (
+            project_name,
+            week_timestamp,
+            login_name,
+            number_of_contributions,
+            number_of_lines_added,
+            number_of_lines_deleted,
+        ) in contributions:
+            time_elements = time.gmtime(week_timestamp)
+            year = time.strftime("%Y", time_elements)
+            week_number = time.strftime("%U", time_elements)
+
+            batch.append(
+                (
+                    year,
+                    week_number,
+                    login_name,
+                    project_name,
+                    number_of_contributions,
+                    number_of_lines_added,
+                    number_of_lines_deleted,
+                )
+            )
+            if len(batch) >= self._BATCH_SIZE:
+                output_writer.WriteContributions(batch)
+                batch = []
+
+        if batch:
+            output_writer.WriteContributions(batch)
+
+    def _WritePullRequests(self, pull_requests, output_writer):
+        """Writes pull requests to the output writer in batches.
+
+        Args:
+          pull_requests (iterable[tuple[str, int, str, str, str, str, str, str]]):
+              project name, pull request number, creation date and time, last
+              update date and time, login name of the creator, title, comma
+              separated login names of the requested reviewers and state.
+          output_writer (OutputWriter): output writer.
+        """
+        batch = []
+        for (
+            project_name,
+            number,
+            creation_time,
+            _,
+            login_name,
+            title,
+            reviewers,
+            state,
+        ) in pull_requests:
+            batch.append(
+                (
+                    creation_time,
+                    login_name,
+                    project_name,
+                    number,
+                    title,
+                    reviewers,
+                    state,
+                )
+            )
+            if len(batch) >= self._BATCH_SIZE:
+                output_writer.WriteReviews(batch)
+                batch = []
+
+        if batch:
+            output_writer.WriteReviews(batch)
+
     def ListContributions(self, projects_per_organization, output_writer):
         """Lists the contributions of projects.
 
@@ -294,11 +619,24 @@ class GithubContributionsHelper(DownloadHelper):
               with corresponding projects names.
           output_writer (OutputWriter): output writer.
         """
-        for organization, projects in iter(projects_per_organization.items()):
-            for project_name in projects:
-                self._ListContributionsForProject(
-                    organization, project_name, output_writer
+        for project_name, contributors_json in self._GetPerProject(
+            projects_per_organization, self._GetContributionsForProject
+        ):
+            if contributors_json:
+                contributions = (
+                    (project_name, *contribution)
+                    for contribution in self._ParseContributions(contributors_json)
                 )
+                self._WriteContributions(contributions, output_writer)
+
+    def ListContributionsFromStore(self, stats_store, output_writer):
+        """Lists the contributions stored in a statistics store.
+
+        Args:
+          stats_store (SQLiteStatsStore): statistics store.
+          output_writer (OutputWriter): output writer.
+        """
+        self._WriteContributions(stats_store.GetContributions(), output_writer)
 
     def ListPullRequests(self, projects_per_organization, output_writer):
         """Lists the pull requests of projects.
@@ -308,29 +646,285 @@ class GithubContributionsHelper(DownloadHelper):
               with corresponding projects names.
           output_writer (OutputWriter): output writer.
         """
-        for organization, projects in iter(projects_per_organization.items()):
-            for project_name in projects:
-                self._ListPullRequestsForProject(
-                    organization, project_name, output_writer
+        for project_name, pulls_json in self._GetPerProject(
+            projects_per_organization, self._GetPullRequestsForProject
+        ):
+            if pulls_json:
+                pull_requests = (
+                    (project_name, *pull_request)
+                    for pull_request in self._ParsePullRequests(pulls_json)
                 )
+                self._WritePullRequests(pull_requests, output_writer)
 
+    def ListPullRequestsFromStore(self, stats_store, output_writer):
+        """Lists the pull requests stored in a statistics store.
 
-class StdoutWriter:
-    """Class that defines a stdout output writer."""
+        Args:
+          stats_store (SQLiteStatsStore): statistics store.
+          output_writer (OutputWriter): output writer.
+        """
+        self._WritePullRequests(stats_store.GetPullRequests(), output_writer)
 
-    def __init__(self, user_mappings, output_format="csv"):
-        """Initializes a stdout output writer.
+    def UpdateContributions(self, projects_per_organization, stats_store):
+        """Updates the contributions in a statistics store.
+
+        Only the weeks from the last stored week onwards are updated, since
+        the contributions of earlier weeks do not change.
+
+        Args:
+          projects_per_organization (dict[str, list[str]]): organization names
+              with corresponding projects names.
+          stats_store (SQLiteStatsStore): statistics store.
+        """
+        for project_name, contributors_json in self._GetPerProject(
+            projects_per_organization, self._GetContributionsForProject
+        ):
+            if not contributors_json:
+                continue
+
+            last_week_timestamp = stats_store.GetLastContributionWeek(project_name)
+            contributions = [
+                contribution
+                for contribution in self._ParseContributions(contributors_json)
+                if last_week_timestamp is None or contribution[0] >= last_week_timestamp
+            ]
+            stats_store.AddContributions(project_name, contributions)
+
+    def UpdatePullRequests(self, projects_per_organization, stats_store):
+        """Updates the pull requests in a statistics store.
+
+        Only the pull requests updated after the last stored update are
+        retrieved.
+
+        Args:
+          projects_per_organization (dict[str, list[str]]): organization names
+              with corresponding projects names.
+          stats_store (SQLiteStatsStore): statistics store.
+        """
+        # Note that the store is only accessed from the main thread.
+        last_update_times = {
+            project_name: stats_store.GetLastPullRequestUpdateTime(project_name)
+            for projects in projects_per_organization.values()
+            for project_name in projects
+        }
+
+        def _GetPullRequests(organization, project_name):
+            return self._GetPullRequestsForProject(
+                organization, project_name, since=last_update_times[project_name]
+            )
+
+        for project_name, pulls_json in self._GetPerProject(
+            projects_per_organization, _GetPullRequests
+        ):
+            if pulls_json:
+                stats_store.AddPullRequests(
+                    project_name, list(self._ParsePullRequests(pulls_json))
+                )
+
+
+class SQLiteStatsStore:
+    """Class that defines a SQLite-backed statistics store."""
+
+    _CREATE_TABLE_QUERIES = [
+        (
+            "CREATE TABLE IF NOT EXISTS contributions ("
+            "project TEXT NOT NULL, "
+            "week_timestamp INTEGER NOT NULL, "
+            "login_name TEXT NOT NULL, "
+            "number_of_contributions INTEGER NOT NULL, "
+            "number_of_lines_added INTEGER NOT NULL, "
+            "number_of_lines_deleted INTEGER NOT NULL, "
+            "PRIMARY KEY (project, week_timestamp, login_name))"
+        ),
+        (
+            "CREATE TABLE IF NOT EXISTS pull_requests ("
+            "project TEXT NOT NULL, "
+            "number INTEGER NOT NULL, "
+            "creation_time TEXT NOT NULL, "
+            "update_time TEXT NOT NULL, "
+            "login_name TEXT NOT NULL, "
+            "title TEXT NOT NULL, "
+            "reviewers TEXT NOT NULL, "
+            "state TEXT NOT NULL, "
+            "PRIMARY KEY (project, number))"
+        ),
+    ]
+
+    def __init__(self):
+        """Initializes a SQLite-backed statistics store."""
+        super().__init__()
+        self._connection = None
+
+    def AddContributions(self, project_name, contributions):
+        """Adds or replaces contributions.
+
+        Args:
+          project_name (str): name of the project.
+          contributions (list[tuple[int, str, int, int, int]]): POSIX timestamp of
+              the start of the week, login name, number of contributions, number
+              of lines added and number of lines deleted.
+        """
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO contributions VALUES (?, ?, ?, ?, ?, ?)",
+                [(project_name, *contribution) for contribution in contributions],
+            )
+
+    def AddPullRequests(self, project_name, pull_requests):
+        """Adds or replaces pull requests.
+
+        Args:
+          project_name (str): name of the project.
+          pull_requests (list[tuple[int, str, str, str, str, str, str]]): pull
+              request number, creation date and time, last update date and time,
+              login name of the creator, title, comma separated login names of
+              the requested reviewers and state.
+        """
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO pull_requests VALUES "
+                "(?, ?, ?, ?, ?, ?, ?, ?)",
+                [(project_name, *pull_request) for pull_request in pull_requests],
+            )
+
+    def Close(self):
+        """Closes the statistics store."""
+        if self._connection:
+            self._connection.close()
+            self._connection = None
+
+    def GetContributions(self):
+        """Retrieves the contributions.
+
+        Yields:
+          tuple[str, int, str, int, int, int]: project name, POSIX timestamp of
+              the start of the week, login name, number of contributions, number
+              of lines added and number of lines deleted.
+        """
+        yield from self._connection.execute(
+            "SELECT * FROM contributions "
+            "ORDER BY project, week_timestamp, login_name"
+        )
+
+    def GetLastContributionWeek(self, project_name):
+        """Retrieves the last week with stored contributions of a project.
+
+        Args:
+          project_name (str): name of the project.
+
+        Returns:
+          int: POSIX timestamp of the start of the week or None if not available.
+        """
+        cursor = self._connection.execute(
+            "SELECT MAX(week_timestamp) FROM contributions WHERE project = ?",
+            (project_name,),
+        )
+        return cursor.fetchone()[0]
+
+    def GetLastPullRequestUpdateTime(self, project_name):
+        """Retrieves the last update date and time of stored pull requests.
+
+        Args:
+          project_name (str): name of the project.
+
+        Returns:
+          str: ISO 8601 date and time or None if not available.
+        """
+        cursor = self._connection.execute(
+            "SELECT MAX(update_time) FROM pull_requests WHERE project = ?",
+            (project_name,),
+        )
+        return cursor.fetchone()[0]
+
+    def GetPullRequests(self):
+        """Retrieves the pull requests.
+
+        Yields:
+          tuple[str, int, str, str, str, str, str, str]: project name, pull
+              request number, creation date and time, last update date and time,
+              login name of the creator, title, comma separated login names of
+              the requested reviewers and state.
+        """
+        yield from self._connection.execute(
+            "SELECT * FROM pull_requests ORDER BY project, number"
+        )
+
+    def Open(self, path):
+        """Opens the statistics store.
+
+        Args:
+          path (str): path of the SQLite database file.
+
+        Returns:
+          bool: True if successful or False if not.
+        """
+        try:
+            self._connection = sqlite3.connect(path)
+            with self._connection:
+                for query in self._CREATE_TABLE_QUERIES:
+                    self._connection.execute(query)
+
+        except sqlite3.Error as exception:
+            logging.error(
+                f"Unable to open statistics store: {path:s} with error: "
+                f"{exception!s}"
+            )
+            self.Close()
+            return False
+
+        return True
+
+
+class OutputWriter:
+    """Class that defines an output writer interface.
+
+    Contribution rows contain: year (str), week number (str), username (str),
+    project name (str), number of contributed CLs (int), total number of lines
+    added (int) and total number of lines deleted (int).
+
+    Review rows contain: creation date and time (str), created by (str), project
+    name (str), code review issue number (int), description (str), reviewers
+    (str) and status (str).
+    """
+
+    def __init__(self, user_mappings):
+        """Initializes an output writer.
 
         Args:
           user_mappings (dict[str, str]): mapping between GitHub username and
               another username.
-          output_format (Optional[str]): output format.
         """
         super().__init__()
-        self._header_written = False
-        self._output_format = output_format
         self._user_mappings = user_mappings
 
+    def _MapContributions(self, contributions):
+        """Maps the login names of contributions to usernames.
+
+        Args:
+          contributions (list[tuple[str, str, str, str, int, int, int]]):
+              contribution rows.
+
+        Yields:
+          tuple[str, str, str, str, int, int, int]: contribution row with the
+              login name replaced by the mapped username.
+        """
+        for contribution in contributions:
+            username = contribution[2]
+
+            if self._user_mappings:
+                username = username.lower()
+                username = self._user_mappings.get(username, None)
+                # TODO: add flag to control this behavior.
+                if not username:
+                    # Skip login names without a username mapping.
+                    continue
+
+            yield (*contribution[:2], username, *contribution[3:])
+
+    def Close(self):
+        """Closes the output writer object."""
+        return
+
     def Open(self):
         """Opens the output writer object.
 
@@ -339,9 +933,56 @@ class StdoutWriter:
         """
         return True
 
+    @abc.abstractmethod
+    def WriteContributions(self, contributions):
+        """Writes a batch of contributions.
+
+        Args:
+          contributions (list[tuple[str, str, str, str, int, int, int]]):
+              contribution rows.
+        """
+
+    @abc.abstractmethod
+    def WriteReviews(self, reviews):
+        """Writes a batch of reviews.
+
+        Args:
+          reviews (list[tuple[str, str, str, int, str, str, str]]): review rows.
+        """
+
+
+class StdoutWriter(OutputWriter):
+    """Class that defines a buffered stdout output writer."""
+
+    # Maximum number of characters buffered before written to stdout.
+    _MAXIMUM_BUFFER_SIZE = 64 * 1024
+
+    def __init__(self, user_mappings, output_format="csv"):
+        """Initializes a stdout output writer.
+
+        Args:
+          user_mappings (dict[str, str]): mapping between GitHub username and
+              another username.
+          output_format (Optional[str]): output format.
+        """
+        super().__init__(user_mappings)
+        self._buffer = []
+        self._buffer_size = 0
+        self._header_written = False
+        self._output_format = output_format
+
     def Close(self):
         """Closes the output writer object."""
-        return
+        self.Flush()
+
+    def Flush(self):
+        """Writes the buffered data to stdout."""
+        if self._buffer:
+            sys.stdout.write("".join(self._buffer))
+            sys.stdout.flush()
+
+            self._buffer = []
+            self._buffer_size = 0
 
     def Write(self, data):
         """Writes the data to stdout (without the default trailing newline).
@@ -349,98 +990,317 @@ class StdoutWriter:
         Args:
           data (str): data to write.
         """
-        print(data, end="")
-
-    def WriteContribution(
-        self,
-        year,
-        week_number,
-        login_name,
-        project_name,
-        number_of_contributions,
-        number_of_lines_added,
-        number_of_lines_deleted,
-    ):
-        """Writes a contribution to stdout.
-
-        Args:
-          year (int): year of the contribution.
-          week_number (int): week number of the contribution.
-          login_name (str): log-in name.
-          project_name (str): project name.
-          number_of_contributions (int): number of contributed CLs.
-          number_of_lines_added (int): total number of lines added.
-          number_of_lines_deleted (int): total number of lines deleted.
-        """
-        username = login_name
-
-        if self._user_mappings:
-            username = username.lower()
-            username = self._user_mappings.get(username, None)
-            # TODO: add flag to control this behavior.
-            if not username:
-                # Skip login names without a username mapping.
-                return
+        self._buffer.append(data)
+        self._buffer_size += len(data)
+
+        if self._buffer_size >= self._MAXIMUM_BUFFER_SIZE:
+            self.Flush()
+
+    def WriteContributions(self, contributions):
+        """Writes a batch of contributions.
+
+        Args:
+          contributions (list[tuple[str, str, str, str, int, int, int]]):
+              contribution rows.
+        """
+        lines = []
 
         if self._output_format == "csv":
             if not self._header_written:
-                self.Write(
+                lines.append(
                     "year\tweek number\tlogin name\tproject\tnumber of contributions\t"
                     "number lines added\tnumber lines deleted\n"
                 )
-
                 self._header_written = True
 
-            self.Write(
-                (
+            for (
+                year,
+                week_number,
+                username,
+                project_name,
+                number_of_contributions,
+                number_of_lines_added,
+                number_of_lines_deleted,
+            ) in self._MapContributions(contributions):
+                lines.append(
                     f"{year:s}\t{week_number:s}\t{username:s}\t{project_name:s}\t"
                     f"{number_of_contributions:d}\t{number_of_lines_added:d}\t"
                     f"{number_of_lines_deleted:d}\n"
                 )
-            )
 
         elif self._output_format == "tilde":
-            date_time = datetime.datetime.strptime(
-                f"{year:s}-W{week_number:s}-0", "%Y-W%W-%w"
-            )
-            date_time_string = date_time.isoformat()
-
-            # TODO: add description.
-            self.Write(
-                f"{date_time_string:s} [github] ~ author:{username:s} ~ "
-                f"project:{project_name:s} ~ "
-                f"number_of_cls:{number_of_contributions:d} ~ "
-                f"delta_added:{number_of_lines_added:d} ~ "
-                f"delta_deleted:{number_of_lines_deleted:d} ~ "
-                f"py:{number_of_lines_added:d} ~ file_type:py ~ op_type:ADD ~\n"
-            )
+            for (
+                year,
+                week_number,
+                username,
+                project_name,
+                number_of_contributions,
+                number_of_lines_added,
+                number_of_lines_deleted,
+            ) in self._MapContributions(contributions):
+                date_time = datetime.datetime.strptime(
+                    f"{year:s}-W{week_number:s}-0", "%Y-W%W-%w"
+                )
+                date_time_string = date_time.isoformat()
+
+                # TODO: add description.
+                lines.append(
+                    f"{date_time_string:s} [github] ~ author:{username:s} ~ "
+                    f"project:{project_name:s} ~ "
+                    f"number_of_cls:{number_of_contributions:d} ~ "
+                    f"delta_added:{number_of_lines_added:d} ~ "
+                    f"delta_deleted:{number_of_lines_deleted:d} ~ "
+                    f"py:{number_of_lines_added:d} ~ file_type:py ~ op_type:ADD ~\n"
+                )
 
-    def WriteReview(
-        self, creation_time, created_by, issue_number, description, reviewers, status
-    ):
-        """Writes a review to stdout.
+        self.Write("".join(lines))
+
+    def WriteReviews(self, reviews):
+        """Writes a batch of reviews.
 
         Args:
-          creation_time (str): creation date and time.
-          created_by (str): created by.
-          issue_number (int): code review issue number.
-          description (str): description.
-          reviewers (str): reviewers.
-          status (str): status.
+          reviews (list[tuple[str, str, str, int, str, str, str]]): review rows.
         """
-        if self._output_format == "csv":
-            if not self._header_written:
-                self.Write(
-                    "creation time\tcreated by\tissue number\tdescription\treviewers\t"
-                    "status\n"
-                )
-                self._header_written = True
+        if self._output_format != "csv":
+            return
 
-            self.Write(
+        lines = []
+        if not self._header_written:
+            lines.append(
+                "creation time\tcreated by\tissue number\tdescription\treviewers\t"
+                "status\n"
+            )
+            self._header_written = True
+
+        for (
+            creation_time,
+            created_by,
+            _,
+            issue_number,
+            description,
+            reviewers,
+            status,
+        ) in reviews:
+            lines.append(
                 f"{creation_time:s}\t{created_by:s}\t{issue_number:d}\t"
                 f"{description:s}\t{reviewers:s}\t{status:s}\n"
             )
 
+        self.Write("".join(lines))
+
+
+class ArrowWriter(OutputWriter):
+    """Class that defines an Apache Arrow or Parquet file output writer."""
+
+    _CONTRIBUTIONS_COLUMNS = [
+        ("year", "int16"),
+        ("week_number", "int8"),
+        ("username", "string"),
+        ("project", "string"),
+        ("number_of_contributions", "int64"),
+        ("number_of_lines_added", "int64"),
+        ("number_of_lines_deleted", "int64"),
+    ]
+
+    _REVIEWS_COLUMNS = [
+        ("creation_time", "string"),
+        ("created_by", "string"),
+        ("project", "string"),
+        ("issue_number", "int64"),
+        ("description", "string"),
+        ("reviewers", "string"),
+        ("status", "string"),
+    ]
+
+    def __init__(self, user_mappings, path, output_format="parquet"):
+        """Initializes an Apache Arrow or Parquet file output writer.
+
+        Args:
+          user_mappings (dict[str, str]): mapping between GitHub username and
+              another username.
+          path (str): path of the output file.
+          output_format (Optional[str]): output format, either "arrow" or
+              "parquet".
+        """
+        super().__init__(user_mappings)
+        self._output_format = output_format
+        self._path = path
+        self._schema = None
+        self._writer = None
+
+    def _GetSchema(self, columns):
+        """Retrieves an Apache Arrow schema.
+
+        Args:
+          columns (list[tuple[str, str]]): names and Apache Arrow type names of
+              the columns.
+
+        Returns:
+          pyarrow.Schema: schema.
+        """
+        return pyarrow.schema(
+            [(name, getattr(pyarrow, type_name)()) for name, type_name in columns]
+        )
+
+    def _WriteRows(self, columns, rows):
+        """Writes rows as a record batch.
+
+        Args:
+          columns (list[tuple[str, str]]): names and Apache Arrow type names of
+              the columns.
+          rows (list[tuple[object, ...]]): rows.
+        """
+        schema = self._GetSchema(columns)
+        if not self._writer:
+            self._schema = schema
+            if self._output_format == "arrow":
+                self._writer = pyarrow.ipc.new_file(self._path, schema)
+            else:
+                self._writer = pyarrow_parquet.ParquetWriter(self._path, schema)
+
+        elif not schema.equals(self._schema):
+            raise ValueError("Unable to write rows of a different schema.")
+
+        record_batch = pyarrow.RecordBatch.from_arrays(
+            [
+                pyarrow.array(values, type=schema.field(index).type)
+                for index, values in enumerate(zip(*rows))
+            ],
+            schema=schema,
+        )
+        self._writer.write_batch(record_batch)
+
+    def Close(self):
+        """Closes the output writer object."""
+        if self._writer:
+            self._writer.close()
+            self._writer = None
+
+    def Open(self):
+        """Opens the output writer object.
+
+        Returns:
+          bool: True if successful or False if not.
+        """
+        if not pyarrow:
+            logging.error("Missing pyarrow, which is required by the output format.")
+            return False
+
+        return True
+
+    def WriteContributions(self, contributions):
+        """Writes a batch of contributions.
+
+        Args:
+          contributions (list[tuple[str, str, str, str, int, int, int]]):
+              contribution rows.
+        """
+        rows = [
+            (int(year, 10), int(week_number, 10), *values)
+            for year, week_number, *values in self._MapContributions(contributions)
+        ]
+        if rows:
+            self._WriteRows(self._CONTRIBUTIONS_COLUMNS, rows)
+
+    def WriteReviews(self, reviews):
+        """Writes a batch of reviews.
+
+        Args:
+          reviews (list[tuple[str, str, str, int, str, str, str]]): review rows.
+        """
+        if reviews:
+            self._WriteRows(self._REVIEWS_COLUMNS, reviews)
+
+
+class SQLiteWriter(OutputWriter):
+    """Class that defines a SQLite database file output writer."""
+
+    _CREATE_TABLE_QUERIES = [
+        (
+            "CREATE TABLE IF NOT EXISTS output_contributions ("
+            "year INTEGER, week_number INTEGER, username TEXT, project TEXT, "
+            "number_of_contributions INTEGER, number_of_lines_added INTEGER, "
+            "number_of_lines_deleted INTEGER)"
+        ),
+        (
+            "CREATE TABLE IF NOT EXISTS output_reviews ("
+            "creation_time TEXT, created_by TEXT, project TEXT, "
+            "issue_number INTEGER, description TEXT, reviewers TEXT, status TEXT)"
+        ),
+    ]
+
+    def __init__(self, user_mappings, path):
+        """Initializes a SQLite database file output writer.
+
+        Args:
+          user_mappings (dict[str, str]): mapping between GitHub username and
+              another username.
+          path (str): path of the SQLite database file.
+        """
+        super().__init__(user_mappings)
+        self._connection = None
+        self._path = path
+
+    def Close(self):
+        """Closes the output writer object."""
+        if self._connection:
+            self._connection.close()
+            self._connection = None
+
+    def Open(self):
+        """Opens the output writer object.
+
+        Returns:
+          bool: True if successful or False if not.
+        """
+        try:
+            self._connection = sqlite3.connect(self._path)
+            with self._connection:
+                for query in self._CREATE_TABLE_QUERIES:
+                    self._connection.execute(query)
+
+                # Replace the output of previous runs.
+                self._connection.execute("DELETE FROM output_contributions")
+                self._connection.execute("DELETE FROM output_reviews")
+
+        except sqlite3.Error as exception:
+            logging.error(
+                f"Unable to open database: {self._path:s} with error: {exception!s}"
+            )
+            self.Close()
+            return False
+
+        return True
+
+    def WriteContributions(self, contributions):
+        """Writes a batch of contributions.
+
+        Args:
+          contributions (list[tuple[str, str, str, str, int, int, int]]):
+              contribution rows.
+        """
+        with self._connection:
+            self._connection.executemany(
+                "INSERT INTO output_contributions VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (int(year, 10), int(week_number, 10), *values)
+                    for year, week_number, *values in self._MapContributions(
+                        contributions
+                    )
+                ],
+            )
+
+    def WriteReviews(self, reviews):
+        """Writes a batch of reviews.
+
+        Args:
+          reviews (list[tuple[str, str, str, int, str, str, str]]): review rows.
+        """
+        with self._connection:
+            self._connection.executemany(
+                "INSERT INTO output_reviews VALUES (?, ?, ?, ?, ?, ?, ?)", reviews
+            )
+
 
 def Main():
     """Entry point of console script.
@@ -448,7 +1308,7 @@ def Main():
     Returns:
       int: exit code that is provided to sys.exit().
     """
-    statistics_types = frozenset(["contributions"])
+    statistics_types = frozenset(["contributions", "pulls"])
 
     argument_parser = argparse.ArgumentParser(
         description=("Generates an overview of project statistics of github projects.")
@@ -465,15 +1325,59 @@ def Main():
             "files e.g. stats.ini."
         ),
     )
+    argument_parser.add_argument(
+        "--database",
+        dest="database_path",
+        action="store",
+        metavar="PATH",
+        default=None,
+        help=(
+            "path of a SQLite database file in which the statistics are stored, "
+            "where only statistics newer than the stored statistics are "
+            "retrieved."
+        ),
+    )
     argument_parser.add_argument(
         "-f",
         "--format",
         dest="output_format",
         action="store",
         metavar="FORMAT",
-        choices=["csv", "tilde"],
+        choices=["arrow", "csv", "parquet", "sqlite", "tilde"],
         default="csv",
-        help="output format.",
+        help=(
+            "output format, where the arrow, parquet and sqlite output formats "
+            "require an output file."
+        ),
+    )
+    argument_parser.add_argument(
+        "-o",
+        "--output",
+        dest="output_path",
+        action="store",
+        metavar="PATH",
+        default=None,
+        help="path of the output file.",
+    )
+    argument_parser.add_argument(
+        "--token",
+        dest="token",
+        action="store",
+        metavar="TOKEN",
+        default=None,
+        help=(
+            "GitHub API authentication token, if not set the GITHUB_TOKEN "
+            "environment variable is used."
+        ),
+    )
+    argument_parser.add_argument(
+        "--workers",
+        dest="number_of_workers",
+        action="store",
+        metavar="NUMBER",
+        type=int,
+        default=8,
+        help="maximum number of projects to retrieve concurrently.",
     )
     argument_parser.add_argument(
         "statistics_type",
@@ -510,24 +1414,78 @@ def Main():
     with open(stats_file, encoding="utf-8") as file_object:
         user_mappings = stats_definition_reader.ReadUserMappings(file_object)
 
-    output_writer = StdoutWriter(user_mappings, output_format=options.output_format)
+    if options.output_format in ("arrow", "parquet", "sqlite"):
+        if not options.output_path:
+            print(f"Output format: {options.output_format:s} requires an output file.")
+            print("")
+            argument_parser.print_help()
+            print("")
+            return 1
+
+        if options.output_format == "sqlite":
+            output_writer = SQLiteWriter(user_mappings, options.output_path)
+        else:
+            output_writer = ArrowWriter(
+                user_mappings,
+                options.output_path,
+                output_format=options.output_format,
+            )
+
+    else:
+        output_writer = StdoutWriter(user_mappings, output_format=options.output_format)
 
     if not output_writer.Open():
         print("Unable to open output writer.")
         print("")
         return 1
 
-    if options.statistics_type == "contributions":
-        projects_per_organization = {}
-        with open(stats_file, encoding="utf-8") as file_object:
-            stats_definition_reader = StatsDefinitionReader()
-            projects_per_organization = (
-                stats_definition_reader.ReadProjectsPerOrganization(file_object)
-            )
+    projects_per_organization = {}
+    with open(stats_file, encoding="utf-8") as file_object:
+        stats_definition_reader = StatsDefinitionReader()
+        projects_per_organization = stats_definition_reader.ReadProjectsPerOrganization(
+            file_object
+        )
+
+    contributions_helper = GithubContributionsHelper(
+        number_of_workers=options.number_of_workers,
+        token=options.token or os.environ.get("GITHUB_TOKEN", None),
+    )
+
+    if options.database_path:
+        stats_store = SQLiteStatsStore()
+        if not stats_store.Open(options.database_path):
+            print(f"Unable to open database: {options.database_path:s}")
+            print("")
+            return 1
+
+        try:
+            if options.statistics_type == "contributions":
+                contributions_helper.UpdateContributions(
+                    projects_per_organization, stats_store
+                )
+                contributions_helper.ListContributionsFromStore(
+                    stats_store, output_writer
+                )
 
-        contributions_helper = GithubContributionsHelper()
+            elif options.statistics_type == "pulls":
+                contributions_helper.UpdatePullRequests(
+                    projects_per_organization, stats_store
+                )
+                contributions_helper.ListPullRequestsFromStore(
+                    stats_store, output_writer
+                )
+
+        finally:
+            stats_store.Close()
+
+    elif options.statistics_type == "contributions":
         contributions_helper.ListContributions(projects_per_organization, output_writer)
 
+    elif options.statistics_type == "pulls":
+        contributions_helper.ListPullRequests(projects_per_organization, output_writer)
+
+    output_writer.Close()
+
     return 0
 
 
@@ -2,6 +2,10 @@
 # pylint: disable=invalid-name
 """Script to update the dependencies in various configuration files."""
 
+import argparse
+import concurrent.futures
+import difflib
+import logging
 import os
 import shutil
 import sys
@@ -23,88 +27,228 @@ from l2tdevtools.dependency_writers import sphinx_docs
 from l2tdevtools.dependency_writers import tox_ini
 
 
+def UpdateDependencies(l2tdevtools_path, project_path):
+    """Updates the dependencies in the configuration files of a project.
+
+    Files are only written if their content changed.
+
+    Args:
+      l2tdevtools_path (str): path to l2tdevtools.
+      project_path (str): path to the project.
+
+    Returns:
+      dict[str, str]: unified diffs of the files that were changed, per path
+          relative to the project, where None represents the file was removed.
+    """
+    file_diffs = {}
+
+    # The dependency file writers use paths relative to the project.
+    current_working_directory = os.getcwd()
+    os.chdir(project_path)
+
+    try:
+        projects_helper = project.ProjectHelper(project_path)
+        project_definition = projects_helper.ReadDefinitionFile()
+
+        dependencies_helper = dependencies.DependencyHelper()
+
+        for writer_class in (pylint_rc.PylintRcWriter, pyproject.PyprojectTomlWriter):
+            writer = writer_class(
+                l2tdevtools_path, project_definition, dependencies_helper
+            )
+            writer.Write()
+            file_diffs.update(writer.file_diffs)
+
+        for writer_class in (
+            github_actions.GitHubActionsBuildWheelYmlWriter,
+            github_actions.GitHubActionsLintYmlWriter,
+            github_actions.GitHubActionsTestDockerYmlWriter,
+            github_actions.GitHubActionsTestDocsYmlWriter,
+            github_actions.GitHubActionsTestMacOSYmlWriter,
+            github_actions.GitHubActionsTestToxYmlWriter,
+            github_actions.GitHubActionsTestWindowsYmlWriter,
+            check_dependencies.CheckDependenciesWriter,
+            dependencies_py.DependenciesPyWriter,
+            dpkg.DPKGCompatWriter,
+            dpkg.DPKGControlWriter,
+            dpkg.DPKGRulesWriter,
+            gift_copr.GIFTCOPRInstallScriptWriter,
+            gift_ppa.GIFTPPAInstallScriptWriter,
+            jenkins_scripts.LinuxRunEndToEndTestsScriptWriter,
+            jenkins_scripts.RunPython3EndToEndTestsScriptWriter,
+            linux_scripts.UbuntuInstallationScriptWriter,
+            sphinx_docs.ReadthedocsConfigurationWriter,
+            sphinx_docs.SphinxBuildConfigurationWriter,
+            sphinx_docs.SphinxBuildRequirementsWriter,
+            tox_ini.ToxIniWriter,
+        ):
+            if not os.path.exists(writer_class.PATH):
+                continue
+
+            writer = writer_class(
+                l2tdevtools_path, project_definition, dependencies_helper
+            )
+            writer.Write()
+            file_diffs.update(writer.file_diffs)
+
+        output_path = os.path.join("utils", "dependencies.py")
+        if os.path.exists(output_path):
+            input_path = os.path.join(
+                l2tdevtools_path, "l2tdevtools", "dependencies.py"
+            )
+            file_data = []
+            with open(input_path, encoding="utf-8") as file_object:
+                for line in file_object.readlines():
+                    if "# The following functions should not be included in " in line:
+                        break
+
+                    file_data.append(line)
+
+            file_data.pop()
+            file_data = "".join(file_data)
+
+            with open(output_path, encoding="utf-8") as file_object:
+                previous_file_data = file_object.read()
+
+            if file_data != previous_file_data:
+                with open(output_path, "w", encoding="utf-8") as file_object:
+                    file_object.write(file_data)
+
+                file_diffs[output_path] = "".join(
+                    difflib.unified_diff(
+                        previous_file_data.splitlines(keepends=True),
+                        file_data.splitlines(keepends=True),
+                        fromfile=f"a/{output_path:s}",
+                        tofile=f"b/{output_path:s}",
+                    )
+                )
+
+        # Remove old configurations and scripts.
+        script_path = os.path.join("config", "linux", "gift_ppa_install.sh")
+        if os.path.isfile(script_path):
+            os.remove(script_path)
+            file_diffs[script_path] = None
+
+        script_path = os.path.join("config", "macos")
+        if os.path.isfile(script_path):
+            shutil.rmtree(script_path)
+            file_diffs[script_path] = None
+
+        script_path = os.path.join(".travis.yml")
+        if os.path.isfile(script_path):
+            os.remove(script_path)
+            file_diffs[script_path] = None
+
+        script_path = os.path.join("config", "travis")
+        if os.path.isfile(script_path):
+            shutil.rmtree(script_path)
+            file_diffs[script_path] = None
+
+    finally:
+        os.chdir(current_working_directory)
+
+    return file_diffs
+
+
 def Main():
     """Entry point of console script.
 
     Returns:
       int: exit code that is provided to sys.exit().
     """
+    argument_parser = argparse.ArgumentParser(
+        description=(
+            "Updates the dependencies in various configuration files of one or "
+            "more projects."
+        )
+    )
+    argument_parser.add_argument(
+        "--no-diff",
+        "--no_diff",
+        action="store_false",
+        dest="show_diff",
+        default=True,
+        help="Only print the names of the changed files instead of their diffs.",
+    )
+    argument_parser.add_argument(
+        "--workers",
+        action="store",
+        metavar="NUMBER",
+        dest="number_of_workers",
+        type=int,
+        default=None,
+        help=(
+            "The maximum number of projects to update concurrently. The default "
+            "is the number of processors."
+        ),
+    )
+    argument_parser.add_argument(
+        "project_paths",
+        nargs="*",
+        action="store",
+        metavar="PATH",
+        type=str,
+        help=(
+            "Optional paths of the project checkouts to update. If no value is "
+            "provided the project in the current working directory is updated."
+        ),
+    )
+    options = argument_parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
+
     l2tdevtools_path = os.path.abspath(__file__)
     l2tdevtools_path = os.path.dirname(l2tdevtools_path)
     l2tdevtools_path = os.path.dirname(l2tdevtools_path)
 
-    project_path = os.getcwd()
-    projects_helper = project.ProjectHelper(project_path)
-    project_definition = projects_helper.ReadDefinitionFile()
-
-    dependencies_helper = dependencies.DependencyHelper()
-
-    for writer_class in (pylint_rc.PylintRcWriter, pyproject.PyprojectTomlWriter):
-        writer = writer_class(l2tdevtools_path, project_definition, dependencies_helper)
-        writer.Write()
-
-    for writer_class in (
-        github_actions.GitHubActionsBuildWheelYmlWriter,
-        github_actions.GitHubActionsLintYmlWriter,
-        github_actions.GitHubActionsTestDockerYmlWriter,
-        github_actions.GitHubActionsTestDocsYmlWriter,
-        github_actions.GitHubActionsTestMacOSYmlWriter,
-        github_actions.GitHubActionsTestToxYmlWriter,
-        github_actions.GitHubActionsTestWindowsYmlWriter,
-        check_dependencies.CheckDependenciesWriter,
-        dependencies_py.DependenciesPyWriter,
-        dpkg.DPKGCompatWriter,
-        dpkg.DPKGControlWriter,
-        dpkg.DPKGRulesWriter,
-        gift_copr.GIFTCOPRInstallScriptWriter,
-        gift_ppa.GIFTPPAInstallScriptWriter,
-        jenkins_scripts.LinuxRunEndToEndTestsScriptWriter,
-        jenkins_scripts.RunPython3EndToEndTestsScriptWriter,
-        linux_scripts.UbuntuInstallationScriptWriter,
-        sphinx_docs.ReadthedocsConfigurationWriter,
-        sphinx_docs.SphinxBuildConfigurationWriter,
-        sphinx_docs.SphinxBuildRequirementsWriter,
-        tox_ini.ToxIniWriter,
-    ):
-        if not os.path.exists(writer_class.PATH):
-            continue
-
-        writer = writer_class(l2tdevtools_path, project_definition, dependencies_helper)
-        writer.Write()
-
-    output_path = os.path.join("utils", "dependencies.py")
-    if os.path.exists(output_path):
-        input_path = os.path.join(l2tdevtools_path, "l2tdevtools", "dependencies.py")
-        file_data = []
-        with open(input_path, encoding="utf-8") as file_object:
-            for line in file_object.readlines():
-                if "# The following functions should not be included in " in line:
-                    break
-
-                file_data.append(line)
-
-        file_data.pop()
-        file_data = "".join(file_data)
-
-        with open(output_path, "w", encoding="utf-8") as file_object:
-            file_object.write(file_data)
-
-    # Remove old configurations and scripts.
-    script_path = os.path.join("config", "linux", "gift_ppa_install.sh")
-    if os.path.isfile(script_path):
-        os.remove(script_path)
-
-    script_path = os.path.join("config", "macos")
-    if os.path.isfile(script_path):
-        shutil.rmtree(script_path)
-
-    script_path = os.path.join(".travis.yml")
-    if os.path.isfile(script_path):
-        os.remove(script_path)
-
-    script_path = os.path.join("config", "travis")
-    if os.path.isfile(script_path):
-        shutil.rmtree(script_path)
+    if not options.project_paths:
+        UpdateDependencies(l2tdevtools_path, os.getcwd())
+        return 0
+
+    project_paths = [
+        os.path.abspath(project_path) for project_path in options.project_paths
+    ]
+
+    # Every worker process updates multiple projects with the same parsed
+    # templates.
+    result = True
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=options.number_of_workers
+    ) as executor:
+        futures = [
+            executor.submit(UpdateDependencies, l2tdevtools_path, project_path)
+            for project_path in project_paths
+        ]
+
+        for project_path, future in zip(project_paths, futures):
+            # Any exception raised in a worker process is reported per project,
+            # so that the other projects are still reported.
+            try:
+                file_diffs = future.result()
+            except Exception as exception:  # pylint: disable=broad-exception-caught
+                logging.error(
+                    f"Unable to update project: {project_path:s} with error: "
+                    f"{exception!s}"
+                )
+                result = False
+                continue
+
+            if not file_diffs:
+                print(f"{project_path:s}: no changes")
+                continue
+
+            number_of_files = len(file_diffs)
+            print(f"{project_path:s}: {number_of_files:d} file(s) changed")
+            for path, file_diff in sorted(file_diffs.items()):
+                if file_diff is None:
+                    print(f"  removed: {path:s}")
+                elif not options.show_diff:
+                    print(f"  changed: {path:s}")
+                else:
+                    print(file_diff, end="")
+
+    if not result:
+        return 1
 
     return 0
 
@@ -2,7 +2,10 @@
 """Script to update prebuilt versions of the projects."""
 
 import argparse
+import concurrent.futures
 import glob
+import hashlib
+import importlib.metadata
 import json
 import logging
 import os
@@ -50,17 +53,23 @@ class GithubRepoDownloadHelper(interface.DownloadHelper):
 
     _GITHUB_REPO_URL = "https://github.com/log2timeline/l2tbinaries"
 
+    _SHA256SUMS_FILENAME = "SHA256SUMS"
+
     _SUPPORTED_PYTHON_VERSIONS = frozenset([(3, 12), (3, 14)])
 
-    def __init__(self, download_url, branch="main"):
+    def __init__(self, download_url, branch="main", tree_index_file=None):
         """Initializes a download helper.
 
         Args:
           download_url (str): download URL.
           branch (Optional[str]): git branch to download from.
+          tree_index_file (Optional[str]): path of the file to cache the git
+              tree listings in, where None represents the listings are not
+              cached between runs.
         """
         super().__init__(download_url)
         self._branch = branch
+        self._tree_index_file = tree_index_file
 
     def _GetMachineTypeSubDirectory(
         self, preferred_machine_type=None, preferred_operating_system=None
@@ -114,6 +123,32 @@ class GithubRepoDownloadHelper(interface.DownloadHelper):
 
         return sub_directory
 
+    def _GetSHA256SumsURL(
+        self, preferred_machine_type=None, preferred_operating_system=None
+    ):
+        """Retrieves the download URL of the SHA256SUMS file.
+
+        Args:
+          preferred_machine_type (Optional[str]): preferred machine type, where
+              None, which will auto-detect the current machine type.
+          preferred_operating_system (Optional[str]): preferred operating system,
+              where None, which will auto-detect the current operating system.
+
+        Returns:
+          str: download URL or None.
+        """
+        sub_directory = self._GetMachineTypeSubDirectory(
+            preferred_machine_type=preferred_machine_type,
+            preferred_operating_system=preferred_operating_system,
+        )
+        if not sub_directory:
+            return None
+
+        return (
+            f"{self._GITHUB_REPO_URL:s}/raw/{self._branch:s}/{sub_directory:s}/"
+            f"{self._SHA256SUMS_FILENAME:s}"
+        )
+
     def _GetDownloadURL(
         self,
         preferred_machine_type=None,
@@ -148,10 +183,115 @@ class GithubRepoDownloadHelper(interface.DownloadHelper):
 
         return f"{self._GITHUB_REPO_URL:s}/tree/{self._branch:s}/{sub_directory:s}"
 
+    def _GetTreePaths(self, update_tree_index=True):
+        """Retrieves the paths of the files in the git tree of the branch.
+
+        The git tree is retrieved with the git trees API, only when the branch
+        points to a different commit than the cached tree listing.
+
+        Args:
+          update_tree_index (Optional[bool]): True if the cached tree listing
+              should be updated.
+
+        Returns:
+          list[str]: paths of the files or None if not available.
+        """
+        download_url = f"{self._GITHUB_REPO_API_URL:s}/git/refs/heads/{self._branch:s}"
+        page_content = self.DownloadPageContent(download_url)
+        if not page_content:
+            return None
+
+        try:
+            json_dict = json.loads(page_content)
+        except ValueError:
+            return None
+
+        commit_sha = json_dict.get("object", {}).get("sha", None)
+        if not commit_sha:
+            return None
+
+        tree_index = self._ReadTreeIndex()
+
+        tree_listing = tree_index.get(self._branch, {})
+        if tree_listing.get("commit", None) == commit_sha:
+            return tree_listing.get("paths", [])
+
+        download_url = (
+            f"{self._GITHUB_REPO_API_URL:s}/git/trees/{commit_sha:s}?recursive=1"
+        )
+        page_content = self.DownloadPageContent(download_url)
+        if not page_content:
+            return None
+
+        try:
+            json_dict = json.loads(page_content)
+        except ValueError:
+            return None
+
+        # A truncated listing does not contain all the files.
+        if json_dict.get("truncated", False):
+            return None
+
+        paths = [
+            tree_entry["path"]
+            for tree_entry in json_dict.get("tree", [])
+            if tree_entry.get("type", None) == "blob" and "path" in tree_entry
+        ]
+
+        if update_tree_index:
+            tree_index[self._branch] = {
+                "commit": commit_sha,
+                "paths": paths,
+                "tree": json_dict.get("sha", None),
+            }
+            self._WriteTreeIndex(tree_index)
+
+        return paths
+
+    def _ReadTreeIndex(self):
+        """Reads the cached git tree listings.
+
+        Returns:
+          dict[str, dict[str, object]]: git tree listing per branch.
+        """
+        if not self._tree_index_file or not os.path.exists(self._tree_index_file):
+            return {}
+
+        try:
+            with open(self._tree_index_file, encoding="utf-8") as file_object:
+                return json.load(file_object)
+
+        except (OSError, ValueError) as exception:
+            logging.warning(
+                f"Unable to read tree index: {self._tree_index_file:s} with error: "
+                f"{exception!s}"
+            )
+            return {}
+
+    def _WriteTreeIndex(self, tree_index):
+        """Writes the cached git tree listings.
+
+        Args:
+          tree_index (dict[str, dict[str, object]]): git tree listing per branch.
+        """
+        if not self._tree_index_file:
+            return
+
+        try:
+            with open(self._tree_index_file, "w", encoding="utf-8") as file_object:
+                json.dump(tree_index, file_object)
+
+        except OSError as exception:
+            logging.warning(
+                f"Unable to write tree index: {self._tree_index_file:s} with error: "
+                f"{exception!s}"
+            )
+
     def GetPackageDownloadURLs(
         self,
         preferred_machine_type=None,
         preferred_operating_system=None,
+        update_tree_index=True,
         use_api=False,
     ):
         """Retrieves the package download URLs for a given system configuration.
@@ -161,6 +301,8 @@ class GithubRepoDownloadHelper(interface.DownloadHelper):
               None, which will auto-detect the current machine type.
           preferred_operating_system (Optional[str]): preferred operating system,
               where None, which will auto-detect the current operating system.
+          update_tree_index (Optional[bool]): True if the cached git tree
+              listing should be updated.
           use_api (Optional[bool]): True if the GitHub API should be used to
               determine the download URL.
 
@@ -168,6 +310,25 @@ class GithubRepoDownloadHelper(interface.DownloadHelper):
           list[str]: list of package download URLs or None if no package download
               URLs could be determined.
         """
+        sub_directory = self._GetMachineTypeSubDirectory(
+            preferred_machine_type=preferred_machine_type,
+            preferred_operating_system=preferred_operating_system,
+        )
+        if not sub_directory:
+            return None
+
+        if not use_api:
+            # The git tree listing is preferred over scraping the web page, since
+            # it is only retrieved when the branch changed.
+            paths = self._GetTreePaths(update_tree_index=update_tree_index)
+            if paths is not None:
+                return [
+                    f"{self._GITHUB_REPO_URL:s}/raw/{self._branch:s}/{path:s}"
+                    for path in paths
+                    if os.path.dirname(path) == sub_directory
+                    and os.path.basename(path) != self._SHA256SUMS_FILENAME
+                ]
+
         download_url = self._GetDownloadURL(
             preferred_machine_type=preferred_machine_type,
             preferred_operating_system=preferred_operating_system,
@@ -181,8 +342,6 @@ class GithubRepoDownloadHelper(interface.DownloadHelper):
         if not page_content:
             return None
 
-        # TODO: skip SHA256SUMS
-
         download_urls = []
         if use_api:
             # The page content consist of JSON data that contains a list of dicts.
@@ -205,18 +364,14 @@ class GithubRepoDownloadHelper(interface.DownloadHelper):
             # }
 
             for directory_entry in json.loads(page_content):
+                if directory_entry.get("name", None) == self._SHA256SUMS_FILENAME:
+                    continue
+
                 download_url = directory_entry.get("download_url", None)
                 if download_url:
                     download_urls.append(download_url)
 
         else:
-            sub_directory = self._GetMachineTypeSubDirectory(
-                preferred_machine_type=preferred_machine_type,
-                preferred_operating_system=preferred_operating_system,
-            )
-            if not sub_directory:
-                return None
-
             # The format of the download URL is:
             # <script type="application/json" data-target="react-app.embeddedData">
             # {"payload":{$JSON}}</script>
@@ -232,6 +387,9 @@ class GithubRepoDownloadHelper(interface.DownloadHelper):
                 code_view_tree_route = payload.get("codeViewTreeRoute", {})
                 tree = code_view_tree_route.get("tree", {})
                 for item in tree.get("items", []):
+                    if item.get("name", None) == self._SHA256SUMS_FILENAME:
+                        continue
+
                     item_path = item.get("path", None)
                     download_url = (
                         f"https://github.com/log2timeline/l2tbinaries/raw/"
@@ -241,6 +399,54 @@ class GithubRepoDownloadHelper(interface.DownloadHelper):
 
         return download_urls
 
+    def GetSHA256Sums(
+        self, preferred_machine_type=None, preferred_operating_system=None
+    ):
+        """Retrieves the SHA-256 digests of the packages for a system configuration.
+
+        Args:
+          preferred_machine_type (Optional[str]): preferred machine type, where
+              None, which will auto-detect the current machine type.
+          preferred_operating_system (Optional[str]): preferred operating system,
+              where None, which will auto-detect the current operating system.
+
+        Returns:
+          dict[str, str]: hexadecimal SHA-256 digests per lower case package
+              filename or None if the SHA256SUMS file is not available.
+        """
+        download_url = self._GetSHA256SumsURL(
+            preferred_machine_type=preferred_machine_type,
+            preferred_operating_system=preferred_operating_system,
+        )
+        page_content = self.DownloadPageContent(download_url)
+        if not page_content:
+            return None
+
+        return self.ParseSHA256Sums(page_content)
+
+    def ParseSHA256Sums(self, page_content):
+        """Parses the content of a SHA256SUMS file.
+
+        The SHA256SUMS file uses the output format of sha256sum, where each line
+        consists of: "{digest} {filename}", where the filename is prefixed with
+        "*" when binary mode is used.
+
+        Args:
+          page_content (str): content of the SHA256SUMS file.
+
+        Returns:
+          dict[str, str]: hexadecimal SHA-256 digests per lower case package
+              filename.
+        """
+        sha256_sums = {}
+        for line in page_content.split("\n"):
+            digest, _, filename = line.strip().partition(" ")
+            filename = filename.strip().lstrip("*")
+            if len(digest) == 64 and filename:
+                sha256_sums[filename.lower()] = digest.lower()
+
+        return sha256_sums
+
 
 class DependencyUpdater:
     """Helps in updating dependencies.
@@ -252,6 +458,10 @@ class DependencyUpdater:
 
     _DOWNLOAD_URL = "https://github.com/log2timeline/l2tbinaries/releases"
 
+    _TREE_INDEX_FILENAME = ".l2tbinaries-tree-index.json"
+
+    _PACKAGE_NAME_NORMALIZE_REGEX = re.compile(r"[-_.]+")
+
     _GIT_BRANCH_PER_TRACK = {
         "dev": "dev",
         "stable": "main",
@@ -287,11 +497,13 @@ class DependencyUpdater:
 
     def __init__(
         self,
+        delta_update=False,
         download_directory="build",
         download_only=False,
         download_track="stable",
         exclude_packages=False,
         force_install=False,
+        number_of_workers=4,
         preferred_machine_type=None,
         preferred_operating_system=None,
         verbose_output=False,
@@ -299,6 +511,9 @@ class DependencyUpdater:
         """Initializes the dependency updater.
 
         Args:
+          delta_update (Optional[bool]): True if only packages that are not
+              installed or of which a different version is installed should be
+              downloaded and installed.
           download_directory (Optional[str]): path of the download directory.
           download_only (Optional[bool]): True if the dependency packages should
               only be downloaded.
@@ -307,6 +522,8 @@ class DependencyUpdater:
               instead of included.
           force_install (Optional[bool]): True if the installation (update) should
               be forced.
+          number_of_workers (Optional[int]): maximum number of packages that are
+              downloaded concurrently.
           preferred_machine_type (Optional[str]): preferred machine type, where
               None, which will auto-detect the current machine type.
           preferred_operating_system (Optional[str]): preferred operating system,
@@ -317,14 +534,18 @@ class DependencyUpdater:
         branch = self._GIT_BRANCH_PER_TRACK.get(download_track, "main")
 
         super().__init__()
+        self._delta_update = delta_update
         self._download_directory = download_directory
         self._download_helper = GithubRepoDownloadHelper(
-            self._DOWNLOAD_URL, branch=branch
+            self._DOWNLOAD_URL,
+            branch=branch,
+            tree_index_file=os.path.join(download_directory, self._TREE_INDEX_FILENAME),
         )
         self._download_only = download_only
         self._download_track = download_track
         self._exclude_packages = exclude_packages
         self._force_install = force_install
+        self._number_of_workers = number_of_workers
         self._verbose_output = verbose_output
 
         if preferred_operating_system:
@@ -337,9 +558,13 @@ class DependencyUpdater:
         else:
             self._preferred_machine_type = None
 
-    def _GetAvailableWheelPackages(self):
+    def _GetAvailableWheelPackages(self, dry_run=False):
         """Determines the wheel packages available for download.
 
+        Args:
+          dry_run (Optional[bool]): True if the cached git tree listing should
+              not be updated.
+
         Returns:
           list[PackageDownload]: packages available for download.
         """
@@ -347,10 +572,12 @@ class DependencyUpdater:
         minor_version = sys.version_info[1]
         python_version_indicator = f"cp{major_version:d}{minor_version:d}"
 
-        # The API is rate limited, so we scrape the web page instead.
+        # The API is rate limited, so the git tree listing is cached and the web
+        # page is scraped if the API is not available.
         package_urls = self._download_helper.GetPackageDownloadURLs(
             preferred_machine_type=self._preferred_machine_type,
             preferred_operating_system=self.operating_system,
+            update_tree_index=not dry_run,
         )
         if not package_urls:
             logging.error("Unable to determine package download URLs.")
@@ -399,10 +626,140 @@ class DependencyUpdater:
 
         return available_packages.values()
 
-    def _GetWheelPackageFilenamesAndVersions(
-        self, project_definitions, available_packages, user_defined_wheel_package_names
+    def _DownloadWheelPackage(self, package_download, sha256_sums):
+        """Downloads a wheel package and verifies its SHA-256 digest.
+
+        Args:
+          package_download (PackageDownload): package download.
+          sha256_sums (dict[str, str]): hexadecimal SHA-256 digests per lower
+              case package filename or None if the digests are not available.
+
+        Returns:
+          str: path of the downloaded package file or None if the download or
+              the verification failed.
+        """
+        package_download_path = os.path.join(
+            self._download_directory, package_download.filename
+        )
+
+        expected_digest = None
+        if sha256_sums is not None:
+            expected_digest = sha256_sums.get(package_download.filename.lower(), None)
+            if not expected_digest:
+                logging.warning(
+                    f"Missing SHA-256 digest of: {package_download.filename:s}"
+                )
+
+        # Remove a previously downloaded file that does not match the digest,
+        # for example due to an interrupted or corrupted download.
+        if expected_digest and os.path.exists(package_download_path):
+            if self._GetSHA256Digest(package_download_path) == expected_digest:
+                return package_download_path
+
+            logging.info(f"Removing: {package_download_path:s}")
+            os.remove(package_download_path)
+
+        package_download_path = self._download_helper.DownloadFile(
+            package_download.url, output_path=package_download_path
+        )
+        if not package_download_path:
+            logging.error(f"Unable to download: {package_download.filename:s}")
+            return None
+
+        if expected_digest:
+            if self._GetSHA256Digest(package_download_path) != expected_digest:
+                logging.error(
+                    f"SHA-256 digest mismatch of: {package_download.filename:s}"
+                )
+                os.remove(package_download_path)
+                return None
+
+        return package_download_path
+
+    def _DownloadAndInstallWheelPackages(self, package_downloads):
+        """Downloads and installs wheel packages.
+
+        The packages are downloaded concurrently and every package is installed
+        as soon as its download was verified, without its dependencies. The
+        dependencies are resolved once all packages were installed.
+
+        Args:
+          package_downloads (list[PackageDownload]): packages to download.
+
+        Returns:
+          bool: True if all packages were downloaded, and installed if
+              applicable.
+        """
+        sha256_sums = self._download_helper.GetSHA256Sums(
+            preferred_machine_type=self._preferred_machine_type,
+            preferred_operating_system=self.operating_system,
+        )
+        if sha256_sums is None:
+            logging.warning(
+                "Unable to retrieve SHA256SUMS, downloads will not be verified."
+            )
+
+        package_paths = []
+        result = True
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=self._number_of_workers
+        ) as executor:
+            futures = [
+                executor.submit(
+                    self._DownloadWheelPackage, package_download, sha256_sums
+                )
+                for package_download in package_downloads
+            ]
+
+            # The installation is done in the main thread, so that only one
+            # instance of pip operates on the installation at a time.
+            for future in concurrent.futures.as_completed(futures):
+                package_path = future.result()
+                if not package_path:
+                    result = False
+                    continue
+
+                package_paths.append(package_path)
+
+                if not self._download_only:
+                    if not self._InstallWheelPackages(
+                        [package_path], no_dependencies=True
+                    ):
+                        result = False
+
+        if result and package_paths and not self._download_only:
+            result = self._InstallWheelPackages(sorted(package_paths))
+
+        return result
+
+    def _GetSHA256Digest(self, path):
+        """Calculates the SHA-256 digest of a file.
+
+        Args:
+          path (str): path of the file.
+
+        Returns:
+          str: hexadecimal SHA-256 digest.
+        """
+        sha256_context = hashlib.sha256()
+        with open(path, "rb") as file_object:
+            for data in iter(lambda: file_object.read(1024 * 1024), b""):
+                sha256_context.update(data)
+
+        return sha256_context.hexdigest()
+
+    def _GetWheelPackageDownloads(
+        self,
+        project_definitions,
+        available_packages,
+        user_defined_wheel_package_names,
+        dry_run=False,
     ):
-        """Determines the wheel package filenames and versions.
+        """Determines the wheel packages to download.
+
+        Previous versions of the packages are removed from the download
+        directory, unless dry run is enabled.
 
         Args:
           project_definitions (dist[str, ProjectDefinition]): project definitions
@@ -413,11 +770,11 @@ class DependencyUpdater:
               packages that should be updated if an update is available. These
               package names are derived from the user specified names of projects.
               An empty list represents all available packages.
+          dry_run (Optional[bool]): True if previous versions of the packages
+              should not be removed.
 
         Returns:
-          tuple: containing:
-              dict[str, str]: filenames per package.
-              dict[str, str]: versions per package.
+          list[PackageDownload]: packages to download.
         """
         project_definition_per_package_name = {}
         for project_name, project_definition in project_definitions.items():
@@ -427,8 +784,7 @@ class DependencyUpdater:
             package_name = package_name.lower()
             project_definition_per_package_name[package_name] = project_definition
 
-        package_filenames = {}
-        package_versions = {}
+        package_downloads = []
 
         for package_download in available_packages:
             package_name = package_download.name
@@ -457,15 +813,16 @@ class DependencyUpdater:
                     continue
 
             # Remove previous versions of a package.
-            package_name_suffix = package_filename[:-4]
-            filenames_glob = f"{package_name:s}*{package_name_suffix:s}"
-            filenames = glob.glob(
-                os.path.join(self._download_directory, filenames_glob)
-            )
-            for filename in filenames:
-                if filename != package_download_path and os.path.isfile(filename):
-                    logging.info(f"Removing: {filename:s}")
-                    os.remove(filename)
+            if not dry_run:
+                package_name_suffix = package_filename[:-4]
+                filenames_glob = f"{package_name:s}*{package_name_suffix:s}"
+                filenames = glob.glob(
+                    os.path.join(self._download_directory, filenames_glob)
+                )
+                for filename in filenames:
+                    if filename != package_download_path and os.path.isfile(filename):
+                        logging.info(f"Removing: {filename:s}")
+                        os.remove(filename)
 
             project_definition = project_definition_per_package_name.get(
                 package_name, None
@@ -481,18 +838,60 @@ class DependencyUpdater:
                 )
                 continue
 
-            if not os.path.exists(package_download_path):
-                logging.info(f"Downloading: {package_filename:s}")
-                os.chdir(self._download_directory)
-                try:
-                    self._download_helper.DownloadFile(package_download.url)
-                finally:
-                    os.chdir("..")
+            package_downloads.append(package_download)
 
-            package_filenames[package_name] = package_filename
-            package_versions[package_name] = package_download.version
+        return package_downloads
 
-        return package_filenames, package_versions
+    def _GetInstalledPackages(self):
+        """Determines the installed packages.
+
+        Returns:
+          dict[str, list[str]]: version parts of the installed packages per
+              normalized package name.
+        """
+        installed_packages = {}
+        for distribution in importlib.metadata.distributions():
+            name = distribution.metadata.get("Name", None)
+            version = distribution.version
+            if not name or not version:
+                continue
+
+            name = self._NormalizePackageName(name)
+
+            # Only the first distribution found on the path is used by Python.
+            if name not in installed_packages:
+                installed_packages[name] = version.split(".")
+
+        return installed_packages
+
+    def _GetPackageUpdates(self, package_downloads, installed_packages):
+        """Determines the packages that change when installed.
+
+        Args:
+          package_downloads (list[PackageDownload]): packages to download.
+          installed_packages (dict[str, list[str]]): version parts of
+              the installed packages per normalized package name.
+
+        Returns:
+          list[tuple[PackageDownload, list[str]]]: packages that change when
+              installed and the version parts of the installed version, where
+              None represents the package is not installed.
+        """
+        package_updates = []
+        for package_download in package_downloads:
+            name = self._NormalizePackageName(package_download.name)
+            installed_version = installed_packages.get(name, None)
+
+            if not self._force_install and installed_version:
+                compare_result = versions.CompareVersions(
+                    package_download.version, installed_version
+                )
+                if compare_result == 0:
+                    continue
+
+            package_updates.append((package_download, installed_version))
+
+        return package_updates
 
     def _GetProjectDefinitions(self, projects_file):
         """Retrieves the project definitions from the projects file.
@@ -552,33 +951,66 @@ class DependencyUpdater:
 
         return user_defined_wheel_package_names
 
-    def _InstallWheelPackagesWindows(self, package_filenames, package_versions):
-        """Installs wheel packages on Windows.
+    def _InstallWheelPackages(self, package_paths, no_dependencies=False):
+        """Installs wheel packages.
 
         Args:
-          package_filenames (dict[str, str]): filenames per package.
-          package_versions (dict[str, str]): versions per package.
+          package_paths (list[str]): paths of the package files.
+          no_dependencies (Optional[bool]): True if the dependencies of
+              the packages should not be installed.
 
         Returns:
           bool: True if the installation was successful.
         """
-        package_paths = [
-            os.path.join(self._download_directory, package_filenames[name])
-            for name in package_versions
-        ]
+        command = [sys.executable, "-m", "pip", "install"]
+        if no_dependencies:
+            command.append("--no-deps")
+        command.extend(package_paths)
+
+        package_paths_string = " ".join(package_paths)
+        logging.info(f"Installing: {package_paths_string:s}")
+
+        exit_code = subprocess.call(command, shell=False)
+        if exit_code != 0:
+            command_string = " ".join(command)
+            logging.error(f'Running: "{command_string:s}" failed.')
+            return False
 
-        result = True
-        if package_paths:
-            package_paths = " ".join(package_paths)
-            logging.info(f"Installing: {package_paths:s}")
+        return True
 
-            command = f"{sys.executable:s} -m pip install {package_paths:s}"
-            exit_code = subprocess.call(command, shell=False)
-            if exit_code != 0:
-                logging.error(f'Running: "{command:s}" failed.')
-                result = False
+    def _NormalizePackageName(self, name):
+        """Normalizes a package name.
 
-        return result
+        Args:
+          name (str): name of the package.
+
+        Returns:
+          str: normalized name of the package, as used in wheel filenames.
+        """
+        return self._PACKAGE_NAME_NORMALIZE_REGEX.sub("_", name).lower()
+
+    def _PrintPackageUpdates(self, package_updates):
+        """Prints the packages that change when installed.
+
+        Args:
+          package_updates (list[tuple[PackageDownload, list[str]]]): packages
+              that change when installed and the version parts of the installed
+              version, where None represents the package is not installed.
+        """
+        if not package_updates:
+            print("All packages are up to date.")
+            return
+
+        for package_download, installed_version in package_updates:
+            available_version = ".".join(package_download.version)
+            if not installed_version:
+                print(f"Install: {package_download.name:s} {available_version:s}")
+            else:
+                installed_version = ".".join(installed_version)
+                print(
+                    f"Update: {package_download.name:s} {installed_version:s} -> "
+                    f"{available_version:s}"
+                )
 
     def ExpandPresets(self, preset_definitions, preset_names):
         """Expands preset names to project names.
@@ -606,7 +1038,7 @@ class DependencyUpdater:
 
         return project_names
 
-    def UpdatePackages(self, projects_file, user_defined_project_names):
+    def UpdatePackages(self, projects_file, user_defined_project_names, dry_run=False):
         """Updates packages.
 
         Args:
@@ -614,6 +1046,9 @@ class DependencyUpdater:
           user_defined_project_names (list[str]): user specified names of projects,
               that should be updated if an update is available. An empty list
               represents all available projects.
+          dry_run (Optional[bool]): True if the packages that would be installed
+              or updated should only be printed, without changing the download
+              directory.
 
         Returns:
           bool: True if the update was successful.
@@ -624,22 +1059,41 @@ class DependencyUpdater:
             project_definitions, user_defined_project_names
         )
 
-        available_packages = self._GetAvailableWheelPackages()
+        # The download directory also contains the cached git tree listing.
+        if not dry_run and not os.path.exists(self._download_directory):
+            os.mkdir(self._download_directory)
+
+        available_packages = self._GetAvailableWheelPackages(dry_run=dry_run)
         if not available_packages:
             logging.error("No packages found.")
             return False
 
-        if not os.path.exists(self._download_directory):
-            os.mkdir(self._download_directory)
-
-        package_filenames, package_versions = self._GetWheelPackageFilenamesAndVersions(
-            project_definitions, available_packages, user_defined_wheel_package_names
+        package_downloads = self._GetWheelPackageDownloads(
+            project_definitions,
+            available_packages,
+            user_defined_wheel_package_names,
+            dry_run=dry_run,
         )
 
-        if self._download_only:
+        if self._delta_update or dry_run:
+            installed_packages = self._GetInstalledPackages()
+            package_updates = self._GetPackageUpdates(
+                package_downloads, installed_packages
+            )
+
+            if dry_run:
+                self._PrintPackageUpdates(package_updates)
+                return True
+
+            package_downloads = [
+                package_download for package_download, _ in package_updates
+            ]
+
+        if not package_downloads:
+            logging.info("No packages to download.")
             return True
 
-        return self._InstallWheelPackagesWindows(package_filenames, package_versions)
+        return self._DownloadAndInstallWheelPackages(package_downloads)
 
 
 def Main():
@@ -665,6 +1119,16 @@ def Main():
             "files e.g. projects.ini."
         ),
     )
+    argument_parser.add_argument(
+        "--delta",
+        action="store_true",
+        dest="delta_update",
+        default=False,
+        help=(
+            "Only download and install packages that are not installed or of "
+            "which a different version is installed."
+        ),
+    )
     argument_parser.add_argument(
         "--download-directory",
         "--download_directory",
@@ -686,6 +1150,17 @@ def Main():
             "download and update the dependencies."
         ),
     )
+    argument_parser.add_argument(
+        "--dry-run",
+        "--dry_run",
+        action="store_true",
+        dest="dry_run",
+        default=False,
+        help=(
+            "Only print the packages that would be installed or updated, "
+            "compared to the installed packages."
+        ),
+    )
     argument_parser.add_argument(
         "-e",
         "--exclude",
@@ -751,6 +1226,15 @@ def Main():
         default=False,
         help="have more verbose output.",
     )
+    argument_parser.add_argument(
+        "--workers",
+        action="store",
+        metavar="NUMBER",
+        dest="number_of_workers",
+        type=int,
+        default=4,
+        help="The maximum number of packages to download concurrently.",
+    )
     argument_parser.add_argument(
         "project_names",
         nargs="*",
@@ -787,11 +1271,13 @@ def Main():
     logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
 
     dependency_updater = DependencyUpdater(
+        delta_update=options.delta_update,
         download_directory=options.download_directory,
         download_only=options.download_only,
         download_track=options.track,
         exclude_packages=options.exclude_packages,
         force_install=options.force_install,
+        number_of_workers=options.number_of_workers,
         preferred_machine_type=options.machine_type,
         verbose_output=options.verbose,
     )
@@ -817,7 +1303,9 @@ def Main():
     elif options.project_names:
         user_defined_project_names = options.project_names
 
-    if not dependency_updater.UpdatePackages(projects_file, user_defined_project_names):
+    if not dependency_updater.UpdatePackages(
+        projects_file, user_defined_project_names, dry_run=options.dry_run
+    ):
         return 1
 
     return 0